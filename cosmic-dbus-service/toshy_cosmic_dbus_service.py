@@ -57,6 +57,7 @@ os.environ['PYTHONPATH'] = f'{parent_folder_path}:{current_folder_path}:{existin
 
 # local imports now that path is prepped
 from lib.env_context import EnvironmentInfo
+from lib.active_window_record import ActiveWindowRecordWriter, active_window_record_path
 
 from protocols.cosmic_toplevel_info_unstable_v1.zcosmic_toplevel_info_v1 import (
     ZcosmicToplevelInfoV1,
@@ -78,6 +79,8 @@ if os.name == 'posix' and os.geteuid() == 0:
 
 # Establish our Wayland client global variable
 wl_client = None
+# D-Bus service object, set in main()
+dbus_svc_obj = None
 
 def signal_handler(sig, frame):
     """handle signals like Ctrl+C"""
@@ -111,26 +114,19 @@ separator       = sep_char * sep_reps
 
 LOG_PFX = 'TOSHY_COSMIC_DBUS_SVC'
 
-DISTRO_ID       = None
-DISTRO_VER      = None
-VARIANT_ID      = None
 SESSION_TYPE    = None
 DESKTOP_ENV     = None
-DE_MAJ_VER      = None
 
 
 def check_environment():
     """Retrieve the current environment from env module"""
     # env_info_dct   = env.get_env_info()
     env_ctxt_getter = EnvironmentInfo()
-    env_info_dct   = env_ctxt_getter.get_env_info()
-    global DISTRO_ID, DISTRO_VER, VARIANT_ID, SESSION_TYPE, DESKTOP_ENV, DE_MAJ_VER
-    DISTRO_ID       = env_info_dct.get('DISTRO_ID', 'keymissing')
-    DISTRO_VER      = env_info_dct.get('DISTRO_VER', 'keymissing')
-    VARIANT_ID      = env_info_dct.get('VARIANT_ID', 'keymissing')
-    SESSION_TYPE    = env_info_dct.get('SESSION_TYPE', 'keymissing')
-    DESKTOP_ENV     = env_info_dct.get('DESKTOP_ENV', 'keymissing')
-    DE_MAJ_VER      = env_info_dct.get('DE_MAJ_VER', 'keymissing')
+    env_ctxt_getter.use_cache()     # values already detected this session, if any
+    global SESSION_TYPE, DESKTOP_ENV
+    # only the values read here get detected (if not in the session cache)
+    SESSION_TYPE    = env_ctxt_getter.SESSION_TYPE
+    DESKTOP_ENV     = env_ctxt_getter.DESKTOP_ENV
 
 
 check_environment()
@@ -157,6 +153,9 @@ else:
 TOSHY_COSMIC_DBUS_SVC_PATH      = '/org/toshy/Cosmic'
 TOSHY_COSMIC_DBUS_SVC_IFACE     = 'org.toshy.Cosmic'
 
+# Memory-mapped record of the active window, for readers that shouldn't need a D-Bus call
+TOSHY_COSMIC_WDW_RECORD_PATH    = active_window_record_path('cosmic')
+
 ERR_NO_COSMIC_APP_CLASS = "ERR_no_cosmic_app_class"
 ERR_NO_COSMIC_WDW_TITLE = "ERR_no_cosmic_wdw_title"
 
@@ -280,6 +279,7 @@ class WaylandClient:
         # Deal with possible out-of-order Wayland events
         if handle == self.active_foreign_handle:
             self.active_app_class = app_id
+            publish_active_window()
 
     def handle_title_change(self, handle, title):
         if handle not in self.wdw_handles_dct:
@@ -288,6 +288,7 @@ class WaylandClient:
         # Deal with possible out-of-order Wayland events
         if handle == self.active_foreign_handle:
             self.active_wdw_title = title
+            publish_active_window()
 
     def handle_window_closed(self, handle):
         """Remove window from local state."""
@@ -353,6 +354,8 @@ class WaylandClient:
                 self.active_app_class = self.wdw_handles_dct[handle]['app_id']
                 self.active_wdw_title = self.wdw_handles_dct[handle]['title']
 
+            publish_active_window()
+
             # self.print_running_applications()  # Print the list of running applications
             # print()
             # print("#" * 80)
@@ -367,6 +370,7 @@ class DBUS_Object(dbus.service.Object):
         super().__init__(session_bus, object_path)
         self.interface_name     = interface_name
         self.dbus_svc_bus_name  = dbus.service.BusName(interface_name, bus=session_bus)
+        self.wdw_record         = ActiveWindowRecordWriter(TOSHY_COSMIC_WDW_RECORD_PATH)
 
     @dbus.service.method(TOSHY_COSMIC_DBUS_SVC_IFACE, out_signature='a{sv}')
     def GetActiveWindow(self):
@@ -374,6 +378,29 @@ class DBUS_Object(dbus.service.Object):
         return {'app_id':           wl_client.active_app_class,
                 'title':            wl_client.active_wdw_title}
 
+    @dbus.service.signal(TOSHY_COSMIC_DBUS_SVC_IFACE, signature='ss')
+    def ActiveWindowChanged(self, app_id, title):
+        # emitted by dbus-python when called, with the same values as GetActiveWindow()
+        pass
+
+    @dbus.service.method(TOSHY_COSMIC_DBUS_SVC_IFACE, out_signature='s')
+    def GetActiveWindowRecordPath(self):
+        # path of the memory-mapped record (see lib/active_window_record.py), or ''
+        return TOSHY_COSMIC_WDW_RECORD_PATH or ''
+
+    def publish_active_window(self, app_id, title):
+        """Push the active window to the record file and to signal listeners, if changed"""
+        if self.wdw_record.publish(app_id, title):
+            self.ActiveWindowChanged(app_id, title)
+
+
+def publish_active_window():
+    """Called by the Wayland client after anything about the active window changed"""
+    if dbus_svc_obj is not None:
+        # values can still be None until the compositor sends them
+        dbus_svc_obj.publish_active_window( str(wl_client.active_app_class or ERR_NO_COSMIC_APP_CLASS),
+                                            str(wl_client.active_wdw_title or ERR_NO_COSMIC_WDW_TITLE))
+
 
 def wayland_event_callback(fd, condition, display: Display):
     if condition & GLib.IO_ERR or condition & GLib.IO_HUP:
@@ -398,8 +425,9 @@ def main():
     session_bus = dbus.SessionBus()
 
     # Create the DBUS_Object
+    global dbus_svc_obj
     try:
-        DBUS_Object(session_bus, TOSHY_COSMIC_DBUS_SVC_PATH, TOSHY_COSMIC_DBUS_SVC_IFACE)
+        dbus_svc_obj = DBUS_Object(session_bus, TOSHY_COSMIC_DBUS_SVC_PATH, TOSHY_COSMIC_DBUS_SVC_IFACE)
     except DBusException as dbus_error:
         error(f"{LOG_PFX}: Error occurred while creating D-Bus service object:\n\t{dbus_error}")
         sys.exit(1)
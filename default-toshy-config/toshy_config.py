@@ -23,16 +23,21 @@ import sys
 import time
 import shutil
 import inspect
+import threading
 import subprocess
 
 from subprocess import DEVNULL
 from typing import Callable, List, Dict, Tuple, Union
 
+_config_load_start = time.perf_counter()     # for the optional startup profile
+
 from xwaykeyz.config_api import *
 from xwaykeyz.lib.key_context import KeyContext
 from xwaykeyz.lib.logger import debug, error
 from xwaykeyz.models.modifier import Modifier
 
+_xwaykeyz_imports_end = time.perf_counter()
+
 
 ###################################################################################################
 ###  SLICE_MARK_START: keymapper_api  ###  EDITS OUTSIDE THESE MARKS WILL BE LOST ON UPGRADE
@@ -157,10 +162,30 @@ current_folder_path = os.path.dirname(os.path.abspath(config_globals["__config__
 sys.path.insert(0, current_folder_path)
 
 # Local imports after path has been set
+from lib.app_groups import AppGroupClassifier
+from lib.condition_cache import ConditionCache, cached, uncached
+from lib.condition_profiler import ConditionProfiler
+from lib.dead_keys import DeadKeysTable
+from lib.optspec_tables import OptSpecTables
 from lib.env_context import EnvironmentInfo
+from lib.input_devices import get_keyboard_device_names
 from lib.machine_context import get_machine_id_hash
 from lib.notification_manager import NotificationManager
+from lib.pattern_matcher import compile_matcher
+from lib.probe_cache import ProbeCache
 from lib.settings_class import Settings
+from lib.startup_profiler import StartupProfiler
+
+# Optional wall time profile of the config load phases, enabled by TOSHY_STARTUP_PROFILE=1
+# in the environment of the keymapper (see 'toshy-startup-profile'). Phases are marked
+# with `startup_profiler.phase()`, the report is written at the end of the config file.
+startup_profiler = StartupProfiler()
+if '_toshy_config_code_times' in config_globals:      # loaded with toshy_config_loader.py
+    startup_profiler.add_phase('config code (cache or compile)',
+                                *config_globals['_toshy_config_code_times'])
+startup_profiler.add_phase('xwaykeyz imports', _config_load_start, _xwaykeyz_imports_end)
+startup_profiler.add_phase('keymapper API, modifier aliases, lib imports',
+                            _xwaykeyz_imports_end, time.perf_counter())
 
 assets_path         = os.path.join(current_folder_path, 'assets')
 icon_file_active    = os.path.join(assets_path, "toshy_app_icon_rainbow.svg")
@@ -173,12 +198,54 @@ TOSHY_PART_NAME = 'Toshy Config file'
 APP_VERSION     = __version__
 
 # Settings object used to tweak preferences "live" between gui, tray and config.
+startup_profiler.phase('Settings')
 cnfg = Settings(current_folder_path)
-cnfg.watch_database()       # activate watchdog observer on the sqlite3 db file
-cnfg.watch_synergy_log()    # activate watchdog observer on the Synergy log file
+startup_profiler.phase('Settings snapshot or database observer')
+# Preference changes saved by the tray/GUI are published in a small memory-mapped file,
+# checked at the start of each key event by the "Settings Snapshot Trigger" modmap/keymap.
+# Falls back to the watchdog observer on the sqlite3 db file if that can't be used.
+if not cnfg.use_snapshot():
+    cnfg.watch_database()   # activate watchdog observer on the sqlite3 db file
+startup_profiler.phase('Synergy log observer')
+cnfg.watch_synergy_log()    # activate watchdog observer on the Synergy (or fork) log file
+startup_profiler.phase('condition cache and profiler setup')
 debug("")
 debug(cnfg, ctx="CG")
 
+# Cache of `when` condition results, per window/device context snapshot. Anything a 
+# condition reads that is not part of the context snapshot (preferences, dead key 
+# state, Enter/F2 state) must invalidate the cache on change.
+cond_cache = ConditionCache(max_contexts=16)
+cnfg.add_change_callback(cond_cache.invalidate)
+
+
+# Remapping is suspended while the Synergy (or fork) screen focus is on another screen.
+# The gate is checked once at the front of every cached condition, so the conditions
+# themselves don't test `cnfg.screen_has_focus`. Uncached conditions (triggers with
+# side effects) keep running.
+def _on_settings_change_screen_focus(name, old_value, new_value):
+    cond_cache.suspend(not new_value)
+
+
+cond_cache.suspend(not cnfg.screen_has_focus)
+cnfg.add_field_callback('screen_has_focus', _on_settings_change_screen_focus)
+
+# Optional profiling of every `when` condition (calls, True rate, time), enabled with the
+# 'profile_conditions' preference. Report is dumped with the "Diagnostics" keymap combo,
+# or with `kill -USR1` to the keymapper process. Conditions are not wrapped when disabled.
+cond_profiler = ConditionProfiler(enabled=cnfg.profile_conditions)
+cond_profiler.install_signal_handler()
+if cond_profiler.enabled:
+    debug(f"Condition profiling enabled. Report file: '{cond_profiler.report_path}'", ctx="CG")
+
+
+def _on_settings_change_profiling(name, old_value, new_value):
+    if new_value != cond_profiler.enabled:
+        debug("Condition profiling preference changed. Restart the config to apply.")
+
+
+cnfg.add_field_callback('profile_conditions', _on_settings_change_profiling)
+
 
 
 #############################  ENVIRONMENT  ##############################
@@ -192,6 +259,7 @@ debug(cnfg, ctx="CG")
 ###                                                                    ###
 ###                                                                    ###
 ##########################################################################
+startup_profiler.phase('ENVIRONMENT')
 # Set up some useful environment variables
 
 ###################################################################################################
@@ -236,8 +304,12 @@ WINDOW_MGR                      = None
 # DESKTOP_ENV     = locals().get('OVERRIDE_DESKTOP_ENV')  or env_info.get('DESKTOP_ENV',  'keymissing')
 # DE_MAJ_VER      = locals().get('OVERRIDE_DE_MAJ_VER')   or env_info.get('DE_MAJ_VER',   'keymissing')
 
+# Detected once per session and shared with the tray and D-Bus services (cache file in
+# XDG_RUNTIME_DIR). Run 'toshy-env --refresh' to detect again after changing something.
+startup_profiler.phase('EnvironmentInfo')
 env_ctxt_getter = EnvironmentInfo()
-env_ctxt: Dict[str, str] = env_ctxt_getter.get_env_info()
+env_ctxt: Dict[str, str] = env_ctxt_getter.get_env_info_cached()
+startup_profiler.phase('ENVIRONMENT (cont.)')
 
 DISTRO_ID       = locals().get('OVERRIDE_DISTRO_ID')    or env_ctxt.get('DISTRO_ID',    'keymissing')
 DISTRO_VER      = locals().get('OVERRIDE_DISTRO_VER')   or env_ctxt.get('DISTRO_VER',   'keymissing')
@@ -311,6 +383,7 @@ except NameError:
 # Allows syncing a single config file between different machines without overlapping the
 # hardware/media key overrides, or any other machine-specific customization.
 # Get the ID for each machine with the `toshy-machine-id` command, for use in `if` conditions.
+startup_profiler.phase('get_machine_id_hash')
 MACHINE_ID = get_machine_id_hash()
 
 
@@ -326,6 +399,7 @@ MACHINE_ID = get_machine_id_hash()
 ###                                            ###
 ###                                            ###
 ##################################################
+startup_profiler.phase('VARIABLES')
 # Establish important global variables here
 
 
@@ -380,6 +454,7 @@ applelogoalert_enabled = True   # Default: True
 ###                                                ###
 ###                                                ###
 ######################################################
+startup_profiler.phase('LISTS')
 
 
 def toRgxStr(lst_of_str) -> str:
@@ -396,6 +471,9 @@ def toRgxStr(lst_of_str) -> str:
 def negRgx(rgx_str):
     """
     Convert positive match regex pattern into negative lookahead regex pattern.
+    matchProps() recognizes this form and converts it back into an inverted match
+    of the positive pattern, which avoids the slow lookahead on long window titles.
+    Prefer the `not_clas`/`not_name`/`not_devn` parameters in new conditions.
     """
     # remove any ^$
     rgx_str_strip = str(rgx_str).replace('^','').replace('$','')
@@ -653,6 +731,21 @@ filemanagers = [x.casefold() for x in filemanagers]
 filemanagerStr = "|".join('^'+x+'$' for x in filemanagers)
 
 
+# Classifier that sorts a window class into all of the app groups above in a single pass,
+# with the result cached per window class. Use with `matchGroups()` in keymap conditions,
+# like `matchGroups(grp=GRP_TERMINALS, not_grp=GRP_REMOTES)`. The regex pattern strings
+# above are still available for use with `matchProps()`.
+app_groups = AppGroupClassifier()
+GRP_TERMINALS           = app_groups.add_group('terminals',         terminals)
+GRP_VSCODES             = app_groups.add_group('vscodes',           vscodes)
+GRP_SUBLIMES            = app_groups.add_group('sublimes',          sublimes)
+GRP_REMOTES             = app_groups.add_group('remotes',           remotes)
+GRP_BROWSERS_CHROME     = app_groups.add_group('browsers_chrome',   browsers_chrome)
+GRP_BROWSERS_FIREFOX    = app_groups.add_group('browsers_firefox',  browsers_firefox)
+GRP_BROWSERS_ALL        = app_groups.add_group('browsers_all',      browsers_all)
+GRP_FILEMANAGERS        = app_groups.add_group('filemanagers',      filemanagers)
+
+
 ### dialogs_Escape_lod = send these windows the Escape key for Cmd+W
 dialogs_Escape_lod = [
     {clas: "^Angry.*IP.*Scanner$",
@@ -791,27 +884,27 @@ not_win_type_rgx    = re.compile("IBM|Chromebook|Apple", re.I)
 ###########################################################################################
 
 
-# Instantiate a useful notification object class instance, to make notifications easier
-ntfy = NotificationManager(icon_file_active, title='Toshy Alert (Config)')
+startup_profiler.phase('NotificationManager')
+# Results of command capability probes (notify-send, zenity), cached in XDG_RUNTIME_DIR
+probe_cache = ProbeCache()
 
+# Instantiate a useful notification object class instance, to make notifications easier
+ntfy = NotificationManager(icon_file_active, title='Toshy Alert (Config)', probe_cache=probe_cache)
+startup_profiler.phase('CUSTOM FUNCTIONS')
 
-def isKBtype(kbtype: str, map=None):
-    # guard against failure to give valid type arg (we don't need to casefold anything with this)
-    if kbtype not in ['IBM', 'Chromebook', 'Windows', 'Apple']:
-        raise ValueError(f"Invalid type given to isKBtype() function: '{kbtype}'"
-                f'\n\t Valid keyboard types (case sensitive): IBM | Chromebook | Windows | Apple')
-    def _isKBtype(ctx: KeyContext):
-        # debug(f"KBTYPE: '{KBTYPE}' | isKBtype check from map: '{map}'")
-        return kbtype == KBTYPE
-    return _isKBtype
 
+valid_kbtypes = ['IBM', 'Chromebook', 'Windows', 'Apple']
 
-kbtype_cache_dct = {}
+# Keyboard type of each device name seen so far (with any user override applied), so that
+# finding the type for a key event is a single dict lookup. Cleared when the override
+# preference changes. Bounded, in case a lot of different devices come and go.
+KBTYPE_CACHE_MAX = 64
+kbtype_cache_dct: Dict[str, str] = {}
 
 
-def getKBtype():
+def resolve_kbtype(kbd_dev_name: str) -> str:
     """
-    ### Get the keyboard type string for the current device
+    ### Get the keyboard type string for a device, and store it in the cache
     
     #### Valid Types
     
@@ -820,75 +913,103 @@ def getKBtype():
     #### Hierarchy of validations:
     
     - Check if a forced override of keyboard type is applied by user preference.
-    - Check cache dictionary for device name stored from previous run of function.
     - Check if the device name is in the keyboards_UserCustom_dct dictionary.
     - Check if the device name matches any keyboard type list.
     - Check if any keyboard type string is found in the device name string.
     - Check if the device name indicates a "Windows" keyboard by excluding other types.
     """
 
-    valid_kbtypes = ['IBM', 'Chromebook', 'Windows', 'Apple']
+    def cache_kbtype(kbtype, msg):
+        debug(f"KBTYPE: '{kbtype}' | {msg}: '{kbd_dev_name}'")
+        if len(kbtype_cache_dct) >= KBTYPE_CACHE_MAX:
+            del kbtype_cache_dct[next(iter(kbtype_cache_dct))]     # oldest device
+        kbtype_cache_dct[kbd_dev_name] = kbtype
+        return kbtype
+
+    # If user wants to override, apply override and return.
+    # Breaks per-device adaptatation capability while engaged!
+    if cnfg.override_kbtype in valid_kbtypes:
+        return cache_kbtype(cnfg.override_kbtype, f"WARNING: Override applied! Dev")
+
+    kbd_dev_name_cf = (kbd_dev_name or '').casefold()
+
+    # Check if there is a custom type for the device
+    custom_kbtype = kbds_UserCustom_dct_cf.get(kbd_dev_name_cf, '')
+    if custom_kbtype and custom_kbtype in valid_kbtypes:
+        return cache_kbtype(custom_kbtype, 'Custom type for dev')
+
+    # Check against the keyboard type lists
+    for kbtype, regex_lst in kbtype_lists_rgx.items():
+        for rgx in regex_lst:
+            if rgx.search(kbd_dev_name_cf):
+                return cache_kbtype(kbtype, 'Rgx matched on dev')
+
+    # Check if any keyboard type string is found in the device name
+    for kbtype in valid_kbtypes:
+        if kbtype.casefold() in kbd_dev_name_cf:
+            return cache_kbtype(kbtype, 'Type in dev name')
+
+    # Check if the device name indicates a "Windows" keyboard
+    if ('windows' not in kbd_dev_name_cf 
+        and not not_win_type_rgx.search(kbd_dev_name_cf) 
+        and not all_kbds_rgx.search(kbd_dev_name_cf) ):
+        return cache_kbtype('Windows', 'Default type for dev')
+
+    # No matching keyboard type is found
+    error(f"KBTYPE: 'unidentified' | Dev fell through all checks: '{kbd_dev_name}'")
+    return cache_kbtype('unidentified', 'Dev fell through all checks')
+
+
+def kbtype_of(kbd_dev_name: str) -> str:
+    """Get the keyboard type of a device, from the cache if the device was seen before"""
+    try:
+        return kbtype_cache_dct[kbd_dev_name]
+    except KeyError:
+        return resolve_kbtype(kbd_dev_name)
 
-    def _getKBtype(ctx: KeyContext):
-        # debug(f"Entering getKBtype with override value: '{cnfg.override_kbtype}'")
-        global KBTYPE
-        kbd_dev_name = ctx.device_name
 
-        def log_kbtype(msg, cache_dev):
-            debug(f"KBTYPE: '{KBTYPE}' | {msg}: '{kbd_dev_name}'")
-            if cache_dev:
-                kbtype_cache_dct[kbd_dev_name] = (KBTYPE, msg)
+def _on_settings_change_kbtype(name, old_value, new_value):
+    """Settings change callback, throws away the cached keyboard types when override changes"""
+    kbtype_cache_dct.clear()
+    debug(f"Keyboard type override changed to: '{new_value}'")
 
-        # If user wants to override, apply override and return.
-        # Breaks per-device adaptatation capability while engaged!
-        if cnfg.override_kbtype in valid_kbtypes:
-            KBTYPE = cnfg.override_kbtype
-            log_kbtype(f"WARNING: Override applied! Dev", cache_dev=False)
-            return
 
-        # Check in the kbtype cache dict for the device
-        if kbd_dev_name in kbtype_cache_dct:
-            KBTYPE, cached_msg = kbtype_cache_dct[kbd_dev_name]
-            log_kbtype(f'(CACHED) {cached_msg}', cache_dev=False)
-            return
+cnfg.add_field_callback('override_kbtype', _on_settings_change_kbtype)
 
-        kbd_dev_name_cf = ctx.device_name.casefold()
 
-        # Check if there is a custom type for the device
-        custom_kbtype = kbds_UserCustom_dct_cf.get(kbd_dev_name_cf, '')
-        if custom_kbtype and custom_kbtype in valid_kbtypes:
-            KBTYPE = custom_kbtype
-            log_kbtype('Custom type for dev', cache_dev=True)
-            return
+def isKBtype(kbtype: str, map=None):
+    # guard against failure to give valid type arg (we don't need to casefold anything with this)
+    if kbtype not in valid_kbtypes:
+        raise ValueError(f"Invalid type given to isKBtype() function: '{kbtype}'"
+                f'\n\t Valid keyboard types (case sensitive): IBM | Chromebook | Windows | Apple')
+    def _isKBtype(ctx: KeyContext):
+        # debug(f"KBTYPE: '{KBTYPE}' | isKBtype check from map: '{map}'")
+        return kbtype == kbtype_of(ctx.device_name)
+    return _isKBtype
 
-        # Check against the keyboard type lists
-        for kbtype, regex_lst in kbtype_lists_rgx.items():
-            for rgx in regex_lst:
-                if rgx.search(kbd_dev_name_cf):
-                    KBTYPE = kbtype
-                    log_kbtype('Rgx matched on dev', cache_dev=True)
-                    return
-
-        # Check if any keyboard type string is found in the device name
-        for kbtype in ['IBM', 'Chromebook', 'Windows', 'Apple']:
-            if kbtype.casefold() in kbd_dev_name_cf:
-                KBTYPE = kbtype
-                log_kbtype('Type in dev name', cache_dev=True)
-                return
-
-        # Check if the device name indicates a "Windows" keyboard
-        if ('windows' not in kbd_dev_name_cf 
-            and not not_win_type_rgx.search(kbd_dev_name_cf) 
-            and not all_kbds_rgx.search(kbd_dev_name_cf) ):
-            KBTYPE = 'Windows'
-            log_kbtype('Default type for dev', cache_dev=True)
-            return
 
-        # Default to None if no matching keyboard type is found
-        KBTYPE = 'unidentified'
-        error(f"KBTYPE: '{KBTYPE}' | Dev fell through all checks: '{kbd_dev_name}'")
+def _getKBtype(ctx: KeyContext):
+    # Keep the global up to date for the diagnostics and notifications (no return value)
+    global KBTYPE
+    try:
+        KBTYPE = kbtype_cache_dct[ctx.device_name]
+    except KeyError:
+        KBTYPE = resolve_kbtype(ctx.device_name)
+
+
+def getKBtype():
+    """
+    Get the function that sets the global `KBTYPE` for the device of the key event.
+    Always returns the same function, so the "Keyboard Type Trigger" conditions
+    don't build a new closure on every key.
+    """
+    return _getKBtype
+
 
-    return _getKBtype  # Return the inner function
+# Resolve the keyboard types of the keyboards attached at startup, so the first key press
+# on each of them doesn't have to. Devices attached later get resolved when first seen.
+for kbd_dev_name in get_keyboard_device_names():
+    kbtype_of(kbd_dev_name)
 
 
 def isDoubleTap(dt_combo):
@@ -954,9 +1075,25 @@ def isDoubleTap(dt_combo):
     return _isDoubleTap
 
 
-total_matchProps_iterations = 0
-MAX_MATCHPROPS_ITERATIONS = 1000
-MAX_MATCHPROPS_ITERATIONS_REACHED = False
+# Cache of constructed matchProps() closures, keyed on the "frozen" set of arguments.
+# Most conditions use matchProps() inside a `when = lambda ctx: ...` so the outer 
+# function gets called again on every key press and release. With the cache, only the
+# first call with a given set of arguments does the validation and regex compiling, and
+# every later call just gets back the same prebuilt closure. 
+_matchProps_cache: Dict[tuple, Callable[[KeyContext], bool]] = {}
+
+
+def _freeze_matchProps_arg(arg):
+    """
+    Convert a (possibly nested) 'lst'/'not_lst' list of dicts into a hashable 
+    equivalent, for use in the matchProps() cache key. Order of keys inside 
+    each dict does not matter, but order of the dicts in a list does.
+    """
+    if isinstance(arg, dict):
+        return frozenset((k, _freeze_matchProps_arg(v)) for k, v in arg.items())
+    if isinstance(arg, list):
+        return tuple(_freeze_matchProps_arg(item) for item in arg)
+    return arg
 
 
 # Correct syntax to reject all positional parameters: put `*,` at beginning
@@ -1022,29 +1159,16 @@ def matchProps(*,
     # https://stackoverflow.com/questions/406230/\
         # regular-expression-to-match-a-line-that-doesnt-contain-a-word
 
-    global MAX_MATCHPROPS_ITERATIONS_REACHED
-    global total_matchProps_iterations
-
-    # Return `False` immediately if screen does not have focus (e.g. Synergy),
-    # but only after the guard clauses have had a chance to evaluate on
-    # all possible uses of the function that may exist in the config.
-    if MAX_MATCHPROPS_ITERATIONS_REACHED and not cnfg.screen_has_focus:
-        return False
-
-    if total_matchProps_iterations >= MAX_MATCHPROPS_ITERATIONS:
-        MAX_MATCHPROPS_ITERATIONS_REACHED = True
-        bypass_guard_clauses = True
-    else:
-        total_matchProps_iterations += 1
-        current_timestamp = time.time()
-
-        # 'STARTUP_TIMESTAMP' is a global variable, set when config is executed
-        time_elapsed = current_timestamp - STARTUP_TIMESTAMP
-
-        # Bypass all guard clauses if more than a few seconds have passed since keymapper 
-        # started and loaded the config file. Inputs never change until keymapper 
-        # restarts and reloads the config file, so we don't need to keep checking.
-        bypass_guard_clauses = time_elapsed > 6
+    # Return the already constructed closure if matchProps() has seen these arguments before.
+    # An unhashable argument (a mistake) falls through to the guard clauses to be reported.
+    try:
+        cache_key = (   clas, name, devn, not_clas, not_name, not_devn, numlk, capslk, cse,
+                        _freeze_matchProps_arg(lst), _freeze_matchProps_arg(not_lst), dbg )
+        return _matchProps_cache[cache_key]
+    except KeyError:
+        pass
+    except TypeError:
+        cache_key = None
 
     logging_enabled = False
 
@@ -1054,29 +1178,24 @@ def matchProps(*,
                         numlk, capslk, cse)
     string_params   = (clas, name, devn, not_clas, not_name, not_devn, dbg)
 
-    # This was using up a lot of CPU time, actually. Bad idea. 
-    # dct_param_strs  = list(inspect.signature(matchProps).parameters.keys())
-
-    # Static list of parameter names. Using this instead of `inspect` cuts CPU 
-    # usage considerably, for reasons I don't yet understand. Apparently the
-    # keymapper is actually running the entire function again on each key 
-    # press and release, rather than just re-evaluating the inner closure.
+    # Static list of parameter names (using `inspect` for this was very slow)
     dct_param_strs = [
         'clas', 'name', 'devn', 'not_clas', 'not_name', 'not_devn',
         'numlk', 'capslk', 'cse', 'lst', 'not_lst', 'dbg'
     ]
 
-    if not MAX_MATCHPROPS_ITERATIONS_REACHED or not bypass_guard_clauses:
-        if all([x is None for x in allowed_params]): 
-            raise ValueError(f"\n\n(EE) matchProps(): Received no valid argument\n")
-        if any([x not in (True, False, None) for x in (numlk, capslk, cse)]): 
-            raise TypeError(f"\n\n(EE) matchProps(): Params 'numlk|capslk|cse' are bools\n")
-        if any([x is not None and not isinstance(x, str) for x in string_params]):
-            raise TypeError(    f"\n\n(EE) matchProps(): These parameters must be strings:"
-                                f"\n\t'clas|name|devn|not_clas|not_name|not_devn|dbg'\n")
-        if clas and not_clas or name and not_name or devn and not_devn or lst and not_lst:
-            raise ValueError(   f"\n\n(EE) matchProps(): Do not mix positive and "
-                                f"negative match params for same property\n")
+    # Guard clauses only need to run once for each unique set of arguments now, 
+    # since the result gets cached below.
+    if all([x is None for x in allowed_params]): 
+        raise ValueError(f"\n\n(EE) matchProps(): Received no valid argument\n")
+    if any([x not in (True, False, None) for x in (numlk, capslk, cse)]): 
+        raise TypeError(f"\n\n(EE) matchProps(): Params 'numlk|capslk|cse' are bools\n")
+    if any([x is not None and not isinstance(x, str) for x in string_params]):
+        raise TypeError(    f"\n\n(EE) matchProps(): These parameters must be strings:"
+                            f"\n\t'clas|name|devn|not_clas|not_name|not_devn|dbg'\n")
+    if clas and not_clas or name and not_name or devn and not_devn or lst and not_lst:
+        raise ValueError(   f"\n\n(EE) matchProps(): Do not mix positive and "
+                            f"negative match params for same property\n")
 
     # consolidate positive and negative matching params into new vars
     # only one should be in use at a time (checked above)
@@ -1088,68 +1207,135 @@ def matchProps(*,
     # process lists of conditions
     if _lst is not None:
 
-        if not MAX_MATCHPROPS_ITERATIONS_REACHED or not bypass_guard_clauses:
-            if any([x is not None for x in lst_dct_params]): 
-                raise TypeError(f"\n\n(EE) matchProps(): Param 'lst|not_lst' must be used alone\n")
-            if not isinstance(_lst, list) or not all(isinstance(item, dict) for item in _lst): 
-                raise TypeError(
-                    f"\n\n(EE) matchProps(): Param 'lst|not_lst' wants a [list] of {{dicts}}\n")
-            # verify that every {dict} in [list of dicts] only contains valid parameter names
-            for dct in _lst:
-                for param in list(dct.keys()):
-                    if param not in dct_param_strs:
-                        error(f"matchProps(): Invalid parameter: '{param}'")
-                        error(f"Invalid parameter is in this dict: \n\t{dct}")
-                        error(f"Dict is in this list:")
-                        for item in _lst:
-                            print(f"\t{item}")
-                        raise ValueError(
-                            f"\n(EE) matchProps(): Invalid parameter found in dict in list. "
-                            f"See log output before traceback.\n")
-
-        def _matchProps_Lst(ctx: KeyContext):
-            if not cnfg.screen_has_focus:
-                return False
-            if not_lst is not None:
-                if logging_enabled: print(f"## _matchProps_Lst()[not_lst] ## {dbg=}")
-                return not any(matchProps(**dct)(ctx) for dct in not_lst)
-            else:
-                if logging_enabled: print(f"## _matchProps_Lst()[lst] ## {dbg=}")
-                return any(matchProps(**dct)(ctx) for dct in lst)
-
-        return _matchProps_Lst      # outer function returning inner function
-
-    # compile case insensitive regex object for given params, unless cse=True
-    if _clas is not None: clas_rgx = re.compile(_clas, 0 if cse else re.I)
-    if _name is not None: name_rgx = re.compile(_name, 0 if cse else re.I)
-    if _devn is not None: devn_rgx = re.compile(_devn, 0 if cse else re.I)
-
-    def _matchProps(ctx: KeyContext):
-        if not cnfg.screen_has_focus:
-            return False
+        if any([x is not None for x in lst_dct_params]): 
+            raise TypeError(f"\n\n(EE) matchProps(): Param 'lst|not_lst' must be used alone\n")
+        if not isinstance(_lst, list) or not all(isinstance(item, dict) for item in _lst): 
+            raise TypeError(
+                f"\n\n(EE) matchProps(): Param 'lst|not_lst' wants a [list] of {{dicts}}\n")
+        # verify that every {dict} in [list of dicts] only contains valid parameter names
+        for dct in _lst:
+            for param in list(dct.keys()):
+                if param not in dct_param_strs:
+                    error(f"matchProps(): Invalid parameter: '{param}'")
+                    error(f"Invalid parameter is in this dict: \n\t{dct}")
+                    error(f"Dict is in this list:")
+                    for item in _lst:
+                        print(f"\t{item}")
+                    raise ValueError(
+                        f"\n(EE) matchProps(): Invalid parameter found in dict in list. "
+                        f"See log output before traceback.\n")
+
+        # Precompile the list into a flat tuple of "terms" (an OR of ANDs), once. The dicts
+        # that only hold a nested positive 'lst' get their terms flattened into this list.
+        # Each term is the matching part of a cached matchProps() closure, so identical
+        # dicts (and their compiled patterns) are shared between lists.
+        def _flatten_terms(lst_of_dcts: List[Dict]) -> List[Callable[[KeyContext], bool]]:
+            terms = []
+            for dct in lst_of_dcts:
+                if list(dct.keys()) == ['lst']:
+                    terms.extend(_flatten_terms(dct['lst']))
+                else:
+                    terms.append(matchProps(**dct).term)
+            return terms
+
+        lst_terms = tuple(_flatten_terms(_lst))
+        lst_negated = not_lst is not None
+
+        def _match_lst_terms(ctx: KeyContext):
+            if logging_enabled:
+                print(f"## _matchProps_Lst()[{'not_lst' if lst_negated else 'lst'}] ## {dbg=}")
+            for term in lst_terms:
+                if term(ctx):
+                    return not lst_negated
+            return lst_negated
+
+        _match_lst_terms.term = _match_lst_terms
+        if cache_key is not None:
+            _matchProps_cache[cache_key] = _match_lst_terms
+        return _match_lst_terms      # outer function returning inner function
+
+    # compile case insensitive matcher function for given params, unless cse=True
+    # (patterns that are only "^name$|^name$" alternations become a set membership test)
+    if _clas is not None: clas_matcher = compile_matcher(_clas, cse)
+    if _name is not None: name_matcher = compile_matcher(_name, cse)
+    if _devn is not None: devn_matcher = compile_matcher(_devn, cse)
+
+    # a match result that is the same as the "negated" flag means the condition fails
+    clas_negated    = not_clas is not None
+    name_negated    = not_name is not None
+    devn_negated    = not_devn is not None
+    nt_err          = 'ERR: matchProps: NoneType in ctx.'
+
+    def _match_term_logged(ctx: KeyContext):
         cond_list       = []
-        nt_err          = 'ERR: matchProps: NoneType in ctx.'
         if _clas is not None:
-            clas_match = re.search(clas_rgx, ctx.wm_class or nt_err + 'wm_class')
-            cond_list.append(not clas_match if not_clas is not None else clas_match)
+            clas_match = clas_matcher(ctx.wm_class or nt_err + 'wm_class')
+            cond_list.append(not clas_match if clas_negated else clas_match)
         if _name is not None:
-            name_match = re.search(name_rgx, ctx.wm_name or nt_err + 'wm_name')
-            cond_list.append(not name_match if not_name is not None else name_match)
+            name_match = name_matcher(ctx.wm_name or nt_err + 'wm_name')
+            cond_list.append(not name_match if name_negated else name_match)
         if _devn is not None:
-            devn_match = re.search(devn_rgx, ctx.device_name or nt_err + 'device_name')
-            cond_list.append(not devn_match if not_devn is not None else devn_match)
-        # these two MUST check explicitly for "is not None" because external input is True/False,
-        # and we want to be able to match the LED_on state of either "True" or "False"
+            devn_match = devn_matcher(ctx.device_name or nt_err + 'device_name')
+            cond_list.append(not devn_match if devn_negated else devn_match)
         if numlk is not None: cond_list.append( numlk is ctx.numlock_on  )
         if capslk is not None: cond_list.append( capslk is ctx.capslock_on )
-        if logging_enabled: # and all(cnd_lst): # << add this to show only "True" condition lists
-            print(f'####  CND_LST ({all(cond_list)})  ####  {dbg=}')
-            for elem in cond_list:
-                print('##', re.sub(r'^.*span=.*\), ', '', str(elem)).replace('>',''))
-            print('-------------------------------------------------------------------')
+        print(f'####  CND_LST ({all(cond_list)})  ####  {dbg=}')
+        for elem in cond_list:
+            print('##', re.sub(r'^.*span=.*\), ', '', str(elem)).replace('>',''))
+        print('-------------------------------------------------------------------')
         return all(cond_list)
 
-    return _matchProps      # outer function returning inner function
+    # Short-circuits on the first failed condition, and allocates nothing per event
+    def _match_term(ctx: KeyContext):
+        if logging_enabled:
+            return _match_term_logged(ctx)
+        if _clas is not None:
+            if clas_matcher(ctx.wm_class or nt_err + 'wm_class') is clas_negated:
+                return False
+        if _name is not None:
+            if name_matcher(ctx.wm_name or nt_err + 'wm_name') is name_negated:
+                return False
+        if _devn is not None:
+            if devn_matcher(ctx.device_name or nt_err + 'device_name') is devn_negated:
+                return False
+        # these two MUST check explicitly for "is not None" because external input is True/False,
+        # and we want to be able to match the LED_on state of either "True" or "False"
+        if numlk is not None and numlk is not ctx.numlock_on:
+            return False
+        if capslk is not None and capslk is not ctx.capslock_on:
+            return False
+        return True
+
+    _match_term.term = _match_term
+    if cache_key is not None:
+        _matchProps_cache[cache_key] = _match_term
+    return _match_term      # outer function returning inner function
+
+
+_matchGroups_cache: Dict[Tuple[int, int], Callable[[KeyContext], bool]] = {}
+
+
+def matchGroups(*, grp: int = 0, not_grp: int = 0) -> Callable[[KeyContext], bool]:
+    """
+    Match the window class against the app groups of the `app_groups` classifier.   \n
+    - `grp`     = bits of groups, matches if class is in ANY of them (`GRP_A | GRP_B`)  \n
+    - `not_grp` = bits of groups, matches if class is in NONE of them               \n
+    Same as `matchProps(clas=...)`/`matchProps(not_clas=...)` with the group regex  \n
+    pattern strings, but the window class only gets classified once.                \n
+    """
+    try:
+        return _matchGroups_cache[(grp, not_grp)]
+    except KeyError:
+        pass
+    if not grp and not not_grp:
+        raise ValueError(f"\n\n(EE) matchGroups(): Received no valid argument\n")
+
+    def _matchGroups(ctx: KeyContext):
+        mask = app_groups.classify(ctx.wm_class)
+        return (not grp or bool(mask & grp)) and not mask & not_grp
+
+    _matchGroups_cache[(grp, not_grp)] = _matchGroups
+    return _matchGroups
 
 
 # Boolean variable to toggle Enter key state between F2 and Enter
@@ -1183,6 +1369,7 @@ def iEF2(combo_if_true, latch_or_combo_if_false,
     """
     def _is_Enter_F2():
         global _enter_is_F2
+        _enter_is_F2_prev = _enter_is_F2
         combo_list = [combo_if_true]
         if latch_or_combo_if_false in (True, False):    # Latch variable to given bool value
             _enter_is_F2 = latch_or_combo_if_false
@@ -1193,6 +1380,8 @@ def iEF2(combo_if_true, latch_or_combo_if_false,
             combo_list = [latch_or_combo_if_false]
             if keep_value_if_false is False:
                 _enter_is_F2 = True
+        if _enter_is_F2 != _enter_is_F2_prev:
+            cond_cache.invalidate()
         debug(f"_is_Enter_F2:  {combo_list      = }")
         debug(f"_is_Enter_F2:  {_enter_is_F2    = }")
         return combo_list
@@ -1221,6 +1410,17 @@ def macro_tester():
     return _macro_tester
 
 
+def dump_condition_profile():
+    """Dump the report of the condition profiler (if enabled) to the log and report file."""
+    def _dump_condition_profile(ctx: KeyContext):
+        if not cond_profiler.enabled:
+            ntfy.send_notification("Condition profiling is not enabled.", icon_file_grayscale)
+            return
+        cond_profiler.dump(reason='Diagnostics keymap')
+        ntfy.send_notification(f"Condition profile written to:\n{cond_profiler.report_path}")
+    return _dump_condition_profile
+
+
 def is_valid_command(command):
     """Check if the command path is valid and executable"""
     return command and os.path.isfile(command) and os.access(command, os.X_OK)
@@ -1244,20 +1444,21 @@ if not zenity_cmd:
 
 debug(f"Zenity command path: '{zenity_cmd}'")
 
-zenity_icon_option = None
+if not zenity_cmd:
+    error('ERR: Zenity command is missing! Diagnostic dialog not available!')
+
 
-if zenity_cmd:
+def probe_zenity_icon_option(cmd_path: str):
+    """Find which icon option (if any) the zenity command supports"""
     try:
-        zenity_help_output = subprocess.check_output([zenity_cmd, '--help-info'])
-        help_text = str(zenity_help_output)
+        help_text = str(subprocess.check_output([cmd_path, '--help-info']))
         if '--icon=' in help_text:
-            zenity_icon_option = '--icon=toshy_app_icon_rainbow'
+            return '--icon=toshy_app_icon_rainbow'
         elif '--icon-name=' in help_text:
-            zenity_icon_option = '--icon-name=toshy_app_icon_rainbow'
-    except subprocess.CalledProcessError:
+            return '--icon-name=toshy_app_icon_rainbow'
+    except (subprocess.CalledProcessError, OSError):
         pass  # zenity --help-info failed, assume icon is not supported
-else:
-    error('ERR: Zenity command is missing! Diagnostic dialog not available!')
+    return None
 
 
 def notify_context():
@@ -1290,11 +1491,11 @@ def notify_context():
         ctx_devn        = ctx.device_name
 
         # ------ following are all True/False
-        ctx_term        = matchProps(clas=termStr           )(ctx)
-        ctx_rmte        = matchProps(clas=remoteStr         )(ctx)
-        ctx_fmgr        = matchProps(clas=filemanagerStr    )(ctx)
-        ctx_brws        = matchProps(clas=browsers_allStr   )(ctx)
-        ctx_vscd        = matchProps(clas=vscodeStr         )(ctx)
+        ctx_term        = matchGroups(grp=GRP_TERMINALS     )(ctx)
+        ctx_rmte        = matchGroups(grp=GRP_REMOTES       )(ctx)
+        ctx_fmgr        = matchGroups(grp=GRP_FILEMANAGERS  )(ctx)
+        ctx_brws        = matchGroups(grp=GRP_BROWSERS_ALL  )(ctx)
+        ctx_vscd        = matchGroups(grp=GRP_VSCODES       )(ctx)
 
         if matchProps(lst=dialogs_CloseWin_lod)(ctx) or matchProps(lst=dialogs_Escape_lod)(ctx):
             ctx_dlgs        = True
@@ -1337,9 +1538,14 @@ def notify_context():
                             '--title=Toshy Context Info',
                             '--text=' + message ]
 
-        # insert the icon argument if it's supported
-        if zenity_icon_option is not None:
-            zenity_cmd_lst.insert(3, zenity_icon_option)
+        def show_zenity_dialog():
+            # insert the icon argument if it's supported (probed on first use, result
+            # cached on disk), the probe can take a while so this runs in a thread
+            zenity_icon_option = probe_cache.probe('zenity icon option', zenity_cmd,
+                                                    probe_zenity_icon_option)
+            if zenity_icon_option is not None:
+                zenity_cmd_lst.insert(3, zenity_icon_option)
+            subprocess.Popen(zenity_cmd_lst, cwd=icons_dir, stderr=DEVNULL, stdout=DEVNULL)
 
         kdialog_cmd_lst = [kdialog_cmd, '--msgbox', message, '--title', 'Toshy Context Info']
         # Add icon if needed: kdialog_cmd_lst += ['--icon', '/path/to/icon']
@@ -1350,7 +1556,8 @@ def notify_context():
         if dialog_cmd == kdialog_cmd:
             subprocess.Popen(kdialog_cmd_lst, cwd=icons_dir, stderr=DEVNULL, stdout=DEVNULL)
         elif dialog_cmd == zenity_cmd:
-            subprocess.Popen(zenity_cmd_lst, cwd=icons_dir, stderr=DEVNULL, stdout=DEVNULL)
+            threading.Thread(target=show_zenity_dialog, name='toshy-context-dialog',
+                                daemon=True).start()
 
         # Optionally, also send a system notification:
         # ntfy.send_notification(message)
@@ -1436,10 +1643,99 @@ def toggle_and_show_numlock_state(ctx: KeyContext):
 ###                                                                          ###
 ###                                                                          ###
 ################################################################################
+startup_profiler.phase('MODMAPS')
 ### Modmaps turn a key into a different key as long as the modmap is active
 ### The modified key can be used in shortcut combos as the new key
 
 
+# Wrap the keymapper API functions that take a `when` condition, so that every condition
+# in the config is served from the condition cache. Conditions with side effects must be
+# marked with `uncached()` to run on every event. Conditions in the user slices are not
+# cached unless marked with `cached()` (see the note before the "user_apps" slice).
+# The condition profiler (if enabled) wraps the outside, to measure the real cost.
+_api_modmap                 = modmap
+_api_multipurpose_modmap    = multipurpose_modmap
+_api_keymap                 = keymap
+
+
+def modmap(name, mappings, when=None):
+    return _api_modmap(name, mappings,
+                        when=cond_profiler.register('modmap', name, cond_cache.register(when)))
+
+
+def multipurpose_modmap(name, mappings, when=None):
+    return _api_multipurpose_modmap(name, mappings,
+                        when=cond_profiler.register('multipurpose_modmap', name, cond_cache.register(when)))
+
+
+def keymap(name, mappings, when=None):
+    return _api_keymap(name, mappings,
+                        when=cond_profiler.register('keymap', name, cond_cache.register(when)))
+
+
+# Environment specific (distro/DE) overrides of a base keymap like "General GUI" get
+# collected here at load time, and merged into the base keymap's dict when it is
+# registered with `with_overrides()`, instead of becoming separate keymaps that
+# evaluate a copy of the same condition on every key event.
+_keymap_overrides: Dict[str, List[Tuple[str, Dict]]] = {}
+_merged_keymaps: List[str] = []
+
+
+def keymap_override(base_name: str, name: str, mappings: Dict):
+    """
+    Collect a dict of overrides for the base keymap `base_name`. Must come before
+    the base keymap is registered. Combos are merged by equality, so an override
+    must use the same combo notation as the base keymap (`RC-` vs `C-`, etc.).
+    """
+    if base_name in _merged_keymaps:
+        error(f"Keymap override '{name}' comes after base keymap '{base_name}'. Ignored.")
+        return
+    _keymap_overrides.setdefault(base_name, []).append((name, mappings))
+
+
+def with_overrides(base_name: str, mappings: Dict) -> Dict:
+    """
+    Merge the collected overrides into the dict of the base keymap `base_name`.
+    Earlier overrides win over later ones, and all overrides win over the base dict,
+    same as when they were separate keymaps registered ahead of the base keymap.
+    """
+    _merged_keymaps.append(base_name)
+    overrides = _keymap_overrides.pop(base_name, [])
+    merged_mappings = {}
+    for _, override_mappings in overrides:
+        for combo, output in override_mappings.items():
+            merged_mappings.setdefault(combo, output)
+    for combo, output in mappings.items():
+        merged_mappings.setdefault(combo, output)
+    if overrides:
+        debug(f"Merged overrides into '{base_name}': {[name for name, _ in overrides]}", ctx="CG")
+    return merged_mappings
+
+
+def _poll_settings_snapshot(ctx):
+    """Apply preference changes published by the tray/GUI. Always returns False."""
+    cnfg.poll_snapshot()
+    return False
+
+
+# DO NOT REMOVE THIS MODMAP AND KEYMAP!
+# Special modmap/keymap to pick up preference changes before any other 
+# condition gets evaluated, on any modifier key or non-modifier key press.
+modmap("Settings Snapshot Trigger Modmap", {
+    Key.LEFT_META:              Key.LEFT_META,
+    Key.RIGHT_META:             Key.RIGHT_META,
+    Key.LEFT_ALT:               Key.LEFT_ALT,
+    Key.RIGHT_ALT:              Key.RIGHT_ALT,
+    Key.LEFT_CTRL:              Key.LEFT_CTRL,
+    Key.RIGHT_CTRL:             Key.RIGHT_CTRL,
+    Key.LEFT_SHIFT:             Key.LEFT_SHIFT,
+    Key.RIGHT_SHIFT:            Key.RIGHT_SHIFT,
+}, when = uncached(_poll_settings_snapshot) )   # THIS CONDITIONAL MUST EVALUATE TO FALSE ALWAYS!
+keymap("Settings Snapshot Trigger Keymap", {
+    # Nothing needed here.
+}, when = uncached(_poll_settings_snapshot) )
+
+
 # DO NOT REMOVE THIS MODMAP AND KEYMAP!
 # Special modmap to trigger the evaluation of the keyboard type when 
 # any modifier key is pressed
@@ -1457,12 +1753,12 @@ modmap("Keyboard Type Trigger Modmap", {
     Key.RIGHT_CTRL:             Key.RIGHT_CTRL,
     Key.LEFT_SHIFT:             Key.LEFT_SHIFT,
     Key.RIGHT_SHIFT:            Key.RIGHT_SHIFT,
-}, when = lambda ctx: getKBtype()(ctx) )    # THIS CONDITIONAL MUST EVALUATE TO FALSE ALWAYS!
+}, when = uncached(getKBtype()) )   # THIS CONDITIONAL MUST EVALUATE TO FALSE ALWAYS!
 # Special keymap to trigger the evaluation of the keyboard type when 
 # any non-modifier key is pressed
 keymap("Keyboard Type Trigger Keymap", {
     # Nothing needed here.
-}, when = lambda ctx: getKBtype()(ctx) )
+}, when = uncached(getKBtype()) )
 
 
 modmap("Cond modmap - Media Arrows Fix",{
@@ -1473,8 +1769,7 @@ modmap("Cond modmap - Media Arrows Fix",{
     Key.NEXTSONG:               Key.END,
 }, when = lambda ctx:
     cnfg.media_arrows_fix and
-    cnfg.screen_has_focus and
-    matchProps(not_clas=remoteStr)(ctx)
+    matchGroups(not_grp=GRP_REMOTES)(ctx)
 )
 
 
@@ -1538,7 +1833,7 @@ modmap("Cond modmap - Forced Numpad feature",{
 }, when = lambda ctx:
     cnfg.forced_numpad and
     matchProps(not_clas=exclude_kpad_devs_Str)(ctx) and
-    matchProps(not_clas=remoteStr)(ctx)
+    matchGroups(not_grp=GRP_REMOTES)(ctx)
 )
 
 
@@ -1563,7 +1858,7 @@ modmap("Cond modmap - GTK3 numpad nav keys fix",{
     not cnfg.forced_numpad and
     matchProps(numlk=False)(ctx) and
     matchProps(not_clas=exclude_kpad_devs_Str)(ctx) and
-    matchProps(not_clas=remoteStr)(ctx)
+    matchGroups(not_grp=GRP_REMOTES)(ctx)
 )
 
 
@@ -1578,7 +1873,7 @@ multipurpose_modmap("Enter2Cmd", {
     Key.ENTER:                  [Key.ENTER, Key.RIGHT_CTRL]     # Enter2Cmd
 }, when = lambda ctx:
     cnfg.Enter2Ent_Cmd and
-    matchProps(not_clas=remoteStr)(ctx)
+    matchGroups(not_grp=GRP_REMOTES)(ctx)
 )
 
 multipurpose_modmap("Caps2Esc - not Chromebook kbd", {
@@ -1586,7 +1881,7 @@ multipurpose_modmap("Caps2Esc - not Chromebook kbd", {
 }, when = lambda ctx:
     cnfg.Caps2Esc_Cmd and
     not isKBtype('Chromebook')(ctx) and
-    matchProps(not_clas=remoteStr)(ctx)
+    matchGroups(not_grp=GRP_REMOTES)(ctx)
 )
 
 multipurpose_modmap("Caps2Esc - Chromebook kbd", {
@@ -1594,7 +1889,7 @@ multipurpose_modmap("Caps2Esc - Chromebook kbd", {
 }, when = lambda ctx:
     cnfg.Caps2Esc_Cmd and
     isKBtype('Chromebook')(ctx) and
-    matchProps(not_clas=remoteStr)(ctx)
+    matchGroups(not_grp=GRP_REMOTES)(ctx)
 )
 
 
@@ -1623,14 +1918,14 @@ modmap("Cond modmap - GUI - Caps2Cmd - not Cbk kdb", {
 }, when = lambda ctx:
     cnfg.Caps2Cmd and
     not isKBtype('Chromebook')(ctx) and
-    matchProps(not_clas=terms_and_remotes_Str)(ctx)
+    matchGroups(not_grp=GRP_TERMINALS | GRP_REMOTES)(ctx)
 )
 modmap("Cond modmap - GUI - Caps2Cmd - Cbk kdb", {
     Key.LEFT_META:              Key.RIGHT_CTRL,                 # Caps2Cmd - Chromebook
 }, when = lambda ctx:
     cnfg.Caps2Cmd and
     isKBtype('Chromebook')(ctx) and
-    matchProps(not_clas=terms_and_remotes_Str)(ctx)
+    matchGroups(not_grp=GRP_TERMINALS | GRP_REMOTES)(ctx)
 )
 modmap("Cond modmap - GUI - IBM kbd - multi_lang OFF", {
     # - IBM
@@ -1639,7 +1934,7 @@ modmap("Cond modmap - GUI - IBM kbd - multi_lang OFF", {
 }, when = lambda ctx:
     not cnfg.multi_lang and
     isKBtype('IBM', map='mmap GUI IBM ML-OFF')(ctx) and 
-    matchProps(not_clas=terms_and_remotes_Str)(ctx)
+    matchGroups(not_grp=GRP_TERMINALS | GRP_REMOTES)(ctx)
 )
 modmap("Cond modmap - GUI - IBM kbd", {
     # - IBM
@@ -1648,7 +1943,7 @@ modmap("Cond modmap - GUI - IBM kbd", {
     Key.LEFT_ALT:               Key.RIGHT_CTRL,                 # IBM
 }, when = lambda ctx:
     isKBtype('IBM', map='mmap GUI IBM')(ctx) and
-    matchProps(not_clas=terms_and_remotes_Str)(ctx)
+    matchGroups(not_grp=GRP_TERMINALS | GRP_REMOTES)(ctx)
 )
 modmap("Cond modmap - GUI - Cbk kbd - multi_lang OFF", {
     # - Chromebook
@@ -1657,7 +1952,7 @@ modmap("Cond modmap - GUI - Cbk kbd - multi_lang OFF", {
 }, when = lambda ctx:
     not cnfg.multi_lang and
     isKBtype('Chromebook', map='mmap GUI Cbk ML-OFF')(ctx) and
-    matchProps(not_clas=terms_and_remotes_Str)(ctx)
+    matchGroups(not_grp=GRP_TERMINALS | GRP_REMOTES)(ctx)
 )
 modmap("Cond modmap - GUI - Cbk kbd", {
     # - Chromebook
@@ -1665,7 +1960,7 @@ modmap("Cond modmap - GUI - Cbk kbd", {
     Key.LEFT_ALT:               Key.RIGHT_CTRL,                 # Chromebook
 }, when = lambda ctx:
     isKBtype('Chromebook', map='mmap GUI Cbk')(ctx) and
-    matchProps(not_clas=terms_and_remotes_Str)(ctx)
+    matchGroups(not_grp=GRP_TERMINALS | GRP_REMOTES)(ctx)
 )
 modmap("Cond modmap - GUI - Win kbd - multi_lang OFF", {
     # - Default Mac/Win
@@ -1676,7 +1971,7 @@ modmap("Cond modmap - GUI - Win kbd - multi_lang OFF", {
 }, when = lambda ctx:
     not cnfg.multi_lang and
     isKBtype('Windows', map='mmap GUI Win ML-OFF')(ctx) and
-    matchProps(not_clas=terms_and_remotes_Str)(ctx)
+    matchGroups(not_grp=GRP_TERMINALS | GRP_REMOTES)(ctx)
 )
 modmap("Cond modmap - GUI - Win kbd", {
     # - Default Mac/Win
@@ -1686,7 +1981,7 @@ modmap("Cond modmap - GUI - Win kbd", {
     Key.LEFT_ALT:               Key.RIGHT_CTRL,                 # WinMac
 }, when = lambda ctx:
     isKBtype('Windows', map='mmap GUI Win')(ctx) and
-    matchProps(not_clas=terms_and_remotes_Str)(ctx)
+    matchGroups(not_grp=GRP_TERMINALS | GRP_REMOTES)(ctx)
 )
 modmap("Cond modmap - GUI - Mac kbd - multi_lang OFF", {
     # - Mac Only
@@ -1695,7 +1990,7 @@ modmap("Cond modmap - GUI - Mac kbd - multi_lang OFF", {
 }, when = lambda ctx:
     not cnfg.multi_lang and
     isKBtype('Apple', map='mmap GUI Apple ML-OFF')(ctx) and
-    matchProps(not_clas=terms_and_remotes_Str)(ctx)
+    matchGroups(not_grp=GRP_TERMINALS | GRP_REMOTES)(ctx)
 )
 modmap("Cond modmap - GUI - Mac kbd", {
     # - Mac Only
@@ -1703,7 +1998,7 @@ modmap("Cond modmap - GUI - Mac kbd", {
     Key.LEFT_META:              Key.RIGHT_CTRL,                 # Mac
 }, when = lambda ctx:
     isKBtype('Apple', map='mmap GUI Apple')(ctx) and
-    matchProps(not_clas=terms_and_remotes_Str)(ctx)
+    matchGroups(not_grp=GRP_TERMINALS | GRP_REMOTES)(ctx)
 )
 
 
@@ -1714,7 +2009,7 @@ modmap("Cond modmap - Terms - IBM kbd - multi_lang OFF", {
 }, when = lambda ctx:
     not cnfg.multi_lang and
     isKBtype('IBM', map='mmap terms IBM ML-OFF')(ctx) and
-    matchProps(clas=termStr)(ctx)
+    matchGroups(grp=GRP_TERMINALS)(ctx)
 )
 modmap("Cond modmap - Terms - IBM kbd", {
     # - IBM
@@ -1725,7 +2020,7 @@ modmap("Cond modmap - Terms - IBM kbd", {
     Key.RIGHT_CTRL:             Key.RIGHT_ALT,                  # IBM
 }, when = lambda ctx:
     isKBtype('IBM', map='mmap terms IBM')(ctx) and
-    matchProps(clas=termStr)(ctx)
+    matchGroups(grp=GRP_TERMINALS)(ctx)
 )
 modmap("Cond modmap - Terms - Cbk kbd - multi_lang OFF", {
     # - Chromebook
@@ -1733,7 +2028,7 @@ modmap("Cond modmap - Terms - Cbk kbd - multi_lang OFF", {
 }, when = lambda ctx:
     not cnfg.multi_lang and
     isKBtype('Chromebook', map='mmap terms Cbk ML-OFF')(ctx) and
-    matchProps(clas=termStr)(ctx)
+    matchGroups(grp=GRP_TERMINALS)(ctx)
 )
 modmap("Cond modmap - Terms - Cbk kbd", {
     # - Chromebook
@@ -1744,7 +2039,7 @@ modmap("Cond modmap - Terms - Cbk kbd", {
     Key.RIGHT_CTRL:             Key.RIGHT_ALT,                  # Chromebook
 }, when = lambda ctx:
     isKBtype('Chromebook', map='mmap terms Cbk')(ctx) and
-    matchProps(clas=termStr)(ctx)
+    matchGroups(grp=GRP_TERMINALS)(ctx)
 )
 modmap("Cond modmap - Terms - Win kbd - multi_lang OFF", {
     # - Default Mac/Win
@@ -1755,7 +2050,7 @@ modmap("Cond modmap - Terms - Win kbd - multi_lang OFF", {
 }, when = lambda ctx:
     not cnfg.multi_lang and
     isKBtype('Windows', map='mmap terms Win ML-OFF')(ctx) and
-    matchProps(clas=termStr)(ctx)
+    matchGroups(grp=GRP_TERMINALS)(ctx)
 )
 modmap("Cond modmap - Terms - Win kbd", {
     # - Default Mac/Win
@@ -1765,7 +2060,7 @@ modmap("Cond modmap - Terms - Win kbd", {
     Key.LEFT_ALT:               Key.RIGHT_CTRL,                 # WinMac
 }, when = lambda ctx:
     isKBtype('Windows', map='mmap terms Win')(ctx) and
-    matchProps(clas=termStr)(ctx)
+    matchGroups(grp=GRP_TERMINALS)(ctx)
 )
 modmap("Cond modmap - Terms - Mac kbd - multi_lang OFF", {
     # - Mac Only
@@ -1775,7 +2070,7 @@ modmap("Cond modmap - Terms - Mac kbd - multi_lang OFF", {
 }, when = lambda ctx:
     not cnfg.multi_lang and
     isKBtype('Apple', map='mmap terms Apple ML-OFF')(ctx) and
-    matchProps(clas=termStr)(ctx)
+    matchGroups(grp=GRP_TERMINALS)(ctx)
 )
 modmap("Cond modmap - Terms - Mac kbd", {
     # - Mac Only
@@ -1786,12 +2081,13 @@ modmap("Cond modmap - Terms - Mac kbd", {
     Key.RIGHT_ALT:              Key.RIGHT_ALT,                  # Mac (self-modmap)
 }, when = lambda ctx:
     isKBtype('Apple', map='mmap terms Apple')(ctx) and
-    matchProps(clas=termStr)(ctx)
+    matchGroups(grp=GRP_TERMINALS)(ctx)
 )
 
 
 
 # Suggested location for adding custom modmaps for personal use.
+cond_cache.cache_by_default = False    # see the note before the "user_apps" slice
 ###################################################################################################
 ###  SLICE_MARK_START: user_custom_modmaps  ###  EDITS OUTSIDE THESE MARKS WILL BE LOST ON UPGRADE
 
@@ -1799,6 +2095,7 @@ modmap("Cond modmap - Terms - Mac kbd", {
 
 ###  SLICE_MARK_END: user_custom_modmaps  ###  EDITS OUTSIDE THESE MARKS WILL BE LOST ON UPGRADE
 ###################################################################################################
+cond_cache.cache_by_default = True
 
 
 
@@ -1813,6 +2110,7 @@ modmap("Cond modmap - Terms - Mac kbd", {
 ###                                                                 ###
 ###                                                                 ###
 #######################################################################
+startup_profiler.phase('FORCED NUMPAD')
 
 # Force the numpad to always be a numpad, like a Mac keyboard on macOS
 # Numlock key becomes "Clear" key for use with calculator (sends Escape)
@@ -1823,6 +2121,7 @@ modmap("Cond modmap - Terms - Mac kbd", {
 def toggle_forced_numpad():
     """Toggle the Forced Numpad feature on or off."""
     cnfg.forced_numpad = not cnfg.forced_numpad
+    cond_cache.invalidate()
     cnfg.save_settings()
     ntfy.forced_numpad(cnfg.forced_numpad)
 
@@ -1844,6 +2143,7 @@ def isNumlockClearKey():
 ###                                                                      ###
 ###                                                                      ###
 ############################################################################
+startup_profiler.phase('OPTSPECIALCHARS')
 
 ###########   START OF OPTION KEY SPECIAL CHARACTER ENTRY SCHEME    #############
 #################################################################################
@@ -1892,7 +2192,9 @@ def set_dead_key_char(hex_unicode_addr):
         # else:
         if hex_unicode_addr:
             _ac_Chr_copy = hex_unicode_addr
-        ac_Chr_main = hex_unicode_addr
+        if ac_Chr_main != hex_unicode_addr:
+            ac_Chr_main = hex_unicode_addr
+            cond_cache.invalidate()
     #
     return _set_dead_key_char
 
@@ -1976,766 +2278,41 @@ deadkeys_US = [
 deadkeys_list = []
 deadkeys_list.extend(deadkeys_ABC)
 deadkeys_list.extend(deadkeys_US)
+deadkeys_set = frozenset(deadkeys_list)
 
 
 #####################################
 ###   DEAD KEYS KEYMAPS - START   ###
 #####################################
-# Dead Keys conditional keymaps
-# only active when the dead key variable matches
-# and the layout variable matches (US or ABC)
-
-#################################################
-###  DEAD KEYS KEYMAPS - ABC EXTENDED LAYOUT  ###
-#################################################
-
-keymap("DK-ABC - Grave", {
-    # Option+Grave              {U+0060}
-    # Valid keys:
-    # a e i n o u v w y
-    # A E I N O U V W Y
-    C("A"):                     UC(0x00E0),                     # à Latin Small Letter A with Grave
-    C("E"):                     UC(0x00E8),                     # è Latin Small Letter E with Grave
-    C("I"):                     UC(0x00EC),                     # ì Latin Small Letter I with Grave
-    C("N"):                     UC(0x01F9),                     # ǹ Latin Small Letter N with Grave
-    C("O"):                     UC(0x00F2),                     # ò Latin Small Letter O with Grave
-    C("U"):                     UC(0x00F9),                     # ù Latin Small Letter U with Grave
-    C("V"):                     UC(0x01DC),                     # ǜ Latin Small Letter U w/Diaeresis and Grave
-    C("W"):                     UC(0x1E81),                     # ẁ Latin Small Letter W with Grave
-    C("Y"):                     UC(0x1EF3),                     # ỳ Latin Small Letter Y with Grave
-    C("Shift-A"):               UC(0x00C0),                     # À Latin Capital Letter A with Grave
-    C("Shift-E"):               UC(0x00C8),                     # È Latin Capital Letter E with Grave
-    C("Shift-I"):               UC(0x00CC),                     # Ì Latin Capital Letter I with Grave
-    C("Shift-N"):               UC(0x01F8),                     # Ǹ Latin Capital Letter N with Grave
-    C("Shift-O"):               UC(0x00D2),                     # Ò Latin Capital Letter O with Grave
-    C("Shift-U"):               UC(0x00D9),                     # Ù Latin Capital Letter U with Grave
-    C("Shift-V"):               UC(0x01DB),                     # Ǜ Latin Capital Letter U w/Diaeresis and Grave
-    C("Shift-W"):               UC(0x1E80),                     # Ẁ Latin Capital Letter W with Grave
-    C("Shift-Y"):               UC(0x1EF2),                     # Ỳ Latin Capital Letter Y with Grave
-}, when = lambda _: ac_Chr_main == 0x0060 and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Circumflex", {
-    # Option+6                  {U+02C6}
-    # Valid keys:
-    # a c e g h i j m n o s u w y z
-    # A C E G H I J M N O S U W Y Z
-    C("A"):                     UC(0x00E2),                     # â Latin Small Letter A with Circumflex
-    C("C"):                     UC(0x0109),                     # ĉ Latin Small Letter C with Circumflex
-    C("E"):                     UC(0x00EA),                     # ê Latin Small Letter E with Circumflex
-    C("G"):                     UC(0x011D),                     # ĝ Latin Small Letter G with Circumflex
-    C("H"):                     UC(0x0125),                     # ĥ Latin Small Letter H with Circumflex
-    C("I"):                     UC(0x00EE),                     # î Latin Small Letter I with Circumflex
-    C("J"):                     UC(0x0135),                     # ĵ Latin Small Letter J with Circumflex
-    C("M"):                    [UC(0x006D),UC(0x0302)],         # m̂ Latin Small Letter M with Circumflex
-    C("N"):                    [UC(0x006E),UC(0x0302)],         # n̂ Latin Small Letter N with Circumflex
-    C("O"):                     UC(0x00F4),                     # ô Latin Small Letter O with Circumflex
-    C("S"):                     UC(0x015D),                     # ŝ Latin Small Letter S with Circumflex
-    C("U"):                     UC(0x00FB),                     # û Latin Small Letter U with Circumflex
-    C("W"):                     UC(0x0175),                     # ŵ Latin Small Letter W with Circumflex
-    C("Y"):                     UC(0x0177),                     # ŷ Latin Small Letter Y with Circumflex
-    C("Z"):                     UC(0x1E91),                     # ẑ Latin Small Letter Z with Circumflex
-    C("Shift-A"):               UC(0x00C2),                     # Â Latin Capital Letter A with Circumflex
-    C("Shift-C"):               UC(0x0108),                     # Ĉ Latin Capital Letter C with Circumflex
-    C("Shift-E"):               UC(0x00CA),                     # Ê Latin Capital Letter E with Circumflex
-    C("Shift-G"):               UC(0x011C),                     # Ĝ Latin Capital Letter G with Circumflex
-    C("Shift-H"):               UC(0x0124),                     # Ĥ Latin Capital Letter H with Circumflex
-    C("Shift-I"):               UC(0x00CE),                     # Î Latin Capital Letter I with Circumflex
-    C("Shift-J"):               UC(0x0134),                     # Ĵ Latin Capital Letter J with Circumflex
-    C("Shift-M"):              [UC(0x004D),UC(0x0302)],         # M̂ Latin Capital Letter M with Circumflex
-    C("Shift-N"):              [UC(0x004E),UC(0x0302)],         # N̂ Latin Capital Letter N with Circumflex
-    C("Shift-O"):               UC(0x00D4),                     # Ô Latin Capital Letter O with Circumflex
-    C("Shift-S"):               UC(0x015C),                     # Ŝ Latin Capital Letter S with Circumflex
-    C("Shift-U"):               UC(0x00DB),                     # Û Latin Capital Letter U with Circumflex
-    C("Shift-W"):               UC(0x0174),                     # Ŵ Latin Capital Letter W with Circumflex
-    C("Shift-Y"):               UC(0x0176),                     # Ŷ Latin Capital Letter Y with Circumflex
-    C("Shift-Z"):               UC(0x1E90),                     # Ẑ Latin Capital Letter Z with Circumflex
-}, when = lambda _: ac_Chr_main == 0x02C6 and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Dot Above", {
-    # Option+W                  {U+02D9}
-    # Valid keys:
-    # a b c d e f g h i m n o p r s t w x y z
-    # A B C D E F G H I M N O P R S T W X Y Z
-    C("A"):                     UC(0x0227),                     # ȧ Latin Small Letter A with Dot Above
-    C("B"):                     UC(0x1E03),                     # ḃ Latin Small Letter B with Dot Above
-    C("C"):                     UC(0x010B),                     # ċ Latin Small Letter C with Dot Above
-    C("D"):                     UC(0x1E0B),                     # ḋ Latin Small Letter D with Dot Above
-    C("E"):                     UC(0x0117),                     # ė Latin Small Letter E with Dot Above
-    C("F"):                     UC(0x1E1F),                     # ḟ Latin Small Letter F with Dot Above
-    C("G"):                     UC(0x0121),                     # ġ Latin Small Letter G with Dot Above
-    C("H"):                     UC(0x1E23),                     # ḣ Latin Small Letter H with Dot Above
-    C("I"):                     UC(0x0131),                     # ı Latin Small Letter Dotless I
-    C("M"):                     UC(0x1E41),                     # ṁ Latin Small Letter M with Dot Above
-    C("N"):                     UC(0x1E45),                     # ṅ Latin Small Letter N with Dot Above
-    C("O"):                     UC(0x022F),                     # ȯ Latin Small Letter O with Dot Above
-    C("P"):                     UC(0x1E57),                     # ṗ Latin Small Letter P with Dot Above
-    C("R"):                     UC(0x1E59),                     # ṙ Latin Small Letter R with Dot Above
-    C("S"):                     UC(0x1E61),                     # ṡ Latin Small Letter S with Dot Above
-    C("T"):                     UC(0x1E6B),                     # ṫ Latin Small Letter T with Dot Above
-    C("W"):                     UC(0x1E87),                     # ẇ Latin Small Letter W with Dot Above
-    C("X"):                     UC(0x1E8B),                     # ẋ Latin Small Letter X with Dot Above
-    C("Y"):                     UC(0x1E8F),                     # ẏ Latin Small Letter Y with Dot Above
-    C("Z"):                     UC(0x017C),                     # ż Latin Small Letter Z with Dot Above
-    C("Shift-A"):               UC(0x0226),                     # Ȧ Latin Capital Letter A with Dot Above
-    C("Shift-B"):               UC(0x1E02),                     # Ḃ Latin Capital Letter B with Dot Above
-    C("Shift-C"):               UC(0x010A),                     # Ċ Latin Capital Letter C with Dot Above
-    C("Shift-D"):               UC(0x1E0A),                     # Ḋ Latin Capital Letter D with Dot Above
-    C("Shift-E"):               UC(0x0116),                     # Ė Latin Capital Letter E with Dot Above
-    C("Shift-F"):               UC(0x1E1E),                     # Ḟ Latin Capital Letter F with Dot Above
-    C("Shift-G"):               UC(0x0120),                     # Ġ Latin Capital Letter G with Dot Above
-    C("Shift-H"):               UC(0x1E22),                     # Ḣ Latin Capital Letter H with Dot Above
-    C("Shift-I"):               UC(0x0130),                     # İ Latin Capital Letter I with Dot Above
-    C("Shift-M"):               UC(0x1E40),                     # Ṁ Latin Capital Letter M with Dot Above
-    C("Shift-N"):               UC(0x1E44),                     # Ṅ Latin Capital Letter N with Dot Above
-    C("Shift-O"):               UC(0x022E),                     # Ȯ Latin Capital Letter O with Dot Above
-    C("Shift-P"):               UC(0x1E56),                     # Ṗ Latin Capital Letter P with Dot Above
-    C("Shift-R"):               UC(0x1E58),                     # Ṙ Latin Capital Letter R with Dot Above
-    C("Shift-S"):               UC(0x1E60),                     # Ṡ Latin Capital Letter S with Dot Above
-    C("Shift-T"):               UC(0x1E6A),                     # Ṫ Latin Capital Letter T with Dot Above
-    C("Shift-W"):               UC(0x1E86),                     # Ẇ Latin Capital Letter W with Dot Above
-    C("Shift-X"):               UC(0x1E8A),                     # Ẋ Latin Capital Letter X with Dot Above
-    C("Shift-Y"):               UC(0x1E8E),                     # Ẏ Latin Capital Letter Y with Dot Above
-    C("Shift-Z"):               UC(0x017B),                     # Ż Latin Capital Letter Z with Dot Above
-}, when = lambda _: ac_Chr_main == 0x02D9 and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Acute", {
-    # Option+E                  {U+00B4}
-    # Valid keys:
-    # a c e g i m n o p r s w y z
-    # A C E G I M N O P R S W Y Z
-    C("A"):                     UC(0x00E1),                     # á Latin Small Letter A with Acute
-    C("C"):                     UC(0x0107),                     # ć Latin Small Letter C with Acute
-    C("E"):                     UC(0x00E9),                     # é Latin Small Letter E with Acute
-    C("G"):                     UC(0x01F5),                     # ǵ Latin Small Letter G with Acute
-    C("I"):                     UC(0x00ED),                     # í Latin Small Letter I with Acute
-    C("M"):                     UC(0x1E3F),                     # ḿ Latin Small Letter M with Acute
-    C("N"):                     UC(0x0144),                     # ń Latin Small Letter N with Acute
-    C("O"):                     UC(0x00F3),                     # ó Latin Small Letter O with Acute
-    C("P"):                     UC(0x1E55),                     # ṕ Latin Small Letter P with Acute
-    C("R"):                     UC(0x0155),                     # ŕ Latin Small Letter R with Acute
-    C("S"):                     UC(0x015B),                     # ś Latin Small Letter S with Acute
-    C("W"):                     UC(0x1E83),                     # ẃ Latin Small Letter W with Acute
-    C("Y"):                     UC(0x00FD),                     # ý Latin Small Letter Y with Acute
-    C("Z"):                     UC(0x017A),                     # ź Latin Small Letter Z with Acute
-    C("Shift-A"):               UC(0x00C1),                     # Á Latin Capital Letter A with Acute
-    C("Shift-C"):               UC(0x0106),                     # Ć Latin Capital Letter C with Acute
-    C("Shift-E"):               UC(0x00C9),                     # É Latin Capital Letter E with Acute
-    C("Shift-G"):               UC(0x01F4),                     # Ǵ Latin Capital Letter G with Acute
-    C("Shift-I"):               UC(0x00CD),                     # Í Latin Capital Letter I with Acute
-    C("Shift-M"):               UC(0x1E3E),                     # Ḿ Latin Capital Letter M with Acute
-    C("Shift-N"):               UC(0x0143),                     # Ń Latin Capital Letter N with Acute
-    C("Shift-O"):               UC(0x00D3),                     # Ó Latin Capital Letter O with Acute
-    C("Shift-P"):               UC(0x1E54),                     # Ṕ Latin Capital Letter P with Acute
-    C("Shift-R"):               UC(0x0154),                     # Ŕ Latin Capital Letter R with Acute
-    C("Shift-S"):               UC(0x015A),                     # Ś Latin Capital Letter S with Acute
-    C("Shift-W"):               UC(0x1E82),                     # Ẃ Latin Capital Letter W with Acute
-    C("Shift-Y"):               UC(0x00DD),                     # Ý Latin Capital Letter Y with Acute
-    C("Shift-Z"):               UC(0x0179),                     # Ź Latin Capital Letter Z with Acute
-}, when = lambda _: ac_Chr_main == 0x00B4 and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Double Grave", {
-    # Shift+Option+Y            {U+030F} [uses {U+02F5} Modifier Letter Middle Double Grave Accent]
-    # Valid keys:
-    # a e i o r u
-    # A E I O R U
-    C("A"):                     UC(0x0201),                     # ȁ Latin Small Letter A with Double Grave
-    C("E"):                     UC(0x0205),                     # ȅ Latin Small Letter E with Double Grave
-    C("I"):                     UC(0x0209),                     # ȉ Latin Small Letter I with Double Grave
-    C("O"):                     UC(0x020D),                     # ȍ Latin Small Letter O with Double Grave
-    C("R"):                     UC(0x0211),                     # ȑ Latin Small Letter R with Double Grave
-    C("U"):                     UC(0x0215),                     # ȕ Latin Small Letter U with Double Grave
-    C("Shift-A"):               UC(0x0200),                     # Ȁ Latin Capital Letter A with Double Grave
-    C("Shift-E"):               UC(0x0204),                     # Ȅ Latin Capital Letter E with Double Grave
-    C("Shift-I"):               UC(0x0208),                     # Ȉ Latin Capital Letter I with Double Grave
-    C("Shift-O"):               UC(0x020C),                     # Ȍ Latin Capital Letter O with Double Grave
-    C("Shift-R"):               UC(0x0210),                     # Ȑ Latin Capital Letter R with Double Grave
-    C("Shift-U"):               UC(0x0214),                     # Ȕ Latin Capital Letter U with Double Grave
-}, when=lambda _: ac_Chr_main in [0x030F, 0x02F5] and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Umlaut/Diaeresis", {
-    # Option+U                  {U+00A8}
-    # Valid keys:
-    # a e h i o t u w x y
-    # A E H I O T U W X Y
-    C("A"):                     UC(0x00E4),                     # ä Latin Small Letter A with Diaeresis
-    C("E"):                     UC(0x00EB),                     # ë Latin Small Letter E with Diaeresis
-    C("H"):                     UC(0x1E27),                     # ḧ Latin Small Letter H with Diaeresis
-    C("I"):                     UC(0x00EF),                     # ï Latin Small Letter I with Diaeresis
-    C("O"):                     UC(0x00F6),                     # ö Latin Small Letter O with Diaeresis
-    C("T"):                     UC(0x1E97),                     # ẗ Latin Small Letter T with Diaeresis
-    C("U"):                     UC(0x00FC),                     # ü Latin Small Letter U with Diaeresis
-    C("W"):                     UC(0x1E85),                     # ẅ Latin Small Letter W with Diaeresis
-    C("X"):                     UC(0x1E8D),                     # ẍ Latin Small Letter X with Diaeresis
-    C("Y"):                     UC(0x00FF),                     # ÿ Latin Small Letter Y with Diaeresis
-    C("Shift-A"):               UC(0x00C4),                     # Ä Latin Capital Letter A with Diaeresis
-    C("Shift-E"):               UC(0x00CB),                     # Ë Latin Capital Letter E with Diaeresis
-    C("Shift-H"):               UC(0x1E26),                     # Ḧ Latin Capital Letter H with Diaeresis
-    C("Shift-I"):               UC(0x00CF),                     # Ï Latin Capital Letter I with Diaeresis
-    C("Shift-O"):               UC(0x00D6),                     # Ö Latin Capital Letter O with Diaeresis
-    C("Shift-T"):              [UC(0x0054),UC(0x0308)],         # T̈ Latin Capital Letter T with Diaeresis
-    C("Shift-U"):               UC(0x00DC),                     # Ü Latin Capital Letter U with Diaeresis
-    C("Shift-W"):               UC(0x1E84),                     # Ẅ Latin Capital Letter W with Diaeresis
-    C("Shift-X"):               UC(0x1E8C),                     # Ẍ Latin Capital Letter X with Diaeresis
-    C("Shift-Y"):               UC(0x0178),                     # Ÿ Latin Capital Letter Y with Diaeresis
-}, when = lambda _: ac_Chr_main == 0x00A8 and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Apostrophe/Horn", {
-    # Option+I                  {U+02BC}
-    # Valid keys:
-    # o u
-    # O U
-    C("O"):                     UC(0x01A1),                     # ơ Latin Small Letter O with Horn
-    C("U"):                     UC(0x01B0),                     # ư Latin Small Letter U with Horn
-    C("Shift-O"):               UC(0x01A0),                     # Ơ Latin Capital Letter O with Horn
-    C("Shift-U"):               UC(0x01AF),                     # Ư Latin Capital Letter U with Horn
-}, when = lambda _: ac_Chr_main == 0x02BC and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Comma Below", {
-    # Option+P                  {U+002C}
-    # Valid keys:
-    # s t
-    # S T
-    C("S"):                     UC(0x0219),                     # ș Latin Small Letter S with Comma Below
-    C("T"):                     UC(0x021B),                     # ț Latin Small Letter T with Comma Below
-    C("Shift-S"):               UC(0x0218),                     # Ș Latin Capital Letter S with Comma Below
-    C("Shift-T"):               UC(0x021A),                     # Ț Latin Capital Letter T with Comma Below
-}, when = lambda _: ac_Chr_main == 0x002C and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Macron/Line Above", {
-    # Option+A                  {U+00AF}
-    # Valid keys:
-    # a e g i l o r s v y z
-    # A E G I L O R S V Y Z
-    C("A"):                     UC(0x0101),                     # ā Latin Small Letter A with Macron
-    C("E"):                     UC(0x0113),                     # ē Latin Small Letter E with Macron
-    C("G"):                     UC(0x1E21),                     # ḡ Latin Small Letter G with Macron
-    C("I"):                     UC(0x012B),                     # ī Latin Small Letter I with Macron
-    C("L"):         [UC(0x006C),UC(0x0304),UC(0x0323)],         # ḹ Latin Small Letter L w/Macron and Dot Below
-    C("O"):                     UC(0x014D),                     # ō Latin Small Letter O with Macron
-    C("R"):         [UC(0x0072),UC(0x0304),UC(0x0323)],         # ṝ Latin Small Letter R w/Macron and Dot Below
-    C("S"):                    [UC(0x0073),UC(0x0304)],         # s̄ Latin Small Letter S with Macron
-    C("V"):                     UC(0x01D6),                     # ǖ Latin Small Letter U with Diaeresis and Macron
-    C("Y"):                     UC(0x0233),                     # ȳ Latin Small Letter Y with Macron
-    C("Z"):                    [UC(0x007A),UC(0x0304)],         # z̄ Latin Small Letter Z with Macron
-    C("Shift-A"):               UC(0x0100),                     # Ā Latin Capital Letter A with Macron
-    C("Shift-E"):               UC(0x0112),                     # Ē Latin Capital Letter E with Macron
-    C("Shift-G"):               UC(0x1E20),                     # Ḡ Latin Capital Letter G with Macron
-    C("Shift-I"):               UC(0x012A),                     # Ī Latin Capital Letter I with Macron
-    C("Shift-L"):   [UC(0x004C),UC(0x0304),UC(0x0323)],         # Ḹ Latin Capital Letter L w/Macron and Dot Below
-    C("Shift-O"):               UC(0x014C),                     # Ō Latin Capital Letter O with Macron
-    C("Shift-R"):   [UC(0x0052),UC(0x0304),UC(0x0323)],         # Ṝ Latin Capital Letter R w/Macron and Dot Below
-    C("Shift-S"):              [UC(0x0053),UC(0x0304)],         # S̄ Latin Capital Letter S with Macron
-    C("Shift-V"):               UC(0x01D5),                     # Ǖ Latin Capital Letter U with Diaeresis and Macron
-    C("Shift-Y"):               UC(0x0232),                     # Ȳ Latin Capital Letter Y with Macron
-    C("Shift-Z"):              [UC(0x005A),UC(0x0304)],         # Z̄ Latin Capital Letter Z with Macron
-}, when = lambda _: ac_Chr_main == 0x00AF and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Inverted Breve", {
-    # Shift+Option+S            {U+0311}    [uses {U+1D16} as a substitute]
-    # Valid keys:
-    # a e i o r u
-    # A E I O R U 
-    C("A"):                     UC(0x0203),                     # ȃ Latin Small Letter A with Inverted Breve
-    C("E"):                     UC(0x0207),                     # ȇ Latin Small Letter E with Inverted Breve
-    C("I"):                     UC(0x020B),                     # ȋ Latin Small Letter I with Inverted Breve
-    C("O"):                     UC(0x020F),                     # ȏ Latin Small Letter O with Inverted Breve
-    C("R"):                     UC(0x0213),                     # ȓ Latin Small Letter R with Inverted Breve
-    C("U"):                     UC(0x0217),                     # ȗ Latin Small Letter U with Inverted Breve
-    C("Shift-A"):               UC(0x0202),                     # Ȃ Latin Capital Letter A with Inverted Breve
-    C("Shift-E"):               UC(0x0206),                     # Ȇ Latin Capital Letter E with Inverted Breve
-    C("Shift-I"):               UC(0x020A),                     # Ȋ Latin Capital Letter I with Inverted Breve
-    C("Shift-O"):               UC(0x020E),                     # Ȏ Latin Capital Letter O with Inverted Breve
-    C("Shift-R"):               UC(0x0212),                     # Ȓ Latin Capital Letter R with Inverted Breve
-    C("Shift-U"):               UC(0x0216),                     # Ȗ Latin Capital Letter U with Inverted Breve
-}, when = lambda _: ac_Chr_main in [0x0311, 0x1D16] and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Tilde Below", {
-    # Shift+Option+F            {U+0330}    [uses {U+02F7} as a substitute]
-    # Valid keys:
-    # e i u
-    # E I U
-    C("E"):                     UC(0x1E1B),                     # ḛ Latin Small Letter E with Tilde Below
-    C("I"):                     UC(0x1E2D),                     # ḭ Latin Small Letter I with Tilde Below
-    C("U"):                     UC(0x1E75),                     # ṵ Latin Small Letter U with Tilde Below
-    C("Shift-E"):               UC(0x1E1A),                     # Ḛ Latin Capital Letter E with Tilde Below
-    C("Shift-I"):               UC(0x1E2C),                     # Ḭ Latin Capital Letter I with Tilde Below
-    C("Shift-U"):               UC(0x1E74),                     # Ṵ Latin Capital Letter U with Tilde Below
-}, when = lambda _: ac_Chr_main in [0x0330, 0x02F7] and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Caret/Circumflex Below", {
-    # Shift+Option+G            {U+2038}
-    # Valid keys:
-    # d e l n t u
-    # D E L N T U
-    C("D"):                     UC(0x1E13),                     # ḓ Latin Small Letter D with Circumflex Below
-    C("E"):                     UC(0x1E19),                     # ḙ Latin Small Letter E with Circumflex Below
-    C("L"):                     UC(0x1E3D),                     # ḽ Latin Small Letter L with Circumflex Below
-    C("N"):                     UC(0x1E4B),                     # ṋ Latin Small Letter N with Circumflex Below
-    C("T"):                     UC(0x1E71),                     # ṱ Latin Small Letter T with Circumflex Below
-    C("U"):                     UC(0x1E77),                     # ṷ Latin Small Letter U with Circumflex Below
-    C("Shift-D"):               UC(0x1E12),                     # Ḓ Latin Capital Letter D with Circumflex Below
-    C("Shift-E"):               UC(0x1E18),                     # Ḙ Latin Capital Letter E with Circumflex Below
-    C("Shift-L"):               UC(0x1E3C),                     # Ḽ Latin Capital Letter L with Circumflex Below
-    C("Shift-N"):               UC(0x1E4A),                     # Ṋ Latin Capital Letter N with Circumflex Below
-    C("Shift-T"):               UC(0x1E70),                     # Ṱ Latin Capital Letter T with Circumflex Below
-    C("Shift-U"):               UC(0x1E76),                     # Ṷ Latin Capital Letter U with Circumflex Below
-}, when = lambda _: ac_Chr_main == 0x2038 and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Low Macron/Line Below", {
-    # Option+H                  {U+02CD}
-    # Valid keys:
-    # b d h k l n r t z
-    # B D H K L N R T Z 
-    C("B"):                     UC(0x1E07),                     # ḇ Latin Small Letter B with Line Below 
-    C("D"):                     UC(0x1E0F),                     # ḏ Latin Small Letter D with Line Below 
-    C("H"):                     UC(0x1E96),                     # ẖ Latin Small Letter H with Line Below 
-    C("K"):                     UC(0x1E35),                     # ḵ Latin Small Letter K with Line Below 
-    C("L"):                     UC(0x1E3B),                     # ḻ Latin Small Letter L with Line Below 
-    C("N"):                     UC(0x1E49),                     # ṉ Latin Small Letter N with Line Below 
-    C("R"):                     UC(0x1E5F),                     # ṟ Latin Small Letter R with Line Below 
-    C("T"):                     UC(0x1E6F),                     # ṯ Latin Small Letter T with Line Below 
-    C("Z"):                     UC(0x1E95),                     # ẕ Latin Small Letter Z with Line Below 
-    C("Shift-B"):               UC(0x1E06),                     # Ḇ Latin Capital Letter B with Line Below 
-    C("Shift-D"):               UC(0x1E0E),                     # Ḏ Latin Capital Letter D with Line Below 
-    C("Shift-H"):              [UC(0x0048),UC(0x0331)],         # H̱ Latin Capital Letter H with Line Below
-    C("Shift-K"):               UC(0x1E34),                     # Ḵ Latin Capital Letter K with Line Below 
-    C("Shift-L"):               UC(0x1E3A),                     # Ḻ Latin Capital Letter L with Line Below 
-    C("Shift-N"):               UC(0x1E48),                     # Ṉ Latin Capital Letter N with Line Below 
-    C("Shift-R"):               UC(0x1E5E),                     # Ṟ Latin Capital Letter R with Line Below 
-    C("Shift-T"):               UC(0x1E6E),                     # Ṯ Latin Capital Letter T with Line Below 
-    C("Shift-Z"):               UC(0x1E94),                     # Ẕ Latin Capital Letter Z with Line Below 
-}, when = lambda _: ac_Chr_main == 0x02CD and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Double Acute", {
-    # Option+J                  {U+02DD}
-    # Valid keys:
-    # o u
-    # O U
-    C("O"):                     UC(0x0151),                     # ő Latin Small Letter O with Double Acute
-    C("U"):                     UC(0x0171),                     # ű Latin Small Letter U with Double Acute
-    C("Shift-O"):               UC(0x0150),                     # Ő Latin Capital Letter O with Double Acute
-    C("Shift-U"):               UC(0x0170),                     # Ű Latin Capital Letter U with Double Acute
-}, when = lambda _: ac_Chr_main == 0x02DD and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Ring Above", {
-    # Option+K                  {U+02DA}
-    # Valid keys:
-    # a e o u w y
-    # A E O U W Y 
-    C("A"):                     UC(0x00E5),                     # å Latin Small Letter A with Ring Above
-    C("E"):                    [UC(0x0065),UC(0x030A)],         # e̊ Latin Small Letter E with Ring Above
-    C("O"):                    [UC(0x006F),UC(0x030A)],         # o̊ Latin Small Letter O with Ring Above
-    C("U"):                     UC(0x016F),                     # ů Latin Small Letter U with Ring Above
-    C("W"):                     UC(0x1E98),                     # ẘ Latin Small Letter W with Ring Above
-    C("Y"):                     UC(0x1E99),                     # ẙ Latin Small Letter Y with Ring Above
-    C("Shift-A"):               UC(0x00C5),                     # Å Latin Capital Letter A with Ring Above
-    C("Shift-E"):              [UC(0x0045),UC(0x030A)],         # E̊ Latin Capital Letter E with Ring Above
-    C("Shift-O"):              [UC(0x004F),UC(0x030A)],         # O̊ Latin Capital Letter O with Ring Above
-    C("Shift-U"):               UC(0x016E),                     # Ů Latin Capital Letter U with Ring Above
-    C("Shift-W"):              [UC(0x0057),UC(0x030A)],         # W̊ Latin Capital Letter W with Ring Above
-    C("Shift-Y"):              [UC(0x0059),UC(0x030A)],         # Y̊ Latin Capital Letter Y with Ring Above
-}, when = lambda _: ac_Chr_main == 0x02DA and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Stroke/Hyphen-Minus", {
-    # Option+L                  {U+002D}
-    # Valid keys:
-    # b d g h i l o t u z
-    #   D G H I L O T   Z 
-    C("B"):                     UC(0x0180),                     # ƀ Latin Small Letter B with Stroke
-    C("D"):                     UC(0x0111),                     # đ Latin Small Letter D with Stroke
-    C("G"):                     UC(0x01E5),                     # ǥ Latin Small Letter G with Stroke
-    C("H"):                     UC(0x0127),                     # ħ Latin Small Letter H with Stroke
-    C("I"):                     UC(0x0268),                     # ɨ Latin Small Letter I with Stroke
-    C("L"):                     UC(0x0142),                     # ł Latin Small Letter L with Stroke
-    C("O"):                     UC(0x0275),                     # ɵ Latin Small Letter Barred O
-    C("T"):                     UC(0x0167),                     # ŧ Latin Small Letter T with Stroke
-    C("U"):                     UC(0x0289),                     # ʉ Latin Small Letter U Bar
-    C("Z"):                     UC(0x01B6),                     # ƶ Latin Small Letter Z with Stroke
-    C("Shift-D"):               UC(0x0110),                     # Đ Latin Capital Letter D with Stroke
-    C("Shift-G"):               UC(0x01E4),                     # Ǥ Latin Capital Letter G with Stroke
-    C("Shift-H"):               UC(0x0126),                     # Ħ Latin Capital Letter H with Stroke
-    C("Shift-I"):               UC(0x0197),                     # Ɨ Latin Capital Letter I with Stroke
-    C("Shift-L"):               UC(0x0141),                     # Ł Latin Capital Letter L with Stroke
-    C("Shift-O"):               UC(0x019F),                     # Ɵ Latin Capital Letter O with Middle Tilde
-    C("Shift-T"):               UC(0x0166),                     # Ŧ Latin Capital Letter T with Stroke
-    C("Shift-Z"):               UC(0x01B5),                     # Ƶ Latin Capital Letter Z with Stroke
-}, when = lambda _: ac_Chr_main == 0x002D and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Numero Sign", {
-    # Shift+Option+Semicolon    {U+2116}
-    # Valid keys:
-    # 2 3 5 6 7 8 (digits with Option)
-    # 2 3 5 6   8 (digits with Shift+Option)
-    # a c e g h j k m n q r s u v w y z (letters with Option)
-    # A C E G H J K M N Q R   U   W Y Z (letters with Shift+Option)
-    C("3"):                     UC(0x025B),                     # ɛ  Latin Small Letter Open E
-    C("5"):                     UC(0x01BD),                     # ƽ  Latin Small Letter Tone Five
-    C("2"):                     UC(0x01A8),                     # ƨ  Latin Small Letter Tone Two
-    C("6"):                     UC(0x0185),                     # ƅ  Latin Small Letter Tone Six
-    C("7"):                     UC(0x204A),                     # ⁊  Tironian Sign Et 
-    C("8"):                     UC(0x0223),                     # ȣ  Latin Small Letter Ou
-    C("Shift-2"):               UC(0x01A7),                     # Ƨ  Latin Capital Letter Tone Two
-    C("Shift-3"):               UC(0x0190),                     # Ɛ  Latin Capital Letter Open E
-    C("Shift-5"):               UC(0x01BC),                     # Ƽ  Latin Capital Letter Tone Five
-    C("Shift-6"):               UC(0x0184),                     # Ƅ  Latin Capital Letter Tone Six
-    C("Shift-8"):               UC(0x0222),                     # Ȣ  Latin Capital Letter Ou
-    C("a"):                     UC(0x0259),                     # ə  Latin Small Letter Schwa
-    C("c"):                     UC(0x0254),                     # ɔ  Latin Small Letter Open O
-    C("e"):                     UC(0x01DD),                     # ǝ  Latin Small Letter Turned E
-    C("g"):                     UC(0x0263),                     # ɣ  Latin Small Letter Gamma
-    C("h"):                     UC(0x0195),                     # ƕ  Latin Small Letter Hv
-    C("j"):                     UC(0x019E),                     # ƞ  Latin Small Letter N with Long Right Leg
-    C("k"):                     UC(0x0138),                     # ĸ  Latin Small Letter Kra
-    C("m"):                     UC(0x026F),                     # ɯ  Latin Small Letter Turned M
-    C("n"):                     UC(0x014B),                     # ŋ  Latin Small Letter Eng
-    C("q"):                     UC(0x01A3),                     # ƣ  Latin Small Letter Oi
-    C("r"):                     UC(0x0280),                     # ʀ  Latin Letter Small Capital R
-    C("s"):                     UC(0x017F),                     # ſ  Latin Small Letter Long S
-    C("u"):                     UC(0x028A),                     # ʊ  Latin Small Letter Upsilon
-    C("v"):                     UC(0x028C),                     # ʌ  Latin Small Letter Turned V
-    C("w"):                     UC(0x01BF),                     # ƿ  Latin Letter Wynn
-    C("y"):                     UC(0x021D),                     # ȝ  Latin Small Letter Yogh
-    C("z"):                     UC(0x0292),                     # ʒ  Latin Small Letter Ezh
-    C("Shift-A"):               UC(0x018F),                     # Ə  Latin Capital Letter Schwa
-    C("Shift-C"):               UC(0x0186),                     # Ɔ  Latin Capital Letter Open O
-    C("Shift-E"):               UC(0x018E),                     # Ǝ  Latin Capital Letter Reversed E
-    C("Shift-G"):               UC(0x0194),                     # Ɣ  Latin Capital Letter Gamma
-    C("Shift-H"):               UC(0x01F6),                     # Ƕ  Latin Capital Letter Hwair
-    C("Shift-J"):               UC(0x0220),                     # Ƞ  Latin Capital Letter N with Long Right Leg
-    C("Shift-K"):              [UC(0x004B),UC(0x2019)],         # K’ Latin Capital Letter K with Apostrophe
-    C("Shift-M"):               UC(0x019C),                     # Ɯ  Latin Capital Letter Turned M
-    C("Shift-N"):               UC(0x014A),                     # Ŋ  Latin Capital Letter Eng
-    C("Shift-Q"):               UC(0x01A2),                     # Ƣ  Latin Capital Letter Oi
-    C("Shift-R"):               UC(0x01A6),                     # Ʀ  Latin Letter Yr
-    C("Shift-U"):               UC(0x01B1),                     # Ʊ  Latin Capital Letter Upsilon
-    C("Shift-W"):               UC(0x01F7),                     # Ƿ  Latin Capital Letter Wynn
-    C("Shift-Y"):               UC(0x021C),                     # Ȝ  Latin Capital Letter Yogh
-    C("Shift-Z"):               UC(0x01B7),                     # Ʒ  Latin Capital Letter Ezh
-}, when = lambda _: ac_Chr_main == 0x2116 and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Hook Above/Glottal Stop", {
-    # Option+Z                  {U+02C0}
-    # Valid keys:
-    # a e i o u y
-    # A E I O U Y 
-    C("A"):                     UC(0x1EA3),                     # ả  Latin Small Letter A with Hook Above
-    C("E"):                     UC(0x1EBB),                     # ẻ  Latin Small Letter E with Hook Above
-    C("I"):                     UC(0x1EC9),                     # ỉ  Latin Small Letter I with Hook Above
-    C("O"):                     UC(0x1ECF),                     # ỏ  Latin Small Letter O with Hook Above
-    C("U"):                     UC(0x1EE7),                     # ủ  Latin Small Letter U with Hook Above
-    C("Y"):                     UC(0x1EF7),                     # ỷ  Latin Small Letter Y with Hook Above
-    C("Shift-A"):               UC(0x1EA2),                     # Ả  Latin Small Letter A with Hook Above
-    C("Shift-E"):               UC(0x1EBA),                     # Ẻ  Latin Small Letter E with Hook Above
-    C("Shift-I"):               UC(0x1EC8),                     # Ỉ  Latin Small Letter I with Hook Above
-    C("Shift-O"):               UC(0x1ECE),                     # Ỏ  Latin Small Letter O with Hook Above
-    C("Shift-U"):               UC(0x1EE6),                     # Ủ  Latin Small Letter U with Hook Above
-    C("Shift-Y"):               UC(0x1EF6),                     # Ỷ  Latin Small Letter Y with Hook Above
-}, when = lambda _: ac_Chr_main == 0x02C0 and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Dot Below", {
-    # Option+X                  {U+002E}
-    # Valid keys:
-    # a b d e h i k l m n o r s t u v w y z
-    # A B D E H I K L M N O R S T U V W Y Z 
-    C("A"):                     UC(0x1EA1),                     # ạ Latin Small Letter A with Dot Below
-    C("B"):                     UC(0x1E05),                     # ḅ Latin Small Letter B with Dot Below
-    C("D"):                     UC(0x1E0D),                     # ḍ Latin Small Letter D with Dot Below
-    C("E"):                     UC(0x1EB9),                     # ẹ Latin Small Letter E with Dot Below
-    C("H"):                     UC(0x1E25),                     # ḥ Latin Small Letter H with Dot Below
-    C("I"):                     UC(0x1ECB),                     # ị Latin Small Letter I with Dot Below
-    C("K"):                     UC(0x1E33),                     # ḳ Latin Small Letter K with Dot Below
-    C("L"):                     UC(0x1E37),                     # ḷ Latin Small Letter L with Dot Below
-    C("M"):                     UC(0x1E43),                     # ṃ Latin Small Letter M with Dot Below
-    C("N"):                     UC(0x1E47),                     # ṇ Latin Small Letter N with Dot Below
-    C("O"):                     UC(0x1ECD),                     # ọ Latin Small Letter O with Dot Below
-    C("R"):                     UC(0x1E5B),                     # ṛ Latin Small Letter R with Dot Below
-    C("S"):                     UC(0x1E63),                     # ṣ Latin Small Letter S with Dot Below
-    C("T"):                     UC(0x1E6D),                     # ṭ Latin Small Letter T with Dot Below
-    C("U"):                     UC(0x1EE5),                     # ụ Latin Small Letter U with Dot Below
-    C("V"):                     UC(0x1E7F),                     # ṿ Latin Small Letter V with Dot Below
-    C("W"):                     UC(0x1E89),                     # ẉ Latin Small Letter W with Dot Below
-    C("Y"):                     UC(0x1EF5),                     # ỵ Latin Small Letter Y with Dot Below
-    C("Z"):                     UC(0x1E93),                     # ẓ Latin Small Letter Z with Dot Below
-    C("Shift-A"):               UC(0x1EA0),                     # Ạ Latin Capital Letter A with Dot Below
-    C("Shift-B"):               UC(0x1E04),                     # Ḅ Latin Capital Letter B with Dot Below
-    C("Shift-D"):               UC(0x1E0C),                     # Ḍ Latin Capital Letter D with Dot Below
-    C("Shift-E"):               UC(0x1EB8),                     # Ẹ Latin Capital Letter E with Dot Below
-    C("Shift-H"):               UC(0x1E24),                     # Ḥ Latin Capital Letter H with Dot Below
-    C("Shift-I"):               UC(0x1ECA),                     # Ị Latin Capital Letter I with Dot Below
-    C("Shift-K"):               UC(0x1E32),                     # Ḳ Latin Capital Letter K with Dot Below
-    C("Shift-L"):               UC(0x1E36),                     # Ḷ Latin Capital Letter L with Dot Below
-    C("Shift-M"):               UC(0x1E42),                     # Ṃ Latin Capital Letter M with Dot Below
-    C("Shift-N"):               UC(0x1E46),                     # Ṇ Latin Capital Letter N with Dot Below
-    C("Shift-O"):               UC(0x1ECC),                     # Ọ Latin Capital Letter O with Dot Below
-    C("Shift-R"):               UC(0x1E5A),                     # Ṛ Latin Capital Letter R with Dot Below
-    C("Shift-S"):               UC(0x1E62),                     # Ṣ Latin Capital Letter S with Dot Below
-    C("Shift-T"):               UC(0x1E6C),                     # Ṭ Latin Capital Letter T with Dot Below
-    C("Shift-U"):               UC(0x1EE4),                     # Ụ Latin Capital Letter U with Dot Below
-    C("Shift-V"):               UC(0x1E7E),                     # Ṿ Latin Capital Letter V with Dot Below
-    C("Shift-W"):               UC(0x1E88),                     # Ẉ Latin Capital Letter W with Dot Below
-    C("Shift-Y"):               UC(0x1EF4),                     # Ỵ Latin Capital Letter Y with Dot Below
-    C("Shift-Z"):               UC(0x1E92),                     # Ẓ Latin Capital Letter Z with Dot Below
-}, when = lambda _: ac_Chr_main == 0x002E and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Cedilla/Cedille", {
-    # Option+C                  {U+00B8}
-    # Valid keys:
-    # c d e g h k l n r s t z
-    # C D E G H K L N R S T Z 
-    C("C"):                     UC(0x00E7),                     # ç Latin Small Letter C with Cedilla
-    C("D"):                     UC(0x1E11),                     # ḑ Latin Small Letter D with Cedilla
-    C("E"):                     UC(0x0229),                     # ȩ Latin Small Letter E with Cedilla
-    C("G"):                     UC(0x0123),                     # ģ Latin Small Letter G with Cedilla
-    C("H"):                     UC(0x1E29),                     # ḩ Latin Small Letter H with Cedilla
-    C("K"):                     UC(0x0137),                     # ķ Latin Small Letter K with Cedilla
-    C("L"):                     UC(0x013C),                     # ļ Latin Small Letter L with Cedilla
-    C("N"):                     UC(0x0146),                     # ņ Latin Small Letter N with Cedilla
-    C("R"):                     UC(0x0157),                     # ŗ Latin Small Letter R with Cedilla
-    C("S"):                     UC(0x015F),                     # ş Latin Small Letter S with Cedilla
-    C("T"):                     UC(0x0163),                     # ţ Latin Small Letter T with Cedilla
-    C("Z"):                    [UC(0x007A),UC(0x0327)],         # z̧ Latin Small Letter Z with Cedilla
-    C("Shift-C"):               UC(0x00C7),                     # Ç Latin Capital Letter C with Cedilla
-    C("Shift-D"):               UC(0x1E10),                     # Ḑ Latin Capital Letter D with Cedilla
-    C("Shift-E"):               UC(0x0228),                     # Ȩ Latin Capital Letter E with Cedilla
-    C("Shift-G"):               UC(0x0122),                     # Ģ Latin Capital Letter G with Cedilla
-    C("Shift-H"):               UC(0x1E28),                     # Ḩ Latin Capital Letter H with Cedilla
-    C("Shift-K"):               UC(0x0136),                     # Ķ Latin Capital Letter K with Cedilla
-    C("Shift-L"):               UC(0x013B),                     # Ļ Latin Capital Letter L with Cedilla
-    C("Shift-N"):               UC(0x0145),                     # Ņ Latin Capital Letter N with Cedilla
-    C("Shift-R"):               UC(0x0156),                     # Ŗ Latin Capital Letter R with Cedilla
-    C("Shift-S"):               UC(0x015E),                     # Ş Latin Capital Letter S with Cedilla
-    C("Shift-T"):               UC(0x0162),                     # Ţ Latin Capital Letter T with Cedilla
-    C("Shift-Z"):              [UC(0x005A),UC(0x0327)],         # Z̧ Latin Capital Letter Z with Cedilla
-}, when = lambda _: ac_Chr_main == 0x00B8 and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Caron/hacek", {
-    # Option+V                  {U+02C7}
-    # Valid keys:
-    # a c d e g h i j k l n o r s t u v x z
-    # A C D E G H I J K L N O R S T U V X Z 
-    C("A"):                     UC(0x01CE),                     # ǎ Latin Small Letter A with Caron
-    C("C"):                     UC(0x010D),                     # č Latin Small Letter C with Caron
-    C("D"):                     UC(0x010F),                     # ď Latin Small Letter D with Caron
-    C("E"):                     UC(0x011B),                     # ě Latin Small Letter E with Caron
-    C("G"):                     UC(0x01E7),                     # ǧ Latin Small Letter G with Caron
-    C("H"):                     UC(0x021F),                     # ȟ Latin Small Letter H with Caron
-    C("I"):                     UC(0x01D0),                     # ǐ Latin Small Letter I with Caron
-    C("J"):                     UC(0x01F0),                     # ǰ Latin Small Letter J with Caron
-    C("K"):                     UC(0x01E9),                     # ǩ Latin Small Letter K with Caron
-    C("L"):                     UC(0x013E),                     # ľ Latin Small Letter L with Caron
-    C("N"):                     UC(0x0148),                     # ň Latin Small Letter N with Caron
-    C("O"):                     UC(0x01D2),                     # ǒ Latin Small Letter O with Caron
-    C("R"):                     UC(0x0159),                     # ř Latin Small Letter R with Caron
-    C("S"):                     UC(0x0161),                     # š Latin Small Letter S with Caron
-    C("T"):                     UC(0x0165),                     # ť Latin Small Letter T with Caron
-    C("U"):                     UC(0x01D4),                     # ǔ Latin Small Letter U with Caron
-    C("V"):                     UC(0x01DA),                     # ǚ Latin Small Letter U w/Diaeresis and Caron
-    C("X"):                    [UC(0x0292),UC(0x030C)],         # ǯ Latin Small Letter Ezh with Caron
-    C("Z"):                     UC(0x017E),                     # ž Latin Small Letter Z with Caron
-    C("Shift-A"):               UC(0x01CD),                     # Ǎ Latin Capital Letter A with Caron
-    C("Shift-C"):               UC(0x010C),                     # Č Latin Capital Letter C with Caron
-    C("Shift-D"):               UC(0x010E),                     # Ď Latin Capital Letter D with Caron
-    C("Shift-E"):               UC(0x011A),                     # Ě Latin Capital Letter E with Caron
-    C("Shift-G"):               UC(0x01E6),                     # Ǧ Latin Capital Letter G with Caron
-    C("Shift-H"):               UC(0x021E),                     # Ȟ Latin Capital Letter H with Caron
-    C("Shift-I"):               UC(0x01CF),                     # Ǐ Latin Capital Letter I with Caron
-    C("Shift-J"):              [UC(0x004A),UC(0x030C)],         # J̌ Latin Capital Letter J with Caron
-    C("Shift-K"):               UC(0x01E8),                     # Ǩ Latin Capital Letter K with Caron
-    C("Shift-L"):               UC(0x013D),                     # Ľ Latin Capital Letter L with Caron
-    C("Shift-N"):               UC(0x0147),                     # Ň Latin Capital Letter N with Caron
-    C("Shift-O"):               UC(0x01D1),                     # Ǒ Latin Capital Letter O with Caron
-    C("Shift-R"):               UC(0x0158),                     # Ř Latin Capital Letter R with Caron
-    C("Shift-S"):               UC(0x0160),                     # Š Latin Capital Letter S with Caron
-    C("Shift-T"):               UC(0x0164),                     # Ť Latin Capital Letter T with Caron
-    C("Shift-U"):               UC(0x01D3),                     # Ǔ Latin Capital Letter U with Caron
-    C("Shift-V"):               UC(0x01D9),                     # Ǚ Latin Capital Letter U w/Diaeresis and Caron
-    C("Shift-X"):              [UC(0x01B7),UC(0x030C)],         # Ǯ Latin Capital Letter Ezh with Caron
-    C("Shift-Z"):               UC(0x017D),                     # Ž Latin Capital Letter Z with Caron
-}, when = lambda _: ac_Chr_main == 0x02C7 and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Breve", {
-    # Option+B                  {U+02D8}
-    # Valid keys:
-    # a e g h i o u
-    # A E G H I O U 
-    C("A"):                     UC(0x0103),                     # ă Latin Small Letter A with Breve
-    C("E"):                     UC(0x0115),                     # ĕ Latin Small Letter E with Breve
-    C("G"):                     UC(0x011F),                     # ğ Latin Small Letter G with Breve
-    C("H"):                     UC(0x1E2B),                     # ḫ Latin Small Letter H with Breve Below
-    C("I"):                     UC(0x012D),                     # ĭ Latin Small Letter I with Breve
-    C("O"):                     UC(0x014F),                     # ŏ Latin Small Letter O with Breve
-    C("U"):                     UC(0x016D),                     # ŭ Latin Small Letter U with Breve
-    C("Shift-A"):               UC(0x0102),                     # Ă Latin Capital Letter A with Breve
-    C("Shift-E"):               UC(0x0114),                     # Ĕ Latin Capital Letter E with Breve
-    C("Shift-G"):               UC(0x011E),                     # Ğ Latin Capital Letter G with Breve
-    C("Shift-H"):               UC(0x1E2A),                     # Ḫ Latin Capital Letter H with Breve Below
-    C("Shift-I"):               UC(0x012C),                     # Ĭ Latin Capital Letter I with Breve
-    C("Shift-O"):               UC(0x014E),                     # Ŏ Latin Capital Letter O with Breve
-    C("Shift-U"):               UC(0x016C),                     # Ŭ Latin Capital Letter U with Breve
-}, when = lambda _: ac_Chr_main == 0x02D8 and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Tilde", {
-    # Option+N                  {U+02DC}
-    # Valid keys:
-    # a e i n o u v y
-    # A E I N O U V Y 
-    C("A"):                     UC(0x00E3),                     # ã Latin Small Letter A with Tilde
-    C("E"):                     UC(0x1EBD),                     # ẽ Latin Small Letter E with Tilde
-    C("I"):                     UC(0x0129),                     # ĩ Latin Small Letter I with Tilde
-    C("N"):                     UC(0x00F1),                     # ñ Latin Small Letter N with Tilde
-    C("O"):                     UC(0x00F5),                     # õ Latin Small Letter O with Tilde
-    C("U"):                     UC(0x0169),                     # ũ Latin Small Letter U with Tilde
-    C("V"):                     UC(0x1E7D),                     # ṽ Latin Small Letter V with Tilde
-    C("Y"):                     UC(0x1EF9),                     # ỹ Latin Small Letter Y with Tilde
-    C("Shift-A"):               UC(0x00C3),                     # Ã Latin Capital Letter A with Tilde
-    C("Shift-E"):               UC(0x1EBC),                     # Ẽ Latin Capital Letter E with Tilde
-    C("Shift-I"):               UC(0x0128),                     # Ĩ Latin Capital Letter I with Tilde
-    C("Shift-N"):               UC(0x00D1),                     # Ñ Latin Capital Letter N with Tilde
-    C("Shift-O"):               UC(0x00D5),                     # Õ Latin Capital Letter O with Tilde
-    C("Shift-U"):               UC(0x0168),                     # Ũ Latin Capital Letter U with Tilde
-    C("Shift-V"):               UC(0x1E7C),                     # Ṽ Latin Capital Letter V with Tilde
-    C("Shift-Y"):               UC(0x1EF8),                     # Ỹ Latin Capital Letter Y with Tilde
-}, when = lambda _: ac_Chr_main == 0x02DC and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Ogonek", {
-    # Option+M                  {U+02DB}
-    # Valid keys:
-    # a e i o u
-    # A E I O U 
-    C("A"):                     UC(0x0105),                     # ą Latin Small Letter A with Ogonek
-    C("E"):                     UC(0x0119),                     # ę Latin Small Letter E with Ogonek
-    C("I"):                     UC(0x012F),                     # į Latin Small Letter I with Ogonek
-    C("O"):                     UC(0x01EB),                     # ǫ Latin Small Letter O with Ogonek
-    C("U"):                     UC(0x0173),                     # ų Latin Small Letter U with Ogonek
-    C("Shift-A"):               UC(0x0104),                     # Ą Latin Capital Letter A with Ogonek
-    C("Shift-E"):               UC(0x0118),                     # Ę Latin Capital Letter E with Ogonek
-    C("Shift-I"):               UC(0x012E),                     # Į Latin Capital Letter I with Ogonek
-    C("Shift-O"):               UC(0x01EA),                     # Ǫ Latin Capital Letter O with Ogonek
-    C("Shift-U"):               UC(0x0172),                     # Ų Latin Capital Letter U with Ogonek
-}, when = lambda _: ac_Chr_main == 0x02DB and cnfg.optspec_layout == 'ABC')
-
-keymap("DK-ABC - Hook", {
-    # Shift+Option+Dot          {U+0294}
-    # Valid keys:
-    # b c d f g h i k n p q r s t u x y z 
-    # B C D F G   I K N P   R S T U X Y Z 
-    C("B"):                     UC(0x0253),                     # ɓ Latin Small Letter B with Hook
-    C("C"):                     UC(0x0188),                     # ƈ Latin Small Letter C with Hook
-    C("D"):                     UC(0x0257),                     # ɗ Latin Small Letter D with Hook
-    C("F"):                     UC(0x0192),                     # ƒ Latin Small Letter F with Hook (function symbol)
-    C("G"):                     UC(0x0260),                     # ɠ Latin Small Letter G with Hook
-    C("H"):                     UC(0x0266),                     # ɦ Latin Small Letter H with Hook
-    C("I"):                     UC(0x0269),                     # ɩ Latin Small Letter Iota
-    C("K"):                     UC(0x0199),                     # ƙ Latin Small Letter K with Hook
-    C("N"):                     UC(0x0272),                     # ɲ Latin Small Letter N with Left Hook
-    C("P"):                     UC(0x01A5),                     # ƥ Latin Small Letter P with Hook
-    C("Q"):                     UC(0x02A0),                     # ʠ Latin Small Letter Q with Hook
-    C("R"):                     UC(0x0288),                     # ʈ Latin Small Letter T with Retroflex Hook
-    C("S"):                     UC(0x0283),                     # ʃ Latin Small Letter Esh
-    C("T"):                     UC(0x01AD),                     # ƭ Latin Small Letter T with Hook
-    C("U"):                     UC(0x028B),                     # ʋ Latin Small Letter V with Hook
-    C("X"):                     UC(0x0256),                     # ɖ Latin Small Letter D with Tail
-    C("Y"):                     UC(0x01B4),                     # ƴ Latin Small Letter Y with Hook
-    C("Z"):                     UC(0x0225),                     # ȥ Latin Small Letter Z with Hook
-    C("Shift-B"):               UC(0x0181),                     # Ɓ Latin Capital Letter B with Hook
-    C("Shift-C"):               UC(0x0187),                     # Ƈ Latin Capital Letter C with Hook
-    C("Shift-D"):               UC(0x018A),                     # Ɗ Latin Capital Letter D with Hook
-    C("Shift-F"):               UC(0x0191),                     # Ƒ Latin Capital Letter F with Hook
-    C("Shift-G"):               UC(0x0193),                     # Ɠ Latin Capital Letter G with Hook
-    C("Shift-I"):               UC(0x0196),                     # Ɩ Latin Capital Letter Iota
-    C("Shift-K"):               UC(0x0198),                     # Ƙ Latin Capital Letter K with Hook
-    C("Shift-N"):               UC(0x019D),                     # Ɲ Latin Capital Letter N with Left Hook
-    C("Shift-P"):               UC(0x01A4),                     # Ƥ Latin Capital Letter P with Hook
-    C("Shift-R"):               UC(0x01AE),                     # Ʈ Latin Capital Letter T with Retroflex Hook
-    C("Shift-S"):               UC(0x01A9),                     # Ʃ Latin Capital Letter Esh
-    C("Shift-T"):               UC(0x01AC),                     # Ƭ Latin Capital Letter T with Hook
-    C("Shift-U"):               UC(0x01B2),                     # Ʋ Latin Capital Letter V with Hook
-    C("Shift-X"):               UC(0x0189),                     # Ɖ Latin Capital Letter African D
-    C("Shift-Y"):               UC(0x01B3),                     # Ƴ Latin Capital Letter Y with Hook
-    C("Shift-Z"):               UC(0x0224),                     # Ȥ Latin Capital Letter Z with Hook
-}, when = lambda _: ac_Chr_main == 0x0294 and cnfg.optspec_layout == 'ABC')
-
-
-#######################################
-###  DEAD KEYS KEYMAPS - US LAYOUT  ###
-#######################################
-keymap("DK-US - Grave", {
-    # Valid keys:
-    # a e i o u
-    # A E I O U
-    C("A"):                     UC(0x00E0),                     # à Latin Small a with Grave
-    C("E"):                     UC(0x00E8),                     # è Latin Small e with Grave
-    C("I"):                     UC(0x00EC),                     # ì Latin Small i with Grave
-    C("O"):                     UC(0x00F2),                     # ò Latin Small o with Grave
-    C("U"):                     UC(0x00F9),                     # ù Latin Small u with Grave
-    C("Shift-A"):               UC(0x00C0),                     # À Latin Capital A with Grave
-    C("Shift-E"):               UC(0x00C8),                     # È Latin Capital E with Grave
-    C("Shift-I"):               UC(0x00CC),                     # Ì Latin Capital I with Grave
-    C("Shift-O"):               UC(0x00D2),                     # Ò Latin Capital O with Grave
-    C("Shift-U"):               UC(0x00D9),                     # Ù Latin Capital U with Grave
-}, when = lambda _: ac_Chr_main == 0x0060 and cnfg.optspec_layout == 'US')
-
-keymap("DK-US - Acute", {
-    # Valid keys:
-    # a e i o u
-    # A E I O U
-    C("A"):                     UC(0x00E1),                     # á Latin Small a with Acute
-    C("E"):                     UC(0x00E9),                     # é Latin Small e with Acute
-    C("I"):                     UC(0x00ED),                     # í Latin Small i with Acute
-    C("O"):                     UC(0x00F3),                     # ó Latin Small o with Acute
-    C("U"):                     UC(0x00FA),                     # ú Latin Small u with Acute
-    C("Shift-A"):               UC(0x00C1),                     # Á Latin Capital A with Acute
-    C("Shift-E"):               UC(0x00C9),                     # É Latin Capital E with Acute
-    C("Shift-I"):               UC(0x00CD),                     # Í Latin Capital I with Acute
-    C("Shift-O"):               UC(0x00D3),                     # Ó Latin Capital O with Acute
-    C("Shift-U"):               UC(0x00DA),                     # Ú Latin Capital U with Acute
-}, when = lambda _: ac_Chr_main == 0x00B4 and cnfg.optspec_layout == 'US')
-
-keymap("DK-US - Umlaut", {
-    # Valid keys:
-    # a e i o u y
-    # A E I O U Y
-    C("A"):                     UC(0x00E4),                     # ä Latin Small a with Umlaut
-    C("E"):                     UC(0x00EB),                     # ë Latin Small e with Umlaut
-    C("I"):                     UC(0x00EF),                     # ï Latin Small i with Umlaut
-    C("O"):                     UC(0x00F6),                     # ö Latin Small o with Umlaut
-    C("U"):                     UC(0x00FC),                     # ü Latin Small u with Umlaut
-    C("Y"):                     UC(0x00FF),                     # ÿ Latin Small y with Umlaut
-    C("Shift-A"):               UC(0x00C4),                     # Ä Latin Capital A with Umlaut
-    C("Shift-E"):               UC(0x00CB),                     # Ë Latin Capital E with Umlaut
-    C("Shift-I"):               UC(0x00CF),                     # Ï Latin Capital I with Umlaut
-    C("Shift-O"):               UC(0x00D6),                     # Ö Latin Capital O with Umlaut
-    C("Shift-U"):               UC(0x00DC),                     # Ü Latin Capital U with Umlaut
-    C("Shift-Y"):               UC(0x0178),                     # Ÿ Latin Capital Y with Umlaut
-}, when = lambda _: ac_Chr_main == 0x00A8 and cnfg.optspec_layout == 'US')
-
-keymap("DK-US - Circumflex", {
-    # Valid keys:
-    # a e i o u
-    # A E I O U
-    C("A"):                     UC(0x00E2),                     # â Latin Small a with Circumflex
-    C("E"):                     UC(0x00EA),                     # ê Latin Small e with Circumflex
-    C("I"):                     UC(0x00EE),                     # î Latin Small i with Circumflex
-    C("O"):                     UC(0x00F4),                     # ô Latin Small o with Circumflex
-    C("U"):                     UC(0x00FB),                     # û Latin Small u with Circumflex
-    C("Shift-A"):               UC(0x00C2),                     # Â Latin Capital A with Circumflex
-    C("Shift-E"):               UC(0x00CA),                     # Ê Latin Capital E with Circumflex
-    C("Shift-I"):               UC(0x00CE),                     # Î Latin Capital I with Circumflex
-    C("Shift-O"):               UC(0x00D4),                     # Ô Latin Capital O with Circumflex
-    C("Shift-U"):               UC(0x00DB),                     # Û Latin Capital U with Circumflex
-}, when = lambda _: ac_Chr_main == 0x02C6 and cnfg.optspec_layout == 'US')
-
-keymap("DK-US - Tilde", {
-    # Valid keys:
-    # a n o
-    # A N O
-    C("A"):                     UC(0x00E3),                     # ã Latin Small a with Tilde
-    C("N"):                     UC(0x00F1),                     # ñ Latin Small n with Tilde
-    C("O"):                     UC(0x00F5),                     # õ Latin Small o with Tilde
-    C("Shift-A"):               UC(0x00C3),                     # Ã Latin Capital A with Tilde
-    C("Shift-N"):               UC(0x00D1),                     # Ñ Latin Capital N with Tilde
-    C("Shift-O"):               UC(0x00D5),                     # Õ Latin Capital O with Tilde
-}, when = lambda _: ac_Chr_main == 0x02DC and cnfg.optspec_layout == 'US')
+# Dead Keys combo dicts, one per accent and layout (US or ABC), are defined as
+# data in 'lib/optspec_data.py', together with the "OptSpecialChars" tables.
+# They are only built when 'optspec_layout' is enabled, and only for that layout.
+# Changing the layout from the tray/GUI swaps them without a restart.
+# They all go into one table, keyed by (layout, accent character), served by
+# a single "Dead Keys" keymap. Its condition picks the dict that matches
+# the dead key variable and the layout variable with one lookup, and returns
+# early when no dead key is active.
+deadkeys_table = DeadKeysTable(
+    get_layout  = lambda: cnfg.optspec_layout,
+    get_accent  = lambda: ac_Chr_main,
+)
+
+optspec_tables = OptSpecTables(
+    deadkeys_table,
+    C               = C,
+    UC              = UC,
+    set_dead_key    = setDK,
+    named_actions   = {'apple_logo_alert': apple_logo_alert},
+)
+
+
+def _on_settings_change_optspec(name, old_value, new_value):
+    optspec_tables.use_layout(new_value)
+
+cnfg.add_field_callback('optspec_layout', _on_settings_change_optspec)
+optspec_tables.use_layout(cnfg.optspec_layout)
+
+keymap("Dead Keys", deadkeys_table, when = uncached(lambda ctx: deadkeys_table.condition(ctx)))
 
 
 
@@ -2798,7 +2375,7 @@ keymap("Escape actions for dead keys - Overrides for ABC Extended", {
 
     C("Shift-Alt-Dot"): [getDK(),UC(0x0294),C("Shift-Left"),setDK(0x0294)], # Dead Key Accent: Hook
 
-}, when = lambda _: ac_Chr_main in deadkeys_list and cnfg.optspec_layout == 'ABC')
+}, when = lambda _: ac_Chr_main in deadkeys_set and cnfg.optspec_layout == 'ABC')
 
 keymap("Escape actions for dead keys", {
     # special case shortcuts that should cancel dead keys
@@ -2936,333 +2513,22 @@ keymap("Escape actions for dead keys", {
     C("Shift-Dot"):             [getDK(),C("Shift-Dot"),setDK(None)],
     C("Shift-Slash"):           [getDK(),C("Shift-Slash"),setDK(None)],
 
-}, when = lambda _: ac_Chr_main in deadkeys_list)
+}, when = lambda _: ac_Chr_main in deadkeys_set)
 
 keymap("Disable Dead Keys Tripwire",{
     # Nothing needs to be here. Tripwire keymap to disable active dead keys keymap(s)
-}, when = lambda _: setDK(None)())
-
-
-
-##############################################################################
-###                                                                        ###
-###                                                                        ###
-###       █████  ██████   ██████     ███    ███  █████  ██ ███    ██       ###
-###      ██   ██ ██   ██ ██          ████  ████ ██   ██ ██ ████   ██       ###
-###      ███████ ██████  ██          ██ ████ ██ ███████ ██ ██ ██  ██       ###
-###      ██   ██ ██   ██ ██          ██  ██  ██ ██   ██ ██ ██  ██ ██       ###
-###      ██   ██ ██████   ██████     ██      ██ ██   ██ ██ ██   ████       ###
-###                                                                        ###
-###                                                                        ###
-##############################################################################
-# Main keymap for special characters on the ABC Extended layout
-keymap("OptSpecialChars - ABC", {
-
-    # Number keys row with Option
-    ######################################################
-    C("Alt-Grave"):     [UC(0x0060),C("Shift-Left"),setDK(0x0060)],     # Dead Key Accent: Grave
-
-    C("Alt-1"):                 UC(0x00A1),                     # ¡ Inverted Exclamation Mark
-    C("Alt-2"):                 UC(0x2122),                     # ™ Trade Mark Sign Emoji
-    C("Alt-3"):                 UC(0x00A3),                     # £ British Pound currency symbol
-    C("Alt-4"):                 UC(0x00A2),                     # ¢ Cent currency symbol
-    C("Alt-5"):                 UC(0x00A7),                     # § Section symbol
-
-    C("Alt-6"):         [UC(0x02C6),C("Shift-Left"),setDK(0x02C6)],     # Dead Key Accent: Circumflex
-
-    C("Alt-7"):                 UC(0x00B6),                     # ¶ Paragraph mark (Pilcrow) symbol
-    C("Alt-8"):                 UC(0x2022),                     # • Bullet Point symbol (solid)
-    C("Alt-9"):                 UC(0x00AA),                     # ª Feminine Ordinal Indicator
-    C("Alt-0"):                 UC(0x00BA),                     # º Masculine Ordinal Indicator
-    C("Alt-Minus"):             UC(0x2013),                     # – En Dash punctuation mark
-    C("Alt-Equal"):             UC(0x2260),                     # ≠ Not Equal To symbol
-
-    # Number keys row with Shift+Option
-    ######################################################
-    C("Shift-Alt-Grave"):       UC(0x0300),                     # ` Combining Grave Accent
-    C("Shift-Alt-1"):           UC(0x2044),                     # ⁄ Fraction Slash
-    C("Shift-Alt-2"):           UC(0x20AC),                     # € Euro currency symbol
-    C("Shift-Alt-3"):           UC(0x2039),                     # ‹ Single Left-Pointing Angle Quotation mark
-    C("Shift-Alt-4"):           UC(0x203A),                     # › Single Right-Pointing Angle Quotation mark
-    C("Shift-Alt-5"):           UC(0x2020),                     # † Simple dagger (cross) symbol
-    C("Shift-Alt-6"):           UC(0x0302),                     #  ̂ Combining Circumflex Accent
-    C("Shift-Alt-7"):           UC(0x2021),                     # ‡ Double dagger (cross) symbol
-    C("Shift-Alt-8"):           UC(0x00B0),                     # ° Degree Sign
-    C("Shift-Alt-9"):           UC(0x00B7),                     # · Middle Dot (interpunct/middot)
-    C("Shift-Alt-0"):           UC(0x201A),                     # ‚ Single low-9 quotation mark
-    C("Shift-Alt-Minus"):       UC(0x2014),                     # — Em Dash punctuation mark
-    C("Shift-Alt-Equal"):       UC(0x00B1),                     # ± Plus Minus mathematical symbol
-
-    # Tab key row with Option
-    ######################################################
-    C("Alt-Q"):                 UC(0x0153),                     # œ Small oe (oethel) ligature
-
-    C("Alt-W"):         [UC(0x02D9),C("Shift-Left"),setDK(0x02D9)],     # Dead Key Accent: Dot Above
-    C("Alt-E"):         [UC(0x00B4),C("Shift-Left"),setDK(0x00B4)],     # Dead Key Accent: Acute
-
-    C("Alt-R"):                 UC(0x00AE),                     # ® Registered Trade Mark Sign
-    C("Alt-T"):                 UC(0x00FE),                     # þ Latin Small Letter Thorn
-    C("Alt-Y"):                 UC(0x00A5),                     # ¥ Japanese Yen currency symbol
-
-    C("Alt-U"):         [UC(0x00A8),C("Shift-Left"),setDK(0x00A8)],     # Dead Key Accent: Umlaut/Diaeresis
-    C("Alt-I"):         [UC(0x02BC),C("Shift-Left"),setDK(0x02BC)],     # Dead Key Accent: Apostrophe/Horn
-
-    C("Alt-O"):                 UC(0x00F8),                     # ø Latin Small Letter o with Stroke
-
-    C("Alt-P"):         [UC(0x002C),C("Shift-Left"),setDK(0x002C)],     # Dead Key Accent: Comma Below
-
-    C("Alt-Left_Brace"):        UC(0x201C),                     # “ Left Double Quotation Mark
-    C("Alt-Right_Brace"):       UC(0x2018),                     # ‘ Left Single Quotation Mark
-    C("Alt-Backslash"):         UC(0x00AB),                     # « Left-Pointing Double Angle Quotation Mark
-
-    # Tab key row with Shift+Option
-    ######################################################
-    C("Shift-Alt-Q"):           UC(0x0152),                     # Œ Capital OE (Oethel) ligature
-    C("Shift-Alt-W"):           UC(0x0307),                     # ˙ Combining Dot Above
-    C("Shift-Alt-E"):           UC(0x0301),                     #  ́ Combining Acute Accent
-    C("Shift-Alt-R"):           UC(0x2030),                     # ‰ Per mille symbol (zero over zero-zero)
-    C("Shift-Alt-T"):           UC(0x00DE),                     # Þ Latin Capital Letter Thorn
-
-    # C("Shift-Alt-Y"):           UC(0x02F5), # UC(0x030F),       # ̏  Combining Double Grave Accent
-    # Spacing issues when using Combining Double Grave {U+030F}
-    # Substituting {U+02F5}: ˵ Modifier Letter Middle Double Grave Accent for initial presentation
-    C("Shift-Alt-Y"):   [UC(0x02F5),C("Shift-Left"),setDK(0x02F5)],     # Dead Key Accent: Double Grave
-
-    C("Shift-Alt-U"):           UC(0x0308),                     #  ̈ Combining Diaeresis/Umlaut
-    C("Shift-Alt-I"):           UC(0x031B),                     # ̛ Combining Horn (Apostrophe)
-    C("Shift-Alt-O"):           UC(0x00D8),                     # Ø Latin Capital Letter O with Stroke
-    C("Shift-Alt-P"):           UC(0x0326),                     #  ̦ Combining Comma Below
-    C("Shift-Alt-Left_Brace"):  UC(0x201D),                     # ” Right Double Quotation Mark
-    C("Shift-Alt-Right_Brace"): UC(0x2019),                     # ’ Right Single Quotation Mark
-    C("Shift-Alt-Backslash"):   UC(0x00BB),                     # » Right-Pointing Double Angle Quotation Mark
-
-    # CapsLock key row with Option
-    ######################################################
-
-    C("Alt-A"):         [UC(0x00AF),C("Shift-Left"),setDK(0x00AF)],     # Dead Key Accent: Macron/Line Above
-
-    C("Alt-S"):                 UC(0x00DF),                     # ß German Eszett/beta (Sharfes/Sharp S)
-    C("Alt-D"):                 UC(0x00F0),                     # ð Latin Small Letter Eth
-    C("Alt-F"):                 UC(0x0192),                     # ƒ Function/florin currency symbol
-    C("Alt-G"):                 UC(0x00A9),                     # © Copyright Sign
-
-    C("Alt-H"):         [UC(0x02CD),C("Shift-Left"),setDK(0x02CD)],     # Dead Key Accent: Low Macron/Line Below
-    C("Alt-J"):         [UC(0x02DD),C("Shift-Left"),setDK(0x02DD)],     # Dead Key Accent: Double Acute
-    C("Alt-K"):         [UC(0x02DA),C("Shift-Left"),setDK(0x02DA)],     # Dead Key Accent: Ring Above
-    C("Alt-L"):         [UC(0x002D),C("Shift-Left"),setDK(0x002D)],     # Dead Key Accent: Stroke/Hyphen-Minus
-
-    C("Alt-Semicolon"):         UC(0x2026),                     # … Horizontal ellipsis
-    C("Alt-Apostrophe"):        UC(0x00E6),                     # æ Small ae ligature
-
-    # CapsLock key row with Shift+Option
-    ######################################################
-    C("Shift-Alt-A"):           UC(0x0304),                     #  ̄ Combining Macron/Line Below
-
-    # C("Shift-Alt-S"): [UC(0x0311),C("Shift-Left"),setDK(0x0311)],   # Dead Key Accent: Combining Inverted Breve
-    # Combining Inverted Breve has spacing problems
-    # Substituting {U+1D16}: ᴖ Latin Small Letter Top Half O
-    C("Shift-Alt-S"):   [UC(0x1D16),C("Shift-Left"),setDK(0x1D16)],     # Dead Key Accent: Inverted Breve
-
-    C("Shift-Alt-D"):           UC(0x00D0),                     # Ð Latin Capital Letter Eth
-
-    # C("Shift-Alt-F"):   [UC(0x0330),C("Shift-Left"),setDK(0x0330)],     # Dead Key Accent: Tilde Below
-    # Combining Tilde Below has spacing problems
-    # Substituting {U+02F7}: ˷ Modifier Letter Low Tilde
-    C("Shift-Alt-F"):   [UC(0x02F7),C("Shift-Left"),setDK(0x02F7)],     # Dead Key Accent: Tilde Below
-    C("Shift-Alt-G"):   [UC(0x2038),C("Shift-Left"),setDK(0x2038)],     # Dead Key Accent: Caret/Circumflex Below
+}, when = uncached(lambda _: setDK(None)()) )
 
-    C("Shift-Alt-H"):           UC(0x0331),                     # ̱  Combining Macron/Line Below
-    C("Shift-Alt-J"):           UC(0x030B),                     #  ̋ Combining Double Acute Accent
-    C("Shift-Alt-K"):           UC(0x030A),                     #  ̊ Combining Ring Above
-    C("Shift-Alt-L"):           UC(0x0335),                     #  ̵ Combining Short Stroke Overlay
 
-    C("Shift-Alt-Semicolon"):  [UC(0x2116),C("Shift-Left"),setDK(0x2116)],      # Dead Key Accent: Numero Sign
 
-    C("Shift-Alt-Apostrophe"):  UC(0x00C6),                     # Æ Capital AE ligature
-
-    # Shift keys row with Option
-    ######################################################
-
-    C("Alt-Z"): [UC(0x02C0),C("Shift-Left"),setDK(0x02C0)],     # Dead Key Accent: Hook Above/Glottal Stop
-    C("Alt-X"): [UC(0x002E),C("Shift-Left"),setDK(0x002E)],     # Dead Key Accent: Dot Below
-    C("Alt-C"): [UC(0x00B8),C("Shift-Left"),setDK(0x00B8)],     # Dead Key Accent: Cedilla/Cedille
-    C("Alt-V"): [UC(0x02C7),C("Shift-Left"),setDK(0x02C7)],     # Dead Key Accent: Caron/hacek
-    C("Alt-B"): [UC(0x02D8),C("Shift-Left"),setDK(0x02D8)],     # Dead Key Accent: Breve
-    C("Alt-N"): [UC(0x02DC),C("Shift-Left"),setDK(0x02DC)],     # Dead Key Accent: Tilde
-    C("Alt-M"): [UC(0x02DB),C("Shift-Left"),setDK(0x02DB)],     # Dead Key Accent: Ogonek
-
-    C("Alt-Comma"):             UC(0x2264),                     # ≤ Less Than or Equal To symbol
-    C("Alt-Dot"):               UC(0x2265),                     # ≥ Greater Than or Equal To symbol
-    C("Alt-Slash"):             UC(0x00F7),                     # ÷ Obelus/Division symbol
-
-    # Shift keys row with Shift+Option
-    ######################################################
-    C("Shift-Alt-Z"):           UC(0x0309),                     # ̉  Combining Hook Above (hoi)
-    C("Shift-Alt-X"):           UC(0x0323),                     # ̣  Combining Dot Below (nang)
-    C("Shift-Alt-C"):           UC(0x0327),                     #  ̧ Combining Cedilla
-    C("Shift-Alt-V"):           UC(0x030C),                     #  ̌ Combining Caron/hacek
-    C("Shift-Alt-B"):           UC(0x0306),                     #  ̆ Combining Breve
-    C("Shift-Alt-N"):           UC(0x0303),                     #  ̃ Combining Tilde
-    C("Shift-Alt-M"):           UC(0x0328),                     #  ̨ Combining Ogonek (nasal hook)
-    C("Shift-Alt-Comma"):       UC(0x201E),                     # „ Double Low-9 Quotation Mark
-
-    C("Shift-Alt-Dot"): [UC(0x0294),C("Shift-Left"),setDK(0x0294)],     # Dead Key Accent: Hook
-
-    C("Shift-Alt-Slash"):       UC(0x00BF),                     # ¿ Inverted Question mark
-
-}, when = lambda ctx:
-    cnfg.optspec_layout == 'ABC' and
-    matchProps(not_clas=terms_and_remotes_Str)(ctx)
-)
-
-
-
-######################################################################
-###                                                                ###
-###                                                                ###
-###      ██    ██ ███████     ███    ███  █████  ██ ███    ██      ###
-###      ██    ██ ██          ████  ████ ██   ██ ██ ████   ██      ###
-###      ██    ██ ███████     ██ ████ ██ ███████ ██ ██ ██  ██      ###
-###      ██    ██      ██     ██  ██  ██ ██   ██ ██ ██  ██ ██      ###
-###       ██████  ███████     ██      ██ ██   ██ ██ ██   ████      ###
-###                                                                ###
-###                                                                ###
-######################################################################
-# Main keymap for special characters on the standard US layout
-keymap("OptSpecialChars - US", {
-
-    # Number keys row with Option
-    ######################################################
-    C("Alt-Grave"): [UC(0x0060), C("Shift-Left"), setDK(0x0060)],       # Dead Key Accent: Grave
-
-    C("Alt-1"):                 UC(0x00A1),                     # ¡ Inverted Exclamation Mark
-    C("Alt-2"):                 UC(0x2122),                     # ™ Trade Mark Sign Emoji
-    C("Alt-3"):                 UC(0x00A3),                     # £ British Pound currency symbol
-    C("Alt-4"):                 UC(0x00A2),                     # ¢ Cent currency symbol
-    C("Alt-5"):                 UC(0x221E),                     # ∞ Infinity mathematical symbol
-    C("Alt-6"):                 UC(0x00A7),                     # § Section symbol
-    C("Alt-7"):                 UC(0x00B6),                     # ¶ Paragraph mark (Pilcrow) symbol
-    C("Alt-8"):                 UC(0x2022),                     # • Bullet Point symbol (solid)
-    C("Alt-9"):                 UC(0x00AA),                     # ª Feminine Ordinal Indicator
-    C("Alt-0"):                 UC(0x00BA),                     # º Masculine Ordinal Indicator
-    C("Alt-Minus"):             UC(0x2013),                     # – En Dash punctuation mark
-    C("Alt-Equal"):             UC(0x2260),                     # ≠ Not Equal To symbol
-
-    # Number keys row with Shift+Option
-    ######################################################
-    C("Shift-Alt-Grave"):       UC(0x0060),                     # ` Grave Accent (non-combining)
-    C("Shift-Alt-1"):           UC(0x2044),                     # ⁄ Fraction Slash
-    C("Shift-Alt-2"):           UC(0x20AC),                     # € Euro currency symbol
-    C("Shift-Alt-3"):           UC(0x2039),                     # ‹ Single Left-Pointing Angle Quotation mark
-    C("Shift-Alt-4"):           UC(0x203A),                     # › Single Right-Pointing Angle Quotation mark
-    C("Shift-Alt-5"):           UC(0xFB01),                     # ﬁ Latin Small Ligature Fi
-    C("Shift-Alt-6"):           UC(0xFB02),                     # ﬂ Latin Small Ligature Fl
-    C("Shift-Alt-7"):           UC(0x2021),                     # ‡ Double dagger (cross) symbol
-    C("Shift-Alt-8"):           UC(0x00B0),                     # ° Degree Sign
-    C("Shift-Alt-9"):           UC(0x00B7),                     # · Middle Dot (interpunct/middot)
-    C("Shift-Alt-0"):           UC(0x201A),                     # ‚ Single low-9 quotation mark
-    C("Shift-Alt-Minus"):       UC(0x2014),                     # — Em Dash punctuation mark
-    C("Shift-Alt-Equal"):       UC(0x00B1),                     # ± Plus Minus mathematical symbol
-
-    # Tab key row with Option
-    ######################################################
-    C("Alt-Q"):                 UC(0x0153),                     # œ Small oe (oethel) ligature
-    C("Alt-W"):                 UC(0x2211),                     # ∑ N-Ary Summation (sigma) notation
-
-    C("Alt-E"):         [UC(0x00B4), C("Shift-Left"), setDK(0x00B4)],   # Dead Key Accent: Acute
-
-    C("Alt-R"):                 UC(0x00AE),                     # ® Registered Trade Mark Sign
-    C("Alt-T"):                 UC(0x2020),                     # † Simple dagger (cross) symbol
-    C("Alt-Y"):                 UC(0x00A5),                     # ¥ Japanese Yen currency symbol
-
-    C("Alt-U"):         [UC(0x00A8), C("Shift-Left"), setDK(0x00A8)],   # Dead Key Accent: Umlaut/Diaeresis
-
-    C("Alt-I"):         [UC(0x02C6), C("Shift-Left"), setDK(0x02C6)],   # Dead Key Accent: Circumflex
-
-    C("Alt-O"):                 UC(0x00F8),                     # ø Latin Small Letter o with Stroke
-    C("Alt-P"):                 UC(0x03C0),                     # π Greek Small Letter Pi
-    C("Alt-Left_Brace"):        UC(0x201C),                     # “ Left Double Quotation Mark
-    C("Alt-Right_Brace"):       UC(0x2018),                     # ‘ Left Single Quotation Mark
-    C("Alt-Backslash"):         UC(0x00AB),                     # « Left-Pointing Double Angle Quotation Mark
-
-    # Tab key row with Shift+Option
-    ######################################################
-    C("Shift-Alt-Q"):           UC(0x0152),                     # Œ Capital OE (Oethel) ligature
-    C("Shift-Alt-W"):           UC(0x201E),                     # „ Double Low-9 Quotation mark
-    C("Shift-Alt-E"):           UC(0x00B4),                     # ´ Acute Accent diacritic (non-combining)
-    C("Shift-Alt-R"):           UC(0x2030),                     # ‰ Per mille symbol (zero over zero-zero)
-    C("Shift-Alt-T"):           UC(0x02C7),                     # ˇ Caron/hacek diacritic (non-combining)
-    C("Shift-Alt-Y"):           UC(0x00C1),                     # Á Latin Capital Letter A with Acute
-    C("Shift-Alt-U"):           UC(0x00A8),                     # ¨ Diaeresis/Umlaut (non-combining)
-    C("Shift-Alt-I"):           UC(0x02C6),                     # ˆ Circumflex Accent (non-combining)
-    C("Shift-Alt-O"):           UC(0x00D8),                     # Ø Latin Capital Letter O with Stroke
-    C("Shift-Alt-P"):           UC(0x220F),                     # ∏ N-Ary Product mathematical symbol
-    C("Shift-Alt-Left_Brace"):  UC(0x201D),                     # ” Right Double Quotation Mark
-    C("Shift-Alt-Right_Brace"): UC(0x2019),                     # ’ Right Single Quotation Mark
-    C("Shift-Alt-Backslash"):   UC(0x00BB),                     # » Right-Pointing Double Angle Quotation Mark
-
-    # CapsLock key row with Option
-    ######################################################
-    C("Alt-A"):                 UC(0x00E5),                     # å Small Letter a with Ring Above
-    C("Alt-S"):                 UC(0x00DF),                     # ß German Eszett/beta (Sharfes/Sharp S)
-    C("Alt-D"):                 UC(0x2202),                     # ∂ Partial Differential
-    C("Alt-F"):                 UC(0x0192),                     # ƒ Function/florin currency symbol
-    C("Alt-G"):                 UC(0x00A9),                     # © Copyright Sign
-    C("Alt-H"):                 UC(0x02D9),                     # ˙ Dot Above diacritic (non-combining)
-    C("Alt-J"):                 UC(0x2206),                     # ∆ Increment, laplace operator symbol
-    C("Alt-K"):                 UC(0x02DA),                     # ˚ Ring Above diacritic (non-combining)
-    C("Alt-L"):                 UC(0x00AC),                     # ¬ Not Sign angled dash symbol
-    C("Alt-Semicolon"):         UC(0x2026),                     # … Horizontal ellipsis
-    C("Alt-Apostrophe"):        UC(0x00E6),                     # æ Small ae ligature
-
-    # CapsLock key row with Shift+Option
-    ######################################################
-    C("Shift-Alt-A"):           UC(0x00C5),                     # Å Capital Letter A with Ring Above
-    C("Shift-Alt-S"):           UC(0x00CD),                     # Í Latin Capital Letter I with Acute
-    C("Shift-Alt-D"):           UC(0x00CE),                     # Î Latin Capital Letter I with Circumflex
-    C("Shift-Alt-F"):           UC(0x00CF),                     # Ï Latin Capital Letter I with Diaeresis
-    C("Shift-Alt-G"):           UC(0x02DD),                     # ˝ Double Acute Accent (non-combining)
-    C("Shift-Alt-H"):           UC(0x00D3),                     # Ó Latin Capital Letter O with Acute
-    C("Shift-Alt-J"):           UC(0x00D4),                     # Ô Latin Capital Letter O with Circumflex
-    #########################################################################################################
-    # The Apple logo is at {U+F8FF} in a Unicode Private Use Area. Only at that location in Mac fonts. 
-    # Symbol exists at {U+F000} in Baskerville Old Face font. 
-    C("Shift-Alt-K"):   [apple_logo_alert,UC(0xF000)],          #  Apple logo [req's Baskerville Old Face font]
-    C("Shift-Alt-L"):           UC(0x00D2),                     # Ò Latin Capital Letter O with Grave
-    C("Shift-Alt-Semicolon"):   UC(0x00DA),                     # Ú Latin Capital Letter U with Acute
-    C("Shift-Alt-Apostrophe"):  UC(0x00C6),                     # Æ Capital AE ligature
-
-    # Shift keys row with Option
-    ######################################################
-    C("Alt-Z"):                 UC(0x03A9),                     # Ω Greek Capital Letter Omega
-    C("Alt-X"):                 UC(0x2248),                     # ≈ Almost Equal To symbol
-    C("Alt-C"):                 UC(0x00E7),                     # ç Small Letter c with Cedilla
-    C("Alt-V"):                 UC(0x221A),                     # √ Square Root radical sign
-    C("Alt-B"):                 UC(0x222B),                     # ∫ Integral mathematical symbol
-
-    C("Alt-N"): [UC(0x02DC), C("Shift-Left"), setDK(0x02DC)],   # Dead Key Accent: Tilde
-
-    C("Alt-M"):                 UC(0x00B5),                     # µ Micro (mu) symbol
-    C("Alt-Comma"):             UC(0x2264),                     # ≤ Less Than or Equal To symbol
-    C("Alt-Dot"):               UC(0x2265),                     # ≥ Greater Than or Equal To symbol
-    C("Alt-Slash"):             UC(0x00F7),                     # ÷ Obelus/Division symbol
-
-    # Shift keys row with Shift+Option
-    ######################################################
-    C("Shift-Alt-Z"):           UC(0x00B8),                     # ¸ Spacing Cedilla diacritic (non-combining)
-    C("Shift-Alt-X"):           UC(0x02DB),                     # ˛ Ogonek diacritic (non-combining)
-    C("Shift-Alt-C"):           UC(0x00C7),                     # Ç Capital Letter C with Cedilla
-    C("Shift-Alt-V"):           UC(0x25CA),                     # ◊ Lozenge (diamond) shape symbol
-    C("Shift-Alt-B"):           UC(0x0131),                     # ı Latin Small Letter Dotless i
-    C("Shift-Alt-N"):           UC(0x02DC),                     # ˜ Small Tilde character
-    C("Shift-Alt-M"):           UC(0x00C2),                     # Â Latin Capital Letter A with Circumflex
-    C("Shift-Alt-Comma"):       UC(0x00AF),                     # ¯ Macron/overline/overbar (non-combining)
-    C("Shift-Alt-Dot"):         UC(0x02D8),                     # ˘ Breve diacritic (non-combining)
-    C("Shift-Alt-Slash"):       UC(0x00BF),                     # ¿ Inverted Question mark
-
-}, when = lambda ctx:
-    cnfg.optspec_layout == 'US' and
-    matchProps(not_clas=terms_and_remotes_Str)(ctx)
+###################################################################
+###  OPTSPECIALCHARS - ABC EXTENDED OR US LAYOUT                ###
+###################################################################
+# Main keymap for special characters on the Option key, for the layout selected
+# by 'optspec_layout'. The mappings come from 'lib/optspec_data.py' (see above).
+keymap("OptSpecialChars", optspec_tables.optspec, when = lambda ctx:
+    optspec_tables.use_layout(cnfg.optspec_layout) and
+    matchGroups(not_grp=GRP_TERMINALS | GRP_REMOTES)(ctx)
 )
 
 
@@ -3278,12 +2544,20 @@ keymap("OptSpecialChars - US", {
 ###                                                                                ###
 ###                                                                                ###
 ######################################################################################
+startup_profiler.phase('USER APPS')
 ### This is a good location in the config file for adding new custom keymaps for 
 ### user applications and custom function keys. Watch out that you don't override 
 ### any "general" shortcuts like Cmd+Z/X/C/V that may be defined below this section. 
 ### Changes made between the "slice" marks will be retained by the Toshy installer 
 ### if you reinstall and it finds matching start/end markers for each section. 
 
+# Conditions in the user slices run on every key event, since they may read anything
+# (custom globals toggled by a macro, time, environment, etc.). A condition that only
+# depends on the window and device (like `matchProps()` and `matchGroups()` do) can be
+# wrapped in `cached()` to be served from the condition cache. A cached condition that
+# reads other state needs a `cond_cache.invalidate()` call whenever that state changes.
+cond_cache.cache_by_default = False
+
 ###################################################################################################
 ###  SLICE_MARK_START: user_apps  ###  EDITS OUTSIDE THESE MARKS WILL BE LOST ON UPGRADE
 
@@ -3294,12 +2568,12 @@ keymap("User hardware keys", {
 
 
 }, when = lambda ctx:
-    cnfg.screen_has_focus and
-    matchProps(not_clas=remoteStr)(ctx)
+    matchGroups(not_grp=GRP_REMOTES)(ctx)
 )
 
 ###  SLICE_MARK_END: user_apps  ###  EDITS OUTSIDE THESE MARKS WILL BE LOST ON UPGRADE
 ###################################################################################################
+cond_cache.cache_by_default = True
 
 
 # HOW TO SWAP CMD+SPACE AND CTRL+SPACE (SPOTLIGHT EQUIVALENT VS INPUT SWITCHING)
@@ -3311,7 +2585,6 @@ keymap("User hardware keys", {
 #     C("LC-Space"):              [iEF2NT(),C("THE-REAL-COMBO-FOR-SOME-LAUNCHER")],    # Spotlight equivalent
 #     C("Shift-LC-Space"):        None,    # block the default general terminals shortcut for input switching
 # }, when = lambda ctx:
-#       cnfg.screen_has_focus and
 #       matchProps(clas=termStr)(ctx)
 # )
 # keymap("User overrides general", {
@@ -3321,7 +2594,6 @@ keymap("User hardware keys", {
 #     C("RC-Space"):              [bind,C("THE-REAL-COMBO-FOR-INPUT-SWITCHING")],    # input switch forward
 #     C("Shift-RC-Space"):        [bind,C("THE-REAL-COMBO-FOR-REVERSE-INPUT-SWITCHING")],    # input switch reverse (OPTIONAL)
 # }, when = lambda ctx:
-#       cnfg.screen_has_focus and
 #       matchProps(clas=remoteStr)(ctx)
 # )
 
@@ -3338,6 +2610,7 @@ keymap("User hardware keys", {
 ###                                                                             ###
 ###                                                                             ###
 ###################################################################################
+startup_profiler.phase('MISC APPS')
 # Miscellaneous apps that need a few fixes
 
 keymap("Thunderbird email client", {
@@ -3371,7 +2644,6 @@ keymap("JDownloader", {
     C("RC-Backspace"):          C("Delete"),                    # Remove download from list
     C("RC-Comma"):              C("C-P"),                       # Open preferences (settings)
 }, when = lambda ctx:
-    cnfg.screen_has_focus and
     matchProps(lst=JDownloader_lod)(ctx) )
 
 keymap("Totem video player", {
@@ -3399,6 +2671,7 @@ keymap("LibreOffice Writer", {
 ###                                                                                              ###
 ###                                                                                              ###
 ####################################################################################################
+startup_profiler.phase('FINDER MODS')
 
 ###  START OF FILE MANAGER GROUP OF KEYMAPS - FINDER MODS  ###
 
@@ -3603,7 +2876,6 @@ keymap("XDG file dialogs", {
     C("RC-Up"):                 C("Alt-Up"),                    # Go Up dir
     C("RC-Down"):               C("Enter"),                     # Go Down dir (open folder/file) [universal]
 }, when = lambda ctx:
-    cnfg.screen_has_focus and
     matchProps(lst=file_open_save_dialogs)(ctx)
 )
 
@@ -3676,7 +2948,7 @@ keymap("General File Managers - Finder Mods", {
     # C("Tab"):               iEF2(C("Tab"), C("Tab"), True, True),       # Set Enter to Enter after using Tab key
     C("Shift-RC-Space"):    iEF2(C("Shift-C-Space"), False),    # Set Enter to Enter for alternate overview shortcut
     C("Shift-RC-Enter"):        C("Enter"),                             # alternative "Enter" key for unusual cases
-}, when = matchProps(clas=filemanagerStr))
+}, when = matchGroups(grp=GRP_FILEMANAGERS))
 
 
 
@@ -3691,6 +2963,7 @@ keymap("General File Managers - Finder Mods", {
 ###                                                                              ###
 ###                                                                              ###
 ####################################################################################
+startup_profiler.phase('BROWSERS')
 
 # Open preferences in Firefox browsers
 keymap("Firefox Browsers Overrides", {
@@ -3703,7 +2976,7 @@ keymap("Firefox Browsers Overrides", {
     # Block shortcuts that might get confused with Shift+Cmd+[Left/Right]_Brace
     C("Shift-RC-Minus"):        ignore_combo,                       # Ignore alternate zoom out shortcut
     C("Shift-RC-Equal"):        ignore_combo,                       # Ignore alternate zoom in shortcut
-}, when = matchProps(clas=browsers_firefoxStr))
+}, when = matchGroups(grp=GRP_BROWSERS_FIREFOX))
 
 # Vivaldi is a Chromium based web browser
 keymap("Overrides for Vivaldi browser", {
@@ -3729,7 +3002,7 @@ keymap("Chrome Browsers Overrides", {
     C("RC-y"):                  C("C-H"),                       # Browser History
     C("Alt-RC-u"):              C("C-U"),                       # View Page Source
     C("Shift-RC-j"):            C("C-J"),                       # Show Downloads view
-}, when = matchProps(clas=browsers_chromeStr))
+}, when = matchGroups(grp=GRP_BROWSERS_CHROME))
 
 # Keybindings for General Web Browsers
 keymap("General Web Browsers", {
@@ -3757,7 +3030,7 @@ keymap("General Web Browsers", {
     # Use Cmd+Braces keys for tab navigation instead of page navigation 
     # C("C-Left_Brace"):        C("C-Page_Up"),
     # C("C-Right_Brace"):       C("C-Page_Down"),
-}, when = matchProps(clas=browsers_allStr))
+}, when = matchGroups(grp=GRP_BROWSERS_ALL))
 
 
 
@@ -3772,6 +3045,7 @@ keymap("General Web Browsers", {
 ###                                                                                                    ###
 ###                                                                                                    ###
 ##########################################################################################################
+startup_profiler.phase('CODE EDITORS')
 
 
 # Keybindings for IntelliJ
@@ -3887,8 +3161,7 @@ keymap("Wordwise - not vscode", {
     # **
     #
 }, when = lambda ctx:
-    cnfg.screen_has_focus and
-    matchProps(not_clas=vscodes_and_remotes_Str)(ctx)
+    matchGroups(not_grp=GRP_VSCODES | GRP_REMOTES)(ctx)
 )
 
 # Keybindings for VS Code and variants
@@ -3898,7 +3171,7 @@ keymap("VSCodes overrides for Chromebook/IBM - Sublime", {
     cnfg.ST3_in_VSCode and
     (   isKBtype('Chromebook', map="vscodes ovr cbook - sublime")(ctx) or
         isKBtype('IBM', map="vscodes ovr ibm - sublime")(ctx) ) and
-    matchProps(clas=vscodeStr)(ctx)
+    matchGroups(grp=GRP_VSCODES)(ctx)
 )
 keymap("VSCodes overrides for not Chromebook/IBM - Sublime", {
     C("Super-C-g"):             C("C-f2"),                      # Default - Sublime - find_all_under
@@ -3906,7 +3179,7 @@ keymap("VSCodes overrides for not Chromebook/IBM - Sublime", {
     cnfg.ST3_in_VSCode and
     not ( isKBtype('Chromebook', map="vscodes ovr not cbook - sublime")(ctx) or 
     isKBtype('IBM', map="vscodes ovr not ibm - sublime")(ctx) ) and 
-    matchProps(clas=vscodeStr)(ctx)
+    matchGroups(grp=GRP_VSCODES)(ctx)
 )
 keymap("VSCodes overrides for Chromebook/IBM", {
     C("Alt-c"):                 C("C-c"),                       #  Chromebook/IBM - Terminal - Sigint
@@ -3914,7 +3187,7 @@ keymap("VSCodes overrides for Chromebook/IBM", {
 }, when = lambda ctx:
     (   isKBtype('Chromebook', map="vscodes ovr cbook")(ctx) or 
         isKBtype('IBM', map="vscodes ovr ibm")(ctx) ) and
-    matchProps(clas=vscodeStr)(ctx)
+    matchGroups(grp=GRP_VSCODES)(ctx)
 )
 keymap("VSCodes overrides for not Chromebook/IBM", {
     C("Super-c"):               C("C-c"),                       # Default - Terminal - Sigint
@@ -3922,7 +3195,7 @@ keymap("VSCodes overrides for not Chromebook/IBM", {
 }, when = lambda ctx:
     not (   isKBtype('Chromebook', map="vscodes ovr not cbook")(ctx) or
             isKBtype('IBM', map="vscodes ovr not ibm")(ctx) ) and
-    matchProps(clas=vscodeStr)(ctx)
+    matchGroups(grp=GRP_VSCODES)(ctx)
 )
 keymap("VSCodes", {
     # C("Super-Space"):           C("C-Space"),                  # Basic code completion (conflicts with input switching)
@@ -3989,8 +3262,7 @@ keymap("VSCodes", {
     C("Shift-f3"):              ignore_combo,                   # cancel find_prev
     C("C-Shift-g"):             C("Shift-f3"),                  # find_prev
 }, when = lambda ctx:
-    cnfg.screen_has_focus and
-    matchProps(clas=vscodeStr)(ctx)
+    matchGroups(grp=GRP_VSCODES)(ctx)
 )
 
 # Keybindings for Sublime Text
@@ -4002,7 +3274,7 @@ keymap("Sublime Text overrides for Chromebook/IBM", {
 }, when = lambda ctx:
     (   isKBtype('Chromebook', map="sublime ovr cbook")(ctx) or 
         isKBtype('IBM', map="sublime ovr ibm")(ctx) ) and
-    matchProps(clas=sublimeStr)(ctx)
+    matchGroups(grp=GRP_SUBLIMES)(ctx)
 )
 keymap("Sublime Text overrides for not Chromebook/IBM", {
     # C("Super-c"):               C("C-c"),                       # Default - Terminal - Sigint
@@ -4012,7 +3284,7 @@ keymap("Sublime Text overrides for not Chromebook/IBM", {
 }, when = lambda ctx:
     not (   isKBtype('Chromebook', map="sublime ovr not cbook")(ctx) or 
             isKBtype('IBM', map="sublime ovr not ibm")(ctx) ) and
-    matchProps(clas=sublimeStr)(ctx)
+    matchGroups(grp=GRP_SUBLIMES)(ctx)
 )
 keymap("Sublime Text", {
     # C("Super-c"):               C("C-c"),                       # Default - Terminal - Sigint
@@ -4081,7 +3353,7 @@ keymap("Sublime Text", {
     C("C-Alt-Shift-Key_5"):     C("Alt-Shift-Key_5"),           # set_layout
     # C(""):                    ignore_combo,                   # cancel
     # C(""):                    C(""),                          #
-}, when = matchProps(clas=sublimeStr))
+}, when = matchGroups(grp=GRP_SUBLIMES))
 
 keymap("Kate Advanced Text Editor", {
     C("RC-Comma"):              C("Shift-C-Comma"),             # Open settings/preferences
@@ -4122,6 +3394,7 @@ keymap("GNOME Text Editor", {
 ###                                                                ###
 ###                                                                ###
 ######################################################################
+startup_profiler.phase('DIALOG FIXES')
 ### Fixes for the problem of modal dialogs and other "child" 
 ### windows failing to close with Cmd+W.
 ### Many dialogs respond to the Escape key, others may require the 
@@ -4138,7 +3411,6 @@ keymap("GNOME Text Editor", {
 keymap("Cmd+W dialog fix - send Escape", {
     C("RC-W"):                  iEF2(C("Esc"), True),
 }, when = lambda ctx:
-    cnfg.screen_has_focus and
     matchProps(lst=dialogs_Escape_lod)(ctx)
 )
 
@@ -4148,14 +3420,12 @@ if DISTRO_ID == 'manjaro'  and DESKTOP_ENV == 'gnome':
     keymap("Cmd+W dialog fix - Super+Q Manjaro GNOME", {
         C("RC-W"):                  iEF2(C("Super-Q"), True),
     }, when = lambda ctx:
-        cnfg.screen_has_focus and
         matchProps(lst=dialogs_CloseWin_lod)(ctx)
     )
 
 keymap("Cmd+W dialog fix - Alt+F4", {
     C("RC-W"):                  iEF2(C("Alt-F4"), True),
 }, when = lambda ctx:
-    cnfg.screen_has_focus and
     matchProps(lst=dialogs_CloseWin_lod)(ctx)
 )
 
@@ -4172,6 +3442,7 @@ keymap("Cmd+W dialog fix - Alt+F4", {
 ###                                                                   ###
 ###                                                                   ###
 #########################################################################
+startup_profiler.phase('TAB NAV FIXES')
 ### Various fixes for supporting tab navigation shortcuts like Shift+Cmd+Braces
 
 
@@ -4199,7 +3470,6 @@ keymap("Tab Nav fix for apps that use Ctrl+Shift+Tab/Ctrl+Tab", {
     C("Shift-RC-Left"):         C("C-Shift-Tab"),               # Tab nav: Go to prior tab (left)
     C("Shift-RC-Right"):        C("C-Tab"),                     # Tab nav: Go to next tab (right)
 }, when = lambda ctx:
-    cnfg.screen_has_focus and
     matchProps(clas=tab_UI_fix_CtrlShiftTab_Str)(ctx)
 )
 
@@ -4208,7 +3478,6 @@ keymap("Tab Nav fix for apps that use Ctrl+Alt+PgUp/PgDn", {
     C("Shift-RC-Left_Brace"):   C("C-Alt-Page_Up"),             # Go to prior tab (Left)
     C("Shift-RC-Right_Brace"):  C("C-Alt-Page_Down"),           # Go to next tab (Right)
 }, when = lambda ctx:
-    cnfg.screen_has_focus and
     matchProps(clas=tab_UI_fix_CtrlAltPgUp_Str)(ctx)
 )
 
@@ -4242,6 +3511,7 @@ keymap("Elementary Terminal tab switching", {
 ###                                                                                    ###
 ###                                                                                    ###
 ##########################################################################################
+startup_profiler.phase('TERMINALS')
 
 keymap("Alacritty terminal", {
     C("RC-K"):                  C("C-L"),                       # clear log
@@ -4311,66 +3581,48 @@ keymap("Xfce4 terminal", {
 # Overrides to General Terminals shortcuts for specific distros (or are they really just desktop environments?)
 
 if DISTRO_ID in ['fedora', 'almalinux'] and DESKTOP_ENV == 'gnome':
-    keymap("GenTerms overrides: Fedora GNOME", {
+    keymap_override("General Terminals", "GenTerms overrides: Fedora GNOME", {
         C("RC-H"):                  C("Super-h"),                   # Hide Window/Minimize app (gnome/fedora)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(clas=termStr)(ctx)
-    )
+    })
 
 if DISTRO_ID == 'pop':
-    keymap("GenTerms overrides: Pop!_OS", {
+    keymap_override("General Terminals", "GenTerms overrides: Pop!_OS", {
         C("LC-Right"):              [bind,C("Super-C-Up")],         # SL - Change workspace (pop)
         C("LC-Left"):               [bind,C("Super-C-Down")],       # SL - Change workspace (pop)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(clas=termStr)(ctx)
-    )
+    })
 
 if DISTRO_ID in ['ubuntu', 'fedora'] and DESKTOP_ENV == 'gnome':
-    keymap("GenTerms overrides: Ubuntu/Fedora", {
+    keymap_override("General Terminals", "GenTerms overrides: Ubuntu/Fedora", {
         C("LC-RC-Q"):               C("Super-L"),                   # Lock screen (ubuntu/fedora)
         C("LC-Right"):              [bind,C("Super-Page_Up")],      # SL - Change workspace (ubuntu/fedora)
         C("LC-Left"):               [bind,C("Super-Page_Down")],    # SL - Change workspace (ubuntu/fedora)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(clas=termStr)(ctx)
-    )
+    })
 
 
 # Overrides to General Terminals shortcuts for specific desktop environments
 
 if DESKTOP_ENV == 'budgie':
-    keymap("GenTerms overrides: Budgie", {
+    keymap_override("General Terminals", "GenTerms overrides: Budgie", {
         C("LC-Right"):              [bind,C("C-Alt-Right")],        # Default SL - Change workspace (budgie)
         C("LC-Left"):               [bind,C("C-Alt-Left")],         # Default SL - Change workspace (budgie)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(clas=termStr)(ctx)
-    )
+    })
 
 # On Pop!_OS 22.04, System76 seems to have changed the name of the DE from 'cosmic' to 'pop'.
 # Probably to avoid overlapping with the new COSMIC desktop environment in Pop!_OS 24.04 and later.
 if DESKTOP_ENV in ['cosmic', 'pop']:
-    keymap("GenTerms overrides: COSMIC", {
+    keymap_override("General Terminals", "GenTerms overrides: COSMIC", {
         C("LC-RC-F"):               C("Super-M"),                   # Maximize window toggle (overrides General terminals)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(clas=termStr)(ctx)
-    )
+    })
 
 if DESKTOP_ENV == 'gnome':
-    keymap("GenTerms overrides: GNOME", {
+    keymap_override("General Terminals", "GenTerms overrides: GNOME", {
         ### Keyboard input source (language/layout) switching in GNOME
         C("LC-Space"):             [bind,C("Super-Space")],         # keyboard input source (layout) switching (gnome)
         C("Shift-LC-Space"):       [bind,C("Super-Shift-Space")],   # keyboard input source (layout) switching (reverse) (gnome)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(clas=termStr)(ctx)
-    )
+    })
 
 if DESKTOP_ENV == 'kde':
-    keymap("GenTerms overrides: KDE", {
+    keymap_override("General Terminals", "GenTerms overrides: KDE", {
         ### Keyboard input source (language/layout) switching in KDE Plasma
         C("LC-Space"):              [bind,C("Super-Alt-L")],        # keyboard input source (layout) switching (Last-Used) (kde)
         C("Shift-LC-Space"):        [bind,C("Super-Alt-K")],        # keyboard input source (layout) switching (Next) (kde)
@@ -4384,42 +3636,30 @@ if DESKTOP_ENV == 'kde':
         C("LC-Left"):               C("C-Super-Left"),              # Switch one desktop to the left
         C("LC-Right"):              C("C-Super-Right"),             # Switch one desktop to the right
 
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(clas=termStr)(ctx)
-    )
+    })
 
 if DESKTOP_ENV == 'pantheon':
-    keymap("GenTerms overrides: elementary OS", {
+    keymap_override("General Terminals", "GenTerms overrides: elementary OS", {
         C("LC-Right"):              [bind,C("Super-Right")],        # SL - Change workspace (elementary)
         C("LC-Left"):               [bind,C("Super-Left")],         # SL - Change workspace (elementary)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(clas=termStr)(ctx)
-    )
+    })
 
 if DESKTOP_ENV == 'sway':
-    keymap("GenTerms overrides: swaywm", {
+    keymap_override("General Terminals", "GenTerms overrides: swaywm", {
         C("RC-Q"):                  C("Shift-C-Q"),                 # Override sway GenGUI Cmd+Q
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(clas=termStr)(ctx)
-    )
+    })
 
 if DESKTOP_ENV == 'xfce':
-    keymap("GenTerms overrides: Xfce4", {
+    keymap_override("General Terminals", "GenTerms overrides: Xfce4", {
         C("RC-Grave"):             [bind,C("Super-Tab")],           # xfce4 Switch within app group
         C("Shift-RC-Grave"):       [bind,C("Super-Shift-Tab")],     # xfce4 Switch within app group
         C("LC-Right"):             [bind,C("C-Alt-Home")],          # SL - Change workspace xfce4
         C("LC-Left"):              [bind,C("C-Alt-End")],           # SL - Change workspace xfce4
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(clas=termStr)(ctx)
-    )
+    })
 
 
 # Active in all apps in the terminals list
-keymap("General Terminals", {
+keymap("General Terminals", with_overrides("General Terminals", {
 
     ### wordwise overrides of general GUI block
     C("Alt-Backspace"):         C("Alt-Shift-Backspace"),       # Wordwise delete word left of cursor in terminals
@@ -4490,9 +3730,8 @@ keymap("General Terminals", {
     C("LC-RC-F6"):              C("C-Alt-F6"),                  # Go to TTY virtual console 6
     C("LC-RC-F7"):              C("C-Alt-F7"),                  # Go to TTY virtual console 7
 
-}, when = lambda ctx:
-    cnfg.screen_has_focus and
-    matchProps(clas=termStr)(ctx)
+}), when = lambda ctx:
+    matchGroups(grp=GRP_TERMINALS)(ctx)
 )
 
 
@@ -4508,13 +3747,13 @@ keymap("General Terminals", {
 ###                                                                      ###
 ###                                                                      ###
 ############################################################################
+startup_profiler.phase('GENERAL GUI')
 
 # Note: terminals extends to remotes as well
 keymap("Cmd+Dot not in terminals", {
     C("RC-Dot"):                C("Esc"),                       # Mimic macOS Cmd+dot = Escape key (not in terminals)
 }, when = lambda ctx:
-    cnfg.screen_has_focus and
-    matchProps(not_clas=terms_and_remotes_Str)(ctx)
+    matchGroups(not_grp=GRP_TERMINALS | GRP_REMOTES)(ctx)
 )
 
 
@@ -4529,7 +3768,7 @@ keymap("GenGUI overrides: Chromebook/IBM", {
 }, when = lambda ctx:
     (   isKBtype('Chromebook', map="gengui ovr cbook")(ctx) or 
         isKBtype('IBM', map="gengui ovr ibm")(ctx) ) and
-    matchProps(not_clas=remoteStr)(ctx)
+    matchGroups(not_grp=GRP_REMOTES)(ctx)
 )
 keymap("GenGUI overrides: not Chromebook", {
     # In-App Tab switching
@@ -4538,171 +3777,123 @@ keymap("GenGUI overrides: not Chromebook", {
     C("Alt-Backspace"):         C("C-Backspace"),                   # Default not-chromebook
 }, when = lambda ctx:
     not isKBtype('Chromebook', map="gengui ovr not cbook")(ctx) and
-    matchProps(not_clas=remoteStr)(ctx)
+    matchGroups(not_grp=GRP_REMOTES)(ctx)
 )
 
 
 # Overrides to General GUI shortcuts for specific distros
 
 if DISTRO_ID == 'debian' and DESKTOP_ENV == 'xfce':
-    keymap("GenGUI overrides: Debian Xfce4", {
+    keymap_override("General GUI", "GenGUI overrides: Debian Xfce4", {
         C("RC-Space"):             [iEF2NT(),C("Alt-F1")],     # Launch Application Menu xfce4 (Debian)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DISTRO_ID in ['fedora', 'almalinux'] and DESKTOP_ENV == 'gnome':
-    keymap("GenGUI overrides: Fedora GNOME", {
+    keymap_override("General GUI", "GenGUI overrides: Fedora GNOME", {
         C("Super-RC-Q"):            C("Super-L"),                   # Lock screen (fedora)
         C("RC-H"):                  C("Super-h"),                   # Default SL - Minimize app (gnome/budgie/popos/fedora) not-deepin
         C("Super-Right"):          [bind,C("Super-Page_Up")],       # SL - Change workspace (ubuntu/fedora)
         C("Super-Left"):           [bind,C("Super-Page_Down")],     # SL - Change workspace (ubuntu/fedora)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DISTRO_ID == 'manjaro' and DESKTOP_ENV == 'gnome':
-    keymap("GenGUI overrides: Manjaro GNOME", {
+    keymap_override("General GUI", "GenGUI overrides: Manjaro GNOME", {
         C("RC-Q"):              C("Super-Q"),                       # Close window
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DISTRO_ID == 'manjaro' and DESKTOP_ENV == 'xfce':
-    keymap("GenGUI overrides: Manjaro Xfce", {
+    keymap_override("General GUI", "GenGUI overrides: Manjaro Xfce", {
         C("RC-Space"):             [iEF2NT(),C("Alt-F1")],          # Open Whisker Menu with Cmd+Space
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DISTRO_ID == 'manjaro':
-    keymap("GenGUI overrides: Manjaro", {
+    keymap_override("General GUI", "GenGUI overrides: Manjaro", {
         # TODO: figure out why these two are the same!
         C("RC-LC-f"):               C("Super-PAGE_UP"),             # SL- Maximize app manjaro
         C("RC-LC-f"):               C("Super-PAGE_DOWN"),           # SL - Minimize app manjaro
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DISTRO_ID == 'mint' and DESKTOP_ENV == 'xfce':
-    keymap("GenGUI overrides: Mint Xfce4", {
+    keymap_override("General GUI", "GenGUI overrides: Mint Xfce4", {
         C("RC-Space"):             [iEF2NT(),C("Super-Space")],     # Launch Application Menu xfce4 (Linux Mint)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DISTRO_ID == 'neon':
-    keymap("GenGUI overrides: KDE Neon", {
+    keymap_override("General GUI", "GenGUI overrides: KDE Neon", {
         C("RC-Super-f"):            C("Super-Page_Up"),             # SL - Toggle maximized window state (kde_neon)
         C("RC-H"):                  C("Super-Page_Down"),           # SL - Minimize app (kde_neon)
                                                                     # SL - Default SL - Change workspace (kde_neon)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DISTRO_ID == 'pop':
-    keymap("GenGUI overrides: Pop!_OS", {
+    keymap_override("General GUI", "GenGUI overrides: Pop!_OS", {
         C("RC-Space"):             [iEF2NT(),C("Super-slash")],     # "Launch and switch applications" (pop)
         C("RC-H"):                  C("Super-h"),                   # Default SL - Minimize app (gnome/budgie/popos/fedora) not-deepin
         C("Super-Right"):          [bind,C("Super-C-Up")],          # SL - Change workspace (pop)
         C("Super-Left"):           [bind,C("Super-C-Down")],        # SL - Change workspace (pop)
         C("RC-Q"):                  C("Super-q"),                   # SL - Close Apps (pop)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DISTRO_ID == 'ubuntu':
-    keymap("GenGUI overrides: Ubuntu", {
+    keymap_override("General GUI", "GenGUI overrides: Ubuntu", {
         C("Super-RC-Q"):            C("Super-L"),                   # Lock screen (ubuntu)
         C("Super-Right"):          [bind,C("Super-Page_Up")],       # SL - Change workspace (ubuntu)
         C("Super-Left"):           [bind,C("Super-Page_Down")],     # SL - Change workspace (ubuntu)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 
 
 # Overrides to General GUI shortcuts for specific desktop environments
 
 if DESKTOP_ENV == 'budgie':
-    keymap("GenGUI overrides: Budgie", {
+    keymap_override("General GUI", "GenGUI overrides: Budgie", {
         C("RC-Space"):             [iEF2NT(),Key.LEFT_META],        # Open panel-main-menu (Budgie menu)
         C("Super-Right"):           C("C-Alt-Right"),               # Change workspace (budgie)
         C("Super-Left"):            C("C-Alt-Left"),                # Change workspace (budgie)
         C("RC-H"):                  C("Super-h"),                   # Minimize app (gnome/budgie/popos/fedora) not-deepin
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DESKTOP_ENV == 'cinnamon':
-    keymap("GenGUI overrides: Cinnamon", {
+    keymap_override("General GUI", "GenGUI overrides: Cinnamon", {
         C("RC-Space"):             [iEF2NT(),C("C-Esc")],           # Right click, configure Mint menu shortcut to Ctrl+Esc
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 # On Pop!_OS 22.04, System76 seems to have changed the name of the DE from 'cosmic' to 'pop'.
 # Probably to avoid overlapping with the new COSMIC desktop environment in Pop!_OS 24.04 and later.
 if DESKTOP_ENV in ['cosmic', 'pop']:
-    keymap("GenGUI overrides: COSMIC", {
+    keymap_override("General GUI", "GenGUI overrides: COSMIC", {
         # No shortcuts settings panel seems to be available at this time (July 30, 2024),
         # so we can't "fix" this during Toshy install to not use the Meta/Super key.
         C("RC-Space"):             [Key.LEFT_META,iEF2NT()],        # Launcher or Workspaces or Applications (user choice)
         C("RC-Q"):                  C("Super-Q"),                   # Close window/Quit (overrides Alt+F4 from General GUI)
         C("Super-RC-F"):            C("Super-M"),                   # Maximize window toggle (overrides General GUI)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DESKTOP_ENV == 'dde':
-    keymap("GenGUI overrides: DDE", {
+    keymap_override("General GUI", "GenGUI overrides: DDE", {
         C("RC-Space"):             [iEF2NT(),Key.LEFT_META],        # Open Launcher menu (Deeping Desktop Environment)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DESKTOP_ENV == 'deepin':
-    keymap("GenGUI overrides: Deepin", {
+    keymap_override("General GUI", "GenGUI overrides: Deepin", {
         C("RC-H"):                  C("Super-n"),                   # Minimize app (deepin)
         C("Alt-RC-Space"):          C("Super-e"),                   # Open Finder - (deepin)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DESKTOP_ENV == 'enlightenment':
-    keymap("GenGUI overrides: Enlightenment", {
+    keymap_override("General GUI", "GenGUI overrides: Enlightenment", {
         C("RC-q"):                  C("C-Alt-x"),                   # Close window (Cmd+Q)
         # C("RC-Space"):             [iEF2NT(),C("C-Alt-m")],         # enlightenment main menu (override in "User Apps" slice if necessary)
         C("RC-Space"):             [iEF2NT(),C("C-Alt-Space")],     # enlightenment main menu (override in "User Apps" slice if necessary)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DESKTOP_ENV == 'gnome':
     if is_pre_GNOME_45(DE_MAJ_VER):
         # This keymap, if invoked, must come before the other GNOME overrides in the next keymap, not after.
-        keymap("GenGUI overrides: pre-GNOME 45 fix", {
+        keymap_override("General GUI", "GenGUI overrides: pre-GNOME 45 fix", {
             C("RC-Space"):             [iEF2NT(),C("Super-s")],         # Override GNOME 45+ Shift+Ctrl+Space remap
-        }, when = lambda ctx:
-            cnfg.screen_has_focus and
-            matchProps(not_clas=remoteStr)(ctx)
-        )
-    keymap("GenGUI overrides: GNOME", {
+        })
+    keymap_override("General GUI", "GenGUI overrides: GNOME", {
         C("RC-Space"):             [iEF2NT(),C("Shift-C-Space")],   # Show GNOME overview/app launcher
         C("RC-F3"):                 C("Super-d"),                   # Default SL - Show Desktop (gnome/kde,elementary)
         C("RC-Super-f"):            C("Alt-F10"),                   # Default SL - Maximize app (gnome/kde)
@@ -4711,30 +3902,21 @@ if DESKTOP_ENV == 'gnome':
         C("RC-Shift-Key_3"):        C("Shift-Print"),               # Take a screenshot immediately (gnome)
         C("RC-Shift-Key_4"):        C("Alt-Print"),                 # Take a screenshot of a window (gnome)
         C("RC-Shift-Key_5"):        C("Print"),                     # Take a screenshot interactively (gnome)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DESKTOP_ENV == 'hyprland':
-    keymap("GenGUI overrides: Hyprland", {
+    keymap_override("General GUI", "GenGUI overrides: Hyprland", {
         # C("RC-Space"):             [iEF2NT(),Key.LEFT_META],        # Open Launcher with Cmd+Space
         C("RC-Space"):             [C("Super-d"), iEF2NT()],        # Open Launcher with Cmd+Space
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DESKTOP_ENV == 'icewm':
-    keymap("GenGUI overrides: IceWM", {
+    keymap_override("General GUI", "GenGUI overrides: IceWM", {
         C("RC-Space"):             [iEF2NT(),Key.LEFT_META],        # IceWM: Win95Keys=1 (Meta shows menu)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DESKTOP_ENV == 'kde':
-    keymap("GenGUI overrides: KDE", {
+    keymap_override("General GUI", "GenGUI overrides: KDE", {
 
         # Application launcher menu remap
         # C("RC-Space"):             [iEF2NT(),C("Alt-F1")],          # Application Launcher Menu
@@ -4763,67 +3945,46 @@ if DESKTOP_ENV == 'kde':
         C("Super-Space"):          [bind,C("Super-Alt-L")],         # keyboard input source (layout) switching (Last-Used) (kde)
         C("Shift-Super-Space"):    [bind,C("Super-Alt-K")],         # keyboard input source (layout) switching (Next) (kde)
 
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DESKTOP_ENV == 'mate':
-    keymap("GenGUI overrides: MATE", {
+    keymap_override("General GUI", "GenGUI overrides: MATE", {
         # Right click, configure Mint menu shortcut to match `Alt+Space` shortcut
         C("RC-Space"):             [iEF2NT(),C("Alt-Space")],       # Open Mint app menu
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DESKTOP_ENV == 'miracle-wm':
-    keymap("GenGUI overrides: MiracleWM", {
+    keymap_override("General GUI", "GenGUI overrides: MiracleWM", {
         # C("RC-Space"):             [iEF2NT(),Key.LEFT_META],        # Open Launcher with Cmd+Space
         C("RC-Space"):             [C("Super-d"), iEF2NT()],        # Open Launcher with Cmd+Space
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DESKTOP_ENV == 'pantheon':
-    keymap("GenGUI overrides: Pantheon", {
+    keymap_override("General GUI", "GenGUI overrides: Pantheon", {
         C("RC-F3"):                 C("Super-d"),                   # Show Desktop (gnome/kde,elementary)
         # C("RC-Space"):             [iEF2NT(),C("Super-Space")],     # Launch Application Menu (elementary)
         C("RC-Space"):             [iEF2NT(),C("Alt-F2")],          # Launch Application Menu (elementary OS 8)
         C("RC-LC-f"):               C("Super-Up"),                  # Maximize app elementary
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DESKTOP_ENV == 'sway':
-    keymap("GenGUI overrides: swaywm", {
+    keymap_override("General GUI", "GenGUI overrides: swaywm", {
         C("RC-Space"):             [iEF2NT(),C("Super-d")],         # Open sway launcher
         C("RC-Q"):                  C("C-Q"),                       # Override General GUI Alt+F4 remap
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DESKTOP_ENV == 'trinity':
-    keymap("GenGUI overrides: Trinity desktop", {
+    keymap_override("General GUI", "GenGUI overrides: Trinity desktop", {
         C("RC-Space"):             [iEF2NT(),Key.LEFT_META],        # Trinity desktop (Q4OS)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DESKTOP_ENV == 'unity':
-    keymap("GenGUI overrides: Unity desktop", {
+    keymap_override("General GUI", "GenGUI overrides: Unity desktop", {
         C("RC-Space"):             [iEF2NT(),Key.LEFT_META],        # Trinity desktop (Q4OS)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 if DESKTOP_ENV == 'xfce':
-    keymap("GenGUI overrides: Xfce4", {
+    keymap_override("General GUI", "GenGUI overrides: Xfce4", {
         C("RC-Grave"):             [bind,C("Super-Tab")],           # xfce4 Switch within app group
         C("Shift-RC-Grave"):       [bind,C("Super-Shift-Tab")],     # xfce4 Switch within app group
         C("RC-Space"):             [iEF2NT(),C("C-Esc")],           # Launch Application Menu xfce4 (Xubuntu)
@@ -4833,16 +3994,13 @@ if DESKTOP_ENV == 'xfce':
         C("RC-Shift-Key_3"):        C("Print"),                     # Take a screenshot immediately (xfce4)
         C("RC-Shift-Key_4"):        C("Alt-Print"),                 # Take a screenshot of a window (xfce4)
         C("RC-Shift-Key_5"):        C("Shift-Print"),               # Take a screenshot interactively (xfce4)
-    }, when = lambda ctx:
-        cnfg.screen_has_focus and
-        matchProps(not_clas=remoteStr)(ctx)
-    )
+    })
 
 
 # None referenced here originally
 # - but remote clients and VM software ought to be set here
 # These are the typical remaps for ALL GUI based apps
-keymap("General GUI", {
+keymap("General GUI", with_overrides("General GUI", {
 
     C("Alt-Numlock"):           toggle_forced_numpad,           # Turn the Forced Numpad feature on and off
     C("Fn-Numlock"):            toggle_forced_numpad,           # Turn the Forced Numpad feature on and off
@@ -4910,13 +4068,16 @@ keymap("General GUI", {
     # C(""):                      ignore_combo,                   # cancel
     # C(""):                      C(""),                          #
 
-}, when = lambda ctx:
-    cnfg.screen_has_focus and
-    matchProps(not_clas=remoteStr)(ctx)
+}), when = lambda ctx:
+    matchGroups(not_grp=GRP_REMOTES)(ctx)
 )
 
 
 keymap("Diagnostics", {
     C("Shift-Alt-RC-i"):        isDoubleTap(notify_context),
     C("Shift-Alt-RC-t"):        isDoubleTap(macro_tester),
+    C("Shift-Alt-RC-p"):        isDoubleTap(dump_condition_profile),
 }, when = lambda ctx: ctx is ctx )
+
+
+startup_profiler.finish()
@@ -23,6 +23,7 @@ import sys
 import time
 import shutil
 import inspect
+import threading
 import subprocess
 
 from subprocess import DEVNULL
@@ -79,6 +80,7 @@ sys.path.insert(0, current_folder_path)
 from lib.env_context import EnvironmentInfo
 from lib.machine_context import get_machine_id_hash
 from lib.notification_manager import NotificationManager
+from lib.probe_cache import ProbeCache
 from lib.settings_class import Settings
 
 assets_path         = os.path.join(current_folder_path, 'assets')
@@ -155,8 +157,10 @@ WINDOW_MGR                      = None
 # DESKTOP_ENV     = locals().get('OVERRIDE_DESKTOP_ENV')  or env_info.get('DESKTOP_ENV',  'keymissing')
 # DE_MAJ_VER      = locals().get('OVERRIDE_DE_MAJ_VER')   or env_info.get('DE_MAJ_VER',   'keymissing')
 
+# Detected once per session and shared with the tray and D-Bus services (cache file in
+# XDG_RUNTIME_DIR). Run 'toshy-env --refresh' to detect again after changing something.
 env_ctxt_getter = EnvironmentInfo()
-env_ctxt: Dict[str, str] = env_ctxt_getter.get_env_info()
+env_ctxt: Dict[str, str] = env_ctxt_getter.get_env_info_cached()
 
 DISTRO_ID       = locals().get('OVERRIDE_DISTRO_ID')    or env_ctxt.get('DISTRO_ID',    'keymissing')
 DISTRO_VER      = locals().get('OVERRIDE_DISTRO_VER')   or env_ctxt.get('DISTRO_VER',   'keymissing')
@@ -416,8 +420,11 @@ not_win_type_rgx    = re.compile("IBM|Chromebook|Apple", re.I)
 ###########################################################################################
 
 
+# Results of command capability probes (notify-send, zenity), cached in XDG_RUNTIME_DIR
+probe_cache = ProbeCache()
+
 # Instantiate a useful notification object class instance, to make notifications easier
-ntfy = NotificationManager(icon_file_active, title='Toshy Alert (Config)')
+ntfy = NotificationManager(icon_file_active, title='Toshy Alert (Config)', probe_cache=probe_cache)
 
 
 def isKBtype(kbtype: str, map=None):
@@ -869,20 +876,21 @@ if not zenity_cmd:
 
 debug(f"Zenity command path: '{zenity_cmd}'")
 
-zenity_icon_option = None
+if not zenity_cmd:
+    error('ERR: Zenity command is missing! Diagnostic dialog not available!')
+
 
-if zenity_cmd:
+def probe_zenity_icon_option(cmd_path: str):
+    """Find which icon option (if any) the zenity command supports"""
     try:
-        zenity_help_output = subprocess.check_output([zenity_cmd, '--help-info'])
-        help_text = str(zenity_help_output)
+        help_text = str(subprocess.check_output([cmd_path, '--help-info']))
         if '--icon=' in help_text:
-            zenity_icon_option = '--icon=toshy_app_icon_rainbow'
+            return '--icon=toshy_app_icon_rainbow'
         elif '--icon-name=' in help_text:
-            zenity_icon_option = '--icon-name=toshy_app_icon_rainbow'
-    except subprocess.CalledProcessError:
+            return '--icon-name=toshy_app_icon_rainbow'
+    except (subprocess.CalledProcessError, OSError):
         pass  # zenity --help-info failed, assume icon is not supported
-else:
-    error('ERR: Zenity command is missing! Diagnostic dialog not available!')
+    return None
 
 
 def notify_context():
@@ -942,9 +950,14 @@ def notify_context():
                             '--title=Toshy Context Info',
                             '--text=' + message ]
 
-        # insert the icon argument if it's supported
-        if zenity_icon_option is not None:
-            zenity_cmd_lst.insert(3, zenity_icon_option)
+        def show_zenity_dialog():
+            # insert the icon argument if it's supported (probed on first use, result
+            # cached on disk), the probe can take a while so this runs in a thread
+            zenity_icon_option = probe_cache.probe('zenity icon option', zenity_cmd,
+                                                    probe_zenity_icon_option)
+            if zenity_icon_option is not None:
+                zenity_cmd_lst.insert(3, zenity_icon_option)
+            subprocess.Popen(zenity_cmd_lst, cwd=icons_dir, stderr=DEVNULL, stdout=DEVNULL)
 
         kdialog_cmd_lst = [kdialog_cmd, '--msgbox', message, '--title', 'Toshy Context Info']
         # Add icon if needed: kdialog_cmd_lst += ['--icon', '/path/to/icon']
@@ -955,7 +968,8 @@ def notify_context():
         if dialog_cmd == kdialog_cmd:
             subprocess.Popen(kdialog_cmd_lst, cwd=icons_dir, stderr=DEVNULL, stdout=DEVNULL)
         elif dialog_cmd == zenity_cmd:
-            subprocess.Popen(zenity_cmd_lst, cwd=icons_dir, stderr=DEVNULL, stdout=DEVNULL)
+            threading.Thread(target=show_zenity_dialog, name='toshy-context-dialog',
+                                daemon=True).start()
 
         # Optionally, also send a system notification:
         # ntfy.send_notification(message)
@@ -43,6 +43,7 @@ os.environ['PYTHONPATH'] = f'{parent_folder_path}:{current_folder_path}:{existin
 
 # local imports now that path is prepped
 from lib.env_context import EnvironmentInfo
+from lib.active_window_record import ActiveWindowRecordWriter, active_window_record_path
 
 if os.name == 'posix' and os.geteuid() == 0:
     error("This app should not be run as root/superuser.")
@@ -70,25 +71,18 @@ separator       = sep_char * sep_reps
 
 LOG_PFX = 'TOSHY_KDE_DBUS_SVC'
 
-DISTRO_ID       = None
-DISTRO_VER      = None
-VARIANT_ID      = None
 SESSION_TYPE    = None
 DESKTOP_ENV     = None
-DE_MAJ_VER      = None
 
 def check_environment():
     """Retrieve the current environment from env module"""
     # env_info_dct   = env.get_env_info()
     env_ctxt_getter = EnvironmentInfo()
-    env_info_dct   = env_ctxt_getter.get_env_info()
-    global DISTRO_ID, DISTRO_VER, VARIANT_ID, SESSION_TYPE, DESKTOP_ENV, DE_MAJ_VER
-    DISTRO_ID       = env_info_dct.get('DISTRO_ID', 'keymissing')
-    DISTRO_VER      = env_info_dct.get('DISTRO_VER', 'keymissing')
-    VARIANT_ID      = env_info_dct.get('VARIANT_ID', 'keymissing')
-    SESSION_TYPE    = env_info_dct.get('SESSION_TYPE', 'keymissing')
-    DESKTOP_ENV     = env_info_dct.get('DESKTOP_ENV', 'keymissing')
-    DE_MAJ_VER      = env_info_dct.get('DE_MAJ_VER', 'keymissing')
+    env_ctxt_getter.use_cache()     # values already detected this session, if any
+    global SESSION_TYPE, DESKTOP_ENV
+    # only the values read here get detected (if not in the session cache)
+    SESSION_TYPE    = env_ctxt_getter.SESSION_TYPE
+    DESKTOP_ENV     = env_ctxt_getter.DESKTOP_ENV
 
 
 check_environment()
@@ -121,6 +115,9 @@ else:
 TOSHY_KDE_DBUS_SVC_PATH         = '/org/toshy/Plasma'
 TOSHY_KDE_DBUS_SVC_IFACE        = 'org.toshy.Plasma'
 
+# Memory-mapped record of the active window, for readers that shouldn't need a D-Bus call
+TOSHY_KDE_WDW_RECORD_PATH       = active_window_record_path('plasma')
+
 
 class DBUS_Object(dbus.service.Object):
     """Class to handle D-Bus interactions"""
@@ -131,6 +128,7 @@ class DBUS_Object(dbus.service.Object):
         self.caption            = "NO_DATA"
         self.resource_class     = "NO_DATA"
         self.resource_name      = "NO_DATA"
+        self.wdw_record         = ActiveWindowRecordWriter(TOSHY_KDE_WDW_RECORD_PATH)
 
     @dbus.service.method(TOSHY_KDE_DBUS_SVC_IFACE, in_signature='sss')
     def NotifyActiveWindow(self, caption, resource_class, resource_name):
@@ -138,6 +136,9 @@ class DBUS_Object(dbus.service.Object):
         self.caption            = str(caption)
         self.resource_class     = str(resource_class)
         self.resource_name      = str(resource_name)
+        # push the change to the record file and to signal listeners (if anything changed)
+        if self.wdw_record.publish(self.resource_class, self.caption, self.resource_name):
+            self.ActiveWindowChanged(self.caption, self.resource_class, self.resource_name)
         # debug(f'{LOG_PFX}: Active window attributes:'
         #         f"\n\t caption        = '{self.caption}'"
         #         f"\n\t resource_class = '{self.resource_class}'"
@@ -151,6 +152,16 @@ class DBUS_Object(dbus.service.Object):
                     'resource_class':   self.resource_class,
                     'resource_name':    self.resource_name }
 
+    @dbus.service.signal(TOSHY_KDE_DBUS_SVC_IFACE, signature='sss')
+    def ActiveWindowChanged(self, caption, resource_class, resource_name):
+        # emitted by dbus-python when called, with the same values as GetActiveWindow()
+        pass
+
+    @dbus.service.method(TOSHY_KDE_DBUS_SVC_IFACE, out_signature='s')
+    def GetActiveWindowRecordPath(self):
+        # path of the memory-mapped record (see lib/active_window_record.py), or ''
+        return TOSHY_KDE_WDW_RECORD_PATH or ''
+
 
 def main():
     # Initialize the D-Bus main loop
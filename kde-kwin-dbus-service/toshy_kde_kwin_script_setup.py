@@ -58,9 +58,6 @@ separator       = sep_char * sep_reps
 LOG_PFX = 'TOSHY_KWIN_SETUP'
 
 
-DISTRO_ID       = None
-DISTRO_VER      = None
-VARIANT_ID      = None
 SESSION_TYPE    = None
 DESKTOP_ENV     = None
 DE_MAJ_VER      = None
@@ -70,14 +67,12 @@ def check_environment():
     """Retrieve the current environment from env module"""
     # env_info_dct   = env.get_env_info()
     env_ctxt_getter = EnvironmentInfo()
-    env_info_dct   = env_ctxt_getter.get_env_info()
-    global DISTRO_ID, DISTRO_VER, VARIANT_ID, SESSION_TYPE, DESKTOP_ENV, DE_MAJ_VER
-    DISTRO_ID       = env_info_dct.get('DISTRO_ID',     'keymissing')
-    DISTRO_VER      = env_info_dct.get('DISTRO_VER',    'keymissing')
-    VARIANT_ID      = env_info_dct.get('VARIANT_ID',    'keymissing')
-    SESSION_TYPE    = env_info_dct.get('SESSION_TYPE',  'keymissing')
-    DESKTOP_ENV     = env_info_dct.get('DESKTOP_ENV',   'keymissing')
-    DE_MAJ_VER      = env_info_dct.get('DE_MAJ_VER',    'keymissing')
+    env_ctxt_getter.use_cache()     # values already detected this session, if any
+    global SESSION_TYPE, DESKTOP_ENV, DE_MAJ_VER
+    # only the values read here get detected (if not in the session cache)
+    SESSION_TYPE    = env_ctxt_getter.SESSION_TYPE
+    DESKTOP_ENV     = env_ctxt_getter.DESKTOP_ENV
+    DE_MAJ_VER      = env_ctxt_getter.DE_MAJ_VER
 
 
 check_environment()
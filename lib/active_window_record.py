@@ -0,0 +1,189 @@
+__version__ = '20261018'
+
+import os
+import mmap
+import time
+import struct
+
+from typing import NamedTuple, Optional, Tuple
+
+from xwaykeyz.lib.logger import debug, error
+
+from lib.runtime_files import runtime_file_path
+
+
+# Layout of the record file (native byte order, it never leaves the machine):
+#   0   8 bytes     magic
+#   8   uint64      sequence number, odd while the writer is updating the record
+#   16  3 x uint32  byte lengths of the three UTF-8 fields
+#   64  the fields, one after the other
+RECORD_MAGIC        = b'TOSHYAW1'
+RECORD_SIZE         = 16 * 1024
+RECORD_HEADER_SIZE  = 64
+RECORD_FIELD_MAX    = (RECORD_SIZE - RECORD_HEADER_SIZE) // 3
+_HEADER             = struct.Struct('=8sQ3I')
+_SEQ                = struct.Struct('=Q')
+_SEQ_OFFSET         = 8
+_LENGTHS            = struct.Struct('=3I')
+_LENGTHS_OFFSET     = 16
+
+
+def active_window_record_path(service_name: str) -> Optional[str]:
+    """
+    Record file of a window context service ('plasma', 'wlroots', 'cosmic'),
+    None if there is no private runtime folder (then no record is written or read)
+    """
+    return runtime_file_path(f'toshy_active_window_{service_name}.bin')
+
+
+class ActiveWindow(NamedTuple):
+    wm_class: str           # KDE: resource class, wlroots/COSMIC: app_id
+    wm_name: str            # window title (KDE: caption)
+    resource_name: str      # KDE only, empty for the others
+
+
+class ActiveWindowRecordWriter:
+    """
+    Publishes the active window of a window context service (KDE, wlroots, COSMIC)
+    in a small memory-mapped file in XDG_RUNTIME_DIR, so the keymapper can get the
+    window context without a D-Bus call on every key event.
+
+    Updates are guarded by the sequence number in the header (a "seqlock"): it is odd
+    while the fields are being written and even when they are complete, and it only
+    ever grows. A reader that sees the same even number before and after reading the
+    fields has a consistent record, and a reader that sees the number it saw last
+    time knows nothing changed. The file is kept (and the numbering continued) when
+    the service restarts, so readers never need to open it again.
+    """
+    def __init__(self, path: Optional[str]) -> None:
+        self.path                                   = path
+        self._mm: Optional[mmap.mmap]               = None
+        self._seq                                   = 0
+        self._last_fields: Optional[Tuple[bytes, ...]] = None
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if os.fstat(fd).st_size != RECORD_SIZE:
+                os.ftruncate(fd, RECORD_SIZE)
+            self._mm = mmap.mmap(fd, RECORD_SIZE)
+        finally:
+            os.close(fd)
+        magic, seq, *_ = _HEADER.unpack_from(self._mm, 0)
+        if magic != RECORD_MAGIC:
+            self._mm[:RECORD_HEADER_SIZE] = bytes(RECORD_HEADER_SIZE)
+            _HEADER.pack_into(self._mm, 0, RECORD_MAGIC, 0, 0, 0, 0)
+            seq = 0
+        self._seq = seq + (seq & 1)     # a previous writer may have died mid-update
+
+    def publish(self, wm_class: str, wm_name: str, resource_name: str = '') -> bool:
+        """Write the active window to the record. False if it didn't change."""
+        fields = tuple(str(value).encode('utf-8', 'replace')[:RECORD_FIELD_MAX]
+                        for value in (wm_class, wm_name, resource_name))
+        if fields == self._last_fields:
+            return False
+        if self.path is None:
+            self._last_fields = fields
+            return True
+        try:
+            if self._mm is None:
+                self._open()
+            mm = self._mm
+            _SEQ.pack_into(mm, _SEQ_OFFSET, self._seq + 1)
+            data = b''.join(fields)
+            mm[RECORD_HEADER_SIZE:RECORD_HEADER_SIZE + len(data)] = data
+            _LENGTHS.pack_into(mm, _LENGTHS_OFFSET, *(len(field) for field in fields))
+            self._seq += 2
+            _SEQ.pack_into(mm, _SEQ_OFFSET, self._seq)
+        except (OSError, ValueError) as write_err:
+            error(f"Could not update active window record '{self.path}': {write_err}")
+            self._mm = None
+            return True         # the window did change, even if the record isn't updated
+        self._last_fields = fields
+        return True
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+
+class ActiveWindowRecordReader:
+    """
+    Reads the record of ActiveWindowRecordWriter. When nothing changed since the last
+    read(), that is one read of the sequence number from the mapped memory, and the
+    previous ActiveWindow object is returned. Returns None while there is no record
+    (the service isn't running, or hasn't seen a window yet), and tries to open it
+    again at most every `retry_secs`.
+    """
+    def __init__(self, path: Optional[str], retry_secs: float = 1.0) -> None:
+        self.path                                   = path
+        self.retry_secs                             = retry_secs
+        self._mm: Optional[mmap.mmap]               = None
+        self._next_open                             = 0.0
+        self._seq                                   = 0
+        self._window: Optional[ActiveWindow]        = None
+
+    def _open(self) -> bool:
+        now = time.monotonic()
+        if self.path is None or now < self._next_open:
+            return False
+        self._next_open = now + self.retry_secs
+        try:
+            with open(self.path, 'rb') as record_file:
+                if os.fstat(record_file.fileno()).st_size < RECORD_SIZE:
+                    return False
+                mm = mmap.mmap(record_file.fileno(), RECORD_SIZE, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False
+        if mm[:len(RECORD_MAGIC)] != RECORD_MAGIC:
+            mm.close()
+            return False
+        debug(f"Reading the active window from '{self.path}'", ctx="AW")
+        self._mm = mm
+        return True
+
+    @property
+    def sequence(self) -> int:
+        """Sequence number of the record (0 if there is none yet)"""
+        if self._mm is None and not self._open():
+            return 0
+        return _SEQ.unpack_from(self._mm, _SEQ_OFFSET)[0]
+
+    def changed(self) -> bool:
+        """True if the record changed since the last read()"""
+        return self.sequence != self._seq
+
+    def read(self, max_tries: int = 100) -> Optional[ActiveWindow]:
+        """The active window, read again from the record only if it changed"""
+        if self._mm is None and not self._open():
+            return self._window
+        mm = self._mm
+        seq = _SEQ.unpack_from(mm, _SEQ_OFFSET)[0]
+        if seq == self._seq:
+            return self._window
+        for _ in range(max_tries):
+            if not seq & 1:
+                lengths = _LENGTHS.unpack_from(mm, _LENGTHS_OFFSET)
+                if max(lengths) <= RECORD_FIELD_MAX:
+                    data = mm[RECORD_HEADER_SIZE:RECORD_HEADER_SIZE + sum(lengths)]
+                    if _SEQ.unpack_from(mm, _SEQ_OFFSET)[0] == seq:
+                        self._window = ActiveWindow(*self._split(data, lengths))
+                        self._seq = seq
+                        return self._window
+            time.sleep(0)               # let the writer finish
+            seq = _SEQ.unpack_from(mm, _SEQ_OFFSET)[0]
+        return self._window             # writer stuck mid-update, keep the last good one
+
+    @staticmethod
+    def _split(data: bytes, lengths: Tuple[int, int, int]):
+        start = 0
+        for length in lengths:
+            yield data[start:start + length].decode('utf-8', 'ignore')
+            start += length
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
@@ -0,0 +1,107 @@
+__version__ = '20261018'
+
+import re
+
+from typing import Dict, FrozenSet, List, Optional, Pattern
+
+from lib.pattern_matcher import is_literal_pattern
+
+
+class AppGroupClassifier:
+    """
+    Sort a window class into every app group (terminals, browsers, etc.) it belongs
+    to, in a single pass, instead of searching a separate regex for every group.
+
+    Each group gets a bit in an integer bitmask. Plain names from all the group lists
+    go into one dict of casefolded name to bitmask. The entries that really are regex
+    patterns get compiled into one combined regex, with an optional lookahead with a
+    named capture group for each group, so a single search finds all the groups a
+    class matches. The resulting bitmask is cached per window class, so after the
+    first key press in a window, "terminal and not remote" is just a dict lookup
+    and a couple of bit tests.
+    """
+    def __init__(self, max_classes: int = 512) -> None:
+        self.max_classes                        = max_classes
+        self.group_bits: Dict[str, int]         = {}
+        self._names: Dict[str, int]             = {}
+        self._patterns: Dict[str, List[str]]    = {}
+        self._pattern_rgx: Optional[Pattern]    = None
+        self._pattern_bits: Dict[str, int]      = {}
+        self._class_cache: Dict[str, int]       = {}
+
+    def add_group(self, group_name: str, app_classes: List[str]) -> int:
+        """
+        Add (or extend) a named group of app classes, where each entry is a plain
+        app class name or a regex pattern (matched case insensitively against the
+        whole window class). Returns the bit for the group.
+        """
+        if not group_name.isidentifier():
+            raise ValueError(f"AppGroupClassifier: Group name must be an identifier: '{group_name}'")
+        if not isinstance(app_classes, list) or not all(isinstance(x, str) for x in app_classes):
+            raise TypeError(f"AppGroupClassifier: Group '{group_name}' wants a list of strings")
+
+        group_bit = self.group_bits.get(group_name)
+        if group_bit is None:
+            group_bit = self.group_bits[group_name] = 1 << len(self.group_bits)
+
+        for app_class in app_classes:
+            app_class = app_class.strip('^$')
+            if is_literal_pattern(app_class):
+                app_class = app_class.casefold()
+                self._names[app_class] = self._names.get(app_class, 0) | group_bit
+            else:
+                self._patterns.setdefault(group_name, []).append(app_class)
+
+        # the combined pattern and any cached results are stale now
+        self._pattern_rgx = None
+        self._class_cache.clear()
+        return group_bit
+
+    def bits(self, *group_names: str) -> int:
+        """Combined bitmask of the given group names"""
+        mask = 0
+        for group_name in group_names:
+            mask |= self.group_bits[group_name]
+        return mask
+
+    def _compile(self):
+        """Compile the regex pattern entries of all groups into one combined regex"""
+        lookaheads = [  f"(?=(?P<{group_name}>(?:{'|'.join(patterns)})$))?"
+                        for group_name, patterns in self._patterns.items() ]
+        self._pattern_rgx = re.compile('^' + ''.join(lookaheads), re.I)
+        self._pattern_bits = { group_name: self.group_bits[group_name]
+                                for group_name in self._patterns }
+
+    def classify(self, wm_class: Optional[str]) -> int:
+        """Get the bitmask of all the groups that the window class belongs to"""
+        try:
+            return self._class_cache[wm_class]
+        except KeyError:
+            pass
+
+        mask = 0
+        if wm_class:
+            mask = self._names.get(wm_class.casefold(), 0)
+            if self._patterns:
+                if self._pattern_rgx is None:
+                    self._compile()
+                for group_name, group_match in self._pattern_rgx.match(wm_class).groupdict().items():
+                    if group_match is not None:
+                        mask |= self._pattern_bits[group_name]
+
+        # window classes are a small set in practice, but don't let the cache grow forever
+        if len(self._class_cache) >= self.max_classes:
+            self._class_cache.clear()
+        self._class_cache[wm_class] = mask
+        return mask
+
+    def groups_of(self, wm_class: Optional[str]) -> FrozenSet[str]:
+        """Get the names of all the groups that the window class belongs to"""
+        mask = self.classify(wm_class)
+        return frozenset(name for name, bit in self.group_bits.items() if mask & bit)
+
+    def __str__(self):
+        pattern_count = sum(len(patterns) for patterns in self._patterns.values())
+        return (f"AppGroupClassifier: {len(self.group_bits)} groups, "
+                f"{len(self._names)} names, {pattern_count} patterns, "
+                f"{len(self._class_cache)} cached classes")
@@ -0,0 +1,136 @@
+__version__ = '20261018'
+
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from xwaykeyz.lib.key_context import KeyContext
+
+
+# The properties of the key event context that `when` conditions are allowed to depend on.
+# Anything else a condition reads (user preferences, dead key state, etc.) must call
+# ConditionCache.invalidate() whenever it changes.
+ContextFingerprint = Tuple[str, str, str, bool, bool]
+
+
+def uncached(cond: Callable[[KeyContext], bool]):
+    """
+    Mark a `when` condition to be evaluated on every key event, bypassing the
+    condition cache. Needed for conditions that have side effects, like the
+    keyboard type trigger or the dead keys tripwire.
+    """
+    cond._toshy_uncached = True
+    return cond
+
+
+def is_uncached(cond: Callable[[KeyContext], bool]):
+    """Check if a `when` condition was marked with uncached()"""
+    return getattr(cond, '_toshy_uncached', False)
+
+
+def cached(cond: Callable[[KeyContext], bool]):
+    """
+    Mark a `when` condition to be served from the condition cache even where
+    conditions aren't cached by default (the user slices of the config). Only for
+    conditions that depend on nothing but the window and device context.
+    """
+    cond._toshy_cached = True
+    return cond
+
+
+class ConditionCache:
+    """
+    Cache of `when` condition results, per window/device context snapshot.
+
+    The context fingerprint is only computed once per key event (the keymapper
+    creates a new KeyContext object for each event). Each registered condition is
+    evaluated once per distinct fingerprint, and the cached result is returned until
+    the fingerprint changes or the cache is invalidated. A small LRU of recent
+    fingerprints keeps switching back and forth between a few windows "warm".
+
+    While remapping is suspended (screen focus is on another Synergy screen), every
+    registered condition returns False right away, before any fingerprint or lookup,
+    so the conditions themselves don't need to check the screen focus.
+
+    While `cache_by_default` is False, conditions registered are only cached if
+    marked with cached(), the others are evaluated on every event (but still
+    behind the "remapping suspended" gate).
+    """
+    def __init__(self, max_contexts: int = 16) -> None:
+        self.max_contexts               = max_contexts
+        self.cond_count                 = 0
+        self.invalidations              = 0
+        self.suspended                  = False
+        self.cache_by_default           = True
+        self._snapshots: OrderedDict[ContextFingerprint, Dict[int, bool]] = OrderedDict()
+        self._last_ctx: Optional[KeyContext]    = None
+        self._last_results: Dict[int, bool]     = {}
+
+    def invalidate(self, *_args, **_kwargs):
+        """
+        Throw away all cached results. Call this whenever anything outside
+        the context fingerprint that a condition might read has changed.
+        Accepts (and ignores) any arguments, to be usable as a callback.
+        """
+        self._snapshots = OrderedDict()
+        self._last_ctx = None
+        self.invalidations += 1
+
+    def suspend(self, suspended: bool):
+        """Turn the "remapping suspended" gate on or off for all registered conditions"""
+        self.suspended = bool(suspended)
+
+    def _results_for(self, ctx: KeyContext) -> Dict[int, bool]:
+        """Get the dict of cached results for the context snapshot of the current event"""
+        if ctx is self._last_ctx:
+            return self._last_results
+
+        fingerprint: ContextFingerprint = ( ctx.wm_class, ctx.wm_name, ctx.device_name,
+                                            ctx.numlock_on, ctx.capslock_on )
+        snapshots = self._snapshots
+        results = snapshots.get(fingerprint)
+        if results is None:
+            results = snapshots[fingerprint] = {}
+            if len(snapshots) > self.max_contexts:
+                snapshots.popitem(last=False)
+        else:
+            snapshots.move_to_end(fingerprint)
+
+        self._last_ctx = ctx
+        self._last_results = results
+        return results
+
+    def register(self, cond: Callable[[KeyContext], bool]) -> Callable[[KeyContext], bool]:
+        """Wrap a `when` condition so its result is served from the cache"""
+        if cond is None or is_uncached(cond):
+            return cond
+
+        if not self.cache_by_default and not getattr(cond, '_toshy_cached', False):
+            def _gated_cond(ctx: KeyContext):
+                if self.suspended:
+                    return False
+                return cond(ctx)
+
+            _gated_cond.__wrapped__ = cond
+            return _gated_cond
+
+        cond_id = self.cond_count
+        self.cond_count += 1
+
+        def _cached_cond(ctx: KeyContext):
+            if self.suspended:
+                return False
+            results = self._results_for(ctx)
+            try:
+                return results[cond_id]
+            except KeyError:
+                result = results[cond_id] = bool(cond(ctx))
+                return result
+
+        _cached_cond.__wrapped__ = cond
+        return _cached_cond
+
+    def __str__(self):
+        return (f"ConditionCache: {self.cond_count} conditions, "
+                f"{len(self._snapshots)}/{self.max_contexts} context snapshots, "
+                f"{self.invalidations} invalidations"
+                f"{', remapping suspended' if self.suspended else ''}")
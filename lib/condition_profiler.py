@@ -0,0 +1,101 @@
+__version__ = '20261018'
+
+import os
+import time
+import signal
+
+from typing import Callable, List, Optional
+
+from xwaykeyz.lib.key_context import KeyContext
+from xwaykeyz.lib.logger import debug, error
+
+
+class ConditionStats:
+    __slots__ = ('kind', 'name', 'calls', 'trues', 'total_ns')
+
+    def __init__(self, kind: str, name: str) -> None:
+        self.kind       = kind
+        self.name       = name
+        self.calls      = 0
+        self.trues      = 0
+        self.total_ns   = 0
+
+
+class ConditionProfiler:
+    """
+    Optional instrumentation of the `when` conditions of modmaps and keymaps, to find
+    out which ones are using the most time. Counts the calls, True results and total
+    time of each condition. Whether it is enabled is decided when the conditions get
+    registered (config load), so when it is off the conditions are not wrapped at all.
+    """
+    def __init__(self, enabled: bool = False, top_n: int = 30, report_dir: str = None) -> None:
+        self.enabled                        = bool(enabled)
+        self.top_n                          = top_n
+        self.report_dir                     = (report_dir or
+                                                os.environ.get('XDG_RUNTIME_DIR') or '/tmp')
+        self.report_path                    = os.path.join( self.report_dir,
+                                                            'toshy_condition_profile.txt')
+        self.start_time                     = time.time()
+        self.stats: List[ConditionStats]    = []
+
+    def register(self, kind: str, name: str, cond: Optional[Callable[[KeyContext], bool]]):
+        """Wrap a `when` condition with counters, if profiling is enabled"""
+        if not self.enabled or cond is None:
+            return cond
+
+        stats = ConditionStats(kind, name)
+        self.stats.append(stats)
+        perf_counter_ns = time.perf_counter_ns
+
+        def _profiled_cond(ctx: KeyContext):
+            t0 = perf_counter_ns()
+            result = cond(ctx)
+            stats.total_ns += perf_counter_ns() - t0
+            stats.calls += 1
+            if result:
+                stats.trues += 1
+            return result
+
+        _profiled_cond.__wrapped__ = cond
+        return _profiled_cond
+
+    def report(self, reason: str = '') -> str:
+        """Text report of the conditions that used the most time"""
+        total_ns = sum(stats.total_ns for stats in self.stats) or 1
+        top_stats = sorted(self.stats, key=lambda stats: stats.total_ns, reverse=True)
+        lines = [
+            f"Toshy condition profile ({reason or 'report'}) at {time.strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Conditions: {len(self.stats)}, profiling for {time.time() - self.start_time:.0f} s, "
+            f"total condition time: {total_ns / 1e6:.2f} ms",
+            f"{'rank':>4} {'kind':<20} {'name':<50} {'calls':>9} {'True %':>7} "
+            f"{'ns/call':>9} {'total ms':>10} {'%':>6}",
+        ]
+        for rank, stats in enumerate(top_stats[:self.top_n], start=1):
+            calls = stats.calls or 1
+            lines.append(
+                f"{rank:>4} {stats.kind:<20} {stats.name[:50]:<50} {stats.calls:>9} "
+                f"{stats.trues / calls * 100:>7.1f} {stats.total_ns / calls:>9.0f} "
+                f"{stats.total_ns / 1e6:>10.2f} {stats.total_ns / total_ns * 100:>6.1f}")
+        return '\n'.join(lines)
+
+    def dump(self, reason: str = ''):
+        """Write the report to the report file, and to the log"""
+        if not self.enabled:
+            debug("Condition profiling is not enabled. Nothing to dump.")
+            return
+        report = self.report(reason)
+        try:
+            with open(self.report_path, 'w', encoding='utf-8') as report_file:
+                report_file.write(report + '\n')
+        except OSError as file_err:
+            error(f"Could not write condition profile to '{self.report_path}':\n\t{file_err}")
+        debug(f"Condition profile written to '{self.report_path}':\n{report}")
+
+    def install_signal_handler(self, signum=signal.SIGUSR1):
+        """Dump the report when the process gets the signal (SIGUSR1 by default)"""
+        if not self.enabled:
+            return
+        try:
+            signal.signal(signum, lambda _signum, _frame: self.dump(signal.Signals(signum).name))
+        except ValueError as sig_err:    # not in the main thread
+            error(f"Could not set up condition profile signal handler:\n\t{sig_err}")
@@ -0,0 +1,91 @@
+__version__ = '20261018'
+
+import os
+import sys
+import marshal
+import hashlib
+import importlib.util
+
+from types import CodeType
+from typing import Optional
+
+from xwaykeyz.lib.logger import debug, error
+
+from lib.runtime_files import write_file_atomic
+
+
+CONFIG_CODE_CACHE_DIR_NAME  = 'toshy'
+CONFIG_CODE_CACHE_SUFFIX    = '.code.bin'
+
+
+def default_cache_dir() -> str:
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, CONFIG_CODE_CACHE_DIR_NAME)
+
+
+class ConfigCodeCache:
+    """
+    Compiled code of the config file, kept between keymapper starts. Compiling the
+    several thousand lines of the config takes longer than most of what running it
+    does, and the keymapper compiles it again on every restart (session start, resume,
+    service restart), since Python only caches the bytecode of imported modules.
+
+    The cache file has a header with the Python bytecode magic number and the SHA-256
+    of the config source, so any edit of the config (including the user slices) or a
+    different Python gets the file compiled again. Only the code is cached: the config
+    still runs in full on every start, since keymaps are made of functions and closures
+    that can't be saved, and much of what it builds depends on the live environment.
+    """
+    def __init__(self, config_path: str, cache_dir: Optional[str] = None) -> None:
+        self.config_path                    = os.path.abspath(config_path)
+        self.cache_dir                      = cache_dir or default_cache_dir()
+        file_name = os.path.basename(self.config_path)
+        self.cache_path                     = os.path.join(
+            self.cache_dir, f'{file_name}.{sys.implementation.cache_tag}{CONFIG_CODE_CACHE_SUFFIX}')
+        self.from_cache: Optional[bool]     = None      # set by load()
+
+    def _header(self, source: bytes) -> bytes:
+        return importlib.util.MAGIC_NUMBER + hashlib.sha256(source).digest()
+
+    def _read_cache(self, header: bytes) -> Optional[CodeType]:
+        try:
+            with open(self.cache_path, 'rb') as cache_file:
+                data = cache_file.read()
+        except OSError:
+            return None
+        if not data.startswith(header):
+            return None
+        try:
+            code = marshal.loads(data[len(header):])
+        except (EOFError, ValueError, TypeError):
+            return None
+        return code if isinstance(code, CodeType) else None
+
+    def _write_cache(self, header: bytes, code: CodeType):
+        try:
+            write_file_atomic(self.cache_path, header + marshal.dumps(code))
+        except OSError as write_err:
+            error(f"Could not write config code cache '{self.cache_path}': {write_err}")
+
+    def load(self) -> CodeType:
+        """
+        Code object of the config file, from the cache if the source didn't change.
+        Compiles it (and updates the cache) otherwise. Syntax errors in the config
+        are raised just like the keymapper would raise them.
+        """
+        with open(self.config_path, 'rb') as config_file:
+            source = config_file.read()
+        header = self._header(source)
+        code = self._read_cache(header)
+        self.from_cache = code is not None
+        if code is None:
+            code = compile(source, self.config_path, 'exec', dont_inherit=True)
+            self._write_cache(header, code)
+            debug(f"Config compiled, code cached in '{self.cache_path}'", ctx="CC")
+        else:
+            debug(f"Config code loaded from cache '{self.cache_path}'", ctx="CC")
+        return code
+
+
+def load_config_code(config_path: str, cache_dir: Optional[str] = None) -> CodeType:
+    return ConfigCodeCache(config_path, cache_dir).load()
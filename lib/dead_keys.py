@@ -0,0 +1,87 @@
+__version__ = '20261018'
+
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from xwaykeyz.lib.key_context import KeyContext
+
+
+NO_MAPPINGS: Dict = {}
+
+
+class SwitchedMappings(dict):
+    """
+    Mappings object for a keymap whose combos can change while the keymapper is
+    running. Behaves like the dict in `active` for the keymapper, so the dicts can
+    be swapped (or dropped, with NO_MAPPINGS) without registering another keymap.
+    """
+    def __init__(self) -> None:
+        super().__init__()
+        self.active: Dict = NO_MAPPINGS
+
+    # Mapping methods, all served by the active dict
+    def __contains__(self, combo):      return combo in self.active
+    def __getitem__(self, combo):       return self.active[combo]
+    def __iter__(self):                 return iter(self.active)
+    def __len__(self):                  return len(self.active)
+    def get(self, combo, default=None): return self.active.get(combo, default)
+    def keys(self):                     return self.active.keys()
+    def items(self):                    return self.active.items()
+    def values(self):                   return self.active.values()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self.active)} combos)"
+
+
+class DeadKeysTable(SwitchedMappings):
+    """
+    Mappings of a single "dead keys" keymap, switched between the combo dicts of all
+    the dead key accents. The dicts are stored in one table keyed by
+    (layout, accent character address), and the keymap condition picks the dict
+    for the active dead key with a single lookup, no matter how many accents there
+    are. When no dead key is active, the condition returns early.
+
+    The condition has a side effect (picking the dict), so register it as `uncached()`.
+    """
+    def __init__(   self,
+                    get_layout: Callable[[], Optional[str]],
+                    get_accent: Callable[[], Optional[int]]) -> None:
+        super().__init__()
+        self._get_layout                        = get_layout
+        self._get_accent                        = get_accent
+        self._table: Dict[Tuple[str, int], Dict] = {}
+        self._names: Dict[Tuple[str, int], str]  = {}
+
+    def add(self, name: str, mappings: Dict, layout: str, accents: Iterable[int]):
+        """Add the combo dict for one or more accent characters of a layout"""
+        for accent in accents:
+            self._table[(layout, accent)] = mappings
+            self._names[(layout, accent)] = name
+
+    def swap(self, entries: List[Tuple[str, Dict, str, Iterable[int]]]):
+        """Replace all combo dicts with (name, mappings, layout, accents) entries"""
+        table, names = {}, {}
+        for name, mappings, layout, accents in entries:
+            for accent in accents:
+                table[(layout, accent)] = mappings
+                names[(layout, accent)] = name
+        self._table, self._names = table, names
+        self.active = NO_MAPPINGS
+
+    def condition(self, ctx: KeyContext) -> bool:
+        """Keymap condition: pick the dict of the active dead key, if there is one"""
+        accent = self._get_accent()
+        if accent is None:
+            self.active = NO_MAPPINGS
+            return False
+        self.active = self._table.get((self._get_layout(), accent), NO_MAPPINGS)
+        return self.active is not NO_MAPPINGS
+
+    def active_name(self) -> Optional[str]:
+        """Name of the dead keys dict picked by the last condition evaluation"""
+        for key, mappings in self._table.items():
+            if mappings is self.active:
+                return self._names[key]
+        return None
+
+    def __repr__(self):
+        return f"DeadKeysTable({len(self._table)} entries, active: {self.active_name()})"
@@ -2,14 +2,21 @@
 
 import re
 import os
+import json
 import time
 import shutil
+import argparse
 import subprocess
 
-from typing import Dict
+from typing import Dict, List, Optional, Set
+
+try:
+    from lib.runtime_files import runtime_file_path, write_file_atomic
+except ModuleNotFoundError:     # run as a script ('toshy-env'), from inside 'lib'
+    from runtime_files import runtime_file_path, write_file_atomic
 
 # ENV_CONTEXT module version:
-__version__ = '20250129'
+__version__ = '20261018'
 
 VERBOSE = True
 FLUSH = True
@@ -52,45 +59,261 @@ def info(*args, ctx="--"):
 # Set up some useful environment variables
 
 
+ENV_CACHE_FILE_NAME = 'toshy_env_context.json'
+ENV_CACHE_MAX_ENTRIES = 8
+
+
+def env_cache_path() -> Optional[str]:
+    return runtime_file_path(ENV_CACHE_FILE_NAME)
+
+
+def env_cache_key() -> Dict[str, str]:
+    """
+    What identifies the session that a detected environment belongs to. Only what
+    the tray and the systemd user services of the same session agree on (not
+    XDG_SESSION_ID, which services don't get), the runtime folder is per user anyway.
+    """
+    try:
+        with open('/proc/sys/kernel/random/boot_id', 'r') as boot_id_file:
+            boot_id = boot_id_file.read().strip()
+    except OSError:
+        boot_id = ''
+    return {
+        'module_version':       __version__,
+        'boot_id':              boot_id,
+        'XDG_CURRENT_DESKTOP':  os.environ.get('XDG_CURRENT_DESKTOP', ''),
+        'WAYLAND_DISPLAY':      os.environ.get('WAYLAND_DISPLAY', ''),
+        'DISPLAY':              os.environ.get('DISPLAY', ''),
+    }
+
+
+class ProcessInventory:
+    """
+    Snapshot of the running processes, read from /proc once, to answer all the
+    "is this process running" questions of the environment detection without
+    running pgrep/ps over and over. Matches like pgrep does:
+    - process names (/proc/PID/comm, at most 15 chars) exactly, ignoring case or not
+    - full command lines (/proc/PID/cmdline, args joined by spaces) with a regex
+    The process doing the checking is left out, like pgrep leaves itself out.
+    """
+    def __init__(self, proc_dir='/proc'):
+        self.names: Set[str]                = set()
+        self.names_casefolded: Set[str]     = set()
+        self.cmdlines: List[str]            = []
+        own_pid = str(os.getpid())
+        try:
+            pids = [entry.name for entry in os.scandir(proc_dir)
+                    if entry.name.isdigit() and entry.name != own_pid]
+        except OSError as proc_err:
+            error(f"ENV: Cannot list processes in '{proc_dir}': {proc_err}")
+            pids = []
+        for pid in pids:
+            try:
+                with open(f'{proc_dir}/{pid}/comm', 'rb') as comm_file:
+                    name = comm_file.read().rstrip(b'\n').decode('utf-8', errors='replace')
+                with open(f'{proc_dir}/{pid}/cmdline', 'rb') as cmdline_file:
+                    cmdline = cmdline_file.read()
+            except OSError:
+                continue    # process exited while reading
+            self.names.add(name)
+            self.names_casefolded.add(name.casefold())
+            args = cmdline.rstrip(b'\0').replace(b'\0', b' ').decode('utf-8', errors='replace')
+            # kernel threads have no command line, "ps" shows them as [name]
+            self.cmdlines.append(args or f'[{name}]')
+
+    def has_name(self, name: str, ignore_case=True) -> bool:
+        """Process name matches exactly, like 'pgrep -x [-i]'"""
+        if ignore_case:
+            return name.casefold() in self.names_casefolded
+        return name in self.names
+
+    def has_cmdline(self, pattern: str, flags=0) -> bool:
+        """Some command line matches the regex pattern, like 'pgrep -f'"""
+        matcher = re.compile(pattern, flags)
+        return any(matcher.search(cmdline) for cmdline in self.cmdlines)
+
+    def count_cmdlines_containing(self, text: str) -> int:
+        """Processes with the text in their command line (ignoring case), like 'ps ax | grep -ic'"""
+        text = text.casefold()
+        return sum(text in cmdline.casefold() for cmdline in self.cmdlines)
+
+
+def _detected_value(attr_name: str, detector_name: str):
+    """
+    Property for an environment value, detected by calling the named detector method
+    the first time it's read (the detector sets the value). A detector that reads
+    another value triggers that detection first, so the order takes care of itself.
+    """
+    def _get(self: 'EnvironmentInfo'):
+        try:
+            return self._values[attr_name]
+        except KeyError:
+            return self._detect(attr_name, detector_name)
+
+    def _set(self: 'EnvironmentInfo', value):
+        self._values[attr_name] = value
+
+    return property(_get, _set, doc=f"Detected by {detector_name}() on first use")
+
+
 class EnvironmentInfo:
+    """
+    Detects the environment: distro, session type, desktop environment, window manager.
+    Each value is only detected when it's first read, and then kept, so a component
+    that only needs a few of them doesn't pay for the rest. get_env_info() reads all.
+    """
+    # As of 2024-09-04 there are seven different bits of info to generate. 
+    DISTRO_ID                               = _detected_value('DISTRO_ID',      'get_distro_id')
+    DISTRO_VER                              = _detected_value('DISTRO_VER',     'get_distro_version')
+    VARIANT_ID                              = _detected_value('VARIANT_ID',     'get_variant_id')
+    SESSION_TYPE                            = _detected_value('SESSION_TYPE',   'get_session_type')
+    DESKTOP_ENV                             = _detected_value('DESKTOP_ENV',    'get_desktop_environment')
+    DE_MAJ_VER                              = _detected_value('DE_MAJ_VER',     'get_desktop_env_version')
+    WINDOW_MGR                              = _detected_value('WINDOW_MGR',     'get_window_manager')
+    # WDW_MGR_VER                             = _detected_value('WDW_MGR_VER',    'get_window_manager_version')
+
+    ENV_INFO_NAMES = [  'DISTRO_ID', 'DISTRO_VER', 'VARIANT_ID', 'SESSION_TYPE',
+                        'DESKTOP_ENV', 'DE_MAJ_VER', 'WINDOW_MGR' ]
+
     def __init__(self):
-        self.DISTRO_ID                      = None
-        self.DISTRO_VER                     = None
-        self.VARIANT_ID                     = None
-        self.SESSION_TYPE                   = None
-        self.DESKTOP_ENV                    = None
-        self.DE_MAJ_VER                     = None
-        self.WINDOW_MGR                     = None
-        # self.WDW_MGR_VER                    = None        # Just in case we need it later
-
-        self.env_info_dct: Dict[str, str]   = {}
-        self.release_files: Dict[str, str]  = self.read_release_files()
+        self._values: Dict[str, str]                    = {}
+        self.detector_ms: Dict[str, float]              = {}    # own time of each detector
+        self._nested_secs                               = 0.0
+        self._detecting                                 = 0
+        self.env_info_dct: Dict[str, str]               = {}
+        self._release_files: Optional[Dict[str, str]]   = None
+        self._processes: Optional[ProcessInventory]     = None
+        self._cache_key: Optional[Dict[str, str]]       = None
+        self._cache_refresh                             = False
+        self._cache_dirty                               = False
+
+    def _detect(self, attr_name: str, detector_name: str):
+        """Run a detector, timing it without the detections it triggers itself"""
+        self._values[attr_name] = None      # what the detector sees while it runs
+        outer_nested_secs, self._nested_secs = self._nested_secs, 0.0
+        self._detecting += 1
+        start = time.perf_counter()
+        try:
+            getattr(self, detector_name)()
+        except BaseException:
+            del self._values[attr_name]
+            raise
+        finally:
+            self._detecting -= 1
+            elapsed = time.perf_counter() - start
+            own_secs = elapsed - self._nested_secs
+            self._nested_secs = outer_nested_secs + elapsed
+        self.detector_ms[attr_name] = own_secs * 1000
+        debug(  f"ENV: {attr_name} = '{self._values[attr_name]}' "
+                f"({detector_name}: {own_secs * 1000:.1f} ms)", ctx="EV")
+        if self._cache_key is not None:
+            self._cache_dirty = True
+            if not self._detecting:
+                self._save_cache()
+        return self._values[attr_name]
+
+    @property
+    def release_files(self) -> Dict[str, str]:
+        """Contents of the distro release files, read on first use"""
+        if self._release_files is None:
+            self._release_files = self.read_release_files()
+        return self._release_files
+
+    @property
+    def processes(self) -> ProcessInventory:
+        """Process inventory, read from /proc on first use in each get_env_info() run"""
+        if self._processes is None:
+            self._processes = ProcessInventory()
+        return self._processes
 
     def get_env_info(self):
         """Primary method to get complete environment info"""
 
-        # Call methods to populate the instance variables with info.
-        # As of 2024-09-04 there are seven different bits of info to generate. 
-        self.get_distro_id()
-        self.get_distro_version()
-        self.get_variant_id()
-        self.get_session_type()
-        self.get_desktop_environment()
-        self.get_desktop_env_version()
-        self.get_window_manager()
-        # self.get_window_manager_version()                 # Just in case we need it later
-
-        # Collect all info into a dictionary
-        self.env_info_dct = {
-            'DISTRO_ID':        self.DISTRO_ID,
-            'DISTRO_VER':       self.DISTRO_VER,
-            'VARIANT_ID':       self.VARIANT_ID,
-            'SESSION_TYPE':     self.SESSION_TYPE,
-            'DESKTOP_ENV':      self.DESKTOP_ENV,
-            'DE_MAJ_VER':       self.DE_MAJ_VER,
-            'WINDOW_MGR':       self.WINDOW_MGR,
-            # 'WDW_MGR_VER':      self.WDW_MGR_VER,         # Just in case we need it later
-        }
+        # Detect everything again. Processes may have started or stopped since a previous run.
+        self._values = {}
+        self._processes = None
+
+        # Reading each value runs its detector, collect all info into a dictionary
+        self.env_info_dct = {attr_name: getattr(self, attr_name) for attr_name in self.ENV_INFO_NAMES}
+        return self.env_info_dct
+
+    def use_cache(self, refresh=False):
+        """
+        Share the detected values with the other Toshy components of the session (config,
+        tray, D-Bus services) through a file in XDG_RUNTIME_DIR. Takes the values already
+        in the file for this boot, desktop and display (unless `refresh` is True),
+        and adds the values detected from now on to the file.
+        """
+        self._cache_key = env_cache_key()
+        self._cache_refresh = refresh
+        if refresh:
+            return
+        cached = self._read_cache()
+        for attr_name in self.ENV_INFO_NAMES:
+            if attr_name in cached and attr_name not in self._values:
+                self._values[attr_name] = cached[attr_name]
+
+    def _read_cache_entries(self) -> List[Dict]:
+        cache_path = env_cache_path()
+        if cache_path is None:
+            return []
+        try:
+            with open(cache_path, 'r', encoding='UTF-8') as cache_file:
+                entries = json.load(cache_file).get('entries')
+        except (OSError, ValueError, AttributeError):
+            return []
+        if not isinstance(entries, list):
+            return []
+        return [entry for entry in entries if isinstance(entry, dict) and
+                isinstance(entry.get('key'), dict) and isinstance(entry.get('env_info'), dict)]
+
+    def _read_cache(self) -> Dict[str, str]:
+        for entry in self._read_cache_entries():
+            if entry['key'] == self._cache_key:
+                return entry['env_info']
+        return {}
+
+    def _save_cache(self):
+        cache_path = env_cache_path()
+        self._cache_dirty = False
+        if cache_path is None:
+            return
+        # One entry per key, so components that see the session a bit differently
+        # don't keep replacing each other's entry. The latest entry goes first.
+        entries = self._read_cache_entries()
+        env_info = {}
+        for entry in entries:
+            if entry['key'] == self._cache_key:
+                # merge with the values other components may have added (unless refreshing)
+                if not self._cache_refresh:
+                    env_info = entry['env_info']
+                entries.remove(entry)
+                break
+        self._cache_refresh = False
+        env_info.update((attr_name, value) for attr_name, value in self._values.items()
+                        if attr_name in self.ENV_INFO_NAMES)
+        entries.insert(0, {'key': self._cache_key, 'env_info': env_info})
+        try:
+            write_file_atomic(cache_path,
+                                json.dumps({'entries': entries[:ENV_CACHE_MAX_ENTRIES]}, indent=2))
+        except OSError as write_err:
+            error(f"ENV: Could not write environment cache file '{cache_path}': {write_err}")
+
+    def get_env_info_cached(self, refresh=False):
+        """
+        Same as get_env_info(), but through the session cache (see use_cache()), so
+        detection only runs for values no other component of the session has detected
+        yet, or for all of them if `refresh` is True.
+        """
+        self.use_cache(refresh)
+        self._detecting += 1        # write the cache file once, after all the detections
+        try:
+            self.env_info_dct = {attr_name: getattr(self, attr_name)
+                                    for attr_name in self.ENV_INFO_NAMES}
+        finally:
+            self._detecting -= 1
+        if self._cache_dirty:
+            self._save_cache()
         return self.env_info_dct
 
     def read_release_files(self) -> Dict[str, str]:
@@ -107,53 +330,17 @@ class EnvironmentInfo:
     def is_process_running(self, process_name):
         """
         Utility function to check if process is running.
-        For names >15 chars, uses pgrep -f with careful pattern matching to avoid false positives.
-        Tests for feature support and falls back gracefully if advanced features unavailable.
+        For names >15 chars, matches the full command line with careful pattern matching
+        to avoid false positives (the process name in /proc is cut to 15 chars).
+        Answered from the process inventory, no subprocess is run.
         """
-        # Test if -i is supported
-        try:
-            subprocess.check_output(['pgrep', '-i', 'test'], stderr=subprocess.PIPE)
-            case_insensitive = True
-        except subprocess.CalledProcessError as e:
-            if "invalid option" in str(e.stderr):
-                case_insensitive = False
-            else:
-                # Process just wasn't found in test, but -i is supported
-                case_insensitive = True
-
         if len(process_name) <= 15:
             # Standard exact match for short names
-            cmd = ['pgrep', '-x']
-            if case_insensitive:
-                cmd.append('-i')
-            cmd.append(process_name)
+            return self.processes.has_name(process_name)
         else:
-            # For long names, try using -f with careful pattern matching
-            pattern = f"(/|^){process_name}($| )"
-            try:
-                # Test if -f is supported with a pattern
-                test_cmd = ['pgrep', '-f', 'test']
-                subprocess.check_output(test_cmd, stderr=subprocess.PIPE)
-                # If we get here, -f is supported
-                cmd = ['pgrep', '-f', pattern]
-            except subprocess.CalledProcessError as e:
-                if "invalid option" in str(e.stderr):
-                    # If -f isn't supported, fall back to truncated exact match
-                    print(f"Warning: process name '{process_name}' is >15 chars and pgrep -f "
-                        f"is not supported. Falling back to exact match with '{process_name[:15]}'")
-                    cmd = ['pgrep', '-x']
-                    if case_insensitive:
-                        cmd.append('-i')
-                    cmd.append(process_name[:15])
-                else:
-                    # Process just wasn't found in test
-                    cmd = ['pgrep', '-f', pattern]
-
-        try:
-            subprocess.check_output(cmd)
-            return True
-        except subprocess.CalledProcessError:
-            return False
+            # For long names, use careful pattern matching on the command line
+            pattern = f"(/|^){re.escape(process_name)}($| )"
+            return self.processes.has_cmdline(pattern)
 
 ####################################################################################################
 ##                                                                                                ##
@@ -332,26 +519,12 @@ class EnvironmentInfo:
             # Deal with archaic distros like antiX that fail to set XDG_SESSION_TYPE
             time.sleep(3)
 
-            xorg_check_p1 = subprocess.Popen(['ps', 'ax'], stdout=subprocess.PIPE)
-            xorg_check_p2 = subprocess.Popen(
-                                        ['grep', '-i', '-c', 'xorg'], 
-                                        stdin=xorg_check_p1.stdout, 
-                                        stdout=subprocess.PIPE)
-            xorg_check_p1.stdout.close()  # Allow p1 to receive a SIGPIPE if p2 exits.
-            xorg_check_output = xorg_check_p2.communicate()[0]
-            xorg_count = int(xorg_check_output.decode()) - 1
+            xorg_count = self.processes.count_cmdlines_containing('xorg')
 
             if xorg_count:
                 self.SESSION_TYPE = 'x11'
 
-            wayland_check_p1 = subprocess.Popen(['ps', 'ax'], stdout=subprocess.PIPE)
-            wayland_check_p2 = subprocess.Popen(
-                                            ['grep', '-i', '-c', 'wayland'], 
-                                            stdin=wayland_check_p1.stdout, 
-                                            stdout=subprocess.PIPE)
-            wayland_check_p1.stdout.close()  # Allow p1 to receive a SIGPIPE if p2 exits.
-            wayland_check_output = wayland_check_p2.communicate()[0]
-            wayland_count = int(wayland_check_output.decode()) - 1
+            wayland_count = self.processes.count_cmdlines_containing('wayland')
 
             if wayland_count:
                 self.SESSION_TYPE = 'wayland'
@@ -466,16 +639,12 @@ class EnvironmentInfo:
             def check_process(names, desktop_env):
                 # nonlocal DESKTOP_ENV
                 for name in names:
-                    command = f"pgrep -x {name}"
-                    try:
-                        subprocess.check_output(command, shell=True)
+                    if self.processes.has_name(name, ignore_case=False):
                         if self.DESKTOP_ENV != desktop_env:
                             error(  f"Desktop may be misidentified: '{self.DESKTOP_ENV}'\n"
                                     f"'{desktop_env}' was detected and will be used instead.")
                             self.DESKTOP_ENV = desktop_env
                         break  # Stop checking if any of the processes are found
-                    except subprocess.CalledProcessError:
-                        pass
 
             processes = {
                 'kde':          ['plasmashell', 'kwin_ft', 'kwin_wayland', 'kwin_x11', 'kwin'],
@@ -715,8 +884,18 @@ class EnvironmentInfo:
 
 
 if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Show the environment Toshy sees")
+    arg_parser.add_argument('--refresh', action='store_true',
+                            help="detect again, and update the cache shared by the Toshy components")
+    arg_parser.add_argument('--no-cache', action='store_true',
+                            help="detect again, without reading or writing the cache")
+    args = arg_parser.parse_args()
+
     env_info_getter = EnvironmentInfo()
-    _env_info = env_info_getter.get_env_info()
+    if args.no_cache:
+        _env_info = env_info_getter.get_env_info()
+    else:
+        _env_info = env_info_getter.get_env_info_cached(refresh=args.refresh)
     print('')
     debug(  f'Toshy env_info module sees this environment:'
             f'\n\t\t DISTRO_ID       = \'{_env_info["DISTRO_ID"]}\''
@@ -0,0 +1,40 @@
+__version__ = '20261018'
+
+from typing import List
+
+from xwaykeyz.lib.logger import debug, error
+
+
+PROC_INPUT_DEVICES_PATH = '/proc/bus/input/devices'
+
+
+def get_keyboard_device_names() -> List[str]:
+    """
+    Get the names of the currently attached input devices that have a keyboard
+    handler ("kbd"), from /proc/bus/input/devices. Same names the keymapper sees
+    as the device name in the key context. Does not need access to /dev/input.
+    """
+    try:
+        with open(PROC_INPUT_DEVICES_PATH, 'r', encoding='utf-8', errors='replace') as f:
+            proc_devices = f.read()
+    except OSError as proc_err:
+        error(f"Could not read input devices list: {proc_err}")
+        return []
+
+    kbd_dev_names = []
+    # Device entries are separated by a blank line. The lines we need look like:
+    # N: Name="AT Translated Set 2 keyboard"
+    # H: Handlers=sysrq kbd event3 leds
+    for entry in proc_devices.split('\n\n'):
+        dev_name = None
+        handlers = []
+        for line in entry.splitlines():
+            if line.startswith('N: Name='):
+                dev_name = line[len('N: Name='):].strip().strip('"')
+            elif line.startswith('H: Handlers='):
+                handlers = line[len('H: Handlers='):].split()
+        if dev_name and 'kbd' in handlers and dev_name not in kbd_dev_names:
+            kbd_dev_names.append(dev_name)
+
+    debug(f"Keyboard devices attached: {kbd_dev_names}")
+    return kbd_dev_names
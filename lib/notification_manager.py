@@ -1,54 +1,162 @@
-__version__ = '20240915'
+__version__ = '20261018'
 
+import queue
 import shutil
+import threading
 import subprocess
+try:
+    import dbus
+except ModuleNotFoundError:
+    dbus = None
 
-from subprocess import DEVNULL
-from xwaykeyz.lib.logger import debug
+from typing import NamedTuple, Optional
+from xwaykeyz.lib.logger import debug, error
 
+from lib.probe_cache import ProbeCache
+
+
+NTFY_BUS_NAME       = 'org.freedesktop.Notifications'
+NTFY_OBJECT_PATH    = '/org/freedesktop/Notifications'
+NTFY_DBUS_TIMEOUT   = 2.0       # seconds to wait for the notification daemon to answer
+NTFY_URGENCY_LEVELS = {'low': 0, 'normal': 1, 'critical': 2}
+
+
+class Notification(NamedTuple):
+    message: str
+    icon_file: str
+    urgency: str
+    replace_previous: bool
 
 
 class NotificationManager:
-    def __init__(self, icon_file=None, title=None, urgency='normal'):
-        self.is_p_option_supported = self.check_p_option()
-        self.ntfy_cmd       = shutil.which('notify-send')
-        self.prio_arg       = f'--urgency={urgency}'
-        self.icon_arg       = '' if icon_file is None else f'--icon={icon_file}'
-        self.app_name_arg   = '--app-name=Toshy'
-        self.title_arg      = "" if title is None else title
-        self.ntfy_id_new    = None
-        self.ntfy_id_last   = '0'
+    """
+    Shows desktop notifications without ever making the caller wait. Calls to
+    send_notification() only put the notification in a queue. A background worker
+    thread sends them to the notification daemon over a persistent D-Bus session
+    connection (`Notify` method, tracking the id of the last notification for
+    `replaces_id`), or with `notify-send` if D-Bus can't be used.
+
+    When notifications pile up (like a burst of CapsLock presses), only the latest
+    of the ones that would replace each other gets shown.
+    """
+    def __init__(self, icon_file=None, title=None, urgency='normal', probe_cache=None):
+        self.icon_file                      = icon_file or ''
+        self.title                          = title or ''
+        self.urgency                        = urgency
+        self.app_name                       = 'Toshy'
+        self.ntfy_cmd                       = shutil.which('notify-send')
+        self.is_p_option_supported: Optional[bool] = None    # checked on first use
+        self.probe_cache                    = probe_cache or ProbeCache()
+        self.ntfy_id_last                   = 0
+        self._ntfy_iface                    = None
+        self._use_dbus                      = dbus is not None
+        self._queue: 'queue.Queue[Notification]' = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock                   = threading.Lock()
 
     @staticmethod
-    def check_p_option():
+    def check_p_option(ntfy_cmd='notify-send'):
         """check that notify-send command supports -p flag"""
         try:
-            subprocess.run(['notify-send', '-p'], check=True, capture_output=True)
+            subprocess.run([ntfy_cmd, '-p'], check=True, capture_output=True)
         except subprocess.CalledProcessError as e:
             # Check if the error message contains "Unknown option" for -p flag
             error_output: bytes = e.stderr  # type hint to validate decode()
             if 'Unknown option' in error_output.decode('utf-8'):
                 return False
+        except OSError:
+            return False
         return True
 
-    def send_notification(self, message: str, icon_file: str=None, 
+    def send_notification(self, message: str, icon_file: str=None,
                                 urgency: str=None, replace_previous=True):
         """Show a notification with given message and icon.
-            Replace existing notification unless argument is false."""
-        _icon_arg = self.icon_arg if icon_file is None else f'--icon={icon_file}'
-        _prio_arg = self.prio_arg if urgency is None else f'--urgency={urgency}'
-        if self.is_p_option_supported and replace_previous:
-            _ntfy_id_new = subprocess.run(
-                [self.ntfy_cmd, _prio_arg, self.app_name_arg,
-                    _icon_arg, self.title_arg,
-                    message, '-p','-r', self.ntfy_id_last],
-                stdout=subprocess.PIPE).stdout # .decode().strip()
-            _ntfy_id_new: bytes     # type hint to help VSCode validate the ".decode().strip()"
-            self.ntfy_id_new = _ntfy_id_new.decode().strip()
-            self.ntfy_id_last = self.ntfy_id_new
+            Replace existing notification unless argument is false.
+            Returns right away, the notification is sent in the background."""
+        self._queue.put(Notification(   message,
+                                        self.icon_file if icon_file is None else icon_file,
+                                        self.urgency if urgency is None else urgency,
+                                        replace_previous))
+        if self._worker is None:
+            self._start_worker()
+
+    def _start_worker(self):
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run_worker,
+                                                name='toshy-notifications', daemon=True)
+                self._worker.start()
+
+    def _run_worker(self):
+        while True:
+            pending = [self._queue.get()]
+            while True:
+                try:
+                    pending.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            # of the queued notifications that replace the previous one, only the last matters
+            last_replacing = max((i for i, ntfy in enumerate(pending) if ntfy.replace_previous),
+                                    default=None)
+            for i, ntfy in enumerate(pending):
+                if ntfy.replace_previous and i != last_replacing:
+                    continue
+                try:
+                    self._send(ntfy)
+                except Exception as send_err:   # keep the worker alive, whatever happens
+                    error(f"Could not show notification: {send_err}")
+
+    def _send(self, ntfy: Notification):
+        if self._use_dbus:
+            try:
+                self._send_dbus(ntfy)
+                return
+            except dbus.exceptions.DBusException as dbus_err:
+                debug(f"Notification over D-Bus failed, using notify-send:\n\t{dbus_err}")
+                self._ntfy_iface = None     # reconnect for the next notification
+        self._send_notify_send(ntfy)
+
+    def _connect_dbus(self):
+        # a private connection, this thread is the only user
+        session_bus = dbus.SessionBus(private=True)
+        ntfy_obj = session_bus.get_object(NTFY_BUS_NAME, NTFY_OBJECT_PATH)
+        self._ntfy_iface = dbus.Interface(ntfy_obj, dbus_interface=NTFY_BUS_NAME)
+
+    def _send_dbus(self, ntfy: Notification):
+        if self._ntfy_iface is None:
+            try:
+                self._connect_dbus()
+            except dbus.exceptions.DBusException:
+                self._use_dbus = False      # no session bus, don't try again
+                raise
+        hints = {'urgency': dbus.Byte(NTFY_URGENCY_LEVELS.get(ntfy.urgency, 1))}
+        replaces_id = self.ntfy_id_last if ntfy.replace_previous else 0
+        ntfy_id = self._ntfy_iface.Notify(  self.app_name, dbus.UInt32(replaces_id),
+                                            ntfy.icon_file, self.title, ntfy.message,
+                                            dbus.Array([], signature='s'),
+                                            dbus.Dictionary(hints, signature='sv'),
+                                            dbus.Int32(-1), timeout=NTFY_DBUS_TIMEOUT)
+        if ntfy.replace_previous:
+            self.ntfy_id_last = int(ntfy_id)
+
+    def _send_notify_send(self, ntfy: Notification):
+        if self.ntfy_cmd is None:
+            error(f"No 'notify-send' command found. Cannot show notification:\n\t{ntfy.message}")
+            return
+        if self.is_p_option_supported is None:
+            self.is_p_option_supported = self.probe_cache.probe(
+                'notify-send -p', self.ntfy_cmd, self.check_p_option)
+        cmd_lst = [ self.ntfy_cmd, f'--urgency={ntfy.urgency}', f'--app-name={self.app_name}' ]
+        if ntfy.icon_file:
+            cmd_lst.append(f'--icon={ntfy.icon_file}')
+        cmd_lst += [self.title, ntfy.message]
+        if self.is_p_option_supported and ntfy.replace_previous:
+            cmd_lst += ['-p', '-r', str(self.ntfy_id_last)]
+            ntfy_id_new = subprocess.run(cmd_lst, stdout=subprocess.PIPE).stdout.decode().strip()
+            if ntfy_id_new.isdigit():
+                self.ntfy_id_last = int(ntfy_id_new)
         else:
-            subprocess.run([self.ntfy_cmd, self.app_name_arg, 
-                            _prio_arg, _icon_arg, self.title_arg, message])
+            subprocess.run(cmd_lst)
 
     def forced_numpad(self, state):
         """Show a notification when Forced Numpad feature is enabled/disabled."""
@@ -0,0 +1,1086 @@
+__version__ = '20261018'
+
+# Data tables for the Option key special characters feature ("OptSpecialChars")
+# and its dead keys, for the ABC Extended and US layouts (`optspec_layout` setting).
+#
+# This module is only imported when the feature is enabled, and the config builds
+# the keymap mappings for the selected layout from these tables (see
+# `lib.optspec_tables`). Nothing here creates any keymapper objects.
+#
+# Combos are the strings that go into C("..."). Outputs are encoded as:
+#   0x00E0                          UC(0x00E0)
+#   (0x006D, 0x0302)                [UC(0x006D), UC(0x0302)]
+#   DeadKey(0x0060)                 [UC(0x0060), C("Shift-Left"), setDK(0x0060)]
+#   ('apple_logo_alert', 0xF000)    [apple_logo_alert, UC(0xF000)]  (named config function)
+
+from typing import Dict, List, NamedTuple, Tuple
+
+
+class DeadKey(NamedTuple):
+    """Output of a dead key: type the accent, select it, and activate the dead key"""
+    accent: int
+
+
+# layout: (name, table)
+OPTSPEC_TABLES: Dict[str, Tuple[str, Dict]] = {}
+
+# layout: [(name, accents, table), ...]
+DEAD_KEYS_TABLES: Dict[str, List[Tuple[str, Tuple[int, ...], Dict]]] = {}
+
+
+def optspec_table(name: str, table: Dict, layout: str):
+    OPTSPEC_TABLES[layout] = (name, table)
+
+
+def dead_keys_table(name: str, table: Dict, layout: str, accents: List[int]):
+    DEAD_KEYS_TABLES.setdefault(layout, []).append((name, tuple(accents), table))
+
+
+#################################################
+###  OPTSPECIALCHARS - ABC EXTENDED LAYOUT    ###
+#################################################
+optspec_table("OptSpecialChars - ABC", {
+
+    # Number keys row with Option
+    ######################################################
+    'Alt-Grave':        DeadKey(0x0060),                                # Dead Key Accent: Grave
+
+    'Alt-1':                    0x00A1,                         # ¡ Inverted Exclamation Mark
+    'Alt-2':                    0x2122,                         # ™ Trade Mark Sign Emoji
+    'Alt-3':                    0x00A3,                         # £ British Pound currency symbol
+    'Alt-4':                    0x00A2,                         # ¢ Cent currency symbol
+    'Alt-5':                    0x00A7,                         # § Section symbol
+
+    'Alt-6':            DeadKey(0x02C6),                                # Dead Key Accent: Circumflex
+
+    'Alt-7':                    0x00B6,                         # ¶ Paragraph mark (Pilcrow) symbol
+    'Alt-8':                    0x2022,                         # • Bullet Point symbol (solid)
+    'Alt-9':                    0x00AA,                         # ª Feminine Ordinal Indicator
+    'Alt-0':                    0x00BA,                         # º Masculine Ordinal Indicator
+    'Alt-Minus':                0x2013,                         # – En Dash punctuation mark
+    'Alt-Equal':                0x2260,                         # ≠ Not Equal To symbol
+
+    # Number keys row with Shift+Option
+    ######################################################
+    'Shift-Alt-Grave':          0x0300,                         # ` Combining Grave Accent
+    'Shift-Alt-1':              0x2044,                         # ⁄ Fraction Slash
+    'Shift-Alt-2':              0x20AC,                         # € Euro currency symbol
+    'Shift-Alt-3':              0x2039,                         # ‹ Single Left-Pointing Angle Quotation mark
+    'Shift-Alt-4':              0x203A,                         # › Single Right-Pointing Angle Quotation mark
+    'Shift-Alt-5':              0x2020,                         # † Simple dagger (cross) symbol
+    'Shift-Alt-6':              0x0302,                         #  ̂ Combining Circumflex Accent
+    'Shift-Alt-7':              0x2021,                         # ‡ Double dagger (cross) symbol
+    'Shift-Alt-8':              0x00B0,                         # ° Degree Sign
+    'Shift-Alt-9':              0x00B7,                         # · Middle Dot (interpunct/middot)
+    'Shift-Alt-0':              0x201A,                         # ‚ Single low-9 quotation mark
+    'Shift-Alt-Minus':          0x2014,                         # — Em Dash punctuation mark
+    'Shift-Alt-Equal':          0x00B1,                         # ± Plus Minus mathematical symbol
+
+    # Tab key row with Option
+    ######################################################
+    'Alt-Q':                    0x0153,                         # œ Small oe (oethel) ligature
+
+    'Alt-W':            DeadKey(0x02D9),                                # Dead Key Accent: Dot Above
+    'Alt-E':            DeadKey(0x00B4),                                # Dead Key Accent: Acute
+
+    'Alt-R':                    0x00AE,                         # ® Registered Trade Mark Sign
+    'Alt-T':                    0x00FE,                         # þ Latin Small Letter Thorn
+    'Alt-Y':                    0x00A5,                         # ¥ Japanese Yen currency symbol
+
+    'Alt-U':            DeadKey(0x00A8),                                # Dead Key Accent: Umlaut/Diaeresis
+    'Alt-I':            DeadKey(0x02BC),                                # Dead Key Accent: Apostrophe/Horn
+
+    'Alt-O':                    0x00F8,                         # ø Latin Small Letter o with Stroke
+
+    'Alt-P':            DeadKey(0x002C),                                # Dead Key Accent: Comma Below
+
+    'Alt-Left_Brace':           0x201C,                         # “ Left Double Quotation Mark
+    'Alt-Right_Brace':          0x2018,                         # ‘ Left Single Quotation Mark
+    'Alt-Backslash':            0x00AB,                         # « Left-Pointing Double Angle Quotation Mark
+
+    # Tab key row with Shift+Option
+    ######################################################
+    'Shift-Alt-Q':              0x0152,                         # Œ Capital OE (Oethel) ligature
+    'Shift-Alt-W':              0x0307,                         # ˙ Combining Dot Above
+    'Shift-Alt-E':              0x0301,                         #  ́ Combining Acute Accent
+    'Shift-Alt-R':              0x2030,                         # ‰ Per mille symbol (zero over zero-zero)
+    'Shift-Alt-T':              0x00DE,                         # Þ Latin Capital Letter Thorn
+
+    # 'Shift-Alt-Y':              0x02F5,     # UC(0x030F),       # ̏  Combining Double Grave Accent
+    # Spacing issues when using Combining Double Grave {U+030F}
+    # Substituting {U+02F5}: ˵ Modifier Letter Middle Double Grave Accent for initial presentation
+    'Shift-Alt-Y':      DeadKey(0x02F5),                                # Dead Key Accent: Double Grave
+
+    'Shift-Alt-U':              0x0308,                         #  ̈ Combining Diaeresis/Umlaut
+    'Shift-Alt-I':              0x031B,                         # ̛ Combining Horn (Apostrophe)
+    'Shift-Alt-O':              0x00D8,                         # Ø Latin Capital Letter O with Stroke
+    'Shift-Alt-P':              0x0326,                         #  ̦ Combining Comma Below
+    'Shift-Alt-Left_Brace':     0x201D,                         # ” Right Double Quotation Mark
+    'Shift-Alt-Right_Brace':    0x2019,                         # ’ Right Single Quotation Mark
+    'Shift-Alt-Backslash':      0x00BB,                         # » Right-Pointing Double Angle Quotation Mark
+
+    # CapsLock key row with Option
+    ######################################################
+
+    'Alt-A':            DeadKey(0x00AF),                                # Dead Key Accent: Macron/Line Above
+
+    'Alt-S':                    0x00DF,                         # ß German Eszett/beta (Sharfes/Sharp S)
+    'Alt-D':                    0x00F0,                         # ð Latin Small Letter Eth
+    'Alt-F':                    0x0192,                         # ƒ Function/florin currency symbol
+    'Alt-G':                    0x00A9,                         # © Copyright Sign
+
+    'Alt-H':            DeadKey(0x02CD),                                # Dead Key Accent: Low Macron/Line Below
+    'Alt-J':            DeadKey(0x02DD),                                # Dead Key Accent: Double Acute
+    'Alt-K':            DeadKey(0x02DA),                                # Dead Key Accent: Ring Above
+    'Alt-L':            DeadKey(0x002D),                                # Dead Key Accent: Stroke/Hyphen-Minus
+
+    'Alt-Semicolon':            0x2026,                         # … Horizontal ellipsis
+    'Alt-Apostrophe':           0x00E6,                         # æ Small ae ligature
+
+    # CapsLock key row with Shift+Option
+    ######################################################
+    'Shift-Alt-A':              0x0304,                         #  ̄ Combining Macron/Line Below
+
+    # 'Shift-Alt-S':    DeadKey(0x0311),                              # Dead Key Accent: Combining Inverted Breve
+    # Combining Inverted Breve has spacing problems
+    # Substituting {U+1D16}: ᴖ Latin Small Letter Top Half O
+    'Shift-Alt-S':      DeadKey(0x1D16),                                # Dead Key Accent: Inverted Breve
+
+    'Shift-Alt-D':              0x00D0,                         # Ð Latin Capital Letter Eth
+
+    # 'Shift-Alt-F':      DeadKey(0x0330),                                # Dead Key Accent: Tilde Below
+    # Combining Tilde Below has spacing problems
+    # Substituting {U+02F7}: ˷ Modifier Letter Low Tilde
+    'Shift-Alt-F':      DeadKey(0x02F7),                                # Dead Key Accent: Tilde Below
+    'Shift-Alt-G':      DeadKey(0x2038),                                # Dead Key Accent: Caret/Circumflex Below
+
+    'Shift-Alt-H':              0x0331,                         # ̱  Combining Macron/Line Below
+    'Shift-Alt-J':              0x030B,                         #  ̋ Combining Double Acute Accent
+    'Shift-Alt-K':              0x030A,                         #  ̊ Combining Ring Above
+    'Shift-Alt-L':              0x0335,                         #  ̵ Combining Short Stroke Overlay
+
+    'Shift-Alt-Semicolon':     DeadKey(0x2116),                                 # Dead Key Accent: Numero Sign
+
+    'Shift-Alt-Apostrophe':     0x00C6,                         # Æ Capital AE ligature
+
+    # Shift keys row with Option
+    ######################################################
+
+    'Alt-Z':    DeadKey(0x02C0),                                # Dead Key Accent: Hook Above/Glottal Stop
+    'Alt-X':    DeadKey(0x002E),                                # Dead Key Accent: Dot Below
+    'Alt-C':    DeadKey(0x00B8),                                # Dead Key Accent: Cedilla/Cedille
+    'Alt-V':    DeadKey(0x02C7),                                # Dead Key Accent: Caron/hacek
+    'Alt-B':    DeadKey(0x02D8),                                # Dead Key Accent: Breve
+    'Alt-N':    DeadKey(0x02DC),                                # Dead Key Accent: Tilde
+    'Alt-M':    DeadKey(0x02DB),                                # Dead Key Accent: Ogonek
+
+    'Alt-Comma':                0x2264,                         # ≤ Less Than or Equal To symbol
+    'Alt-Dot':                  0x2265,                         # ≥ Greater Than or Equal To symbol
+    'Alt-Slash':                0x00F7,                         # ÷ Obelus/Division symbol
+
+    # Shift keys row with Shift+Option
+    ######################################################
+    'Shift-Alt-Z':              0x0309,                         # ̉  Combining Hook Above (hoi)
+    'Shift-Alt-X':              0x0323,                         # ̣  Combining Dot Below (nang)
+    'Shift-Alt-C':              0x0327,                         #  ̧ Combining Cedilla
+    'Shift-Alt-V':              0x030C,                         #  ̌ Combining Caron/hacek
+    'Shift-Alt-B':              0x0306,                         #  ̆ Combining Breve
+    'Shift-Alt-N':              0x0303,                         #  ̃ Combining Tilde
+    'Shift-Alt-M':              0x0328,                         #  ̨ Combining Ogonek (nasal hook)
+    'Shift-Alt-Comma':          0x201E,                         # „ Double Low-9 Quotation Mark
+
+    'Shift-Alt-Dot':    DeadKey(0x0294),                                # Dead Key Accent: Hook
+
+    'Shift-Alt-Slash':          0x00BF,                         # ¿ Inverted Question mark
+
+}, layout='ABC')
+
+
+#################################################
+###  OPTSPECIALCHARS - US LAYOUT              ###
+#################################################
+optspec_table("OptSpecialChars - US", {
+
+    # Number keys row with Option
+    ######################################################
+    'Alt-Grave':    DeadKey(0x0060),                                    # Dead Key Accent: Grave
+
+    'Alt-1':                    0x00A1,                         # ¡ Inverted Exclamation Mark
+    'Alt-2':                    0x2122,                         # ™ Trade Mark Sign Emoji
+    'Alt-3':                    0x00A3,                         # £ British Pound currency symbol
+    'Alt-4':                    0x00A2,                         # ¢ Cent currency symbol
+    'Alt-5':                    0x221E,                         # ∞ Infinity mathematical symbol
+    'Alt-6':                    0x00A7,                         # § Section symbol
+    'Alt-7':                    0x00B6,                         # ¶ Paragraph mark (Pilcrow) symbol
+    'Alt-8':                    0x2022,                         # • Bullet Point symbol (solid)
+    'Alt-9':                    0x00AA,                         # ª Feminine Ordinal Indicator
+    'Alt-0':                    0x00BA,                         # º Masculine Ordinal Indicator
+    'Alt-Minus':                0x2013,                         # – En Dash punctuation mark
+    'Alt-Equal':                0x2260,                         # ≠ Not Equal To symbol
+
+    # Number keys row with Shift+Option
+    ######################################################
+    'Shift-Alt-Grave':          0x0060,                         # ` Grave Accent (non-combining)
+    'Shift-Alt-1':              0x2044,                         # ⁄ Fraction Slash
+    'Shift-Alt-2':              0x20AC,                         # € Euro currency symbol
+    'Shift-Alt-3':              0x2039,                         # ‹ Single Left-Pointing Angle Quotation mark
+    'Shift-Alt-4':              0x203A,                         # › Single Right-Pointing Angle Quotation mark
+    'Shift-Alt-5':              0xFB01,                         # ﬁ Latin Small Ligature Fi
+    'Shift-Alt-6':              0xFB02,                         # ﬂ Latin Small Ligature Fl
+    'Shift-Alt-7':              0x2021,                         # ‡ Double dagger (cross) symbol
+    'Shift-Alt-8':              0x00B0,                         # ° Degree Sign
+    'Shift-Alt-9':              0x00B7,                         # · Middle Dot (interpunct/middot)
+    'Shift-Alt-0':              0x201A,                         # ‚ Single low-9 quotation mark
+    'Shift-Alt-Minus':          0x2014,                         # — Em Dash punctuation mark
+    'Shift-Alt-Equal':          0x00B1,                         # ± Plus Minus mathematical symbol
+
+    # Tab key row with Option
+    ######################################################
+    'Alt-Q':                    0x0153,                         # œ Small oe (oethel) ligature
+    'Alt-W':                    0x2211,                         # ∑ N-Ary Summation (sigma) notation
+
+    'Alt-E':            DeadKey(0x00B4),                                # Dead Key Accent: Acute
+
+    'Alt-R':                    0x00AE,                         # ® Registered Trade Mark Sign
+    'Alt-T':                    0x2020,                         # † Simple dagger (cross) symbol
+    'Alt-Y':                    0x00A5,                         # ¥ Japanese Yen currency symbol
+
+    'Alt-U':            DeadKey(0x00A8),                                # Dead Key Accent: Umlaut/Diaeresis
+
+    'Alt-I':            DeadKey(0x02C6),                                # Dead Key Accent: Circumflex
+
+    'Alt-O':                    0x00F8,                         # ø Latin Small Letter o with Stroke
+    'Alt-P':                    0x03C0,                         # π Greek Small Letter Pi
+    'Alt-Left_Brace':           0x201C,                         # “ Left Double Quotation Mark
+    'Alt-Right_Brace':          0x2018,                         # ‘ Left Single Quotation Mark
+    'Alt-Backslash':            0x00AB,                         # « Left-Pointing Double Angle Quotation Mark
+
+    # Tab key row with Shift+Option
+    ######################################################
+    'Shift-Alt-Q':              0x0152,                         # Œ Capital OE (Oethel) ligature
+    'Shift-Alt-W':              0x201E,                         # „ Double Low-9 Quotation mark
+    'Shift-Alt-E':              0x00B4,                         # ´ Acute Accent diacritic (non-combining)
+    'Shift-Alt-R':              0x2030,                         # ‰ Per mille symbol (zero over zero-zero)
+    'Shift-Alt-T':              0x02C7,                         # ˇ Caron/hacek diacritic (non-combining)
+    'Shift-Alt-Y':              0x00C1,                         # Á Latin Capital Letter A with Acute
+    'Shift-Alt-U':              0x00A8,                         # ¨ Diaeresis/Umlaut (non-combining)
+    'Shift-Alt-I':              0x02C6,                         # ˆ Circumflex Accent (non-combining)
+    'Shift-Alt-O':              0x00D8,                         # Ø Latin Capital Letter O with Stroke
+    'Shift-Alt-P':              0x220F,                         # ∏ N-Ary Product mathematical symbol
+    'Shift-Alt-Left_Brace':     0x201D,                         # ” Right Double Quotation Mark
+    'Shift-Alt-Right_Brace':    0x2019,                         # ’ Right Single Quotation Mark
+    'Shift-Alt-Backslash':      0x00BB,                         # » Right-Pointing Double Angle Quotation Mark
+
+    # CapsLock key row with Option
+    ######################################################
+    'Alt-A':                    0x00E5,                         # å Small Letter a with Ring Above
+    'Alt-S':                    0x00DF,                         # ß German Eszett/beta (Sharfes/Sharp S)
+    'Alt-D':                    0x2202,                         # ∂ Partial Differential
+    'Alt-F':                    0x0192,                         # ƒ Function/florin currency symbol
+    'Alt-G':                    0x00A9,                         # © Copyright Sign
+    'Alt-H':                    0x02D9,                         # ˙ Dot Above diacritic (non-combining)
+    'Alt-J':                    0x2206,                         # ∆ Increment, laplace operator symbol
+    'Alt-K':                    0x02DA,                         # ˚ Ring Above diacritic (non-combining)
+    'Alt-L':                    0x00AC,                         # ¬ Not Sign angled dash symbol
+    'Alt-Semicolon':            0x2026,                         # … Horizontal ellipsis
+    'Alt-Apostrophe':           0x00E6,                         # æ Small ae ligature
+
+    # CapsLock key row with Shift+Option
+    ######################################################
+    'Shift-Alt-A':              0x00C5,                         # Å Capital Letter A with Ring Above
+    'Shift-Alt-S':              0x00CD,                         # Í Latin Capital Letter I with Acute
+    'Shift-Alt-D':              0x00CE,                         # Î Latin Capital Letter I with Circumflex
+    'Shift-Alt-F':              0x00CF,                         # Ï Latin Capital Letter I with Diaeresis
+    'Shift-Alt-G':              0x02DD,                         # ˝ Double Acute Accent (non-combining)
+    'Shift-Alt-H':              0x00D3,                         # Ó Latin Capital Letter O with Acute
+    'Shift-Alt-J':              0x00D4,                         # Ô Latin Capital Letter O with Circumflex
+    #########################################################################################################
+    # The Apple logo is at {U+F8FF} in a Unicode Private Use Area. Only at that location in Mac fonts. 
+    # Symbol exists at {U+F000} in Baskerville Old Face font. 
+    'Shift-Alt-K':      ('apple_logo_alert', 0xF000),           #  Apple logo [req's Baskerville Old Face font]
+    'Shift-Alt-L':              0x00D2,                         # Ò Latin Capital Letter O with Grave
+    'Shift-Alt-Semicolon':      0x00DA,                         # Ú Latin Capital Letter U with Acute
+    'Shift-Alt-Apostrophe':     0x00C6,                         # Æ Capital AE ligature
+
+    # Shift keys row with Option
+    ######################################################
+    'Alt-Z':                    0x03A9,                         # Ω Greek Capital Letter Omega
+    'Alt-X':                    0x2248,                         # ≈ Almost Equal To symbol
+    'Alt-C':                    0x00E7,                         # ç Small Letter c with Cedilla
+    'Alt-V':                    0x221A,                         # √ Square Root radical sign
+    'Alt-B':                    0x222B,                         # ∫ Integral mathematical symbol
+
+    'Alt-N':    DeadKey(0x02DC),                                # Dead Key Accent: Tilde
+
+    'Alt-M':                    0x00B5,                         # µ Micro (mu) symbol
+    'Alt-Comma':                0x2264,                         # ≤ Less Than or Equal To symbol
+    'Alt-Dot':                  0x2265,                         # ≥ Greater Than or Equal To symbol
+    'Alt-Slash':                0x00F7,                         # ÷ Obelus/Division symbol
+
+    # Shift keys row with Shift+Option
+    ######################################################
+    'Shift-Alt-Z':              0x00B8,                         # ¸ Spacing Cedilla diacritic (non-combining)
+    'Shift-Alt-X':              0x02DB,                         # ˛ Ogonek diacritic (non-combining)
+    'Shift-Alt-C':              0x00C7,                         # Ç Capital Letter C with Cedilla
+    'Shift-Alt-V':              0x25CA,                         # ◊ Lozenge (diamond) shape symbol
+    'Shift-Alt-B':              0x0131,                         # ı Latin Small Letter Dotless i
+    'Shift-Alt-N':              0x02DC,                         # ˜ Small Tilde character
+    'Shift-Alt-M':              0x00C2,                         # Â Latin Capital Letter A with Circumflex
+    'Shift-Alt-Comma':          0x00AF,                         # ¯ Macron/overline/overbar (non-combining)
+    'Shift-Alt-Dot':            0x02D8,                         # ˘ Breve diacritic (non-combining)
+    'Shift-Alt-Slash':          0x00BF,                         # ¿ Inverted Question mark
+
+}, layout='US')
+
+
+#################################################
+###  DEAD KEYS TABLES - ABC EXTENDED LAYOUT   ###
+#################################################
+
+dead_keys_table("DK-ABC - Grave", {
+    # Option+Grave              {U+0060}
+    # Valid keys:
+    # a e i n o u v w y
+    # A E I N O U V W Y
+    'A':                        0x00E0,                         # à Latin Small Letter A with Grave
+    'E':                        0x00E8,                         # è Latin Small Letter E with Grave
+    'I':                        0x00EC,                         # ì Latin Small Letter I with Grave
+    'N':                        0x01F9,                         # ǹ Latin Small Letter N with Grave
+    'O':                        0x00F2,                         # ò Latin Small Letter O with Grave
+    'U':                        0x00F9,                         # ù Latin Small Letter U with Grave
+    'V':                        0x01DC,                         # ǜ Latin Small Letter U w/Diaeresis and Grave
+    'W':                        0x1E81,                         # ẁ Latin Small Letter W with Grave
+    'Y':                        0x1EF3,                         # ỳ Latin Small Letter Y with Grave
+    'Shift-A':                  0x00C0,                         # À Latin Capital Letter A with Grave
+    'Shift-E':                  0x00C8,                         # È Latin Capital Letter E with Grave
+    'Shift-I':                  0x00CC,                         # Ì Latin Capital Letter I with Grave
+    'Shift-N':                  0x01F8,                         # Ǹ Latin Capital Letter N with Grave
+    'Shift-O':                  0x00D2,                         # Ò Latin Capital Letter O with Grave
+    'Shift-U':                  0x00D9,                         # Ù Latin Capital Letter U with Grave
+    'Shift-V':                  0x01DB,                         # Ǜ Latin Capital Letter U w/Diaeresis and Grave
+    'Shift-W':                  0x1E80,                         # Ẁ Latin Capital Letter W with Grave
+    'Shift-Y':                  0x1EF2,                         # Ỳ Latin Capital Letter Y with Grave
+}, layout='ABC', accents=[0x0060])
+
+dead_keys_table("DK-ABC - Circumflex", {
+    # Option+6                  {U+02C6}
+    # Valid keys:
+    # a c e g h i j m n o s u w y z
+    # A C E G H I J M N O S U W Y Z
+    'A':                        0x00E2,                         # â Latin Small Letter A with Circumflex
+    'C':                        0x0109,                         # ĉ Latin Small Letter C with Circumflex
+    'E':                        0x00EA,                         # ê Latin Small Letter E with Circumflex
+    'G':                        0x011D,                         # ĝ Latin Small Letter G with Circumflex
+    'H':                        0x0125,                         # ĥ Latin Small Letter H with Circumflex
+    'I':                        0x00EE,                         # î Latin Small Letter I with Circumflex
+    'J':                        0x0135,                         # ĵ Latin Small Letter J with Circumflex
+    'M':                       (0x006D, 0x0302),                # m̂ Latin Small Letter M with Circumflex
+    'N':                       (0x006E, 0x0302),                # n̂ Latin Small Letter N with Circumflex
+    'O':                        0x00F4,                         # ô Latin Small Letter O with Circumflex
+    'S':                        0x015D,                         # ŝ Latin Small Letter S with Circumflex
+    'U':                        0x00FB,                         # û Latin Small Letter U with Circumflex
+    'W':                        0x0175,                         # ŵ Latin Small Letter W with Circumflex
+    'Y':                        0x0177,                         # ŷ Latin Small Letter Y with Circumflex
+    'Z':                        0x1E91,                         # ẑ Latin Small Letter Z with Circumflex
+    'Shift-A':                  0x00C2,                         # Â Latin Capital Letter A with Circumflex
+    'Shift-C':                  0x0108,                         # Ĉ Latin Capital Letter C with Circumflex
+    'Shift-E':                  0x00CA,                         # Ê Latin Capital Letter E with Circumflex
+    'Shift-G':                  0x011C,                         # Ĝ Latin Capital Letter G with Circumflex
+    'Shift-H':                  0x0124,                         # Ĥ Latin Capital Letter H with Circumflex
+    'Shift-I':                  0x00CE,                         # Î Latin Capital Letter I with Circumflex
+    'Shift-J':                  0x0134,                         # Ĵ Latin Capital Letter J with Circumflex
+    'Shift-M':                 (0x004D, 0x0302),                # M̂ Latin Capital Letter M with Circumflex
+    'Shift-N':                 (0x004E, 0x0302),                # N̂ Latin Capital Letter N with Circumflex
+    'Shift-O':                  0x00D4,                         # Ô Latin Capital Letter O with Circumflex
+    'Shift-S':                  0x015C,                         # Ŝ Latin Capital Letter S with Circumflex
+    'Shift-U':                  0x00DB,                         # Û Latin Capital Letter U with Circumflex
+    'Shift-W':                  0x0174,                         # Ŵ Latin Capital Letter W with Circumflex
+    'Shift-Y':                  0x0176,                         # Ŷ Latin Capital Letter Y with Circumflex
+    'Shift-Z':                  0x1E90,                         # Ẑ Latin Capital Letter Z with Circumflex
+}, layout='ABC', accents=[0x02C6])
+
+dead_keys_table("DK-ABC - Dot Above", {
+    # Option+W                  {U+02D9}
+    # Valid keys:
+    # a b c d e f g h i m n o p r s t w x y z
+    # A B C D E F G H I M N O P R S T W X Y Z
+    'A':                        0x0227,                         # ȧ Latin Small Letter A with Dot Above
+    'B':                        0x1E03,                         # ḃ Latin Small Letter B with Dot Above
+    'C':                        0x010B,                         # ċ Latin Small Letter C with Dot Above
+    'D':                        0x1E0B,                         # ḋ Latin Small Letter D with Dot Above
+    'E':                        0x0117,                         # ė Latin Small Letter E with Dot Above
+    'F':                        0x1E1F,                         # ḟ Latin Small Letter F with Dot Above
+    'G':                        0x0121,                         # ġ Latin Small Letter G with Dot Above
+    'H':                        0x1E23,                         # ḣ Latin Small Letter H with Dot Above
+    'I':                        0x0131,                         # ı Latin Small Letter Dotless I
+    'M':                        0x1E41,                         # ṁ Latin Small Letter M with Dot Above
+    'N':                        0x1E45,                         # ṅ Latin Small Letter N with Dot Above
+    'O':                        0x022F,                         # ȯ Latin Small Letter O with Dot Above
+    'P':                        0x1E57,                         # ṗ Latin Small Letter P with Dot Above
+    'R':                        0x1E59,                         # ṙ Latin Small Letter R with Dot Above
+    'S':                        0x1E61,                         # ṡ Latin Small Letter S with Dot Above
+    'T':                        0x1E6B,                         # ṫ Latin Small Letter T with Dot Above
+    'W':                        0x1E87,                         # ẇ Latin Small Letter W with Dot Above
+    'X':                        0x1E8B,                         # ẋ Latin Small Letter X with Dot Above
+    'Y':                        0x1E8F,                         # ẏ Latin Small Letter Y with Dot Above
+    'Z':                        0x017C,                         # ż Latin Small Letter Z with Dot Above
+    'Shift-A':                  0x0226,                         # Ȧ Latin Capital Letter A with Dot Above
+    'Shift-B':                  0x1E02,                         # Ḃ Latin Capital Letter B with Dot Above
+    'Shift-C':                  0x010A,                         # Ċ Latin Capital Letter C with Dot Above
+    'Shift-D':                  0x1E0A,                         # Ḋ Latin Capital Letter D with Dot Above
+    'Shift-E':                  0x0116,                         # Ė Latin Capital Letter E with Dot Above
+    'Shift-F':                  0x1E1E,                         # Ḟ Latin Capital Letter F with Dot Above
+    'Shift-G':                  0x0120,                         # Ġ Latin Capital Letter G with Dot Above
+    'Shift-H':                  0x1E22,                         # Ḣ Latin Capital Letter H with Dot Above
+    'Shift-I':                  0x0130,                         # İ Latin Capital Letter I with Dot Above
+    'Shift-M':                  0x1E40,                         # Ṁ Latin Capital Letter M with Dot Above
+    'Shift-N':                  0x1E44,                         # Ṅ Latin Capital Letter N with Dot Above
+    'Shift-O':                  0x022E,                         # Ȯ Latin Capital Letter O with Dot Above
+    'Shift-P':                  0x1E56,                         # Ṗ Latin Capital Letter P with Dot Above
+    'Shift-R':                  0x1E58,                         # Ṙ Latin Capital Letter R with Dot Above
+    'Shift-S':                  0x1E60,                         # Ṡ Latin Capital Letter S with Dot Above
+    'Shift-T':                  0x1E6A,                         # Ṫ Latin Capital Letter T with Dot Above
+    'Shift-W':                  0x1E86,                         # Ẇ Latin Capital Letter W with Dot Above
+    'Shift-X':                  0x1E8A,                         # Ẋ Latin Capital Letter X with Dot Above
+    'Shift-Y':                  0x1E8E,                         # Ẏ Latin Capital Letter Y with Dot Above
+    'Shift-Z':                  0x017B,                         # Ż Latin Capital Letter Z with Dot Above
+}, layout='ABC', accents=[0x02D9])
+
+dead_keys_table("DK-ABC - Acute", {
+    # Option+E                  {U+00B4}
+    # Valid keys:
+    # a c e g i m n o p r s w y z
+    # A C E G I M N O P R S W Y Z
+    'A':                        0x00E1,                         # á Latin Small Letter A with Acute
+    'C':                        0x0107,                         # ć Latin Small Letter C with Acute
+    'E':                        0x00E9,                         # é Latin Small Letter E with Acute
+    'G':                        0x01F5,                         # ǵ Latin Small Letter G with Acute
+    'I':                        0x00ED,                         # í Latin Small Letter I with Acute
+    'M':                        0x1E3F,                         # ḿ Latin Small Letter M with Acute
+    'N':                        0x0144,                         # ń Latin Small Letter N with Acute
+    'O':                        0x00F3,                         # ó Latin Small Letter O with Acute
+    'P':                        0x1E55,                         # ṕ Latin Small Letter P with Acute
+    'R':                        0x0155,                         # ŕ Latin Small Letter R with Acute
+    'S':                        0x015B,                         # ś Latin Small Letter S with Acute
+    'W':                        0x1E83,                         # ẃ Latin Small Letter W with Acute
+    'Y':                        0x00FD,                         # ý Latin Small Letter Y with Acute
+    'Z':                        0x017A,                         # ź Latin Small Letter Z with Acute
+    'Shift-A':                  0x00C1,                         # Á Latin Capital Letter A with Acute
+    'Shift-C':                  0x0106,                         # Ć Latin Capital Letter C with Acute
+    'Shift-E':                  0x00C9,                         # É Latin Capital Letter E with Acute
+    'Shift-G':                  0x01F4,                         # Ǵ Latin Capital Letter G with Acute
+    'Shift-I':                  0x00CD,                         # Í Latin Capital Letter I with Acute
+    'Shift-M':                  0x1E3E,                         # Ḿ Latin Capital Letter M with Acute
+    'Shift-N':                  0x0143,                         # Ń Latin Capital Letter N with Acute
+    'Shift-O':                  0x00D3,                         # Ó Latin Capital Letter O with Acute
+    'Shift-P':                  0x1E54,                         # Ṕ Latin Capital Letter P with Acute
+    'Shift-R':                  0x0154,                         # Ŕ Latin Capital Letter R with Acute
+    'Shift-S':                  0x015A,                         # Ś Latin Capital Letter S with Acute
+    'Shift-W':                  0x1E82,                         # Ẃ Latin Capital Letter W with Acute
+    'Shift-Y':                  0x00DD,                         # Ý Latin Capital Letter Y with Acute
+    'Shift-Z':                  0x0179,                         # Ź Latin Capital Letter Z with Acute
+}, layout='ABC', accents=[0x00B4])
+
+dead_keys_table("DK-ABC - Double Grave", {
+    # Shift+Option+Y            {U+030F} [uses {U+02F5} Modifier Letter Middle Double Grave Accent]
+    # Valid keys:
+    # a e i o r u
+    # A E I O R U
+    'A':                        0x0201,                         # ȁ Latin Small Letter A with Double Grave
+    'E':                        0x0205,                         # ȅ Latin Small Letter E with Double Grave
+    'I':                        0x0209,                         # ȉ Latin Small Letter I with Double Grave
+    'O':                        0x020D,                         # ȍ Latin Small Letter O with Double Grave
+    'R':                        0x0211,                         # ȑ Latin Small Letter R with Double Grave
+    'U':                        0x0215,                         # ȕ Latin Small Letter U with Double Grave
+    'Shift-A':                  0x0200,                         # Ȁ Latin Capital Letter A with Double Grave
+    'Shift-E':                  0x0204,                         # Ȅ Latin Capital Letter E with Double Grave
+    'Shift-I':                  0x0208,                         # Ȉ Latin Capital Letter I with Double Grave
+    'Shift-O':                  0x020C,                         # Ȍ Latin Capital Letter O with Double Grave
+    'Shift-R':                  0x0210,                         # Ȑ Latin Capital Letter R with Double Grave
+    'Shift-U':                  0x0214,                         # Ȕ Latin Capital Letter U with Double Grave
+}, layout='ABC', accents=[0x030F, 0x02F5])
+
+dead_keys_table("DK-ABC - Umlaut/Diaeresis", {
+    # Option+U                  {U+00A8}
+    # Valid keys:
+    # a e h i o t u w x y
+    # A E H I O T U W X Y
+    'A':                        0x00E4,                         # ä Latin Small Letter A with Diaeresis
+    'E':                        0x00EB,                         # ë Latin Small Letter E with Diaeresis
+    'H':                        0x1E27,                         # ḧ Latin Small Letter H with Diaeresis
+    'I':                        0x00EF,                         # ï Latin Small Letter I with Diaeresis
+    'O':                        0x00F6,                         # ö Latin Small Letter O with Diaeresis
+    'T':                        0x1E97,                         # ẗ Latin Small Letter T with Diaeresis
+    'U':                        0x00FC,                         # ü Latin Small Letter U with Diaeresis
+    'W':                        0x1E85,                         # ẅ Latin Small Letter W with Diaeresis
+    'X':                        0x1E8D,                         # ẍ Latin Small Letter X with Diaeresis
+    'Y':                        0x00FF,                         # ÿ Latin Small Letter Y with Diaeresis
+    'Shift-A':                  0x00C4,                         # Ä Latin Capital Letter A with Diaeresis
+    'Shift-E':                  0x00CB,                         # Ë Latin Capital Letter E with Diaeresis
+    'Shift-H':                  0x1E26,                         # Ḧ Latin Capital Letter H with Diaeresis
+    'Shift-I':                  0x00CF,                         # Ï Latin Capital Letter I with Diaeresis
+    'Shift-O':                  0x00D6,                         # Ö Latin Capital Letter O with Diaeresis
+    'Shift-T':                 (0x0054, 0x0308),                # T̈ Latin Capital Letter T with Diaeresis
+    'Shift-U':                  0x00DC,                         # Ü Latin Capital Letter U with Diaeresis
+    'Shift-W':                  0x1E84,                         # Ẅ Latin Capital Letter W with Diaeresis
+    'Shift-X':                  0x1E8C,                         # Ẍ Latin Capital Letter X with Diaeresis
+    'Shift-Y':                  0x0178,                         # Ÿ Latin Capital Letter Y with Diaeresis
+}, layout='ABC', accents=[0x00A8])
+
+dead_keys_table("DK-ABC - Apostrophe/Horn", {
+    # Option+I                  {U+02BC}
+    # Valid keys:
+    # o u
+    # O U
+    'O':                        0x01A1,                         # ơ Latin Small Letter O with Horn
+    'U':                        0x01B0,                         # ư Latin Small Letter U with Horn
+    'Shift-O':                  0x01A0,                         # Ơ Latin Capital Letter O with Horn
+    'Shift-U':                  0x01AF,                         # Ư Latin Capital Letter U with Horn
+}, layout='ABC', accents=[0x02BC])
+
+dead_keys_table("DK-ABC - Comma Below", {
+    # Option+P                  {U+002C}
+    # Valid keys:
+    # s t
+    # S T
+    'S':                        0x0219,                         # ș Latin Small Letter S with Comma Below
+    'T':                        0x021B,                         # ț Latin Small Letter T with Comma Below
+    'Shift-S':                  0x0218,                         # Ș Latin Capital Letter S with Comma Below
+    'Shift-T':                  0x021A,                         # Ț Latin Capital Letter T with Comma Below
+}, layout='ABC', accents=[0x002C])
+
+dead_keys_table("DK-ABC - Macron/Line Above", {
+    # Option+A                  {U+00AF}
+    # Valid keys:
+    # a e g i l o r s v y z
+    # A E G I L O R S V Y Z
+    'A':                        0x0101,                         # ā Latin Small Letter A with Macron
+    'E':                        0x0113,                         # ē Latin Small Letter E with Macron
+    'G':                        0x1E21,                         # ḡ Latin Small Letter G with Macron
+    'I':                        0x012B,                         # ī Latin Small Letter I with Macron
+    'L':            (0x006C, 0x0304, 0x0323),                   # ḹ Latin Small Letter L w/Macron and Dot Below
+    'O':                        0x014D,                         # ō Latin Small Letter O with Macron
+    'R':            (0x0072, 0x0304, 0x0323),                   # ṝ Latin Small Letter R w/Macron and Dot Below
+    'S':                       (0x0073, 0x0304),                # s̄ Latin Small Letter S with Macron
+    'V':                        0x01D6,                         # ǖ Latin Small Letter U with Diaeresis and Macron
+    'Y':                        0x0233,                         # ȳ Latin Small Letter Y with Macron
+    'Z':                       (0x007A, 0x0304),                # z̄ Latin Small Letter Z with Macron
+    'Shift-A':                  0x0100,                         # Ā Latin Capital Letter A with Macron
+    'Shift-E':                  0x0112,                         # Ē Latin Capital Letter E with Macron
+    'Shift-G':                  0x1E20,                         # Ḡ Latin Capital Letter G with Macron
+    'Shift-I':                  0x012A,                         # Ī Latin Capital Letter I with Macron
+    'Shift-L':      (0x004C, 0x0304, 0x0323),                   # Ḹ Latin Capital Letter L w/Macron and Dot Below
+    'Shift-O':                  0x014C,                         # Ō Latin Capital Letter O with Macron
+    'Shift-R':      (0x0052, 0x0304, 0x0323),                   # Ṝ Latin Capital Letter R w/Macron and Dot Below
+    'Shift-S':                 (0x0053, 0x0304),                # S̄ Latin Capital Letter S with Macron
+    'Shift-V':                  0x01D5,                         # Ǖ Latin Capital Letter U with Diaeresis and Macron
+    'Shift-Y':                  0x0232,                         # Ȳ Latin Capital Letter Y with Macron
+    'Shift-Z':                 (0x005A, 0x0304),                # Z̄ Latin Capital Letter Z with Macron
+}, layout='ABC', accents=[0x00AF])
+
+dead_keys_table("DK-ABC - Inverted Breve", {
+    # Shift+Option+S            {U+0311}    [uses {U+1D16} as a substitute]
+    # Valid keys:
+    # a e i o r u
+    # A E I O R U 
+    'A':                        0x0203,                         # ȃ Latin Small Letter A with Inverted Breve
+    'E':                        0x0207,                         # ȇ Latin Small Letter E with Inverted Breve
+    'I':                        0x020B,                         # ȋ Latin Small Letter I with Inverted Breve
+    'O':                        0x020F,                         # ȏ Latin Small Letter O with Inverted Breve
+    'R':                        0x0213,                         # ȓ Latin Small Letter R with Inverted Breve
+    'U':                        0x0217,                         # ȗ Latin Small Letter U with Inverted Breve
+    'Shift-A':                  0x0202,                         # Ȃ Latin Capital Letter A with Inverted Breve
+    'Shift-E':                  0x0206,                         # Ȇ Latin Capital Letter E with Inverted Breve
+    'Shift-I':                  0x020A,                         # Ȋ Latin Capital Letter I with Inverted Breve
+    'Shift-O':                  0x020E,                         # Ȏ Latin Capital Letter O with Inverted Breve
+    'Shift-R':                  0x0212,                         # Ȓ Latin Capital Letter R with Inverted Breve
+    'Shift-U':                  0x0216,                         # Ȗ Latin Capital Letter U with Inverted Breve
+}, layout='ABC', accents=[0x0311, 0x1D16])
+
+dead_keys_table("DK-ABC - Tilde Below", {
+    # Shift+Option+F            {U+0330}    [uses {U+02F7} as a substitute]
+    # Valid keys:
+    # e i u
+    # E I U
+    'E':                        0x1E1B,                         # ḛ Latin Small Letter E with Tilde Below
+    'I':                        0x1E2D,                         # ḭ Latin Small Letter I with Tilde Below
+    'U':                        0x1E75,                         # ṵ Latin Small Letter U with Tilde Below
+    'Shift-E':                  0x1E1A,                         # Ḛ Latin Capital Letter E with Tilde Below
+    'Shift-I':                  0x1E2C,                         # Ḭ Latin Capital Letter I with Tilde Below
+    'Shift-U':                  0x1E74,                         # Ṵ Latin Capital Letter U with Tilde Below
+}, layout='ABC', accents=[0x0330, 0x02F7])
+
+dead_keys_table("DK-ABC - Caret/Circumflex Below", {
+    # Shift+Option+G            {U+2038}
+    # Valid keys:
+    # d e l n t u
+    # D E L N T U
+    'D':                        0x1E13,                         # ḓ Latin Small Letter D with Circumflex Below
+    'E':                        0x1E19,                         # ḙ Latin Small Letter E with Circumflex Below
+    'L':                        0x1E3D,                         # ḽ Latin Small Letter L with Circumflex Below
+    'N':                        0x1E4B,                         # ṋ Latin Small Letter N with Circumflex Below
+    'T':                        0x1E71,                         # ṱ Latin Small Letter T with Circumflex Below
+    'U':                        0x1E77,                         # ṷ Latin Small Letter U with Circumflex Below
+    'Shift-D':                  0x1E12,                         # Ḓ Latin Capital Letter D with Circumflex Below
+    'Shift-E':                  0x1E18,                         # Ḙ Latin Capital Letter E with Circumflex Below
+    'Shift-L':                  0x1E3C,                         # Ḽ Latin Capital Letter L with Circumflex Below
+    'Shift-N':                  0x1E4A,                         # Ṋ Latin Capital Letter N with Circumflex Below
+    'Shift-T':                  0x1E70,                         # Ṱ Latin Capital Letter T with Circumflex Below
+    'Shift-U':                  0x1E76,                         # Ṷ Latin Capital Letter U with Circumflex Below
+}, layout='ABC', accents=[0x2038])
+
+dead_keys_table("DK-ABC - Low Macron/Line Below", {
+    # Option+H                  {U+02CD}
+    # Valid keys:
+    # b d h k l n r t z
+    # B D H K L N R T Z 
+    'B':                        0x1E07,                         # ḇ Latin Small Letter B with Line Below
+    'D':                        0x1E0F,                         # ḏ Latin Small Letter D with Line Below
+    'H':                        0x1E96,                         # ẖ Latin Small Letter H with Line Below
+    'K':                        0x1E35,                         # ḵ Latin Small Letter K with Line Below
+    'L':                        0x1E3B,                         # ḻ Latin Small Letter L with Line Below
+    'N':                        0x1E49,                         # ṉ Latin Small Letter N with Line Below
+    'R':                        0x1E5F,                         # ṟ Latin Small Letter R with Line Below
+    'T':                        0x1E6F,                         # ṯ Latin Small Letter T with Line Below
+    'Z':                        0x1E95,                         # ẕ Latin Small Letter Z with Line Below
+    'Shift-B':                  0x1E06,                         # Ḇ Latin Capital Letter B with Line Below
+    'Shift-D':                  0x1E0E,                         # Ḏ Latin Capital Letter D with Line Below
+    'Shift-H':                 (0x0048, 0x0331),                # H̱ Latin Capital Letter H with Line Below
+    'Shift-K':                  0x1E34,                         # Ḵ Latin Capital Letter K with Line Below
+    'Shift-L':                  0x1E3A,                         # Ḻ Latin Capital Letter L with Line Below
+    'Shift-N':                  0x1E48,                         # Ṉ Latin Capital Letter N with Line Below
+    'Shift-R':                  0x1E5E,                         # Ṟ Latin Capital Letter R with Line Below
+    'Shift-T':                  0x1E6E,                         # Ṯ Latin Capital Letter T with Line Below
+    'Shift-Z':                  0x1E94,                         # Ẕ Latin Capital Letter Z with Line Below
+}, layout='ABC', accents=[0x02CD])
+
+dead_keys_table("DK-ABC - Double Acute", {
+    # Option+J                  {U+02DD}
+    # Valid keys:
+    # o u
+    # O U
+    'O':                        0x0151,                         # ő Latin Small Letter O with Double Acute
+    'U':                        0x0171,                         # ű Latin Small Letter U with Double Acute
+    'Shift-O':                  0x0150,                         # Ő Latin Capital Letter O with Double Acute
+    'Shift-U':                  0x0170,                         # Ű Latin Capital Letter U with Double Acute
+}, layout='ABC', accents=[0x02DD])
+
+dead_keys_table("DK-ABC - Ring Above", {
+    # Option+K                  {U+02DA}
+    # Valid keys:
+    # a e o u w y
+    # A E O U W Y 
+    'A':                        0x00E5,                         # å Latin Small Letter A with Ring Above
+    'E':                       (0x0065, 0x030A),                # e̊ Latin Small Letter E with Ring Above
+    'O':                       (0x006F, 0x030A),                # o̊ Latin Small Letter O with Ring Above
+    'U':                        0x016F,                         # ů Latin Small Letter U with Ring Above
+    'W':                        0x1E98,                         # ẘ Latin Small Letter W with Ring Above
+    'Y':                        0x1E99,                         # ẙ Latin Small Letter Y with Ring Above
+    'Shift-A':                  0x00C5,                         # Å Latin Capital Letter A with Ring Above
+    'Shift-E':                 (0x0045, 0x030A),                # E̊ Latin Capital Letter E with Ring Above
+    'Shift-O':                 (0x004F, 0x030A),                # O̊ Latin Capital Letter O with Ring Above
+    'Shift-U':                  0x016E,                         # Ů Latin Capital Letter U with Ring Above
+    'Shift-W':                 (0x0057, 0x030A),                # W̊ Latin Capital Letter W with Ring Above
+    'Shift-Y':                 (0x0059, 0x030A),                # Y̊ Latin Capital Letter Y with Ring Above
+}, layout='ABC', accents=[0x02DA])
+
+dead_keys_table("DK-ABC - Stroke/Hyphen-Minus", {
+    # Option+L                  {U+002D}
+    # Valid keys:
+    # b d g h i l o t u z
+    #   D G H I L O T   Z 
+    'B':                        0x0180,                         # ƀ Latin Small Letter B with Stroke
+    'D':                        0x0111,                         # đ Latin Small Letter D with Stroke
+    'G':                        0x01E5,                         # ǥ Latin Small Letter G with Stroke
+    'H':                        0x0127,                         # ħ Latin Small Letter H with Stroke
+    'I':                        0x0268,                         # ɨ Latin Small Letter I with Stroke
+    'L':                        0x0142,                         # ł Latin Small Letter L with Stroke
+    'O':                        0x0275,                         # ɵ Latin Small Letter Barred O
+    'T':                        0x0167,                         # ŧ Latin Small Letter T with Stroke
+    'U':                        0x0289,                         # ʉ Latin Small Letter U Bar
+    'Z':                        0x01B6,                         # ƶ Latin Small Letter Z with Stroke
+    'Shift-D':                  0x0110,                         # Đ Latin Capital Letter D with Stroke
+    'Shift-G':                  0x01E4,                         # Ǥ Latin Capital Letter G with Stroke
+    'Shift-H':                  0x0126,                         # Ħ Latin Capital Letter H with Stroke
+    'Shift-I':                  0x0197,                         # Ɨ Latin Capital Letter I with Stroke
+    'Shift-L':                  0x0141,                         # Ł Latin Capital Letter L with Stroke
+    'Shift-O':                  0x019F,                         # Ɵ Latin Capital Letter O with Middle Tilde
+    'Shift-T':                  0x0166,                         # Ŧ Latin Capital Letter T with Stroke
+    'Shift-Z':                  0x01B5,                         # Ƶ Latin Capital Letter Z with Stroke
+}, layout='ABC', accents=[0x002D])
+
+dead_keys_table("DK-ABC - Numero Sign", {
+    # Shift+Option+Semicolon    {U+2116}
+    # Valid keys:
+    # 2 3 5 6 7 8 (digits with Option)
+    # 2 3 5 6   8 (digits with Shift+Option)
+    # a c e g h j k m n q r s u v w y z (letters with Option)
+    # A C E G H J K M N Q R   U   W Y Z (letters with Shift+Option)
+    '3':                        0x025B,                         # ɛ  Latin Small Letter Open E
+    '5':                        0x01BD,                         # ƽ  Latin Small Letter Tone Five
+    '2':                        0x01A8,                         # ƨ  Latin Small Letter Tone Two
+    '6':                        0x0185,                         # ƅ  Latin Small Letter Tone Six
+    '7':                        0x204A,                         # ⁊  Tironian Sign Et
+    '8':                        0x0223,                         # ȣ  Latin Small Letter Ou
+    'Shift-2':                  0x01A7,                         # Ƨ  Latin Capital Letter Tone Two
+    'Shift-3':                  0x0190,                         # Ɛ  Latin Capital Letter Open E
+    'Shift-5':                  0x01BC,                         # Ƽ  Latin Capital Letter Tone Five
+    'Shift-6':                  0x0184,                         # Ƅ  Latin Capital Letter Tone Six
+    'Shift-8':                  0x0222,                         # Ȣ  Latin Capital Letter Ou
+    'a':                        0x0259,                         # ə  Latin Small Letter Schwa
+    'c':                        0x0254,                         # ɔ  Latin Small Letter Open O
+    'e':                        0x01DD,                         # ǝ  Latin Small Letter Turned E
+    'g':                        0x0263,                         # ɣ  Latin Small Letter Gamma
+    'h':                        0x0195,                         # ƕ  Latin Small Letter Hv
+    'j':                        0x019E,                         # ƞ  Latin Small Letter N with Long Right Leg
+    'k':                        0x0138,                         # ĸ  Latin Small Letter Kra
+    'm':                        0x026F,                         # ɯ  Latin Small Letter Turned M
+    'n':                        0x014B,                         # ŋ  Latin Small Letter Eng
+    'q':                        0x01A3,                         # ƣ  Latin Small Letter Oi
+    'r':                        0x0280,                         # ʀ  Latin Letter Small Capital R
+    's':                        0x017F,                         # ſ  Latin Small Letter Long S
+    'u':                        0x028A,                         # ʊ  Latin Small Letter Upsilon
+    'v':                        0x028C,                         # ʌ  Latin Small Letter Turned V
+    'w':                        0x01BF,                         # ƿ  Latin Letter Wynn
+    'y':                        0x021D,                         # ȝ  Latin Small Letter Yogh
+    'z':                        0x0292,                         # ʒ  Latin Small Letter Ezh
+    'Shift-A':                  0x018F,                         # Ə  Latin Capital Letter Schwa
+    'Shift-C':                  0x0186,                         # Ɔ  Latin Capital Letter Open O
+    'Shift-E':                  0x018E,                         # Ǝ  Latin Capital Letter Reversed E
+    'Shift-G':                  0x0194,                         # Ɣ  Latin Capital Letter Gamma
+    'Shift-H':                  0x01F6,                         # Ƕ  Latin Capital Letter Hwair
+    'Shift-J':                  0x0220,                         # Ƞ  Latin Capital Letter N with Long Right Leg
+    'Shift-K':                 (0x004B, 0x2019),                # K’ Latin Capital Letter K with Apostrophe
+    'Shift-M':                  0x019C,                         # Ɯ  Latin Capital Letter Turned M
+    'Shift-N':                  0x014A,                         # Ŋ  Latin Capital Letter Eng
+    'Shift-Q':                  0x01A2,                         # Ƣ  Latin Capital Letter Oi
+    'Shift-R':                  0x01A6,                         # Ʀ  Latin Letter Yr
+    'Shift-U':                  0x01B1,                         # Ʊ  Latin Capital Letter Upsilon
+    'Shift-W':                  0x01F7,                         # Ƿ  Latin Capital Letter Wynn
+    'Shift-Y':                  0x021C,                         # Ȝ  Latin Capital Letter Yogh
+    'Shift-Z':                  0x01B7,                         # Ʒ  Latin Capital Letter Ezh
+}, layout='ABC', accents=[0x2116])
+
+dead_keys_table("DK-ABC - Hook Above/Glottal Stop", {
+    # Option+Z                  {U+02C0}
+    # Valid keys:
+    # a e i o u y
+    # A E I O U Y 
+    'A':                        0x1EA3,                         # ả  Latin Small Letter A with Hook Above
+    'E':                        0x1EBB,                         # ẻ  Latin Small Letter E with Hook Above
+    'I':                        0x1EC9,                         # ỉ  Latin Small Letter I with Hook Above
+    'O':                        0x1ECF,                         # ỏ  Latin Small Letter O with Hook Above
+    'U':                        0x1EE7,                         # ủ  Latin Small Letter U with Hook Above
+    'Y':                        0x1EF7,                         # ỷ  Latin Small Letter Y with Hook Above
+    'Shift-A':                  0x1EA2,                         # Ả  Latin Small Letter A with Hook Above
+    'Shift-E':                  0x1EBA,                         # Ẻ  Latin Small Letter E with Hook Above
+    'Shift-I':                  0x1EC8,                         # Ỉ  Latin Small Letter I with Hook Above
+    'Shift-O':                  0x1ECE,                         # Ỏ  Latin Small Letter O with Hook Above
+    'Shift-U':                  0x1EE6,                         # Ủ  Latin Small Letter U with Hook Above
+    'Shift-Y':                  0x1EF6,                         # Ỷ  Latin Small Letter Y with Hook Above
+}, layout='ABC', accents=[0x02C0])
+
+dead_keys_table("DK-ABC - Dot Below", {
+    # Option+X                  {U+002E}
+    # Valid keys:
+    # a b d e h i k l m n o r s t u v w y z
+    # A B D E H I K L M N O R S T U V W Y Z 
+    'A':                        0x1EA1,                         # ạ Latin Small Letter A with Dot Below
+    'B':                        0x1E05,                         # ḅ Latin Small Letter B with Dot Below
+    'D':                        0x1E0D,                         # ḍ Latin Small Letter D with Dot Below
+    'E':                        0x1EB9,                         # ẹ Latin Small Letter E with Dot Below
+    'H':                        0x1E25,                         # ḥ Latin Small Letter H with Dot Below
+    'I':                        0x1ECB,                         # ị Latin Small Letter I with Dot Below
+    'K':                        0x1E33,                         # ḳ Latin Small Letter K with Dot Below
+    'L':                        0x1E37,                         # ḷ Latin Small Letter L with Dot Below
+    'M':                        0x1E43,                         # ṃ Latin Small Letter M with Dot Below
+    'N':                        0x1E47,                         # ṇ Latin Small Letter N with Dot Below
+    'O':                        0x1ECD,                         # ọ Latin Small Letter O with Dot Below
+    'R':                        0x1E5B,                         # ṛ Latin Small Letter R with Dot Below
+    'S':                        0x1E63,                         # ṣ Latin Small Letter S with Dot Below
+    'T':                        0x1E6D,                         # ṭ Latin Small Letter T with Dot Below
+    'U':                        0x1EE5,                         # ụ Latin Small Letter U with Dot Below
+    'V':                        0x1E7F,                         # ṿ Latin Small Letter V with Dot Below
+    'W':                        0x1E89,                         # ẉ Latin Small Letter W with Dot Below
+    'Y':                        0x1EF5,                         # ỵ Latin Small Letter Y with Dot Below
+    'Z':                        0x1E93,                         # ẓ Latin Small Letter Z with Dot Below
+    'Shift-A':                  0x1EA0,                         # Ạ Latin Capital Letter A with Dot Below
+    'Shift-B':                  0x1E04,                         # Ḅ Latin Capital Letter B with Dot Below
+    'Shift-D':                  0x1E0C,                         # Ḍ Latin Capital Letter D with Dot Below
+    'Shift-E':                  0x1EB8,                         # Ẹ Latin Capital Letter E with Dot Below
+    'Shift-H':                  0x1E24,                         # Ḥ Latin Capital Letter H with Dot Below
+    'Shift-I':                  0x1ECA,                         # Ị Latin Capital Letter I with Dot Below
+    'Shift-K':                  0x1E32,                         # Ḳ Latin Capital Letter K with Dot Below
+    'Shift-L':                  0x1E36,                         # Ḷ Latin Capital Letter L with Dot Below
+    'Shift-M':                  0x1E42,                         # Ṃ Latin Capital Letter M with Dot Below
+    'Shift-N':                  0x1E46,                         # Ṇ Latin Capital Letter N with Dot Below
+    'Shift-O':                  0x1ECC,                         # Ọ Latin Capital Letter O with Dot Below
+    'Shift-R':                  0x1E5A,                         # Ṛ Latin Capital Letter R with Dot Below
+    'Shift-S':                  0x1E62,                         # Ṣ Latin Capital Letter S with Dot Below
+    'Shift-T':                  0x1E6C,                         # Ṭ Latin Capital Letter T with Dot Below
+    'Shift-U':                  0x1EE4,                         # Ụ Latin Capital Letter U with Dot Below
+    'Shift-V':                  0x1E7E,                         # Ṿ Latin Capital Letter V with Dot Below
+    'Shift-W':                  0x1E88,                         # Ẉ Latin Capital Letter W with Dot Below
+    'Shift-Y':                  0x1EF4,                         # Ỵ Latin Capital Letter Y with Dot Below
+    'Shift-Z':                  0x1E92,                         # Ẓ Latin Capital Letter Z with Dot Below
+}, layout='ABC', accents=[0x002E])
+
+dead_keys_table("DK-ABC - Cedilla/Cedille", {
+    # Option+C                  {U+00B8}
+    # Valid keys:
+    # c d e g h k l n r s t z
+    # C D E G H K L N R S T Z 
+    'C':                        0x00E7,                         # ç Latin Small Letter C with Cedilla
+    'D':                        0x1E11,                         # ḑ Latin Small Letter D with Cedilla
+    'E':                        0x0229,                         # ȩ Latin Small Letter E with Cedilla
+    'G':                        0x0123,                         # ģ Latin Small Letter G with Cedilla
+    'H':                        0x1E29,                         # ḩ Latin Small Letter H with Cedilla
+    'K':                        0x0137,                         # ķ Latin Small Letter K with Cedilla
+    'L':                        0x013C,                         # ļ Latin Small Letter L with Cedilla
+    'N':                        0x0146,                         # ņ Latin Small Letter N with Cedilla
+    'R':                        0x0157,                         # ŗ Latin Small Letter R with Cedilla
+    'S':                        0x015F,                         # ş Latin Small Letter S with Cedilla
+    'T':                        0x0163,                         # ţ Latin Small Letter T with Cedilla
+    'Z':                       (0x007A, 0x0327),                # z̧ Latin Small Letter Z with Cedilla
+    'Shift-C':                  0x00C7,                         # Ç Latin Capital Letter C with Cedilla
+    'Shift-D':                  0x1E10,                         # Ḑ Latin Capital Letter D with Cedilla
+    'Shift-E':                  0x0228,                         # Ȩ Latin Capital Letter E with Cedilla
+    'Shift-G':                  0x0122,                         # Ģ Latin Capital Letter G with Cedilla
+    'Shift-H':                  0x1E28,                         # Ḩ Latin Capital Letter H with Cedilla
+    'Shift-K':                  0x0136,                         # Ķ Latin Capital Letter K with Cedilla
+    'Shift-L':                  0x013B,                         # Ļ Latin Capital Letter L with Cedilla
+    'Shift-N':                  0x0145,                         # Ņ Latin Capital Letter N with Cedilla
+    'Shift-R':                  0x0156,                         # Ŗ Latin Capital Letter R with Cedilla
+    'Shift-S':                  0x015E,                         # Ş Latin Capital Letter S with Cedilla
+    'Shift-T':                  0x0162,                         # Ţ Latin Capital Letter T with Cedilla
+    'Shift-Z':                 (0x005A, 0x0327),                # Z̧ Latin Capital Letter Z with Cedilla
+}, layout='ABC', accents=[0x00B8])
+
+dead_keys_table("DK-ABC - Caron/hacek", {
+    # Option+V                  {U+02C7}
+    # Valid keys:
+    # a c d e g h i j k l n o r s t u v x z
+    # A C D E G H I J K L N O R S T U V X Z 
+    'A':                        0x01CE,                         # ǎ Latin Small Letter A with Caron
+    'C':                        0x010D,                         # č Latin Small Letter C with Caron
+    'D':                        0x010F,                         # ď Latin Small Letter D with Caron
+    'E':                        0x011B,                         # ě Latin Small Letter E with Caron
+    'G':                        0x01E7,                         # ǧ Latin Small Letter G with Caron
+    'H':                        0x021F,                         # ȟ Latin Small Letter H with Caron
+    'I':                        0x01D0,                         # ǐ Latin Small Letter I with Caron
+    'J':                        0x01F0,                         # ǰ Latin Small Letter J with Caron
+    'K':                        0x01E9,                         # ǩ Latin Small Letter K with Caron
+    'L':                        0x013E,                         # ľ Latin Small Letter L with Caron
+    'N':                        0x0148,                         # ň Latin Small Letter N with Caron
+    'O':                        0x01D2,                         # ǒ Latin Small Letter O with Caron
+    'R':                        0x0159,                         # ř Latin Small Letter R with Caron
+    'S':                        0x0161,                         # š Latin Small Letter S with Caron
+    'T':                        0x0165,                         # ť Latin Small Letter T with Caron
+    'U':                        0x01D4,                         # ǔ Latin Small Letter U with Caron
+    'V':                        0x01DA,                         # ǚ Latin Small Letter U w/Diaeresis and Caron
+    'X':                       (0x0292, 0x030C),                # ǯ Latin Small Letter Ezh with Caron
+    'Z':                        0x017E,                         # ž Latin Small Letter Z with Caron
+    'Shift-A':                  0x01CD,                         # Ǎ Latin Capital Letter A with Caron
+    'Shift-C':                  0x010C,                         # Č Latin Capital Letter C with Caron
+    'Shift-D':                  0x010E,                         # Ď Latin Capital Letter D with Caron
+    'Shift-E':                  0x011A,                         # Ě Latin Capital Letter E with Caron
+    'Shift-G':                  0x01E6,                         # Ǧ Latin Capital Letter G with Caron
+    'Shift-H':                  0x021E,                         # Ȟ Latin Capital Letter H with Caron
+    'Shift-I':                  0x01CF,                         # Ǐ Latin Capital Letter I with Caron
+    'Shift-J':                 (0x004A, 0x030C),                # J̌ Latin Capital Letter J with Caron
+    'Shift-K':                  0x01E8,                         # Ǩ Latin Capital Letter K with Caron
+    'Shift-L':                  0x013D,                         # Ľ Latin Capital Letter L with Caron
+    'Shift-N':                  0x0147,                         # Ň Latin Capital Letter N with Caron
+    'Shift-O':                  0x01D1,                         # Ǒ Latin Capital Letter O with Caron
+    'Shift-R':                  0x0158,                         # Ř Latin Capital Letter R with Caron
+    'Shift-S':                  0x0160,                         # Š Latin Capital Letter S with Caron
+    'Shift-T':                  0x0164,                         # Ť Latin Capital Letter T with Caron
+    'Shift-U':                  0x01D3,                         # Ǔ Latin Capital Letter U with Caron
+    'Shift-V':                  0x01D9,                         # Ǚ Latin Capital Letter U w/Diaeresis and Caron
+    'Shift-X':                 (0x01B7, 0x030C),                # Ǯ Latin Capital Letter Ezh with Caron
+    'Shift-Z':                  0x017D,                         # Ž Latin Capital Letter Z with Caron
+}, layout='ABC', accents=[0x02C7])
+
+dead_keys_table("DK-ABC - Breve", {
+    # Option+B                  {U+02D8}
+    # Valid keys:
+    # a e g h i o u
+    # A E G H I O U 
+    'A':                        0x0103,                         # ă Latin Small Letter A with Breve
+    'E':                        0x0115,                         # ĕ Latin Small Letter E with Breve
+    'G':                        0x011F,                         # ğ Latin Small Letter G with Breve
+    'H':                        0x1E2B,                         # ḫ Latin Small Letter H with Breve Below
+    'I':                        0x012D,                         # ĭ Latin Small Letter I with Breve
+    'O':                        0x014F,                         # ŏ Latin Small Letter O with Breve
+    'U':                        0x016D,                         # ŭ Latin Small Letter U with Breve
+    'Shift-A':                  0x0102,                         # Ă Latin Capital Letter A with Breve
+    'Shift-E':                  0x0114,                         # Ĕ Latin Capital Letter E with Breve
+    'Shift-G':                  0x011E,                         # Ğ Latin Capital Letter G with Breve
+    'Shift-H':                  0x1E2A,                         # Ḫ Latin Capital Letter H with Breve Below
+    'Shift-I':                  0x012C,                         # Ĭ Latin Capital Letter I with Breve
+    'Shift-O':                  0x014E,                         # Ŏ Latin Capital Letter O with Breve
+    'Shift-U':                  0x016C,                         # Ŭ Latin Capital Letter U with Breve
+}, layout='ABC', accents=[0x02D8])
+
+dead_keys_table("DK-ABC - Tilde", {
+    # Option+N                  {U+02DC}
+    # Valid keys:
+    # a e i n o u v y
+    # A E I N O U V Y 
+    'A':                        0x00E3,                         # ã Latin Small Letter A with Tilde
+    'E':                        0x1EBD,                         # ẽ Latin Small Letter E with Tilde
+    'I':                        0x0129,                         # ĩ Latin Small Letter I with Tilde
+    'N':                        0x00F1,                         # ñ Latin Small Letter N with Tilde
+    'O':                        0x00F5,                         # õ Latin Small Letter O with Tilde
+    'U':                        0x0169,                         # ũ Latin Small Letter U with Tilde
+    'V':                        0x1E7D,                         # ṽ Latin Small Letter V with Tilde
+    'Y':                        0x1EF9,                         # ỹ Latin Small Letter Y with Tilde
+    'Shift-A':                  0x00C3,                         # Ã Latin Capital Letter A with Tilde
+    'Shift-E':                  0x1EBC,                         # Ẽ Latin Capital Letter E with Tilde
+    'Shift-I':                  0x0128,                         # Ĩ Latin Capital Letter I with Tilde
+    'Shift-N':                  0x00D1,                         # Ñ Latin Capital Letter N with Tilde
+    'Shift-O':                  0x00D5,                         # Õ Latin Capital Letter O with Tilde
+    'Shift-U':                  0x0168,                         # Ũ Latin Capital Letter U with Tilde
+    'Shift-V':                  0x1E7C,                         # Ṽ Latin Capital Letter V with Tilde
+    'Shift-Y':                  0x1EF8,                         # Ỹ Latin Capital Letter Y with Tilde
+}, layout='ABC', accents=[0x02DC])
+
+dead_keys_table("DK-ABC - Ogonek", {
+    # Option+M                  {U+02DB}
+    # Valid keys:
+    # a e i o u
+    # A E I O U 
+    'A':                        0x0105,                         # ą Latin Small Letter A with Ogonek
+    'E':                        0x0119,                         # ę Latin Small Letter E with Ogonek
+    'I':                        0x012F,                         # į Latin Small Letter I with Ogonek
+    'O':                        0x01EB,                         # ǫ Latin Small Letter O with Ogonek
+    'U':                        0x0173,                         # ų Latin Small Letter U with Ogonek
+    'Shift-A':                  0x0104,                         # Ą Latin Capital Letter A with Ogonek
+    'Shift-E':                  0x0118,                         # Ę Latin Capital Letter E with Ogonek
+    'Shift-I':                  0x012E,                         # Į Latin Capital Letter I with Ogonek
+    'Shift-O':                  0x01EA,                         # Ǫ Latin Capital Letter O with Ogonek
+    'Shift-U':                  0x0172,                         # Ų Latin Capital Letter U with Ogonek
+}, layout='ABC', accents=[0x02DB])
+
+dead_keys_table("DK-ABC - Hook", {
+    # Shift+Option+Dot          {U+0294}
+    # Valid keys:
+    # b c d f g h i k n p q r s t u x y z 
+    # B C D F G   I K N P   R S T U X Y Z 
+    'B':                        0x0253,                         # ɓ Latin Small Letter B with Hook
+    'C':                        0x0188,                         # ƈ Latin Small Letter C with Hook
+    'D':                        0x0257,                         # ɗ Latin Small Letter D with Hook
+    'F':                        0x0192,                         # ƒ Latin Small Letter F with Hook (function symbol)
+    'G':                        0x0260,                         # ɠ Latin Small Letter G with Hook
+    'H':                        0x0266,                         # ɦ Latin Small Letter H with Hook
+    'I':                        0x0269,                         # ɩ Latin Small Letter Iota
+    'K':                        0x0199,                         # ƙ Latin Small Letter K with Hook
+    'N':                        0x0272,                         # ɲ Latin Small Letter N with Left Hook
+    'P':                        0x01A5,                         # ƥ Latin Small Letter P with Hook
+    'Q':                        0x02A0,                         # ʠ Latin Small Letter Q with Hook
+    'R':                        0x0288,                         # ʈ Latin Small Letter T with Retroflex Hook
+    'S':                        0x0283,                         # ʃ Latin Small Letter Esh
+    'T':                        0x01AD,                         # ƭ Latin Small Letter T with Hook
+    'U':                        0x028B,                         # ʋ Latin Small Letter V with Hook
+    'X':                        0x0256,                         # ɖ Latin Small Letter D with Tail
+    'Y':                        0x01B4,                         # ƴ Latin Small Letter Y with Hook
+    'Z':                        0x0225,                         # ȥ Latin Small Letter Z with Hook
+    'Shift-B':                  0x0181,                         # Ɓ Latin Capital Letter B with Hook
+    'Shift-C':                  0x0187,                         # Ƈ Latin Capital Letter C with Hook
+    'Shift-D':                  0x018A,                         # Ɗ Latin Capital Letter D with Hook
+    'Shift-F':                  0x0191,                         # Ƒ Latin Capital Letter F with Hook
+    'Shift-G':                  0x0193,                         # Ɠ Latin Capital Letter G with Hook
+    'Shift-I':                  0x0196,                         # Ɩ Latin Capital Letter Iota
+    'Shift-K':                  0x0198,                         # Ƙ Latin Capital Letter K with Hook
+    'Shift-N':                  0x019D,                         # Ɲ Latin Capital Letter N with Left Hook
+    'Shift-P':                  0x01A4,                         # Ƥ Latin Capital Letter P with Hook
+    'Shift-R':                  0x01AE,                         # Ʈ Latin Capital Letter T with Retroflex Hook
+    'Shift-S':                  0x01A9,                         # Ʃ Latin Capital Letter Esh
+    'Shift-T':                  0x01AC,                         # Ƭ Latin Capital Letter T with Hook
+    'Shift-U':                  0x01B2,                         # Ʋ Latin Capital Letter V with Hook
+    'Shift-X':                  0x0189,                         # Ɖ Latin Capital Letter African D
+    'Shift-Y':                  0x01B3,                         # Ƴ Latin Capital Letter Y with Hook
+    'Shift-Z':                  0x0224,                         # Ȥ Latin Capital Letter Z with Hook
+}, layout='ABC', accents=[0x0294])
+
+
+#######################################
+###  DEAD KEYS TABLES - US LAYOUT   ###
+#######################################
+dead_keys_table("DK-US - Grave", {
+    # Valid keys:
+    # a e i o u
+    # A E I O U
+    'A':                        0x00E0,                         # à Latin Small a with Grave
+    'E':                        0x00E8,                         # è Latin Small e with Grave
+    'I':                        0x00EC,                         # ì Latin Small i with Grave
+    'O':                        0x00F2,                         # ò Latin Small o with Grave
+    'U':                        0x00F9,                         # ù Latin Small u with Grave
+    'Shift-A':                  0x00C0,                         # À Latin Capital A with Grave
+    'Shift-E':                  0x00C8,                         # È Latin Capital E with Grave
+    'Shift-I':                  0x00CC,                         # Ì Latin Capital I with Grave
+    'Shift-O':                  0x00D2,                         # Ò Latin Capital O with Grave
+    'Shift-U':                  0x00D9,                         # Ù Latin Capital U with Grave
+}, layout='US', accents=[0x0060])
+
+dead_keys_table("DK-US - Acute", {
+    # Valid keys:
+    # a e i o u
+    # A E I O U
+    'A':                        0x00E1,                         # á Latin Small a with Acute
+    'E':                        0x00E9,                         # é Latin Small e with Acute
+    'I':                        0x00ED,                         # í Latin Small i with Acute
+    'O':                        0x00F3,                         # ó Latin Small o with Acute
+    'U':                        0x00FA,                         # ú Latin Small u with Acute
+    'Shift-A':                  0x00C1,                         # Á Latin Capital A with Acute
+    'Shift-E':                  0x00C9,                         # É Latin Capital E with Acute
+    'Shift-I':                  0x00CD,                         # Í Latin Capital I with Acute
+    'Shift-O':                  0x00D3,                         # Ó Latin Capital O with Acute
+    'Shift-U':                  0x00DA,                         # Ú Latin Capital U with Acute
+}, layout='US', accents=[0x00B4])
+
+dead_keys_table("DK-US - Umlaut", {
+    # Valid keys:
+    # a e i o u y
+    # A E I O U Y
+    'A':                        0x00E4,                         # ä Latin Small a with Umlaut
+    'E':                        0x00EB,                         # ë Latin Small e with Umlaut
+    'I':                        0x00EF,                         # ï Latin Small i with Umlaut
+    'O':                        0x00F6,                         # ö Latin Small o with Umlaut
+    'U':                        0x00FC,                         # ü Latin Small u with Umlaut
+    'Y':                        0x00FF,                         # ÿ Latin Small y with Umlaut
+    'Shift-A':                  0x00C4,                         # Ä Latin Capital A with Umlaut
+    'Shift-E':                  0x00CB,                         # Ë Latin Capital E with Umlaut
+    'Shift-I':                  0x00CF,                         # Ï Latin Capital I with Umlaut
+    'Shift-O':                  0x00D6,                         # Ö Latin Capital O with Umlaut
+    'Shift-U':                  0x00DC,                         # Ü Latin Capital U with Umlaut
+    'Shift-Y':                  0x0178,                         # Ÿ Latin Capital Y with Umlaut
+}, layout='US', accents=[0x00A8])
+
+dead_keys_table("DK-US - Circumflex", {
+    # Valid keys:
+    # a e i o u
+    # A E I O U
+    'A':                        0x00E2,                         # â Latin Small a with Circumflex
+    'E':                        0x00EA,                         # ê Latin Small e with Circumflex
+    'I':                        0x00EE,                         # î Latin Small i with Circumflex
+    'O':                        0x00F4,                         # ô Latin Small o with Circumflex
+    'U':                        0x00FB,                         # û Latin Small u with Circumflex
+    'Shift-A':                  0x00C2,                         # Â Latin Capital A with Circumflex
+    'Shift-E':                  0x00CA,                         # Ê Latin Capital E with Circumflex
+    'Shift-I':                  0x00CE,                         # Î Latin Capital I with Circumflex
+    'Shift-O':                  0x00D4,                         # Ô Latin Capital O with Circumflex
+    'Shift-U':                  0x00DB,                         # Û Latin Capital U with Circumflex
+}, layout='US', accents=[0x02C6])
+
+dead_keys_table("DK-US - Tilde", {
+    # Valid keys:
+    # a n o
+    # A N O
+    'A':                        0x00E3,                         # ã Latin Small a with Tilde
+    'N':                        0x00F1,                         # ñ Latin Small n with Tilde
+    'O':                        0x00F5,                         # õ Latin Small o with Tilde
+    'Shift-A':                  0x00C3,                         # Ã Latin Capital A with Tilde
+    'Shift-N':                  0x00D1,                         # Ñ Latin Capital N with Tilde
+    'Shift-O':                  0x00D5,                         # Õ Latin Capital O with Tilde
+}, layout='US', accents=[0x02DC])
@@ -0,0 +1,103 @@
+__version__ = '20261018'
+
+import time
+import threading
+
+from typing import Callable, Dict, Optional
+
+from xwaykeyz.lib.logger import debug, error
+
+from lib.dead_keys import NO_MAPPINGS, DeadKeysTable, SwitchedMappings
+
+
+class OptSpecTables:
+    """
+    Builds the "OptSpecialChars" and dead keys mappings of the Option key special
+    characters layout (`optspec_layout` setting) from the data in `lib.optspec_data`.
+
+    Nothing is imported or built while the feature is 'Disabled'. Switching the layout
+    swaps the mappings of the already registered keymaps, and the mappings of the
+    previous layout are dropped, so no config restart is needed.
+    """
+    def __init__(   self,
+                    deadkeys: DeadKeysTable,
+                    C: Callable,
+                    UC: Callable,
+                    set_dead_key: Callable,
+                    named_actions: Optional[Dict[str, Callable]] = None) -> None:
+        self.deadkeys                   = deadkeys
+        self.optspec                    = SwitchedMappings()
+        self.layout: Optional[str]      = None
+        self._C                         = C
+        self._UC                        = UC
+        self._set_dead_key              = set_dead_key
+        self._named_actions             = named_actions or {}
+        self._lock                      = threading.Lock()
+
+    def use_layout(self, layout: str) -> bool:
+        """
+        Make the mappings of the layout active, building them if the layout changed.
+        Returns True if the layout has mappings (False for 'Disabled' or unknown).
+        """
+        if layout != self.layout:
+            with self._lock:
+                if layout != self.layout:
+                    self._load(layout)
+        return self.optspec.active is not NO_MAPPINGS
+
+    def _load(self, layout: str):
+        """Build (or drop) the mappings, then publish them all at once"""
+        if layout in (None, 'Disabled'):
+            OPTSPEC_TABLES = {}
+        else:
+            from lib.optspec_data import OPTSPEC_TABLES, DEAD_KEYS_TABLES
+
+        if layout not in OPTSPEC_TABLES:
+            self.optspec.active = NO_MAPPINGS
+            self.deadkeys.swap([])
+            self.layout = layout
+            debug(f"OptSpecialChars: no mappings for layout '{layout}'.")
+            return
+
+        start = time.perf_counter()
+        try:
+            _, optspec_table = OPTSPEC_TABLES[layout]
+            optspec_mappings = self._build(optspec_table)
+            deadkeys_entries = [
+                (name, self._build(table), layout, accents)
+                for name, accents, table in DEAD_KEYS_TABLES.get(layout, [])
+            ]
+        except (KeyError, TypeError, ValueError) as build_err:
+            error(f"OptSpecialChars: could not build mappings for layout '{layout}':\n\t{build_err}")
+            optspec_mappings, deadkeys_entries = NO_MAPPINGS, []
+
+        self.deadkeys.swap(deadkeys_entries)
+        self.optspec.active = optspec_mappings
+        self.layout = layout
+        debug(  f"OptSpecialChars: built mappings for layout '{layout}' "
+                f"({len(optspec_mappings)} combos, {len(deadkeys_entries)} dead keys) "
+                f"in {(time.perf_counter() - start) * 1000:.1f} ms.")
+
+    def _build(self, table: Dict) -> Dict:
+        """Turn a data table (combo string: encoded output) into keymap mappings"""
+        from lib.optspec_data import DeadKey
+
+        C, UC, setDK = self._C, self._UC, self._set_dead_key
+        select_left = C("Shift-Left")
+
+        def output(item):
+            if isinstance(item, int):
+                return UC(item)
+            if isinstance(item, str):
+                return self._named_actions[item]
+            raise TypeError(f"Unknown output '{item}'")
+
+        mappings = {}
+        for combo, value in table.items():
+            if isinstance(value, DeadKey):
+                mappings[C(combo)] = [UC(value.accent), select_left, setDK(value.accent)]
+            elif isinstance(value, tuple):
+                mappings[C(combo)] = [output(item) for item in value]
+            else:
+                mappings[C(combo)] = output(value)
+        return mappings
@@ -0,0 +1,158 @@
+__version__ = '20261018'
+
+import re
+
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+
+# Characters that make a string a "real" regex pattern, instead of a plain name that
+# can be compared directly. A bare '.' is deliberately not in here. The dots in
+# reverse-DNS style app classes ("org.gnome.Terminal") are meant to be literal dots,
+# even though the regex pattern strings treat them as single character wildcards.
+_PATTERN_META_RGX = re.compile(r'[\\^$*+?{}\[\]|()]')
+
+
+def is_literal_pattern(pattern: str) -> bool:
+    """Check if a string (without ^$ anchors) is a plain name rather than a regex pattern"""
+    return _PATTERN_META_RGX.search(pattern) is None
+
+
+def split_alternatives(pattern: str) -> List[str]:
+    """
+    Split a pattern at the '|' characters that separate its top level alternatives,
+    leaving any '|' inside groups, character classes or escaped alone.
+    """
+    alternatives = []
+    depth = 0
+    in_class = False
+    start = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            i += 1                      # skip the escaped character
+        elif in_class:
+            if char == ']':
+                in_class = False
+        elif char == '[':
+            in_class = True
+            if pattern[i + 1:i + 2] == ']':
+                i += 1                  # a ']' right after '[' is part of the class
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            alternatives.append(pattern[start:i])
+            start = i + 1
+        i += 1
+    alternatives.append(pattern[start:])
+    return alternatives
+
+
+def split_literal_names(pattern: str) -> Tuple[FrozenSet[str], Optional[str]]:
+    """
+    Separate the anchored plain names in an alternation, like the ones from toRgxStr()
+    ("^konsole$|^org.kde.konsole$"), from the alternatives that are real patterns
+    ("^org.gnome.Ptyxis.*$"). Returns the set of names, and a pattern of the remaining
+    alternatives (None if there are none). A string matches the whole pattern if it
+    is in the set or the remaining pattern can be found in it.
+    """
+    names = []
+    rest = []
+    for alternative in split_alternatives(pattern):
+        name = alternative[1:-1]
+        if (len(alternative) >= 2 and alternative[0] == '^' and alternative[-1] == '$' and
+                is_literal_pattern(name)):
+            names.append(name)
+        else:
+            rest.append(alternative)
+    return frozenset(names), ('|'.join(rest) if rest else None)
+
+
+# The "tempered" negative lookahead form that negRgx() in the config produces, and that
+# the matchProps() docstring suggests for inverting a pattern: "^(?:(?!^pattern$).)*$"
+_NEG_RGX_PREFIX = '^(?:(?!'
+_NEG_RGX_SUFFIX = ').)*$'
+
+
+def positive_of_negated(pattern: str) -> Optional[str]:
+    """
+    Get the positive pattern back out of a negative lookahead pattern like the ones
+    from negRgx(). Returns None if the pattern is not of that form.
+
+    The lookahead pattern matches a string if the inner pattern can't be found at
+    any position of it, which is the same as a failed search for the inner pattern.
+    (Except for empty strings and strings with line breaks, neither of which are
+    ever checked against a pattern by matchProps.) The lookahead gets tried at every
+    character, so it can be very slow on long window titles.
+    """
+    if not (pattern.startswith(_NEG_RGX_PREFIX) and pattern.endswith(_NEG_RGX_SUFFIX)):
+        return None
+    positive = pattern[len(_NEG_RGX_PREFIX):-len(_NEG_RGX_SUFFIX)]
+    # Only valid on its own (balanced groups) if the lookahead group wraps all of it
+    try:
+        re.compile(positive)
+    except re.error:
+        return None
+    return positive
+
+
+# Matchers are shared by every caller that compiles the same pattern
+_matcher_cache: Dict[Tuple[str, bool], Callable[[str], bool]] = {}
+
+
+def compile_matcher(pattern: str, cse: bool = False) -> Callable[[str], bool]:
+    """
+    Compile a pattern into a function that checks a string against it.
+    Anchored plain names among the alternatives of a pattern become a set membership
+    test (casefolded, unless case sensitive), tried before a regex search of the other
+    alternatives (if any), so only real patterns need the regex.
+    Negative lookahead patterns become the inverted matcher of their positive pattern.
+    """
+    cse = bool(cse)
+    try:
+        return _matcher_cache[(pattern, cse)]
+    except KeyError:
+        pass
+    matcher = _matcher_cache[(pattern, cse)] = _build_matcher(pattern, cse)
+    return matcher
+
+
+def _build_matcher(pattern: str, cse: bool) -> Callable[[str], bool]:
+    positive = positive_of_negated(pattern)
+    if positive is not None:
+        positive_matcher = compile_matcher(positive, cse)
+        def _inverted_matcher(value: str) -> bool:
+            return not positive_matcher(value)
+        return _inverted_matcher
+
+    names, rest_pattern = split_literal_names(pattern)
+    if names and rest_pattern is not None:
+        try:
+            re.compile(rest_pattern)
+        except re.error:
+            names, rest_pattern = frozenset(), pattern     # couldn't split it, use it whole
+
+    if not names:
+        rgx = re.compile(pattern, 0 if cse else re.I)
+        def _rgx_matcher(value: str) -> bool:
+            return rgx.search(value) is not None
+        return _rgx_matcher
+
+    if cse:
+        names_matcher = names.__contains__
+    else:
+        names_casefolded = frozenset(name.casefold() for name in names)
+        def _names_matcher(value: str) -> bool:
+            return value.casefold() in names_casefolded
+        names_matcher = _names_matcher
+
+    if rest_pattern is None:
+        return names_matcher
+
+    # the names first, the regex only for the real patterns among the alternatives
+    rest_rgx = re.compile(rest_pattern, 0 if cse else re.I)
+    def _names_rgx_matcher(value: str) -> bool:
+        return names_matcher(value) or rest_rgx.search(value) is not None
+    return _names_rgx_matcher
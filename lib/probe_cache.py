@@ -0,0 +1,76 @@
+__version__ = '20261018'
+
+import os
+import json
+import threading
+
+from typing import Any, Callable, Dict, Optional
+
+from xwaykeyz.lib.logger import debug, error
+
+from lib.runtime_files import runtime_file_path, write_file_atomic
+
+
+PROBE_CACHE_FILE_NAME   = 'toshy_probes.json'
+
+
+def default_probe_cache_path() -> Optional[str]:
+    return runtime_file_path(PROBE_CACHE_FILE_NAME)
+
+
+class ProbeCache:
+    """
+    Results of command capability probes (like "does notify-send support -p"), kept
+    in a small JSON file in XDG_RUNTIME_DIR. A result is keyed by the probe name and
+    the command path, and is only reused while the command file has the same mtime,
+    so an update of the command runs the probe again. The runtime folder is cleared
+    at logout, so nothing stale survives a new session either.
+
+    Nothing is read or run until a probe result is actually needed. Without a safe
+    runtime folder, probes run every time.
+    """
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path: Optional[str]                = path or default_probe_cache_path()
+        self._entries: Optional[Dict[str, Dict]] = None
+        self._lock                              = threading.Lock()
+
+    def _read_file(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as cache_file:
+                entries = json.load(cache_file)
+            return entries if isinstance(entries, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _write_file(self, key: str, entry: Dict):
+        # merge with what other processes may have written since it was read
+        entries = self._read_file()
+        entries[key] = entry
+        try:
+            write_file_atomic(self.path, json.dumps(entries, indent=2))
+        except OSError as write_err:
+            error(f"Could not write probe cache file '{self.path}': {write_err}")
+        self._entries = entries
+
+    def probe(self, name: str, cmd_path: str, probe_fn: Callable[[str], Any]) -> Any:
+        """
+        Result of `probe_fn(cmd_path)`, from the cache if the command didn't change
+        since the probe last ran. The result must be JSON serializable.
+        """
+        if self.path is None:
+            return probe_fn(cmd_path)
+        try:
+            mtime_ns = os.stat(cmd_path).st_mtime_ns
+        except OSError:
+            return probe_fn(cmd_path)
+        key = f'{name}:{cmd_path}'
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._read_file()
+            entry = self._entries.get(key)
+            if entry is not None and entry.get('mtime_ns') == mtime_ns:
+                return entry.get('result')
+            result = probe_fn(cmd_path)
+            debug(f"Probe '{name}' of '{cmd_path}': {result!r}")
+            self._write_file(key, {'mtime_ns': mtime_ns, 'result': result})
+            return result
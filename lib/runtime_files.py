@@ -0,0 +1,68 @@
+__version__ = '20261018'
+
+import os
+import stat
+
+from typing import Optional, Union
+
+
+# Nothing from the keymapper here, this is also used by lib/env_context.py
+
+
+def toshy_runtime_dir() -> Optional[str]:
+    """
+    Folder for the per-session files that Toshy components share (caches, snapshots,
+    records). That is XDG_RUNTIME_DIR, private to the user and cleared at logout.
+    Without it, a folder in /tmp named after the user id, which another local user
+    could have created first: it's only used if it belongs to this user and nobody
+    else has any access to it. Returns None if there is no safe folder to use.
+    """
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return runtime_dir
+    runtime_dir = f'/tmp/toshy_runtime_{os.getuid()}'
+    try:
+        os.mkdir(runtime_dir, 0o700)
+    except FileExistsError:
+        pass
+    except OSError:
+        return None
+    try:
+        st = os.lstat(runtime_dir)
+    except OSError:
+        return None
+    if (not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or
+            stat.S_IMODE(st.st_mode) != 0o700):
+        print(f"(EE) Not using runtime folder '{runtime_dir}', it's not a private folder "
+                f"of this user. Set XDG_RUNTIME_DIR, or remove the folder.", flush=True)
+        return None
+    return runtime_dir
+
+
+def runtime_file_path(file_name: str) -> Optional[str]:
+    """Path of a file in the runtime folder, or None if there is no safe folder"""
+    runtime_dir = toshy_runtime_dir()
+    return os.path.join(runtime_dir, file_name) if runtime_dir else None
+
+
+def write_file_atomic(path: str, data: Union[str, bytes]):
+    """
+    Write a whole file through a temporary file in the same folder and os.replace(),
+    so a reader (maybe another process) gets either the old or the new file, never
+    part of one. Creates the folder (private) if needed. Raises OSError on failure.
+    """
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_NOFOLLOW, 0o600)
+        with os.fdopen(fd, 'wb') as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
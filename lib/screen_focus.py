@@ -0,0 +1,267 @@
+__version__ = '20261018'
+
+import os
+import re
+
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+
+from xwaykeyz.lib.logger import debug, error
+
+
+_REGEX_META = re.compile(rb'[\\^$.*+?{}\[\]|()]')
+
+
+class ScreenFocusSource:
+    """
+    A keyboard/mouse sharing app whose log shows when the pointer leaves or enters
+    this screen. Log paths can have '~' and environment variables. The patterns are
+    bytes regexes. Plain text patterns (the usual case) are found with a reverse
+    search instead of a regex scan, since only the latest event matters.
+    """
+    def __init__(   self,
+                    name: str,
+                    log_paths: List[str],
+                    leave_pattern: bytes = b'leaving screen',
+                    enter_pattern: bytes = b'entering screen') -> None:
+        self.name           = name
+        self.log_paths      = [os.path.expanduser(os.path.expandvars(p)) for p in log_paths]
+        self.leave_pattern  = leave_pattern
+        self.enter_pattern  = enter_pattern
+        self._literal       = not any(_REGEX_META.search(pattern)
+                                        for pattern in (leave_pattern, enter_pattern))
+        # one pattern for both, so each chunk of log data is scanned once
+        self._matcher       = re.compile(b'(?P<leave>' + leave_pattern + b')|(?P<enter>' +
+                                            enter_pattern + b')')
+
+    def last_state(self, data: bytes) -> Optional[bool]:
+        """Focus state from the last event in the data (None if there is no event)"""
+        if self._literal:
+            leave_at = data.rfind(self.leave_pattern)
+            enter_at = data.rfind(self.enter_pattern)
+            if leave_at == enter_at:        # both -1
+                return None
+            return enter_at > leave_at
+        state = None
+        for match in self._matcher.finditer(data):
+            state = match.lastgroup == 'enter'
+        return state
+
+    def __repr__(self):
+        return f"ScreenFocusSource({self.name!r}, {self.log_paths})"
+
+
+# Synergy and its forks all log the same "leaving screen"/"entering screen" messages
+# on the server side. Paths are where each one writes its log file (if enabled).
+DEFAULT_SOURCES: List[ScreenFocusSource] = [
+    ScreenFocusSource('Synergy',    ['~/.local/state/Synergy/synergy.log']),
+    ScreenFocusSource('Deskflow',   ['~/.local/state/Deskflow/deskflow.log']),
+    ScreenFocusSource('Input Leap', ['~/.local/share/input-leap/input-leap.log',
+                                     '~/.local/state/input-leap/input-leap.log']),
+    ScreenFocusSource('Barrier',    ['~/.local/share/barrier/barrier.log']),
+]
+
+
+# bytes before the read position that are checked again to notice a truncated log
+LOG_MARK_SIZE = 64
+
+
+class LogFollower:
+    """
+    Incremental reader for a growing log file. Keeps the file open between reads, and
+    tracks the inode to notice rotation or removal (the rest of the old file is still
+    read, then the new file from the start). Truncation (read from the start) is noticed
+    by the size, or by the last bytes read no longer being there, for a file that was
+    truncated and has grown past the old read position since. New data is handed out
+    newest first, in chunks of complete lines of at most `max_read` bytes, so a reader
+    that only needs the latest event can stop early.
+
+    Only the last `initial_tail` bytes are read of a file that was already there when
+    the follower first looked at it, unless skip_to_end() was called first.
+    """
+    def __init__(self, path: str, max_read: int = 64 * 1024, initial_tail: int = 1024) -> None:
+        self.path                               = path
+        self.max_read                           = max_read
+        self.initial_tail                       = initial_tail
+        self._file: Optional[BinaryIO]          = None
+        self._file_id: Optional[Tuple[int, int]] = None
+        self._pos                               = 0     # end of the last complete line read
+        self._mark                              = b''   # the bytes just before _pos
+        self._tail_on_open                      = True
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+        self._file, self._file_id, self._pos, self._mark = None, None, 0, b''
+
+    def skip_to_end(self):
+        """
+        Open the file (if it exists) and start reading after what is already in it.
+        A file that doesn't exist yet will be read from its start once it appears.
+        """
+        self.close()
+        self._tail_on_open = False
+        try:
+            self._file = open(self.path, 'rb')
+        except OSError:
+            return
+        st = os.fstat(self._file.fileno())
+        self._file_id = (st.st_dev, st.st_ino)
+        self._pos = self._file.seek(0, os.SEEK_END)
+        self._remember_mark()
+
+    def _remember_mark(self):
+        mark_start = max(self._pos - LOG_MARK_SIZE, 0)
+        self._mark = os.pread(self._file.fileno(), self._pos - mark_start, mark_start)
+
+    def _was_truncated(self, size: int) -> bool:
+        """Check if the open file was truncated since the last read (maybe grown back)"""
+        if size < self._pos:
+            return True
+        if not self._mark:
+            return False
+        mark_start = self._pos - len(self._mark)
+        return os.pread(self._file.fileno(), len(self._mark), mark_start) != self._mark
+
+    def _complete_end(self, start: int, end: int) -> int:
+        """End of the last complete line between start and end of the open file"""
+        tail_start = max(start, end - self.max_read)
+        self._file.seek(tail_start)
+        last_newline = self._file.read(end - tail_start).rfind(b'\n')
+        if last_newline < 0:
+            # no line end yet, or a single line longer than max_read (take all of it)
+            return start if tail_start == start else end
+        return tail_start + last_newline + 1
+
+    def _chunks(self, log_file: BinaryIO, start: int, end: int) -> Iterator[bytes]:
+        """Data between start and end of the file in chunks of whole lines, newest first"""
+        chunk_end = end
+        while chunk_end > start:
+            chunk_start = max(start, chunk_end - self.max_read)
+            log_file.seek(chunk_start)
+            chunk = log_file.read(chunk_end - chunk_start)
+            if chunk_start > start:
+                # the partial first line goes with the next (older) chunk
+                first_newline = chunk.find(b'\n')
+                chunk = chunk[first_newline + 1:]
+                chunk_start += first_newline + 1
+            chunk_end = chunk_start
+            yield chunk
+
+    def _iter_segments(self, segments, old_file: Optional[BinaryIO]) -> Iterator[bytes]:
+        try:
+            for log_file, start, end in reversed(segments):
+                yield from self._chunks(log_file, start, end)
+        finally:
+            if old_file is not None:
+                old_file.close()
+
+    def new_chunks(self) -> Iterator[bytes]:
+        """
+        Complete lines appended since the last call, in chunks, newest first. The read
+        position is moved to the end right away, iterating all the chunks is optional.
+        """
+        segments: List[Tuple[BinaryIO, int, int]] = []     # oldest first
+        old_file = None
+        try:
+            st = os.stat(self.path)
+            file_id = (st.st_dev, st.st_ino)
+        except OSError:
+            st, file_id = None, None
+        if self._file is not None and file_id != self._file_id:
+            # rotated, moved away or deleted: the rest of the old file (still open) comes first
+            old_file = self._file
+            old_end = os.fstat(old_file.fileno()).st_size
+            if old_end > self._pos:
+                segments.append((old_file, self._pos, old_end))
+            self._file, self._file_id, self._pos, self._mark = None, None, 0, b''
+            start = 0
+        elif st is not None and self._tail_on_open:
+            start = max(st.st_size - self.initial_tail, 0)
+        else:
+            start = 0
+
+        if st is not None:
+            if self._file is None:
+                try:
+                    self._file = open(self.path, 'rb')
+                except OSError as open_err:
+                    error(f"Could not open log file '{self.path}': {open_err}")
+                else:
+                    self._file_id = file_id
+                    if start > 0:
+                        self._file.seek(start)
+                        self._file.readline()       # skip the partial line
+                    self._pos = self._file.tell()
+                    self._remember_mark()
+            elif self._was_truncated(st.st_size):
+                self._pos, self._mark = 0, b''
+            if self._file is not None and st.st_size > self._pos:
+                end = self._complete_end(self._pos, st.st_size)
+                if end > self._pos:
+                    segments.append((self._file, self._pos, end))
+                    self._pos = end
+                    self._remember_mark()
+        return self._iter_segments(segments, old_file)
+
+
+class ScreenFocusTracker:
+    """
+    Tracks whether this screen has the keyboard/mouse focus, from the logs of the
+    configured sources (Synergy, Deskflow, Input Leap, Barrier). Calls `on_change`
+    with the new state when a log shows that the pointer left or entered the screen.
+    """
+    def __init__(   self,
+                    on_change: Callable[[bool], None],
+                    sources: Optional[List[ScreenFocusSource]] = None,
+                    has_focus: bool = True) -> None:
+        self.on_change                                  = on_change
+        self.sources                                    = sources or DEFAULT_SOURCES
+        self.has_focus                                  = has_focus
+        self.followers: Dict[str, Tuple[ScreenFocusSource, LogFollower]] = {
+            path: (source, LogFollower(path))
+            for source in self.sources for path in source.log_paths
+        }
+
+    def poll(self, path: str):
+        """Read what was appended to a log file, and report a change of focus state"""
+        source, follower = self.followers[path]
+        most_recent_state = None
+        for chunk in follower.new_chunks():
+            most_recent_state = source.last_state(chunk)
+            if most_recent_state is not None:
+                break
+        if most_recent_state is not None and most_recent_state != self.has_focus:
+            self.has_focus = most_recent_state
+            debug(f"{source.name} log watcher detected {'return' if most_recent_state else 'loss'} "
+                    f"of screen focus.")
+            self.on_change(most_recent_state)
+
+    def watch(self) -> bool:
+        """Start a watchdog observer on the folders of the logs. False if none exist."""
+        log_dirs = {os.path.dirname(path) for path in self.followers}
+        log_dirs = sorted(log_dir for log_dir in log_dirs if os.path.isdir(log_dir))
+        if not log_dirs:
+            debug("No screen sharing app log folder found. No log observer will be engaged.")
+            return False
+
+        def on_event(event: Optional[FileSystemEvent]):
+            for path in (event.src_path, getattr(event, 'dest_path', None)):
+                if path in self.followers:
+                    self.poll(path)
+
+        event_handler = FileSystemEventHandler()
+        event_handler.on_modified   = on_event
+        event_handler.on_created    = on_event
+        event_handler.on_moved      = on_event
+        observer = Observer()
+        for log_dir in log_dirs:
+            debug(f"Setting an observer on '{log_dir}'")
+            observer.schedule(event_handler, path=log_dir, recursive=False)
+        # Logs that already exist may be left over from an earlier session, so nothing
+        # in them is trusted. Only lines written after this point can change the state.
+        for _, follower in self.followers.values():
+            follower.skip_to_end()
+        observer.start()
+        return True
@@ -1,50 +1,133 @@
-__version__ = '20240915'
+__version__ = '20261018'
 
 import os
 import inspect
 import sqlite3
+import threading
 
 from pprint import pprint
-from typing import List, Dict, Optional, Tuple, Union
+from typing import Any, Callable, Iterable, List, Dict, Optional, Tuple, Union
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 
 import xwaykeyz.lib.logger
 from xwaykeyz.lib.logger import debug, error
 
+from lib.screen_focus import ScreenFocusSource, ScreenFocusTracker
+from lib.settings_snapshot import SettingsSnapshot
+
+
+PREFS_TABLE     = 'config_preferences'      # one row per setting, (name, value) as text
+MRU_TABLE       = 'mru_layouts'             # most recently used layouts, newest row is current
+
+
+def _parse_bool(value: str) -> bool:
+    # Convert the string value to a Python boolean correctly
+    return value.lower() == 'true'
+
+
+class SettingField:
+    """
+    Declaration of one setting: its name (attribute of the Settings object, and
+    name in the database), type, default value and the parser for the text stored
+    in the database. Settings with `storage=None` are runtime state, not saved,
+    but changes to them are tracked and reported to subscribers all the same.
+    """
+    __slots__ = ('name', 'type', 'default', 'parse', 'storage', 'group')
+
+    def __init__(   self,
+                    name: str,
+                    type_: type,
+                    default: Any,
+                    parse: Optional[Callable[[str], Any]] = None,
+                    storage: Optional[str] = PREFS_TABLE,
+                    group: str = '') -> None:
+        self.name       = name
+        self.type       = type_
+        self.default    = default
+        self.parse      = parse or (_parse_bool if type_ is bool else type_)
+        self.storage    = storage
+        self.group      = group
+
+    def serialize(self, value: Any) -> str:
+        return str(value)
+
+    def format(self, value: Any) -> str:
+        """Value as shown in the settings printout"""
+        return f"'{value}'" if self.type is str else f"{value}"
+
+
+# All the settings, in the order they are shown. The group separates them in the printout.
+SETTINGS_SCHEMA: Tuple[SettingField, ...] = (
+    SettingField('autostart_tray_icon',     bool,   True,               group='ui'),
+    SettingField('gui_dark_theme',          bool,   True,               group='ui'),
+    SettingField('override_kbtype',         str,    'Auto-Adapt',       group='kbtype'),
+        ###  Disable optspec_layout by default for performance, and international keyboard users
+    SettingField('optspec_layout',          str,    'Disabled',         group='layout'),
+    SettingField('mru_layout',              tuple,  ('us', 'default'),  group='layout',
+                                                                        storage=MRU_TABLE),
+    SettingField('forced_numpad',           bool,   True,               group='features'),
+    SettingField('media_arrows_fix',        bool,   False,              group='features'),
+    SettingField('multi_lang',              bool,   False,              group='features'),
+    SettingField('Caps2Cmd',                bool,   False,              group='features'),
+    SettingField('Caps2Esc_Cmd',            bool,   False,              group='features'),
+    SettingField('Enter2Ent_Cmd',           bool,   False,              group='features'),
+    SettingField('ST3_in_VSCode',           bool,   False,              group='features'),
+        ###  Instrumentation of keymap conditions, takes effect on restart of the config
+    SettingField('profile_conditions',      bool,   False,              group='debug'),
+        # Synergy (or fork): True if focus is on the screen, False otherwise
+    SettingField('screen_has_focus',        bool,   True,               group='runtime',
+                                                                        storage=None),
+)
+
+SETTINGS_FIELDS: Dict[str, SettingField] = {field.name: field for field in SETTINGS_SCHEMA}
+
+FieldCallback = Callable[[str, Any, Any], None]     # (setting name, old value, new value)
+
 
 class Settings:
+    __slots__ = tuple(SETTINGS_FIELDS) + (
+        'config_dir_path', 'prefs_db_file_name', 'prefs_db_file_path', 'first_run',
+        'calling_module', 'screen_focus_tracker',
+        'change_callbacks', 'field_callbacks', 'last_changes', 'reload_delay_secs',
+        '_db_lock', '_ro_connection', '_ro_db_file_id', '_data_version', '_reload_timer',
+        '_snapshot', '_snapshot_channel', '_snapshot_polling',
+    )
+
     def __init__(self, config_dir_path: str = '..') -> None:
         self.config_dir_path        = config_dir_path
         self.prefs_db_file_name     = 'toshy_user_preferences.sqlite'
         self.prefs_db_file_path     = os.path.join(self.config_dir_path, self.prefs_db_file_name)
         self.first_run              = True
-        self.last_settings          = None
-        self.current_settings       = None
         # Get the name of the module that instantiated the class
         calling_frame               = inspect.stack()[1]
         calling_file_path           = calling_frame.filename
         calling_module              = os.path.split(calling_file_path)[1]
         self.calling_module         = calling_module
         # settings defaults
-        self.autostart_tray_icon    = True              # Default: True
-        self.gui_dark_theme         = True              # Default: True
-        self.override_kbtype        = 'Auto-Adapt'      # Default: 'Auto-Adapt'
-            ###  Disable optspec_layout by default for performance, and international keyboard users
-        self.optspec_layout         = 'Disabled'        # Default: 'Disabled'
-        self.mru_layout             = ('us', 'default') # Default: ('us', 'default')
-        self.forced_numpad          = True              # Default: True
-        self.media_arrows_fix       = False             # Default: False
-        self.multi_lang             = False             # Default: False
-        self.Caps2Cmd               = False             # Default: False
-        self.Caps2Esc_Cmd           = False             # Default: False
-        self.Enter2Ent_Cmd          = False             # Default: False
-        self.ST3_in_VSCode          = False             # Default: False
-        # Synergy
-        self.screen_has_focus       = True  # True if focus is on the screen, False otherwise
-        self.synergy_log_path       = os.path.expanduser("~/.local/state/Synergy/synergy.log")
-        self.synergy_log_last_pos   = 0  # Keep track of the last read position in the log file
-        self.initial_log_read_done  = False
+        for field in SETTINGS_SCHEMA:
+            setattr(self, field.name, field.default)
+        # Synergy (and forks) screen focus, from the app's log, see watch_synergy_log()
+        self.screen_focus_tracker: Optional[ScreenFocusTracker] = None
+        # Functions to call when settings (or Synergy screen focus) change after startup
+        self.change_callbacks: List[Callable[[], None]] = []
+        # Functions to call when specific settings change, by setting name
+        self.field_callbacks: Dict[str, List[FieldCallback]] = {}
+        # Settings that changed in the most recent change: {name: (old value, new value)}
+        self.last_changes: Dict[str, Tuple[Any, Any]] = {}
+        self._snapshot: Dict[str, Any] = self.snapshot()
+        # Reloading: one persistent read-only connection, only re-read when the
+        # database change counter (PRAGMA data_version) moved, bursts of file
+        # modification events coalesced into a single check
+        self.reload_delay_secs      = 0.2
+        self._db_lock               = threading.RLock()
+        self._ro_connection: Optional[sqlite3.Connection] = None
+        self._ro_db_file_id: Optional[Tuple[int, int]]    = None
+        self._data_version: Optional[int]               = None
+        self._reload_timer: Optional[threading.Timer]   = None
+        # Optional publication of the settings in a memory-mapped file, see use_snapshot()
+        self._snapshot_channel: Optional[SettingsSnapshot] = None
+        self._snapshot_polling      = False     # instead of watching the database
         # Make sure the database and tables are actually existing before trying to load settings
         self.ensure_database_setup()
         # Load user's custom settings from database (defaults will be saved if no DB)
@@ -70,16 +153,16 @@ class Settings:
                 return db_cursor.fetchone()[0] == 0
 
             # Create the table for user preferences if it does not exist
-            if not table_exists("config_preferences"):
-                db_cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS config_preferences
+            if not table_exists(PREFS_TABLE):
+                db_cursor.execute(f'''
+                    CREATE TABLE IF NOT EXISTS {PREFS_TABLE}
                     (
                         name TEXT PRIMARY KEY, 
                         value TEXT
                     )
                     ''')
 
-            if table_is_empty("config_preferences"):
+            if table_is_empty(PREFS_TABLE):
                 # Save the default values, only if the table is empty
                 self._save_config_preferences(db_cursor)
 
@@ -122,26 +205,103 @@ class Settings:
 
     def on_database_modified(self, event: Optional[FileSystemEvent]):
         if event.src_path == self.prefs_db_file_path:
+            self.schedule_reload()
+
+    def schedule_reload(self):
+        """
+        Coalesce a burst of modification events (a single save can cause several)
+        into one reload, after a short delay. Events while a reload is pending are dropped.
+        """
+        with self._db_lock:
+            if self._reload_timer is not None:
+                return
+            self._reload_timer = threading.Timer(self.reload_delay_secs, self._run_scheduled_reload)
+            self._reload_timer.daemon = True
+            self._reload_timer.start()
+
+    def _run_scheduled_reload(self):
+        with self._db_lock:
+            self._reload_timer = None
+        try:
             self.load_settings()
+        except (sqlite3.Error, OSError) as db_err:
+            error(f"Error reloading settings from database:\n\t{db_err}")
+
+    def _get_ro_connection(self) -> sqlite3.Connection:
+        """
+        Get the persistent read-only connection to the database, (re)opening it if
+        needed. Reopened if the database file was replaced, since the connection
+        would otherwise keep reading the old (deleted) file.
+        """
+        db_stat = os.stat(self.prefs_db_file_path)
+        db_file_id = (db_stat.st_dev, db_stat.st_ino)
+        if self._ro_connection is None or db_file_id != self._ro_db_file_id:
+            if self._ro_connection is not None:
+                self._ro_connection.close()
+            self._ro_connection = sqlite3.connect(
+                f'file:{self.prefs_db_file_path}?mode=ro', uri=True,
+                isolation_level=None, check_same_thread=False)
+            self._ro_db_file_id = db_file_id
+            self._data_version = None
+        return self._ro_connection
+
+    def database_changed(self, db_connection: sqlite3.Connection) -> bool:
+        """
+        Check the change counter of the database. PRAGMA data_version changes when
+        any other connection (any process, including this one saving settings)
+        commits a change to the database file.
+        """
+        data_version = db_connection.execute("PRAGMA data_version").fetchone()[0]
+        if data_version == self._data_version:
+            return False
+        self._data_version = data_version
+        return True
+
+    def add_change_callback(self, callback: Callable[[], None]):
+        """Register a function to be called when a settings change is detected"""
+        self.change_callbacks.append(callback)
+
+    def add_field_callback(self, names: Union[str, Iterable[str]], callback: FieldCallback):
+        """
+        Register a function to be called with (name, old value, new value) when one
+        of the named settings changes. Only called for the settings that changed.
+        """
+        for name in ([names] if isinstance(names, str) else names):
+            if name not in SETTINGS_FIELDS:
+                raise ValueError(f"Unknown setting name: '{name}'")
+            self.field_callbacks.setdefault(name, []).append(callback)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current values of all the settings in the schema"""
+        return {name: getattr(self, name) for name in SETTINGS_FIELDS}
+
+    def _update_snapshot(self) -> Dict[str, Tuple[Any, Any]]:
+        """Take a new snapshot, and return the settings that changed since the last one"""
+        old_snapshot, self._snapshot = self._snapshot, self.snapshot()
+        return {name: (old_snapshot[name], value)
+                for name, value in self._snapshot.items() if old_snapshot[name] != value}
+
+    def _run_change_callbacks(self, changes: Dict[str, Tuple[Any, Any]]):
+        self.last_changes = changes
+        for name, (old_value, new_value) in changes.items():
+            for callback in self.field_callbacks.get(name, []):
+                try:
+                    callback(name, old_value, new_value)
+                except Exception as cb_err:
+                    error(f"Error in '{name}' setting change callback '{callback}':\n\t{cb_err}")
+        for callback in self.change_callbacks:
+            try:
+                callback()
+            except Exception as cb_err:
+                error(f"Error in settings change callback '{callback}':\n\t{cb_err}")
 
     def _save_config_preferences(self, db_cursor: sqlite3.Cursor):
-        sql_query = "INSERT OR REPLACE INTO config_preferences (name, value) VALUES (?, ?)"
+        sql_query = f"INSERT OR REPLACE INTO {PREFS_TABLE} (name, value) VALUES (?, ?)"
         settings = [
-            ('autostart_tray_icon',     str(self.autostart_tray_icon)),
-            ('gui_dark_theme',          str(self.gui_dark_theme)),
-            ('override_kbtype',         str(self.override_kbtype)),
-            ('optspec_layout',          str(self.optspec_layout)),
-            ('forced_numpad',           str(self.forced_numpad)),
-            ('media_arrows_fix',        str(self.media_arrows_fix)),
-            ('multi_lang',              str(self.multi_lang)),
-            ('Caps2Cmd',                str(self.Caps2Cmd)),
-            ('Caps2Esc_Cmd',            str(self.Caps2Esc_Cmd)),
-            ('Enter2Ent_Cmd',           str(self.Enter2Ent_Cmd)),
-            ('ST3_in_VSCode',           str(self.ST3_in_VSCode))
+            (field.name, field.serialize(getattr(self, field.name)))
+            for field in SETTINGS_SCHEMA if field.storage == PREFS_TABLE
         ]
-
-        for setting_name, setting_value in settings:
-            db_cursor.execute(sql_query, (setting_name, setting_value))
+        db_cursor.executemany(sql_query, settings)
 
     def _save_mru_layouts(self, db_cursor: sqlite3.Cursor):
         sql_query = '''
@@ -158,145 +318,139 @@ class Settings:
             self._save_config_preferences(db_cursor)
             self._save_mru_layouts(db_cursor)
             debug("Settings saved in database using Settings class method.")
-
-    def load_settings(self):
-        
-        with sqlite3.connect(self.prefs_db_file_path) as db_connection:
-            db_cursor = db_connection.cursor()
-
-            db_cursor.execute("SELECT * FROM config_preferences")
-
-            rows_prefs: List[Tuple[str, str]] = db_cursor.fetchall()
-            for row in rows_prefs:
-                # Convert the string value to a Python boolean correctly
-                setting_value       = row[1].lower() == 'true'
-                if True is False: pass  # dummy first `if` line so other rows line up (readability)
-                elif row[0] == 'autostart_tray_icon' : self.autostart_tray_icon = setting_value
-                elif row[0] == 'gui_dark_theme'      : self.gui_dark_theme      = setting_value
-                elif row[0] == 'override_kbtype'     : self.override_kbtype     = row[1]
-                elif row[0] == 'optspec_layout'      : self.optspec_layout      = row[1]
-                elif row[0] == 'forced_numpad'       : self.forced_numpad       = setting_value
-                elif row[0] == 'media_arrows_fix'    : self.media_arrows_fix    = setting_value
-                elif row[0] == 'multi_lang'          : self.multi_lang          = setting_value
-                elif row[0] == 'Caps2Cmd'            : self.Caps2Cmd            = setting_value
-                elif row[0] == 'Caps2Esc_Cmd'        : self.Caps2Esc_Cmd        = setting_value
-                elif row[0] == 'Enter2Ent_Cmd'       : self.Enter2Ent_Cmd       = setting_value
-                elif row[0] == 'ST3_in_VSCode'       : self.ST3_in_VSCode       = setting_value
-
-            db_cursor.execute('''
-                SELECT layout_code, variant_code from mru_layouts 
-                ORDER BY timestamp DESC 
-                LIMIT 1;
-                ''')
-
-            row_mru_layout = db_cursor.fetchone()     # redundant limit since query limited to one row
-            if row_mru_layout:
-                # Convert MRU Layouts record columns back to a Python tuple
-                self.mru_layout     = (row_mru_layout[0], row_mru_layout[1])
-            else:
-                self.mru_layout     = ('us', 'default')
-
-        # Compare the current settings with the last settings, and 
-        # update last_settings if they are different
-        self.current_settings = self.get_settings_list()
-        if self.last_settings != self.current_settings:
-            self.last_settings = self.current_settings
-            if not self.first_run:
-                debug(f'User preferences database modified... loading new settings...')
-                if xwaykeyz.lib.logger.VERBOSE:
-                    debug(self, ctx="CG")   # print out the changed settings when verbose logging
-            else:
+        self.publish_snapshot()
+
+    def _get_snapshot_channel(self) -> SettingsSnapshot:
+        if self._snapshot_channel is None:
+            self._snapshot_channel = SettingsSnapshot(
+                [(field.name, field.type) for field in SETTINGS_SCHEMA if field.storage is not None])
+        return self._snapshot_channel
+
+    def publish_snapshot(self):
+        """Write the saved settings to the memory-mapped snapshot file, for the keymapper"""
+        try:
+            self._get_snapshot_channel().write(self.snapshot())
+        except (OSError, ValueError) as snap_err:
+            error(f"Could not publish settings snapshot:\n\t{snap_err}")
+
+    def use_snapshot(self) -> bool:
+        """
+        Pick up settings changes from the snapshot file that save_settings() writes,
+        by calling poll_snapshot() (cheap when nothing changed), instead of watching
+        the database. Publishes the current settings first, so the file exists.
+        Returns False if the snapshot file can't be used.
+        """
+        self.publish_snapshot()
+        self._snapshot_polling = self._get_snapshot_channel().open()
+        return self._snapshot_polling
+
+    def poll_snapshot(self) -> bool:
+        """Apply a newly published snapshot, if any. Returns True if any setting changed."""
+        if not self._snapshot_polling:
+            return False
+        values = self._snapshot_channel.read_if_changed()
+        if values is None:
+            if not self._snapshot_channel.is_open:
+                # taken over by a writer with another schema, go back to the database
+                self._snapshot_polling = False
+                self.watch_database()
+                self.schedule_reload()
+            return False
+        with self._db_lock:
+            for name, value in values.items():
+                setattr(self, name, value)
+            changes = self._update_snapshot()
+        if not changes:
+            return False
+        debug(f'Settings snapshot changed... applying new settings: {", ".join(changes)}')
+        self._run_change_callbacks(changes)
+        return True
+
+    def load_settings(self, force: bool = False):
+        """
+        Load the settings from the database, if it changed since the last load
+        (or always, with `force`). Runs the change callbacks if any setting changed.
+        """
+        with self._db_lock:
+            db_connection = self._get_ro_connection()
+            if not self.database_changed(db_connection) and not force:
+                return
+            self._read_settings(db_connection)
+
+            changes = self._update_snapshot()
+            if self.first_run:
                 self.first_run = False
+                return
+            if not changes:
+                return
+
+        debug(f'User preferences database modified... loading new settings: {", ".join(changes)}')
+        if xwaykeyz.lib.logger.VERBOSE:
+            debug(self, ctx="CG")   # print out the changed settings when verbose logging
+        self._run_change_callbacks(changes)
+
+    def _read_settings(self, db_connection: sqlite3.Connection):
+        db_cursor = db_connection.cursor()
+
+        db_cursor.execute(f"SELECT name, value FROM {PREFS_TABLE}")
+
+        rows_prefs: List[Tuple[str, str]] = db_cursor.fetchall()
+        for setting_name, setting_value in rows_prefs:
+            field = SETTINGS_FIELDS.get(setting_name)
+            if field is None or field.storage != PREFS_TABLE:
+                continue
+            try:
+                setattr(self, setting_name, field.parse(setting_value))
+            except (TypeError, ValueError) as parse_err:
+                error(f"Invalid value for setting '{setting_name}': '{setting_value}'\n\t{parse_err}")
+
+        db_cursor.execute('''
+            SELECT layout_code, variant_code from mru_layouts 
+            ORDER BY timestamp DESC, id DESC
+            LIMIT 1;
+            ''')
+
+        row_mru_layout = db_cursor.fetchone()     # redundant limit since query limited to one row
+        if row_mru_layout:
+            # Convert MRU Layouts record columns back to a Python tuple
+            self.mru_layout     = (row_mru_layout[0], row_mru_layout[1])
+        else:
+            self.mru_layout     = ('us', 'default')
 
     def get_settings_list(self):
-        # get all attributes from the object
-        all_attributes = [attr for attr in dir(self) 
-                            if not callable(getattr(self, attr)) and 
-                            not attr.startswith("__")]
-
-        # Filter attributes further only if a specific attribute should be ignored.
-        # Removed earlier list comprehension that limited data types too much.
-        filtered_attributes = all_attributes
-
-        # create a list of tuples with attribute name and value pairs
-        settings_list = [(attr, getattr(self, attr)) for attr in filtered_attributes]
-        return settings_list
-
-    def watch_synergy_log(self):
-        log_dir = os.path.dirname(self.synergy_log_path)
-        if not os.path.exists(log_dir):
-            debug("No Synergy log folder found. No log observer will be engaged.")
-        else:
-            debug(f"Setting an observer on '{log_dir}'")
-            event_handler = FileSystemEventHandler()
-            event_handler.on_modified = self.on_synergy_log_modified
-            event_handler.on_created = self.on_synergy_log_created
-            observer = Observer()
-            observer.schedule(event_handler, path=log_dir, recursive=False)
-            observer.start()
-
-    def on_synergy_log_modified(self, event: Optional[FileSystemEvent]):
-        if event.src_path == self.synergy_log_path:
-            self.handle_synergy_log_file_change()
-
-    def on_synergy_log_created(self, event: Optional[FileSystemEvent]):
-        if event.src_path == self.synergy_log_path:
-            self.handle_synergy_log_file_change()
-
-    def handle_synergy_log_file_change(self):
-        lines = []  # prevent UnboundLocalError
-        if os.path.exists(self.synergy_log_path):
-            with open(self.synergy_log_path, 'r') as f:
-                if self.synergy_log_last_pos == 0:
-                    # Seek to a position near the end of the file
-                    f.seek(0, os.SEEK_END)
-                    end_pos = f.tell()
-                    f.seek(max(end_pos - 1024, 0))  # Read the last ~1024 bytes
-                    if f.tell() != 0:
-                        f.readline()  # Skip partial line
-                    lines = f.readlines()
-                    self.synergy_log_last_pos = f.tell()
-                else:
-                    f.seek(self.synergy_log_last_pos)
-                    lines = f.readlines()
-                    self.synergy_log_last_pos = f.tell()  # Update the last read position
-                # Track the most recent relevant screen focus state
-        if lines:
-            most_recent_state = None
-            for line in lines:
-                line = line.strip()
-                if "leaving screen" in line:
-                    most_recent_state = False
-                elif "entering screen" in line:
-                    most_recent_state = True
-
-            if most_recent_state is not None:
-                self.screen_has_focus = most_recent_state
-                if self.screen_has_focus:
-                    debug("Synergy log watcher detected return of screen focus.")
-                else:
-                    debug("Synergy log watcher detected loss of screen focus.")
+        # list of tuples with setting name and value pairs
+        return list(self.snapshot().items())
 
-    def __str__(self):
-        return f"""Current settings:
-        ------------------------------------------------------------------------------
-        calling_module          = '{self.calling_module}'
-        prefs_db_file_path      = '{self.prefs_db_file_path}'
-        ------------------------------------------------------------------------------
-        autostart_tray_icon     = {self.autostart_tray_icon}
-        gui_dark_theme          = {self.gui_dark_theme}
-        ------------------------------------------------------------------------------
-        override_kbtype         = '{self.override_kbtype}'
-        ------------------------------------------------------------------------------
-        optspec_layout          = '{self.optspec_layout}'
-        mru_layout              = {self.mru_layout}
-        ------------------------------------------------------------------------------
-        forced_numpad           = {self.forced_numpad}
-        media_arrows_fix        = {self.media_arrows_fix}
-        multi_lang              = {self.multi_lang}
-        Caps2Cmd                = {self.Caps2Cmd}
-        Caps2Esc_Cmd            = {self.Caps2Esc_Cmd}
-        Enter2Ent_Cmd           = {self.Enter2Ent_Cmd}
-        ST3_in_VSCode           = {self.ST3_in_VSCode}
-        ------------------------------------------------------------------------------
+    def watch_synergy_log(self, sources: Optional[List[ScreenFocusSource]] = None):
+        """
+        Track screen focus from the log of Synergy, or one of its forks (Deskflow,
+        Input Leap, Barrier), or the given sources. Updates `screen_has_focus`.
         """
+        self.screen_focus_tracker = ScreenFocusTracker(
+            self.on_screen_focus_change, sources=sources, has_focus=self.screen_has_focus)
+        self.screen_focus_tracker.watch()
+
+    def on_screen_focus_change(self, has_focus: bool):
+        with self._db_lock:
+            self.screen_has_focus = has_focus
+            changes = self._update_snapshot()
+        self._run_change_callbacks(changes)
+
+    def __str__(self):
+        separator = '        ' + '-' * 78
+        lines = [
+            "Current settings:",
+            separator,
+            f"        {'calling_module':<24}= '{self.calling_module}'",
+            f"        {'prefs_db_file_path':<24}= '{self.prefs_db_file_path}'",
+        ]
+        last_group = None
+        for field in SETTINGS_SCHEMA:
+            if field.storage is None:
+                continue
+            if field.group != last_group:
+                lines.append(separator)
+                last_group = field.group
+            lines.append(f"        {field.name:<24}= {field.format(getattr(self, field.name))}")
+        lines.extend([separator, '        '])
+        return '\n'.join(lines)
@@ -0,0 +1,176 @@
+__version__ = '20261018'
+
+import os
+import mmap
+import zlib
+import fcntl
+import struct
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from xwaykeyz.lib.logger import debug, error
+
+from lib.runtime_files import runtime_file_path
+
+
+SNAPSHOT_FILE_NAME      = 'toshy_settings.snapshot'
+SNAPSHOT_MAGIC          = b'TSHY'
+SNAPSHOT_FORMAT_VER     = 1
+SNAPSHOT_STR_SIZE       = 64        # bytes for each string value (UTF-8, zero padded)
+
+# magic, format version, (reserved), schema hash, sequence number
+_header                 = struct.Struct('<4sHHII')
+_seq_offset             = 12
+_seq                    = struct.Struct('<I')
+
+
+def default_snapshot_path() -> Optional[str]:
+    return runtime_file_path(SNAPSHOT_FILE_NAME)
+
+
+class SettingsSnapshot:
+    """
+    Settings values published in a small memory-mapped file (in XDG_RUNTIME_DIR), so
+    another process can pick up changes without any database I/O or watcher thread.
+
+    Fixed binary layout: a header with a hash of the field names/types and a sequence
+    number, then the values. Writers (any process saving settings) hold a file lock
+    and make the sequence number odd while writing. Readers don't lock anything: a
+    read is only accepted if the sequence number was even and unchanged around it.
+    Checking for a change is a single 4-byte read from the mapped file.
+
+    The sequence number only ever grows, whichever writer bumps it, so a reader can't
+    mistake a new snapshot for the one it already read. The header is checked again
+    with every new snapshot: if a writer with another schema (another version of
+    Toshy) took over the file, the reader closes it and stops reading.
+    """
+    def __init__(self, fields: List[Tuple[str, type]], path: Optional[str] = None) -> None:
+        self.fields                         = fields
+        self.path                           = path or default_snapshot_path()
+        fmt = '<'
+        for _, field_type in fields:
+            if field_type is bool:          fmt += '?'
+            elif field_type is str:         fmt += f'{SNAPSHOT_STR_SIZE}s'
+            elif field_type is tuple:       fmt += f'{SNAPSHOT_STR_SIZE}s{SNAPSHOT_STR_SIZE}s'
+            else: raise TypeError(f"Unsupported settings snapshot field type: {field_type}")
+        self._payload                       = struct.Struct(fmt)
+        self.size                           = _header.size + self._payload.size
+        schema_text = ';'.join(f'{name}:{field_type.__name__}' for name, field_type in fields)
+        self.schema_hash                    = zlib.crc32(schema_text.encode())
+        self._mm: Optional[mmap.mmap]       = None
+        self._last_seq: Optional[int]       = None
+
+    def _encode(self, values: Dict[str, Any]) -> bytes:
+        items = []
+        for name, field_type in self.fields:
+            value = values[name]
+            if field_type is tuple:
+                items.extend(str(part).encode('utf-8') for part in value)
+            elif field_type is str:
+                items.append(str(value).encode('utf-8'))
+            else:
+                items.append(bool(value))
+        return self._payload.pack(*items)
+
+    def _decode(self, payload: bytes) -> Dict[str, Any]:
+        items = iter(self._payload.unpack(payload))
+        text = lambda raw: raw.rstrip(b'\0').decode('utf-8', errors='replace')
+        values = {}
+        for name, field_type in self.fields:
+            if field_type is tuple:
+                values[name] = (text(next(items)), text(next(items)))
+            elif field_type is str:
+                values[name] = text(next(items))
+            else:
+                values[name] = next(items)
+        return values
+
+    def write(self, values: Dict[str, Any]):
+        """Publish the values (a dict with all the fields), bumping the sequence number"""
+        payload = self._encode(values)
+        if self.path is None:
+            raise OSError("No private runtime folder for the settings snapshot file")
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            if os.fstat(fd).st_size != self.size:
+                os.ftruncate(fd, self.size)
+            with mmap.mmap(fd, self.size) as mm:
+                # keep counting from any previous writer, even with another schema,
+                # so readers never see a number they already saw
+                seq = _seq.unpack_from(mm, _seq_offset)[0] if mm[:4] == SNAPSHOT_MAGIC else 0
+                seq += 2 if seq % 2 == 0 else 1         # next even number
+                seq &= 0xFFFFFFFF
+                _header.pack_into(mm, 0, SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VER, 0,
+                                    self.schema_hash, seq - 1)  # odd: write in progress
+                mm[_header.size:] = payload
+                _seq.pack_into(mm, _seq_offset, seq)
+        finally:
+            os.close(fd)     # also releases the lock
+
+    def open(self) -> bool:
+        """Map the snapshot file for reading. False if it's missing or from another schema."""
+        if self.path is None:
+            error("Settings snapshot not available: no private runtime folder")
+            return False
+        try:
+            fd = os.open(self.path, os.O_RDONLY)
+        except OSError as open_err:
+            error(f"Settings snapshot not available: {open_err}")
+            return False
+        try:
+            if os.fstat(fd).st_size != self.size:
+                error(f"Settings snapshot file has unexpected size: '{self.path}'")
+                return False
+            self._mm = mmap.mmap(fd, self.size, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        if not self._header_matches(self._mm):
+            error(f"Settings snapshot file is from a different version of Toshy: '{self.path}'")
+            self.close()
+            return False
+        debug(f"Reading settings snapshot from '{self.path}'")
+        return True
+
+    @property
+    def is_open(self) -> bool:
+        return self._mm is not None
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def _header_matches(self, header: bytes) -> bool:
+        magic, format_ver, _, schema_hash, _ = _header.unpack_from(header, 0)
+        return (magic, format_ver, schema_hash) == (SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VER, self.schema_hash)
+
+    def read_if_changed(self) -> Optional[Dict[str, Any]]:
+        """
+        Values of the latest snapshot, or None if nothing was published since the last
+        read. Also None (and the file is closed, see `is_open`) if the snapshot was
+        written with another schema.
+        """
+        mm = self._mm
+        if mm is None:
+            return None
+        seq = _seq.unpack_from(mm, _seq_offset)[0]
+        if seq == self._last_seq:
+            return None
+        for _ in range(100):
+            if seq % 2 == 0:
+                snapshot = mm[:]
+                seq_after = _seq.unpack_from(mm, _seq_offset)[0]
+                if seq_after == seq:
+                    self._last_seq = seq
+                    if not self._header_matches(snapshot):
+                        error(f"Settings snapshot was written by a different version of Toshy, "
+                                f"no longer reading it: '{self.path}'")
+                        self.close()
+                        return None
+                    return self._decode(snapshot[_header.size:])
+                seq = seq_after
+            else:
+                seq = _seq.unpack_from(mm, _seq_offset)[0]
+        return None     # writer still busy, try again on the next event
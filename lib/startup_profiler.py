@@ -0,0 +1,99 @@
+__version__ = '20261018'
+
+import os
+import json
+import time
+
+from typing import Dict, List, Optional
+
+from xwaykeyz.lib.logger import debug, error
+
+
+STARTUP_PROFILE_ENV_VAR     = 'TOSHY_STARTUP_PROFILE'
+STARTUP_PROFILE_FILE_NAME   = 'toshy_startup_profile.json'
+
+
+class StartupProfiler:
+    """
+    Optional wall time profile of the phases of the config load (imports, Settings and
+    its observers, environment detection, each section of keymaps, etc.), to find out
+    what keeps the keyboard from working after a session start or resume.
+
+    Enabled by the TOSHY_STARTUP_PROFILE environment variable of the keymapper process
+    ('1', or the threshold in ms for flagging slow phases). The config marks the start
+    of each phase with phase(), and finish() writes a JSON report. When disabled,
+    phase() does nothing.
+    """
+    def __init__(   self,
+                    enabled: Optional[bool] = None,
+                    threshold_ms: float = 50.0,
+                    report_dir: Optional[str] = None) -> None:
+        env_value = os.environ.get(STARTUP_PROFILE_ENV_VAR, '').strip()
+        if enabled is None:
+            enabled = env_value not in ('', '0', 'false', 'no')
+        if env_value.replace('.', '', 1).isdigit() and env_value not in ('0', '1'):
+            threshold_ms = float(env_value)     # a number other than 0/1 is the threshold
+        self.enabled                        = bool(enabled)
+        self.threshold_ms                   = threshold_ms
+        self.report_dir                     = (report_dir or
+                                                os.environ.get('XDG_RUNTIME_DIR') or '/tmp')
+        self.report_path                    = os.path.join( self.report_dir,
+                                                            STARTUP_PROFILE_FILE_NAME)
+        self.phases: List[Dict]             = []
+        self._phase_name: Optional[str]     = None
+        self._phase_start                   = 0.0
+        self._first_start: Optional[float]  = None
+
+    def add_phase(self, name: str, start: float, end: float):
+        """Record a phase timed (with time.perf_counter()) before the profiler existed"""
+        if not self.enabled:
+            return
+        if self._first_start is None or start < self._first_start:
+            self._first_start = start
+        self.phases.append({'name': name, 'start': start, 'secs': end - start})
+
+    def phase(self, name: str):
+        """End the current phase (if any) and start the next one"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._phase_name is not None:
+            self.add_phase(self._phase_name, self._phase_start, now)
+        self._phase_name = name
+        self._phase_start = now
+
+    def finish(self) -> Optional[str]:
+        """End the last phase and write the report. Returns the report path."""
+        if not self.enabled:
+            return None
+        self.phase(None)
+        first_start = self._first_start or 0.0
+        total_ms = sum(phase['secs'] for phase in self.phases) * 1000
+        phases = [
+            {   'name':             phase['name'],
+                'start_ms':         round((phase['start'] - first_start) * 1000, 3),
+                'ms':               round(phase['secs'] * 1000, 3),
+                'over_threshold':   phase['secs'] * 1000 > self.threshold_ms }
+            for phase in self.phases
+        ]
+        report = {
+            'timestamp':            time.strftime('%Y-%m-%d %H:%M:%S'),
+            'pid':                  os.getpid(),
+            'total_ms':             round(total_ms, 3),
+            'threshold_ms':         self.threshold_ms,
+            'flagged':              [phase['name'] for phase in phases if phase['over_threshold']],
+            'phases':               phases,
+        }
+        try:
+            with open(self.report_path, 'w', encoding='utf-8') as report_file:
+                json.dump(report, report_file, indent=2)
+        except OSError as write_err:
+            error(f"Could not write startup profile '{self.report_path}': {write_err}")
+
+        debug(f"Config startup profile: {total_ms:.1f} ms in {len(phases)} phases, "
+                f"report written to '{self.report_path}'", ctx="SP")
+        for phase in phases:
+            if phase['over_threshold']:
+                error(f"Slow config startup phase (over {self.threshold_ms:.0f} ms): "
+                        f"'{phase['name']}' {phase['ms']:.1f} ms")
+        return self.report_path
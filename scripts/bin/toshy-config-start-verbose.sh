@@ -47,11 +47,17 @@ if command xhost &> /dev/null; then
     fi
 fi
 
+# Load the config through the loader that keeps its compiled code cached (if installed)
+TOSHY_CONFIG_FILE="$HOME/.config/toshy/toshy_config.py"
+if [[ -f "$HOME/.config/toshy/toshy_config_loader.py" ]]; then
+    TOSHY_CONFIG_FILE="$HOME/.config/toshy/toshy_config_loader.py"
+fi
+
 # Start keymapper (xwaykeyz or keyszer) with verbose flag [-v] and anti-buffering flag [--flush]
 if command -v xwaykeyz >/dev/null 2>&1; then
-    xwaykeyz --flush -w -v -c "$HOME/.config/toshy/toshy_config.py"
+    xwaykeyz --flush -w -v -c "$TOSHY_CONFIG_FILE"
 elif command -v keyszer >/dev/null 2>&1; then
-    keyszer --flush -w -v -c "$HOME/.config/toshy/toshy_config.py"
+    keyszer --flush -w -v -c "$TOSHY_CONFIG_FILE"
 else
     echo -e "Neither \"xwaykeyz\" nor \"keyszer\" command was found in: \n$PATH."
     echo "Toshy config cannot be loaded until one of these is installed."
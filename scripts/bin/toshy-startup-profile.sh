@@ -0,0 +1,71 @@
+#!/usr/bin/env bash
+
+
+# Start the Toshy manual script, with verbose output and a profile of the config load phases.
+# Optional argument: threshold in ms for flagging slow phases (default: 50 ms).
+# The JSON report is written to "$XDG_RUNTIME_DIR/toshy_startup_profile.json" when the
+# config has finished loading, and the slow phases are shown in the output.
+
+# Check if the script is being run as root
+if [[ $EUID -eq 0 ]]; then
+    echo "This script must not be run as root"
+    exit 1
+fi
+
+# Check if $USER and $HOME environment variables are not empty
+if [[ -z $USER ]] || [[ -z $HOME ]]; then
+    echo "\$USER and/or \$HOME environment variables are not set. We need them."
+    exit 1
+fi
+
+"$HOME/.local/bin/toshy-services-stop"
+
+pkill -f "bin/xwaykeyz"
+pkill -f "bin/keyszer"
+# systemctl stop xkeysnail.service
+pkill -f "bin/xkeysnail"
+
+############################  COMPANION D-BUS SERVICES  #####################################
+
+# start KDE D-Bus service in case we are in Wayland+KDE (it will stop itself if not)
+nohup "${HOME}/.local/bin/toshy-kde-dbus-service" >/dev/null 2>&1 &
+
+# start COSMIC D-Bus service in case we are in Wayland+COSMIC (it will stop itself if not)
+nohup "${HOME}/.local/bin/toshy-cosmic-dbus-service" >/dev/null 2>&1 &
+
+# start Wlroots D-Bus service in case we are in a wlroots-based DE/WM (it will stop itself if not)
+nohup "${HOME}/.local/bin/toshy-wlroots-dbus-service" >/dev/null 2>&1 &
+
+
+# pause to let D-Bus service(s) start up
+sleep 2
+
+# shellcheck disable=SC1091
+source "$HOME/.config/toshy/.venv/bin/activate"
+
+# overcome a possible strange and rare problem connecting to X display
+if command xhost &> /dev/null; then
+    if [[ "$XDG_SESSION_TYPE" == "x11" ]]; then
+        xhost +local:
+    fi
+fi
+
+# Enable the startup profiler in the config file
+export TOSHY_STARTUP_PROFILE="${1:-1}"
+
+# Load the config through the loader that keeps its compiled code cached (if installed)
+TOSHY_CONFIG_FILE="$HOME/.config/toshy/toshy_config.py"
+if [[ -f "$HOME/.config/toshy/toshy_config_loader.py" ]]; then
+    TOSHY_CONFIG_FILE="$HOME/.config/toshy/toshy_config_loader.py"
+fi
+
+# Start keymapper (xwaykeyz or keyszer) with verbose flag [-v] and anti-buffering flag [--flush]
+if command -v xwaykeyz >/dev/null 2>&1; then
+    xwaykeyz --flush -w -v -c "$TOSHY_CONFIG_FILE"
+elif command -v keyszer >/dev/null 2>&1; then
+    keyszer --flush -w -v -c "$TOSHY_CONFIG_FILE"
+else
+    echo -e "Neither \"xwaykeyz\" nor \"keyszer\" command was found in: \n$PATH."
+    echo "Toshy config cannot be loaded until one of these is installed."
+    exit 1
+fi
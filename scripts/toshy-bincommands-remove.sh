@@ -35,6 +35,7 @@ rm -f "${LOCAL_BIN}/toshy-config-restart"
 rm -f "${LOCAL_BIN}/toshy-config-start-verbose"
 rm -f "${LOCAL_BIN}/toshy-config-verbose-start"
 rm -f "${LOCAL_BIN}/toshy-debug"
+rm -f "${LOCAL_BIN}/toshy-startup-profile"
 rm -f "${LOCAL_BIN}/toshy-tray"
 rm -f "${LOCAL_BIN}/toshy-gui"
 rm -f "${LOCAL_BIN}/toshy-env"
@@ -65,6 +66,7 @@ echo "- toshy-config-stop"
 echo "- toshy-config-restart"
 echo "- toshy-config-start-verbose"
 echo "- toshy-config-verbose-start"
+echo "- toshy-startup-profile"
 echo "- toshy-tray"
 echo "- toshy-gui"
 echo "- toshy-env"
@@ -38,6 +38,7 @@ ln -sf "${TOSHY_BIN}/toshy-config-restart.sh"           "${LOCAL_BIN}/toshy-conf
 ln -sf "${TOSHY_BIN}/toshy-config-start-verbose.sh"     "${LOCAL_BIN}/toshy-config-start-verbose"
 ln -sf "${TOSHY_BIN}/toshy-config-start-verbose.sh"     "${LOCAL_BIN}/toshy-config-verbose-start"
 ln -sf "${TOSHY_BIN}/toshy-config-start-verbose.sh"     "${LOCAL_BIN}/toshy-debug"
+ln -sf "${TOSHY_BIN}/toshy-startup-profile.sh"         "${LOCAL_BIN}/toshy-startup-profile"
 ln -sf "${TOSHY_BIN}/toshy-tray.sh"                     "${LOCAL_BIN}/toshy-tray"
 ln -sf "${TOSHY_BIN}/toshy-gui.sh"                      "${LOCAL_BIN}/toshy-gui"
 ln -sf "${TOSHY_BIN}/toshy-env.sh"                      "${LOCAL_BIN}/toshy-env"
@@ -69,6 +70,7 @@ echo "- toshy-config-restart"
 echo "- toshy-config-start-verbose"
 echo "- toshy-config-verbose-start"
 echo "- toshy-config-debug"
+echo "- toshy-startup-profile"
 echo "- toshy-tray"
 echo "- toshy-gui"
 echo "- toshy-env"
@@ -81,10 +81,16 @@ fi
 # Set the process name for the keymapper config process
 echo "toshy-config" > /proc/$$/comm
 
+# Load the config through the loader that keeps its compiled code cached (if installed)
+TOSHY_CONFIG_FILE="$HOME/.config/toshy/toshy_config.py"
+if [[ -f "$HOME/.config/toshy/toshy_config_loader.py" ]]; then
+    TOSHY_CONFIG_FILE="$HOME/.config/toshy/toshy_config_loader.py"
+fi
+
 if command -v xwaykeyz >/dev/null 2>&1; then
-    xwaykeyz -w -c "$HOME/.config/toshy/toshy_config.py"
+    xwaykeyz -w -c "$TOSHY_CONFIG_FILE"
 elif command -v keyszer >/dev/null 2>&1; then
-    keyszer -w -c "$HOME/.config/toshy/toshy_config.py"
+    keyszer -w -c "$TOSHY_CONFIG_FILE"
 else
     echo -e "Neither \"xwaykeyz\" nor \"keyszer\" command was found in: \n$PATH."
     echo "Toshy config cannot be loaded until one of these is installed."
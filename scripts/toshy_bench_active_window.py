@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+# Benchmark and consistency check of the memory-mapped active window record that the
+# window context D-Bus services (KDE, wlroots, COSMIC) publish next to their
+# ActiveWindowChanged signal (lib/active_window_record.py).
+
+# Reports the cost of a reader check when the window didn't change (the usual case
+# on the key path), and of reading a changed record. Then a writer process updates
+# the record as fast as it can while this process reads it, and every record read
+# is checked for torn (half updated) values.
+
+# Needs the Python from the Toshy virtual environment (for the keymapper logger):
+#   ~/.config/toshy/.venv/bin/python3 scripts/toshy_bench_active_window.py [options]
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import multiprocessing
+
+this_file_path          = os.path.realpath(__file__)
+parent_folder_path      = os.path.abspath(os.path.join(os.path.dirname(this_file_path), '..'))
+sys.path.insert(0, parent_folder_path)
+
+from lib.active_window_record import ActiveWindowRecordReader, ActiveWindowRecordWriter
+
+
+def run_writer(path: str, updates: int, ready):
+    writer = ActiveWindowRecordWriter(path)
+    writer.publish('bench-0', 'title 0 ' + 'x' * 0, 'bench-0')
+    ready.set()
+    for i in range(1, updates + 1):
+        # every field carries the update number, and the title length varies with it
+        writer.publish(f'bench-{i}', f'title {i} ' + 'x' * (i % 200), f'bench-{i}')
+    writer.close()
+
+
+def is_consistent(window) -> bool:
+    number = window.wm_class.split('-')[1]
+    title_number, padding = window.wm_name.split(' ')[1:]
+    return (window.resource_name == window.wm_class and title_number == number and
+            len(padding) == int(number) % 200)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark the active window record")
+    arg_parser.add_argument('--reads', type=int, default=1000000, help="reader checks to time")
+    arg_parser.add_argument('--updates', type=int, default=200000, help="writer updates in the race check")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'toshy_active_window_bench.bin')
+        writer = ActiveWindowRecordWriter(path)
+        writer.publish('org.kde.konsole', 'bench — Konsole', 'konsole')
+        reader = ActiveWindowRecordReader(path)
+        reader.read()
+
+        start = time.perf_counter()
+        for _ in range(args.reads):
+            reader.read()
+        unchanged_ns = (time.perf_counter() - start) / args.reads * 1e9
+
+        changes = min(args.reads, 100000)
+        start = time.perf_counter()
+        for i in range(changes):
+            writer.publish('org.kde.konsole', f'bench {i} — Konsole', 'konsole')
+            reader.read()
+        both_ns = (time.perf_counter() - start) / changes * 1e9
+        start = time.perf_counter()
+        for i in range(changes):
+            writer.publish('org.kde.konsole', f'bench {i} — Konsole!', 'konsole')
+        publish_ns = (time.perf_counter() - start) / changes * 1e9
+        writer.close()
+        reader.close()
+
+        print(f"{'read(), unchanged':<24} {unchanged_ns:>10.0f} ns")
+        print(f"{'read(), changed':<24} {both_ns - publish_ns:>10.0f} ns")
+        print(f"{'publish()':<24} {publish_ns:>10.0f} ns")
+
+        ready = multiprocessing.Event()
+        writer_proc = multiprocessing.Process(target=run_writer, args=(path, args.updates, ready))
+        writer_proc.start()
+        ready.wait()
+        reader = ActiveWindowRecordReader(path)
+        reads = changed_reads = torn = 0
+        last = None
+        while writer_proc.is_alive() or reader.changed():
+            window = reader.read()
+            reads += 1
+            if window is not last:
+                changed_reads += 1
+                last = window
+                if not is_consistent(window):
+                    torn += 1
+        writer_proc.join()
+        print(f"race check: {args.updates} updates, {reads} reads, "
+                f"{changed_reads} changed values read, torn: {torn}, "
+                f"last: {last.wm_class if last else None}")
+        reader.close()
+        return 1 if torn else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+
+# Headless benchmark of the `when` conditions of a Toshy config file.
+
+# Loads the config with a stand-in for `xwaykeyz.config_api` that captures every
+# modmap/multipurpose_modmap/keymap registration and its `when` condition, instead of
+# handing them to the keymapper. Then replays a trace of key event contexts (window
+# class/title, device name, LED states) and evaluates every captured condition once
+# per event, in registration order. Reports the calls, errors, ns/call and total cost
+# of each keymap's condition, plus the total condition cost per event, as a table
+# and optionally as JSON, to compare the per-keystroke cost of config versions.
+
+# Needs the keymapper (`xwaykeyz`) to be importable for keys, combos and modifiers,
+# so run it with the Python from the Toshy virtual environment:
+#   ~/.config/toshy/.venv/bin/python scripts/toshy_bench_conditions.py [options]
+
+# Trace files are JSON lines, one key event per line, with any of these fields:
+#   {"wm_class": "firefox", "wm_name": "Title", "device_name": "AT Translated Set 2 keyboard",
+#    "numlock_on": false, "capslock_on": false}
+# Without a trace file, a synthetic trace is generated (use --save-trace to keep it).
+
+import os
+import sys
+import json
+import time
+import types
+import random
+import shutil
+import argparse
+import importlib
+import tempfile
+
+from typing import Callable, Dict, List, Optional
+
+this_file_path          = os.path.realpath(__file__)
+parent_folder_path      = os.path.abspath(os.path.join(os.path.dirname(this_file_path), '..'))
+home_dir                = os.path.expanduser('~')
+
+config_file_paths = [
+    os.path.join(home_dir, '.config', 'toshy', 'toshy_config.py'),
+    os.path.join(parent_folder_path, 'default-toshy-config', 'toshy_config.py'),
+]
+
+# The config file finds its own folder through the globals of the frame that runs it,
+# the same way it does when the keymapper loads it. Gets set before loading the config.
+__config__ = None
+
+
+class TraceContext:
+    """Stand-in for the keymapper's KeyContext, with the properties conditions use"""
+    __slots__ = ('wm_class', 'wm_name', 'device_name', 'numlock_on', 'capslock_on')
+
+    def __init__(self, wm_class='', wm_name='', device_name='', numlock_on=False, capslock_on=False):
+        self.wm_class       = wm_class
+        self.wm_name        = wm_name
+        self.device_name    = device_name
+        self.numlock_on     = numlock_on
+        self.capslock_on    = capslock_on
+
+
+class CapturedCondition:
+    """A captured modmap/keymap registration and the measurements of its condition"""
+    def __init__(self, kind: str, name: str, when: Callable) -> None:
+        self.kind           = kind
+        self.name           = name
+        self.when           = when
+        self.calls          = 0
+        self.errors         = 0
+        self.total_ns       = 0
+
+    def as_dict(self, overhead_ns: int):
+        total_ns = max(self.total_ns - overhead_ns * self.calls, 0)
+        return {
+            'kind':         self.kind,
+            'name':         self.name,
+            'calls':        self.calls,
+            'errors':       self.errors,
+            'total_ns':     total_ns,
+            'ns_per_call':  total_ns / self.calls if self.calls else 0,
+        }
+
+
+captured: List[CapturedCondition] = []
+
+
+def install_config_api_stub():
+    """Replace xwaykeyz.config_api with a copy that captures the registrations"""
+    try:
+        real_api = importlib.import_module('xwaykeyz.config_api')
+    except ImportError as import_err:
+        print(f"The keymapper (xwaykeyz) is not importable: {import_err}")
+        print(f"Run this with the Python from the Toshy virtual environment.")
+        sys.exit(1)
+
+    stub_api = types.ModuleType('xwaykeyz.config_api')
+    stub_api.__dict__.update({k: v for k, v in vars(real_api).items() if k != '__name__'})
+
+    def capture(kind):
+        def _capture(name, mappings, when=None):
+            if when is not None:
+                captured.append(CapturedCondition(kind, name, when))
+        return _capture
+
+    stub_api.modmap                 = capture('modmap')
+    stub_api.multipurpose_modmap    = capture('multipurpose_modmap')
+    stub_api.keymap                 = capture('keymap')
+    sys.modules['xwaykeyz.config_api'] = stub_api
+
+
+def load_config(config_path: str, work_dir: str) -> Dict:
+    """
+    Run the config file from a temporary folder, so its preferences database and
+    anything else it writes next to itself doesn't touch the real config folder.
+    """
+    global __config__
+    config_dir = os.path.dirname(config_path)
+    work_config_path = os.path.join(work_dir, 'toshy_config.py')
+    shutil.copy2(config_path, work_config_path)
+
+    # installed config has 'lib' next to it, the repo has it one level up
+    for item in ['lib', 'assets', 'toshy_user_preferences.sqlite']:
+        for src_dir in [config_dir, parent_folder_path]:
+            src_path = os.path.join(src_dir, item)
+            if os.path.exists(src_path):
+                if os.path.isdir(src_path):
+                    os.symlink(src_path, os.path.join(work_dir, item))
+                else:
+                    shutil.copy2(src_path, os.path.join(work_dir, item))
+                break
+
+    __config__ = work_config_path
+    config_globals = {'__name__': 'toshy_config', '__file__': work_config_path}
+    with open(work_config_path, 'r', encoding='utf-8') as config_file:
+        config_code = compile(config_file.read(), config_path, 'exec')
+    exec(config_code, config_globals)
+    return config_globals
+
+
+# Windows for the synthetic trace: (wm_class, wm_name)
+trace_windows = [
+    ('org.gnome.Terminal',      'user@hostname: ~/projects/toshy'),
+    ('kitty',                   'vim default-toshy-config/toshy_config.py'),
+    ('org.kde.konsole',         'git log --oneline --graph --decorate --all | less — Konsole'),
+    ('firefox',                 'How to find the slow parts of your Python program with cProfile '
+                                'and line_profiler, a practical guide with examples — Mozilla Firefox'),
+    ('Google-chrome',           'Inbox (12) - user@example.com - Gmail - Google Chrome'),
+    ('org.gnome.Nautilus',      'Downloads'),
+    ('org.kde.dolphin',         'Home — Dolphin'),
+    ('code',                    'toshy_config.py - default-toshy-config - toshy - Visual Studio Code'),
+    ('org.remmina.Remmina',     'Remote Desktop - workstation'),
+    ('thunderbird',             'Inbox - Mozilla Thunderbird'),
+    ('libreoffice-writer',      'Quarterly report.odt - LibreOffice Writer'),
+    ('Slack',                   'general (Channel) - Example Workspace - Slack'),
+    ('org.gnome.Settings',      'Settings'),
+    ('jetbrains-pycharm',       'toshy – toshy_config.py'),
+]
+
+trace_devices = [
+    'AT Translated Set 2 keyboard',
+    'Apple Inc. Magic Keyboard',
+    'Logitech MX Keys',
+]
+
+
+def synthetic_trace(events: int, seed: int) -> List[Dict]:
+    """Key events in bursts of typing in one window, with focus and title changes between"""
+    rng = random.Random(seed)
+    trace = []
+    device_name = trace_devices[0]
+    numlock_on, capslock_on = True, False
+    while len(trace) < events:
+        wm_class, wm_name = rng.choice(trace_windows)
+        if rng.random() < 0.3:
+            wm_name = f"{wm_name} ({rng.randint(1, 99)})"
+        if rng.random() < 0.1:
+            device_name = rng.choice(trace_devices)
+        if rng.random() < 0.05:
+            capslock_on = not capslock_on
+        for _ in range(rng.randint(5, 40)):
+            trace.append({  'wm_class': wm_class, 'wm_name': wm_name, 'device_name': device_name,
+                            'numlock_on': numlock_on, 'capslock_on': capslock_on })
+    return trace[:events]
+
+
+def read_trace(trace_path: str) -> List[Dict]:
+    with open(trace_path, 'r', encoding='utf-8') as trace_file:
+        return [json.loads(line) for line in trace_file if line.strip()]
+
+
+def timer_overhead_ns() -> int:
+    """Cost of the timing itself, around a call that does nothing"""
+    noop = lambda ctx: False
+    ctx = TraceContext()
+    perf_counter_ns = time.perf_counter_ns
+    reps = 100_000
+    start = perf_counter_ns()
+    for _ in range(reps):
+        t0 = perf_counter_ns()
+        noop(ctx)
+        perf_counter_ns() - t0
+    return (perf_counter_ns() - start) // reps
+
+
+def replay(trace: List[Dict]):
+    """Evaluate every captured condition once for each event of the trace"""
+    perf_counter_ns = time.perf_counter_ns
+    for event in trace:
+        # a new context object for every event, like the keymapper does
+        ctx = TraceContext(**event)
+        for cond in captured:
+            t0 = perf_counter_ns()
+            try:
+                cond.when(ctx)
+            except Exception:
+                cond.errors += 1
+            cond.total_ns += perf_counter_ns() - t0
+            cond.calls += 1
+
+
+def print_table(results: List[Dict], summary: Dict, top: Optional[int]):
+    print(f"\n{'kind':<20} {'name':<50} {'calls':>9} {'errors':>6} {'ns/call':>9} {'total ms':>10} {'%':>6}")
+    total_ns = summary['condition_ns_total'] or 1
+    for result in results[:top]:
+        print(  f"{result['kind']:<20} {result['name'][:50]:<50} {result['calls']:>9} "
+                f"{result['errors']:>6} {result['ns_per_call']:>9.0f} "
+                f"{result['total_ns'] / 1e6:>10.2f} {result['total_ns'] / total_ns * 100:>6.1f}")
+    print()
+    for key, value in summary.items():
+        print(f"{key:<28} {value}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark the `when` conditions of a Toshy config")
+    arg_parser.add_argument('--config', help="config file (default: installed config, or repo default)")
+    arg_parser.add_argument('--trace', help="JSON lines trace file to replay")
+    arg_parser.add_argument('--events', type=int, default=20_000, help="events in synthetic trace")
+    arg_parser.add_argument('--seed', type=int, default=1, help="random seed for synthetic trace")
+    arg_parser.add_argument('--save-trace', help="write the replayed trace to a JSON lines file")
+    arg_parser.add_argument('--json', help="write the results to a JSON file")
+    arg_parser.add_argument('--top', type=int, default=40, help="rows in the table (0 for all)")
+    arg_parser.add_argument('--unfocused', action='store_true',
+                            help="replay with the screen focus on another Synergy screen")
+    args = arg_parser.parse_args()
+
+    config_path = args.config or next((p for p in config_file_paths if os.path.isfile(p)), None)
+    if config_path is None or not os.path.isfile(config_path):
+        print(f"Config file not found: {args.config or config_file_paths}")
+        sys.exit(1)
+    config_path = os.path.abspath(config_path)
+
+    trace = read_trace(args.trace) if args.trace else synthetic_trace(args.events, args.seed)
+    if args.save_trace:
+        with open(args.save_trace, 'w', encoding='utf-8') as trace_file:
+            for event in trace:
+                trace_file.write(json.dumps(event) + '\n')
+
+    install_config_api_stub()
+    with tempfile.TemporaryDirectory(prefix='toshy_bench_') as work_dir:
+        load_start = time.perf_counter()
+        config_globals = load_config(config_path, work_dir)
+        load_secs = time.perf_counter() - load_start
+        if args.unfocused:
+            config_globals['cnfg'].on_screen_focus_change(False)
+
+        overhead_ns = timer_overhead_ns()
+        replay_start = time.perf_counter_ns()
+        replay(trace)
+        replay_ns = time.perf_counter_ns() - replay_start
+
+    results = sorted(   (cond.as_dict(overhead_ns) for cond in captured),
+                        key=lambda result: result['total_ns'], reverse=True )
+    condition_ns_total = sum(result['total_ns'] for result in results)
+    summary = {
+        'config':                   config_path,
+        'config_version':           config_globals.get('__version__'),
+        'config_load_secs':         round(load_secs, 3),
+        'events':                   len(trace),
+        'screen_has_focus':         not args.unfocused,
+        'conditions':               len(captured),
+        'condition_errors':         sum(result['errors'] for result in results),
+        'timer_overhead_ns':        overhead_ns,
+        'condition_ns_total':       condition_ns_total,
+        'condition_ns_per_event':   round(condition_ns_total / len(trace)) if trace else 0,
+        'replay_ns_per_event':      round(replay_ns / len(trace)) if trace else 0,
+    }
+
+    print_table(results, summary, args.top or None)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as json_file:
+            json.dump({'summary': summary, 'conditions': results}, json_file, indent=2)
+        print(f"\nResults written to: {args.json}")
+
+    # the config starts watchdog observer threads and such, don't wait for them
+    sys.stdout.flush()
+    os._exit(0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+# Benchmark of the process checks of the environment detection (lib/env_context.py).
+
+# Checks the same list of process names (the desktop environment and window manager
+# process names the detection looks for) two ways:
+#   - legacy:       pgrep subprocesses for each name, including the pgrep option
+#                   probes (how EnvironmentInfo.is_process_running() used to work)
+#   - inventory:    one lib.env_context.ProcessInventory snapshot of /proc, then
+#                   every check answered from it
+# Reports the time for the whole list of checks, whether both ways agree, and the
+# time of a full EnvironmentInfo.get_env_info() run.
+
+# Doesn't need the keymapper, any Python 3 will do:
+#   python3 scripts/toshy_bench_env_context.py [options]
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+this_file_path          = os.path.realpath(__file__)
+parent_folder_path      = os.path.abspath(os.path.join(os.path.dirname(this_file_path), '..'))
+sys.path.insert(0, parent_folder_path)
+
+import lib.env_context
+from lib.env_context import EnvironmentInfo, ProcessInventory
+
+
+process_names = [
+    'plasmashell', 'kwin_ft', 'kwin_wayland', 'kwin_x11', 'kwin', 'gnome-shell', 'mutter',
+    'miracle-wm', 'sway', 'swaywm', 'hyprland', 'Hyprland', 'openbox', 'labwc', 'wayfire',
+    'river', 'niri', 'miriway', 'miriway-shell', 'deepin-kwin_wayland', 'deepin-kwin_x11',
+    'deepin-kwin', 'awesome', 'cinnamon', 'cosmic-comp', 'dwm', 'i3', 'gala', 'xfwm4',
+]
+
+
+def legacy_is_process_running(process_name):
+    """The old check: pgrep option probes, then pgrep for the process"""
+    try:
+        subprocess.check_output(['pgrep', '-i', 'test'], stderr=subprocess.PIPE)
+    except subprocess.CalledProcessError:
+        pass
+    if len(process_name) <= 15:
+        cmd = ['pgrep', '-x', '-i', process_name]
+    else:
+        try:
+            subprocess.check_output(['pgrep', '-f', 'test'], stderr=subprocess.PIPE)
+        except subprocess.CalledProcessError:
+            pass
+        cmd = ['pgrep', '-f', f"(/|^){process_name}($| )"]
+    try:
+        subprocess.check_output(cmd)
+        return True
+    except subprocess.CalledProcessError:
+        return False
+
+
+def inventory_is_process_running(processes: ProcessInventory, process_name):
+    if len(process_name) <= 15:
+        return processes.has_name(process_name)
+    return processes.has_cmdline(f"(/|^){process_name}($| )")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark the environment detection process checks")
+    arg_parser.add_argument('--rounds', type=int, default=5, help="times to run each way")
+    arg_parser.add_argument('--skip-legacy', action='store_true', help="don't run the pgrep checks")
+    args = arg_parser.parse_args()
+
+    legacy_secs = inventory_secs = env_info_secs = 0.0
+    legacy_results = inventory_results = None
+    for _ in range(args.rounds):
+        if not args.skip_legacy:
+            start = time.perf_counter()
+            legacy_results = [legacy_is_process_running(name) for name in process_names]
+            legacy_secs += time.perf_counter() - start
+
+        start = time.perf_counter()
+        processes = ProcessInventory()
+        inventory_results = [inventory_is_process_running(processes, name) for name in process_names]
+        inventory_secs += time.perf_counter() - start
+
+        lib.env_context.VERBOSE = False
+        start = time.perf_counter()
+        EnvironmentInfo().get_env_info()
+        env_info_secs += time.perf_counter() - start
+
+    print(f"process names checked: {len(process_names)}, rounds: {args.rounds}, "
+            f"processes in snapshot: {len(processes.cmdlines)}")
+    print(f"{'way':<12} {'ms/round':>10}")
+    if not args.skip_legacy:
+        print(f"{'legacy':<12} {legacy_secs / args.rounds * 1000:>10.1f}")
+    print(f"{'inventory':<12} {inventory_secs / args.rounds * 1000:>10.1f}")
+    print(f"{'get_env_info':<12} {env_info_secs / args.rounds * 1000:>10.1f}")
+    if legacy_results is not None:
+        mismatches = [name for name, legacy, inventory in
+                        zip(process_names, legacy_results, inventory_results) if legacy != inventory]
+        print(f"results differ for: {mismatches if mismatches else 'none'}")
+    print(f"running: {[name for name, found in zip(process_names, inventory_results) if found]}")
+
+
+if __name__ == '__main__':
+    main()
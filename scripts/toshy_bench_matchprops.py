@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+# Micro-benchmark of the per-call cost of the window class matching done by matchProps(),
+# comparing a plain case insensitive regex search of the app group pattern strings with
+# the matcher functions from compile_matcher() (set membership for the plain names, and
+# a regex search only for the real patterns among the alternatives).
+# Also compares negRgx() negative lookahead patterns with the inverted matchers they get
+# converted into, on long (200 character) window titles.
+
+# Run from the repo or the installed config folder:
+#   python3 scripts/toshy_bench_matchprops.py [number_of_calls]
+
+import os
+import re
+import ast
+import sys
+import timeit
+
+this_file_path          = os.path.realpath(__file__)
+parent_folder_path      = os.path.abspath(os.path.join(os.path.dirname(this_file_path), '..'))
+
+sys.path.insert(0, parent_folder_path)
+
+from lib.pattern_matcher import compile_matcher
+
+config_file_paths = [
+    os.path.join(parent_folder_path, 'toshy_config.py'),
+    os.path.join(parent_folder_path, 'default-toshy-config', 'toshy_config.py'),
+]
+
+# The app group lists to benchmark (the largest ones in the config). The "regex" time is
+# the old matchProps() way of doing it: re.search() with the compiled pattern object.
+list_names = ['terminals', 'browsers_firefox', 'filemanagers', 'remotes']
+
+
+def get_config_lists(config_file_path):
+    """Get the app group lists from the config file, without importing it (needs the keymapper)"""
+    with open(config_file_path, 'r', encoding='utf-8') as config_file:
+        tree = ast.parse(config_file.read())
+    lists = {}
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and isinstance(node.value, ast.List) and
+                len(node.targets) == 1 and isinstance(node.targets[0], ast.Name) and
+                node.targets[0].id in list_names and node.targets[0].id not in lists):
+            lists[node.targets[0].id] = [x.casefold() for x in ast.literal_eval(node.value)]
+    return lists
+
+
+def toRgxStr(lst_of_str):
+    """Same as toRgxStr() in the config file"""
+    lst_of_str_clean = [str(x).replace('^','').replace('$','') for x in lst_of_str]
+    return "|".join('^'+x.casefold()+'$' for x in lst_of_str_clean)
+
+
+def negRgx(rgx_str):
+    """Same as negRgx() in the config file"""
+    rgx_str_strip = str(rgx_str).replace('^','').replace('$','')
+    rgx_str_add = str('^'+rgx_str_strip+'$')
+    return str(rgx_str_add).replace('^','^(?:(?!^').replace('$','$).)*$')
+
+
+# Realistic long window titles (web page, terminal, editor), padded/cut to 200 characters
+title_bases = [
+    "How to find the slow parts of your Python program with cProfile and line_profiler, "
+    "a practical guide with examples - Programming Blog - Mozilla Firefox",
+    "user@hostname: ~/projects/toshy/default-toshy-config - git log --oneline --graph "
+    "--decorate --all | less",
+    "toshy_config.py - default-toshy-config - toshy - Visual Studio Code - OSS",
+]
+titles = [(base + ' ' + base)[:200] for base in title_bases]
+
+# Patterns that might be used to exclude windows by title
+neg_patterns = [
+    "^Preferences$",
+    "^.*Private Browsing.*$",
+    "^.* - Mozilla Firefox$",
+]
+
+
+def bench_negated(calls):
+    """Benchmark negRgx() patterns against the inverted matchers on long titles"""
+    print(f"\n{'negated pattern':<30} {'title':<26} {'negRgx ns':>10} {'matcher ns':>11}")
+    for pattern in neg_patterns:
+        neg_pattern = negRgx(pattern)
+        neg_rgx = re.compile(neg_pattern, re.I)
+        matcher = compile_matcher(neg_pattern)
+        for wm_name in titles:
+            if bool(re.search(neg_rgx, wm_name)) != matcher(wm_name):
+                print(f"Result mismatch: '{neg_pattern}' on '{wm_name}'")
+                sys.exit(1)
+            rgx_time = timeit.timeit(lambda: re.search(neg_rgx, wm_name), number=calls)
+            matcher_time = timeit.timeit(lambda: matcher(wm_name), number=calls)
+            print(  f"{pattern[:30]:<30} {wm_name[:26]:<26} "
+                    f"{rgx_time / calls * 1e9:>10.0f} {matcher_time / calls * 1e9:>11.0f}")
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    config_file_path = next((path for path in config_file_paths if os.path.isfile(path)), None)
+    if config_file_path is None:
+        print(f"Config file not found in: {config_file_paths}")
+        sys.exit(1)
+
+    lists = get_config_lists(config_file_path)
+    print(f"Config file: {config_file_path}")
+    print(f"Calls per measurement: {calls:,}\n")
+    print(f"{'list':<18} {'entries':>7} {'window class':<26} {'regex ns':>9} {'matcher ns':>11}  matcher")
+
+    for list_name in list_names:
+        pattern = toRgxStr(lists[list_name])
+        rgx = re.compile(pattern, re.I)
+        matcher = compile_matcher(pattern)
+        matcher_kind = {'_rgx_matcher': 'regex', '_names_rgx_matcher': 'set+regex'}.get(
+                            getattr(matcher, '__name__', ''), 'set')
+        # a hit at the start of the list, a hit at the end, and a miss
+        samples = [lists[list_name][0].upper(), lists[list_name][-1], 'some-other-app']
+        for wm_class in samples:
+            rgx_time = timeit.timeit(lambda: re.search(rgx, wm_class), number=calls)
+            matcher_time = timeit.timeit(lambda: matcher(wm_class), number=calls)
+            print(  f"{list_name:<18} {len(lists[list_name]):>7} {wm_class[:26]:<26} "
+                    f"{rgx_time / calls * 1e9:>9.0f} {matcher_time / calls * 1e9:>11.0f}  {matcher_kind}")
+
+    # the lookahead patterns are much slower, so use fewer calls
+    bench_negated(max(calls // 10, 1))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+# Benchmark of screen focus tracking from a fast-growing Synergy-style log file.
+
+# Appends batches of synthetic log lines (with "leaving screen"/"entering screen"
+# events mixed in) to a log file in a temporary folder, rotating the file every so
+# often, and after each batch lets two readers catch up:
+#   - legacy:   reopen the file, seek to the saved offset, readlines() and scan each line
+#               (how Settings.handle_synergy_log_file_change() used to work)
+#   - follower: lib.screen_focus.ScreenFocusTracker (persistent fd, bounded reads,
+#               rotation/truncation aware, one regex scan per chunk)
+# Reports the time per catch-up and how often each reader ended up with the wrong state.
+
+# Run it with the Python from the Toshy virtual environment:
+#   ~/.config/toshy/.venv/bin/python scripts/toshy_bench_screen_focus.py [options]
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+this_file_path          = os.path.realpath(__file__)
+parent_folder_path      = os.path.abspath(os.path.join(os.path.dirname(this_file_path), '..'))
+sys.path.insert(0, parent_folder_path)
+
+from lib.screen_focus import ScreenFocusSource, ScreenFocusTracker
+
+
+filler_lines = [
+    "[2026-10-18T12:00:00] DEBUG: event: type=mouse move x=1287 y=402",
+    "[2026-10-18T12:00:00] DEBUG1: received keep alive from client \"laptop\"",
+    "[2026-10-18T12:00:00] DEBUG: sending clipboard 0 to \"laptop\" seqnum=41",
+    "[2026-10-18T12:00:00] NOTE: client \"laptop\" has connected",
+    "[2026-10-18T12:00:00] DEBUG2: writef(%s)",
+]
+
+
+class LegacyReader:
+    """The old approach: reopen, seek to saved offset, readlines(), scan every line"""
+    def __init__(self, path: str) -> None:
+        self.path       = path
+        self.last_pos   = 0
+        self.has_focus  = True
+
+    def poll(self):
+        lines = []
+        if os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                if self.last_pos == 0:
+                    f.seek(0, os.SEEK_END)
+                    end_pos = f.tell()
+                    f.seek(max(end_pos - 1024, 0))
+                    if f.tell() != 0:
+                        f.readline()
+                    lines = f.readlines()
+                else:
+                    f.seek(self.last_pos)
+                    lines = f.readlines()
+                self.last_pos = f.tell()
+        most_recent_state = None
+        for line in lines:
+            line = line.strip()
+            if "leaving screen" in line:
+                most_recent_state = False
+            elif "entering screen" in line:
+                most_recent_state = True
+        if most_recent_state is not None:
+            self.has_focus = most_recent_state
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark screen focus log tracking")
+    arg_parser.add_argument('--batches', type=int, default=2000, help="number of appended batches")
+    arg_parser.add_argument('--lines', type=int, default=200, help="log lines per batch")
+    arg_parser.add_argument('--rotate-every', type=int, default=250,
+                            help="rotate the log every N batches (0 to never rotate)")
+    arg_parser.add_argument('--seed', type=int, default=1, help="random seed")
+    args = arg_parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory(prefix='toshy_bench_focus_') as work_dir:
+        log_path = os.path.join(work_dir, 'synergy.log')
+        open(log_path, 'w').close()
+
+        legacy = LegacyReader(log_path)
+        tracker = ScreenFocusTracker(   lambda has_focus: None,
+                                        sources=[ScreenFocusSource('Synergy', [log_path])])
+        legacy_ns = follower_ns = 0
+        legacy_wrong = follower_wrong = 0
+        has_focus = True
+        bytes_written = 0
+        perf_counter_ns = time.perf_counter_ns
+
+        for batch in range(1, args.batches + 1):
+            if args.rotate_every and batch % args.rotate_every == 0:
+                os.replace(log_path, log_path + '.1')
+            lines = []
+            for _ in range(args.lines):
+                if rng.random() < 0.01:
+                    has_focus = not has_focus
+                    lines.append(f"[2026-10-18T12:00:00] INFO: "
+                                    f"{'entering' if has_focus else 'leaving'} screen")
+                else:
+                    lines.append(rng.choice(filler_lines))
+            text = '\n'.join(lines) + '\n'
+            with open(log_path, 'a') as log_file:
+                log_file.write(text)
+            bytes_written += len(text)
+
+            t0 = perf_counter_ns()
+            legacy.poll()
+            legacy_ns += perf_counter_ns() - t0
+
+            t0 = perf_counter_ns()
+            tracker.poll(log_path)
+            follower_ns += perf_counter_ns() - t0
+
+            legacy_wrong += legacy.has_focus != has_focus
+            follower_wrong += tracker.has_focus != has_focus
+
+    print(f"batches: {args.batches}, lines/batch: {args.lines}, rotate every: {args.rotate_every}, "
+            f"log data: {bytes_written / 1e6:.1f} MB")
+    print(f"{'reader':<10} {'us/poll':>10} {'MB/s':>10} {'wrong state':>12}")
+    for name, total_ns, wrong in [  ('legacy', legacy_ns, legacy_wrong),
+                                    ('follower', follower_ns, follower_wrong)]:
+        print(  f"{name:<10} {total_ns / args.batches / 1000:>10.1f} "
+                f"{bytes_written / (total_ns / 1e9) / 1e6:>10.1f} {wrong:>12}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+__version__ = '20261018'
+
+# Small config file for the keymapper that runs the real config (toshy_config.py in
+# the same folder) from a cache of its compiled code, instead of the keymapper
+# compiling the whole config on every start. The cache is checked against the config
+# source, so edits to the config are picked up right away. Falls back to compiling
+# the config if the cache can't be used for any reason.
+#
+# The config runs with the same globals as this file (those of the keymapper), and
+# finds its folder from '__config__' just like when the keymapper loads it directly.
+#
+#   xwaykeyz -w -c ~/.config/toshy/toshy_config_loader.py
+
+import os
+import sys
+import time
+
+_toshy_config_code_start = time.perf_counter()
+_toshy_dir_path = os.path.dirname(os.path.abspath(__config__))
+_toshy_config_path = os.path.join(_toshy_dir_path, 'toshy_config.py')
+if _toshy_dir_path not in sys.path:
+    sys.path.insert(0, _toshy_dir_path)
+
+try:
+    from lib.config_code_cache import load_config_code
+    _toshy_config_code = load_config_code(_toshy_config_path)
+except SyntaxError:
+    raise
+except Exception as _cache_err:
+    print(f"(CC) Config code cache not usable, compiling the config: {_cache_err}")
+    with open(_toshy_config_path, 'rb') as _config_file:
+        _toshy_config_code = compile(_config_file.read(), _toshy_config_path, 'exec')
+
+# for the optional startup profile of the config
+_toshy_config_code_times = (_toshy_config_code_start, time.perf_counter())
+
+exec(_toshy_config_code, globals())
@@ -208,32 +208,6 @@ from lib.notification_manager import NotificationManager
 ntfy = NotificationManager(icon_file_active, title='Toshy Alert (GUI)')
 
 
-def get_settings_list(settings_obj):
-    # get all attributes from the object
-    all_attributes = [attr for attr in dir(settings_obj) if not callable(getattr(settings_obj, attr)) and not attr.startswith("__")]
-    # filter out attributes that are not strings or booleans
-    filtered_attributes = [attr for attr in all_attributes if isinstance(getattr(settings_obj, attr), (str, bool, int))]
-    # create a list of tuples with attribute name and value pairs
-    settings_list = [(attr, getattr(settings_obj, attr)) for attr in filtered_attributes]
-    return settings_list
-
-
-# Store the settings as a list to see when they change.
-# Monitor from a separate thread.
-last_settings_list = get_settings_list(cnfg)
-
-
-def fn_monitor_internal_settings():
-    global last_settings_list
-    while True:
-        time.sleep(1)
-        if last_settings_list != get_settings_list(cnfg):
-            # debug(f'Updating GUI preferences switch settings...')
-            load_radio_btn_settings(cnfg, optspec_var, "optspec_layout")
-            load_switch_settings(cnfg)
-            last_settings_list = get_settings_list(cnfg)
-
-
 sysctl_cmd      = f"{shutil.which('systemctl')}"
 user_sysctl     = f'{sysctl_cmd} --user'
 
@@ -939,10 +913,14 @@ if __name__ == "__main__":
         monitor_toshy_settings_thread.daemon = True
         monitor_toshy_settings_thread.start()
 
-    # Start separate thread to watch the internal state of settings
-    monitor_internal_settings_thread = threading.Thread(target=fn_monitor_internal_settings)
-    monitor_internal_settings_thread.daemon = True
-    monitor_internal_settings_thread.start()
+    # Update the widgets when the settings they show are changed elsewhere (tray, config).
+    # Callbacks come from the settings watcher thread, so queue the updates for the Tk loop.
+    cnfg.add_field_callback('optspec_layout',
+        lambda *_: root.after(0, load_radio_btn_settings, cnfg, optspec_var, "optspec_layout"))
+    cnfg.add_field_callback(
+        [   'forced_numpad', 'media_arrows_fix', 'multi_lang', 'ST3_in_VSCode',
+            'Caps2Cmd', 'Caps2Esc_Cmd', 'Enter2Ent_Cmd', 'gui_dark_theme' ],
+        lambda *_: root.after(0, load_switch_settings, cnfg))
 
     # Force the window to process pending tasks and calculate its dimensions
     root.update_idletasks()
@@ -237,33 +237,6 @@ def is_init_systemd():
         return False
 
 
-def get_settings_list(settings_obj):
-    # get all attributes from the object
-    all_attributes = [attr for attr in dir(settings_obj) if not callable(getattr(settings_obj, attr)) and not attr.startswith("__")]
-    # filter out attributes that are not strings or booleans
-    filtered_attributes = [attr for attr in all_attributes if isinstance(getattr(settings_obj, attr), (str, bool, int))]
-    # create a list of tuples with attribute name and value pairs
-    settings_list = [(attr, getattr(settings_obj, attr)) for attr in filtered_attributes]
-    return settings_list
-
-
-# Store the settings as a list to see when they change.
-# Monitor from a separate thread.
-last_settings_list = get_settings_list(cnfg)
-
-
-def fn_monitor_internal_settings():
-    global last_settings_list
-    while True:
-        time.sleep(1)
-        if last_settings_list != get_settings_list(cnfg):
-            # debug(f'settings list changed...')
-            last_settings_list = get_settings_list(cnfg)
-            load_prefs_submenu_settings()
-            load_optspec_layout_submenu_settings()
-            load_kbtype_submenu_settings()
-
-
 sysctl_cmd      = f"{shutil.which('systemctl')}"
 user_sysctl     = f'{sysctl_cmd} --user'
 
@@ -938,7 +911,7 @@ def main():
     global DESKTOP_ENV
     # env_info_dct   = env.get_env_info()
     env_ctxt_getter = EnvironmentInfo()
-    env_info_dct   = env_ctxt_getter.get_env_info()
+    env_info_dct   = env_ctxt_getter.get_env_info_cached()
     DESKTOP_ENV = str(env_info_dct.get('DESKTOP_ENV', None)).casefold()
 
     # COSMIC desktop environment messes with tray icon, so use 'grayscale' icon
@@ -968,12 +941,19 @@ def main():
         monitor_toshy_services_thread.daemon = True
         monitor_toshy_services_thread.start()
 
-    # Start separate thread to watch the internal state of settings
-    monitor_internal_settings_thread = threading.Thread(target=fn_monitor_internal_settings)
-    monitor_internal_settings_thread.daemon = True
-    monitor_internal_settings_thread.start()
-
     if not barebones_config:
+        # Update the menu items when the settings they show are changed elsewhere
+        # (GUI, config, layout selector). Callbacks come from the settings watcher
+        # thread, so queue the updates to run in GTK's main loop.
+        cnfg.add_field_callback(
+            [   'forced_numpad', 'media_arrows_fix', 'multi_lang', 'ST3_in_VSCode',
+                'Caps2Cmd', 'Caps2Esc_Cmd', 'Enter2Ent_Cmd' ],
+            lambda *_: GLib.idle_add(load_prefs_submenu_settings))
+        cnfg.add_field_callback('optspec_layout',
+            lambda *_: GLib.idle_add(load_optspec_layout_submenu_settings))
+        cnfg.add_field_callback('override_kbtype',
+            lambda *_: GLib.idle_add(load_kbtype_submenu_settings))
+
         # load the settings for the preferences submenu toggle items
         load_prefs_submenu_settings()
         # load the settings for the optspec layout submenu